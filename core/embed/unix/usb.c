@@ -20,6 +20,7 @@
 #include <arpa/inet.h>
 #include <assert.h>
 #include <fcntl.h>
+#include <stdbool.h>
 #include <stdlib.h>
 #include <string.h>
 #include <sys/poll.h>
@@ -69,6 +70,23 @@ void usb_init(const usb_dev_info_t *dev_info) {
 
 void usb_deinit(void) {}
 
+// Tell the process which started the emulator that the interfaces are
+// listening, by writing to the file descriptor in TREZOR_NOTIFY_FD. See
+// Emulator.wait_until_ready() in python/src/trezorlib/_internal/emulator.py.
+static void usb_notify_ready(void) {
+  static bool notified = false;
+  const char *notify_fd = getenv("TREZOR_NOTIFY_FD");
+  if (notified || notify_fd == NULL) {
+    return;
+  }
+  notified = true;
+  int fd = atoi(notify_fd);
+  if (write(fd, "READY\n", 6) != 6) {
+    // the parent stopped waiting, nothing to do
+  }
+  close(fd);
+}
+
 void usb_start(void) {
   const char *ip = getenv("TREZOR_UDP_IP");
 
@@ -98,6 +116,8 @@ void usb_start(void) {
                                 sizeof(struct sockaddr_in))),
            NULL);
   }
+
+  usb_notify_ready();
 }
 
 void usb_stop(void) {}
@@ -123,6 +123,8 @@ trezor.enums.OutputScriptType
 import trezor.enums.OutputScriptType
 trezor.enums.PinMatrixRequestType
 import trezor.enums.PinMatrixRequestType
+trezor.enums.PsbtRequestType
+import trezor.enums.PsbtRequestType
 trezor.enums.RecoveryDeviceType
 import trezor.enums.RecoveryDeviceType
 trezor.enums.RequestType
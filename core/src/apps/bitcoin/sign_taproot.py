@@ -2,12 +2,21 @@ from typing import TYPE_CHECKING
 
 from trezor import wire
 from trezor.crypto import base58
-from trezor.enums import AmountUnit, OutputScriptType
+from trezor.enums import AmountUnit, OutputScriptType, PsbtRequestType
 from trezor.lvglui.scrs import lv
-from trezor.messages import SignedPsbt, SignTx, TxInput, TxOutput
+from trezor.messages import (
+    PsbtAck,
+    PsbtRecord,
+    PsbtRequest,
+    SignedPsbt,
+    SignTx,
+    TxInput,
+    TxOutput,
+)
+from trezor.utils import BufferReader
 
 from apps.common import address_type
-from apps.ur_registry.chains.bitcoin.psbt.psbt import PSBT
+from apps.ur_registry.chains.bitcoin.psbt.psbt import PSBT, PartiallySignedInput
 from apps.ur_registry.chains.bitcoin.psbt.script import is_witness
 from apps.ur_registry.chains.bitcoin.psbt.serialize import ser_string
 
@@ -25,20 +34,112 @@ from .sign_tx.sig_hasher import BitcoinSigHasher
 # from .sign_tx import tx_weight
 
 if TYPE_CHECKING:
+    from typing import Any, Callable, TypeVar
+
     from apps.common.coininfo import CoinInfo
     from apps.common.keychain import Keychain
+    from apps.ur_registry.chains.bitcoin.psbt.psbt import PartiallySignedOutput
     from trezor.messages import SignPsbt
 
+    T = TypeVar("T")
+
+    # x-only public key, BIP-32 path and the leaf hash for script path spending
+    SigningKey = tuple[bytes, list[int], bytes | None]
+
 
 @with_keychain
 async def sign_taproot(
     ctx: wire.Context, msg: SignPsbt, keychain: Keychain, coin: CoinInfo
-) -> SignedPsbt:
+) -> SignedPsbt | PsbtRequest:
+    signer = TaprootSigner(ctx, keychain, coin)
+    if msg.psbt is None:
+        return await sign_streamed(ctx, signer)
     if not msg.psbt:
         raise wire.DataError("Missing psbt")
+
+    psbt = PSBT()
+    _parse(psbt.deserialize, msg.psbt)
+    signer.inputs_count = len(psbt.inputs)
+    signing_keys = [signer.add_input(input) for input in psbt.inputs]
+    signer.check_ours()
+    for output in psbt.outputs:
+        await signer.add_output(output)
+    assert psbt.tx_version is not None
+    lock_time = await signer.confirm_tx(psbt.fallback_locktime)
+
+    for i, input in enumerate(psbt.inputs):
+        for key, leaf_hash, signature in signer.sign_input(
+            i, signing_keys[i], psbt.tx_version, lock_time
+        ):
+            if leaf_hash is None:
+                input.tap_key_sig = signature
+            else:
+                input.tap_script_sigs[(key, leaf_hash)] = signature
+
+    return SignedPsbt(psbt=psbt.serialize())
+
+
+async def sign_streamed(ctx: wire.Context, signer: "TaprootSigner") -> PsbtRequest:
+    """
+    Pulls the PSBT map by map instead of receiving it whole. Only what is needed
+    to sign the inputs is kept, the maps are dropped once they are hashed and
+    the signatures are passed to the host as PSBT records.
+    """
+    psbt = PSBT()
+    r = await request_map(ctx, PsbtRequestType.PSBT_GLOBAL)
+    inputs_count, outputs_count = _parse_map(r, psbt.deserialize_global, r)
+    signer.inputs_count = inputs_count
+
+    signing_keys = []
+    for i in range(inputs_count):
+        r = await request_map(ctx, PsbtRequestType.PSBT_INPUT, i)
+        input = _parse_map(r, psbt.deserialize_input, r, i)
+        signing_keys.append(signer.add_input(input))
+    signer.check_ours()
+
+    for i in range(outputs_count):
+        r = await request_map(ctx, PsbtRequestType.PSBT_OUTPUT, i)
+        output = _parse_map(r, psbt.deserialize_output, r, i)
+        await signer.add_output(output)
+
+    assert psbt.tx_version is not None
+    lock_time = await signer.confirm_tx(psbt.fallback_locktime)
+
+    for i in range(inputs_count):
+        for key, leaf_hash, signature in signer.sign_input(
+            i, signing_keys[i], psbt.tx_version, lock_time
+        ):
+            if leaf_hash is None:
+                record_key = bytes([PartiallySignedInput.PSBT_IN_TAP_KEY_SIG])
+            else:
+                record_key = (
+                    bytes([PartiallySignedInput.PSBT_IN_TAP_SCRIPT_SIG])
+                    + key
+                    + leaf_hash
+                )
+            req = PsbtRequest(
+                request_type=PsbtRequestType.PSBT_SIGNATURE,
+                request_index=i,
+                record=PsbtRecord(key=record_key, value=signature),
+            )
+            await ctx.call(req, PsbtAck)
+
+    return PsbtRequest(request_type=PsbtRequestType.PSBT_FINISHED)
+
+
+async def request_map(
+    ctx: wire.Context, request_type: PsbtRequestType, index: int | None = None
+) -> BufferReader:
+    req = PsbtRequest(request_type=request_type, request_index=index)
+    ack = await ctx.call(req, PsbtAck)
+    if not ack.map:
+        raise wire.DataError("Missing psbt map")
+    return BufferReader(ack.map)
+
+
+def _parse(deserialize: Callable[..., T], *args: Any) -> T:
     try:
-        psbt = PSBT()
-        psbt.deserialize(msg.psbt)
+        return deserialize(*args)
     except Exception as e:
         if __debug__:
             import sys
@@ -46,15 +147,40 @@ async def sign_taproot(
             sys.print_exception(e)  # type: ignore["print_exception" is not a known member of module]
         raise wire.DataError("Invalid psbt")
 
-    sig_hasher = BitcoinSigHasher()
-    # weight = tx_weight.TxWeightCalculator()
-    total_in = 0
-    total_out = 0
-    change_out = 0
-    master_fp = keychain.root_fingerprint().to_bytes(4, "big")
-    found_ours = False
-    contains_script_path_spending = False
-    for i, input in enumerate(psbt.inputs):
+
+def _parse_map(r: BufferReader, deserialize: Callable[..., T], *args: Any) -> T:
+    # every PsbtAck carries exactly one map
+    result = _parse(deserialize, *args)
+    if r.remaining_count():
+        raise wire.DataError("Invalid psbt")
+    return result
+
+
+class TaprootSigner:
+    """
+    Checks and hashes the inputs and the outputs of a PSBT one by one, so the
+    same steps serve a PSBT received whole and one pulled map by map.
+    """
+
+    def __init__(self, ctx: wire.Context, keychain: Keychain, coin: CoinInfo) -> None:
+        self.ctx = ctx
+        self.keychain = keychain
+        self.coin = coin
+        self.sig_hasher = BitcoinSigHasher()
+        # weight = tx_weight.TxWeightCalculator()
+        self.inputs_count = 0
+        self.total_in = 0
+        self.total_out = 0
+        self.change_out = 0
+        self.master_fp = keychain.root_fingerprint().to_bytes(4, "big")
+        self.found_ours = False
+        self.contains_script_path_spending = False
+        # the greatest lock times required by the inputs, see PSBT.compute_lock_time
+        self.time_lock: int | None = 0
+        self.height_lock: int | None = 0
+        self.lock_time_disabled = True
+
+    def add_input(self, input: PartiallySignedInput) -> list[SigningKey]:
         assert input.prev_txid is not None
         assert input.prev_out is not None
         assert input.sequence is not None
@@ -64,34 +190,44 @@ async def sign_taproot(
             raise wire.DataError("Non-witness UTXO is not allowed")
         if input.witness_utxo is None:
             raise wire.DataError("Missing required witness UTXO")
-        if list(input.tap_bip32_paths.items()):
-            found_ours = True
+        if input.tap_bip32_paths:
+            self.found_ours = True
 
         scriptPub = input.witness_utxo.scriptPubKey
         amount = input.witness_utxo.nValue
         is_wit, wit_ver, _ = is_witness(scriptPub)
 
         assert is_wit and wit_ver == 1, "Only taproot input is allowed"
-        total_in += amount
+        self.total_in += amount
+
+        script = b""
+        leaf_hash = None
+        if input.tap_scripts:
+            script, leaf_version = list(input.tap_scripts.keys())[0]
+            leaf_hash_writer = tagged_hashwriter(b"TapLeaf")
+            leaf_hash_writer.extend(bytes([leaf_version]) + ser_string(script))
+            leaf_hash = leaf_hash_writer.get_digest()
+
+        signing_keys = []
         for key, (_, origin) in input.tap_bip32_paths.items():
-            if origin.fingerprint != master_fp:
+            if origin.fingerprint != self.master_fp:
                 if __debug__:
                     print(
-                        f"Key fingerprint {origin.fingerprint} does not match master key {master_fp}"
+                        f"Key fingerprint {origin.fingerprint} does not match master key {self.master_fp}"
                     )
                 raise wire.DataError("Wallet mismatch")
-            node = keychain.derive(origin.path)
+            node = self.keychain.derive(origin.path)
             intend_key = node.public_key()[1:]
             assert intend_key == key, "Invalid key"
             if not input.tap_scripts:
                 assert key == input.tap_internal_key, "Invalid internal key"
             else:
-                script, _ = list(input.tap_scripts.keys())[0]
                 assert key in script, "Invalid script"
-                if not contains_script_path_spending:
-                    contains_script_path_spending = True
+                self.contains_script_path_spending = True
+            signing_keys.append((key, origin.path, leaf_hash))
 
-        sig_hasher.add_input(
+        self._add_lock_time(input)
+        self.sig_hasher.add_input(
             txi=TxInput(
                 prev_hash=bytes(reversed(input.prev_txid)),
                 prev_index=input.prev_out,
@@ -100,17 +236,39 @@ async def sign_taproot(
             ),
             script_pubkey=scriptPub,
         )
-    if not found_ours:
-        raise wire.DataError("Invalid PSBT, no tap_bip32_paths present")
-    ctx.primary_color, ctx.icon_path = (
-        lv.color_hex(coin.primary_color),
-        f"A:/res/{coin.icon}",
-    )
-    for i, output in enumerate(psbt.outputs):
+        return signing_keys
+
+    def _add_lock_time(self, input: PartiallySignedInput) -> None:
+        if input.time_locktime is not None and input.height_locktime is None:
+            self.height_lock = None
+            if self.time_lock is None:
+                raise wire.DataError("Cannot require both time and height locktimes")
+        elif input.time_locktime is None and input.height_locktime is not None:
+            self.time_lock = None
+            if self.height_lock is None:
+                raise wire.DataError("Cannot require both time and height locktimes")
+
+        if input.time_locktime is not None and self.time_lock is not None:
+            self.time_lock = max(self.time_lock, input.time_locktime)
+        if input.height_locktime is not None and self.height_lock is not None:
+            self.height_lock = max(self.height_lock, input.height_locktime)
+        if input.sequence != 0xFFFF_FFFF:
+            self.lock_time_disabled = False
+
+    def check_ours(self) -> None:
+        if not self.found_ours:
+            raise wire.DataError("Invalid PSBT, no tap_bip32_paths present")
+        self.ctx.primary_color, self.ctx.icon_path = (
+            lv.color_hex(self.coin.primary_color),
+            f"A:/res/{self.coin.icon}",
+        )
+
+    async def add_output(self, output: PartiallySignedOutput) -> None:
+        coin = self.coin
         is_change_out = False
         op_return_data = None
         out = output.get_txout()
-        total_out += out.nValue
+        self.total_out += out.nValue
         wit, ver, prog = out.is_witness()
         out_address = None
         if wit:
@@ -129,7 +287,7 @@ async def sign_taproot(
         elif out.is_opreturn():
             if out.nValue != 0:
                 assert (
-                    contains_script_path_spending and len(psbt.inputs) == 1
+                    self.contains_script_path_spending and self.inputs_count == 1
                 ), "OpReturn output should have 0 value"
             op_return_data = out.scriptPubKey[2:]
         else:
@@ -137,28 +295,29 @@ async def sign_taproot(
 
         if not wit or (wit and ver == 0):
             for _, keypath in output.hd_keypaths.items():
-                if keypath.fingerprint != master_fp:
+                if keypath.fingerprint != self.master_fp:
                     if __debug__:
                         print(
-                            f"Key fingerprint {keypath.fingerprint} does not match master key {master_fp}"
+                            f"Key fingerprint {keypath.fingerprint} does not match master key {self.master_fp}"
                         )
                     else:
                         raise wire.DataError(
                             "Master fingerprint does not match master key"
                         )
-                change_out += out.nValue
+                self.change_out += out.nValue
                 is_change_out = True
         elif wit and ver == 1:
             for key, (_, origin) in output.tap_bip32_paths.items():
                 if not (
-                    key == output.tap_internal_key and origin.fingerprint == master_fp
+                    key == output.tap_internal_key
+                    and origin.fingerprint == self.master_fp
                 ):
                     raise wire.DataError(
                         "Invalid parameters, only key path change is allowed"
                     )
-                change_out += out.nValue
+                self.change_out += out.nValue
                 is_change_out = True
-        sig_hasher.add_output(
+        self.sig_hasher.add_output(
             txo=TxOutput(
                 amount=out.nValue,
             ),
@@ -176,59 +335,59 @@ async def sign_taproot(
                 else {}
             )
             await layout.confirm_output(
-                ctx,
+                self.ctx,
                 TxOutput(amount=out.nValue, address=out_address, **output_params),
                 coin,
                 AmountUnit.BITCOIN,
             )
-    if total_in <= total_out:
-        raise wire.DataError("Insufficient funds")
-    tx_locktime = psbt.compute_lock_time()
 
-    if tx_locktime > 0:
-        await layout.confirm_nondefault_locktime(
-            ctx, tx_locktime, lock_time_disabled=psbt.lock_time_disabled()
-        )
-    fee = total_in - total_out
-    spending = total_in - change_out
-    await layout.confirm_total(ctx, spending, fee, 0, coin, AmountUnit.BITCOIN)
+    async def confirm_tx(self, fallback_locktime: int | None) -> int:
+        """Confirms the lock time, the total and the fee, returns the lock time."""
+        ctx = self.ctx
+        if self.total_in <= self.total_out:
+            raise wire.DataError("Insufficient funds")
 
-    from trezor.ui.layouts import confirm_final
+        if self.height_lock:
+            tx_locktime = self.height_lock
+        elif self.time_lock:
+            tx_locktime = self.time_lock
+        else:
+            tx_locktime = fallback_locktime or 0
 
-    await confirm_final(ctx, coin.coin_name)
+        if tx_locktime > 0:
+            await layout.confirm_nondefault_locktime(
+                ctx, tx_locktime, lock_time_disabled=self.lock_time_disabled
+            )
+        fee = self.total_in - self.total_out
+        spending = self.total_in - self.change_out
+        await layout.confirm_total(ctx, spending, fee, 0, self.coin, AmountUnit.BITCOIN)
 
-    for i, input in enumerate(psbt.inputs):
-        for key, (_, origin) in input.tap_bip32_paths.items():
-            if not input.tap_scripts:
-                script_path_spending = False
-                leaf_hash = None
-            else:
-                script_path_spending = True
-                script, leaf_version = list(input.tap_scripts.keys())[0]
-                leaf_hash_writer = tagged_hashwriter(b"TapLeaf")
-                leaf_hash_writer.extend(bytes([leaf_version]) + ser_string(script))
-                leaf_hash = leaf_hash_writer.get_digest()
-
-            node = keychain.derive(origin.path)
-            sigmsg_digest = sig_hasher.hash341(
+        from trezor.ui.layouts import confirm_final
+
+        await confirm_final(ctx, self.coin.coin_name)
+        return tx_locktime
+
+    def sign_input(
+        self, i: int, signing_keys: list[SigningKey], tx_version: int, lock_time: int
+    ) -> list[tuple[bytes, bytes | None, bytes]]:
+        """Returns the key, the leaf hash and the signature for each signing key."""
+        signatures = []
+        for key, path, leaf_hash in signing_keys:
+            node = self.keychain.derive(path)
+            sigmsg_digest = self.sig_hasher.hash341(
                 i,
                 SignTx(
                     outputs_count=0,
                     inputs_count=0,
-                    version=psbt.tx_version,
-                    lock_time=tx_locktime,
+                    version=tx_version,
+                    lock_time=lock_time,
                 ),
                 SigHashType.SIGHASH_ALL_TAPROOT,
                 leaf_hash=leaf_hash,
             )
-            if not script_path_spending:
+            if leaf_hash is None:
                 signature = bip340_sign(node, sigmsg_digest)
             else:
                 signature = bip340_sign_internal(node, sigmsg_digest)
-            if not script_path_spending:
-                input.tap_key_sig = signature
-            else:
-                assert leaf_hash is not None
-                input.tap_script_sigs[(key, leaf_hash)] = signature
-
-    return SignedPsbt(psbt=psbt.serialize())
+            signatures.append((key, leaf_hash, signature))
+        return signatures
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from trezor.utils import HashWriter
+
 from apps.common import cbor
 
 if TYPE_CHECKING:
@@ -23,11 +25,13 @@ class HashBuilderCollection:
         self.size = size
         self.remaining = size
         self.hash_fn: HashContext | None = None
+        self.hash_writer: HashWriter | None = None
         self.parent: "HashBuilderCollection | None" = None
         self.has_unfinished_child = False
 
     def start(self, hash_fn: HashContext) -> "HashBuilderCollection":
         self.hash_fn = hash_fn
+        self.hash_writer = HashWriter(hash_fn)
         self.hash_fn.update(self._header_bytes())
         return self
 
@@ -52,9 +56,8 @@ class HashBuilderCollection:
         return encoded_item
 
     def _hash_item_streamed(self, item: Any) -> None:
-        assert self.hash_fn is not None
-        for chunk in cbor.encode_streamed(item):
-            self.hash_fn.update(chunk)
+        assert self.hash_writer is not None
+        cbor.encode_into(self.hash_writer, item)
 
     def _header_bytes(self) -> bytes:
         raise NotImplementedError
@@ -65,6 +68,7 @@ class HashBuilderCollection:
         if self.parent is not None:
             self.parent.has_unfinished_child = False
         self.hash_fn = None
+        self.hash_writer = None
         self.parent = None
 
     def __enter__(self) -> "HashBuilderCollection":
@@ -5,7 +5,7 @@ Minimalistic CBOR implementation, supports only what we need in cardano.
 from micropython import const
 from typing import TYPE_CHECKING
 
-from trezor.utils import BufferReader
+from trezor.utils import BufferReader, BufferWriter, memcpy
 
 if __debug__:
     from trezor import log
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
     K = TypeVar("K")
     V = TypeVar("V")
+    from trezor.utils import Writer
+
     Value = Any
     CborSequence = list[Value] | tuple[Value, ...]
 else:
@@ -34,6 +36,16 @@ _CBOR_MAP = const(0b101 << 5)
 _CBOR_TAG = const(0b110 << 5)
 _CBOR_PRIMITIVE = const(0b111 << 5)
 
+# major types, see Reader.peek_type()
+TYPE_UNSIGNED_INT = _CBOR_UNSIGNED_INT
+TYPE_NEGATIVE_INT = _CBOR_NEGATIVE_INT
+TYPE_BYTE_STRING = _CBOR_BYTE_STRING
+TYPE_TEXT_STRING = _CBOR_TEXT_STRING
+TYPE_ARRAY = _CBOR_ARRAY
+TYPE_MAP = _CBOR_MAP
+TYPE_TAG = _CBOR_TAG
+TYPE_PRIMITIVE = _CBOR_PRIMITIVE
+
 _CBOR_UINT8_FOLLOWS = const(0x18)
 _CBOR_UINT16_FOLLOWS = const(0x19)
 _CBOR_UINT32_FOLLOWS = const(0x1A)
@@ -51,78 +63,150 @@ _CBOR_RAW_TAG = const(0x18)  # Tag 24
 _CBOR_SET_TAG = const(0x102)  # Tag 258
 
 
-def _header(typ: int, l: int) -> bytes:
-    from ustruct import pack
-
+def _header_length(l: int) -> int:
     if l < 24:
-        return pack(">B", typ + l)
+        return 1
     elif l < 2**8:
-        return pack(">BB", typ + 24, l)
+        return 2
     elif l < 2**16:
-        return pack(">BH", typ + 25, l)
+        return 3
     elif l < 2**32:
-        return pack(">BI", typ + 26, l)
+        return 5
     elif l < 2**64:
-        return pack(">BQ", typ + 27, l)
+        return 9
     else:
         raise NotImplementedError  # Length not supported
 
 
-def _cbor_encode(value: Value) -> Iterator[bytes]:
-    if isinstance(value, int):
+def _write_header(w: Writer, typ: int, l: int) -> None:
+    if l < 24:
+        w.append(typ + l)
+        return
+    n = _header_length(l) - 1
+    # 1, 2, 4 and 8 byte arguments are flagged by 24, 25, 26 and 27
+    w.append(typ + 24 + (0, 0, 1, 0, 2, 0, 0, 0, 3)[n])
+    for shift in range(8 * (n - 1), -1, -8):
+        w.append((l >> shift) & 0xFF)
+
+
+def _header(typ: int, l: int) -> bytes:
+    w = bytearray()
+    _write_header(w, typ, l)
+    return bytes(w)
+
+
+def _map_key_order(key: Value) -> tuple[int, int, bytes]:
+    """
+    Sort key ordering map keys like their encodings compared bytewise, without
+    encoding the usual int, bytes and str keys. Within a major type the
+    encodings of these compare by their argument first and the content second.
+    """
+    if isinstance(key, bool):
+        pass
+    elif isinstance(key, int):
+        if key >= 0:
+            return (_CBOR_UNSIGNED_INT, key, b"")
+        else:
+            return (_CBOR_NEGATIVE_INT, -1 - key, b"")
+    elif isinstance(key, bytes):
+        return (_CBOR_BYTE_STRING, len(key), key)
+    elif isinstance(key, str):
+        encoded_key = key.encode()
+        return (_CBOR_TEXT_STRING, len(encoded_key), encoded_key)
+    encoded_key = encode(key)
+    return (encoded_key[0] & _CBOR_TYPE_MASK, 0, encoded_key)
+
+
+def _encode(w: Writer, value: Value) -> None:
+    if isinstance(value, bool):
+        if value:
+            w.append(_CBOR_PRIMITIVE + _CBOR_TRUE)
+        else:
+            w.append(_CBOR_PRIMITIVE + _CBOR_FALSE)
+    elif isinstance(value, int):
         if value >= 0:
-            yield _header(_CBOR_UNSIGNED_INT, value)
+            _write_header(w, _CBOR_UNSIGNED_INT, value)
         else:
-            yield _header(_CBOR_NEGATIVE_INT, -1 - value)
-    elif isinstance(value, bytes):
-        yield _header(_CBOR_BYTE_STRING, len(value))
-        yield value
-    elif isinstance(value, bytearray):
-        yield _header(_CBOR_BYTE_STRING, len(value))
-        yield bytes(value)
+            _write_header(w, _CBOR_NEGATIVE_INT, -1 - value)
+    elif isinstance(value, (bytes, bytearray)):
+        _write_header(w, _CBOR_BYTE_STRING, len(value))
+        w.extend(value)
     elif isinstance(value, str):
         encoded_value = value.encode()
-        yield _header(_CBOR_TEXT_STRING, len(encoded_value))
-        yield encoded_value
+        _write_header(w, _CBOR_TEXT_STRING, len(encoded_value))
+        w.extend(encoded_value)
     elif isinstance(value, (list, tuple)):
         # definite-length valued list
-        yield _header(_CBOR_ARRAY, len(value))
+        _write_header(w, _CBOR_ARRAY, len(value))
         for x in value:
-            yield from _cbor_encode(x)
+            _encode(w, x)
     elif isinstance(value, dict):
-        yield _header(_CBOR_MAP, len(value))
-        sorted_map = sorted((encode(k), v) for k, v in value.items())
-        for k, v in sorted_map:
-            yield k
-            yield from _cbor_encode(v)
+        _write_header(w, _CBOR_MAP, len(value))
+        for k in sorted(value, key=_map_key_order):
+            _encode(w, k)
+            _encode(w, value[k])
     elif isinstance(value, OrderedMap):
-        yield _header(_CBOR_MAP, len(value))
+        _write_header(w, _CBOR_MAP, len(value))
         for k, v in value:
-            yield encode(k)
-            yield from _cbor_encode(v)
+            _encode(w, k)
+            _encode(w, v)
     elif isinstance(value, Tagged):
-        yield _header(_CBOR_TAG, value.tag)
-        yield from _cbor_encode(value.value)
+        _write_header(w, _CBOR_TAG, value.tag)
+        _encode(w, value.value)
     elif isinstance(value, IndefiniteLengthArray):
-        yield bytes([_CBOR_ARRAY + 31])
+        w.append(_CBOR_ARRAY + _CBOR_VAR_FOLLOWS)
         for x in value.array:
-            yield from _cbor_encode(x)
-        yield bytes([_CBOR_PRIMITIVE + 31])
-    elif isinstance(value, bool):
-        if value:
-            yield bytes([_CBOR_PRIMITIVE + _CBOR_TRUE])
-        else:
-            yield bytes([_CBOR_PRIMITIVE + _CBOR_FALSE])
+            _encode(w, x)
+        w.append(_CBOR_PRIMITIVE + _CBOR_BREAK)
     elif isinstance(value, Raw):
-        yield value.value
+        w.extend(value.value)
     elif value is None:
-        yield bytes([_CBOR_PRIMITIVE + _CBOR_NULL])
+        w.append(_CBOR_PRIMITIVE + _CBOR_NULL)
     else:
         if __debug__:
             log.debug(__name__, "not implemented (encode): %s", type(value))
         raise NotImplementedError
 
 
+def encoded_length(value: Value) -> int:
+    """Returns the size of `encode(value)` without encoding the value."""
+    if isinstance(value, bool) or value is None:
+        return 1
+    elif isinstance(value, int):
+        return _header_length(value if value >= 0 else -1 - value)
+    elif isinstance(value, (bytes, bytearray)):
+        return _header_length(len(value)) + len(value)
+    elif isinstance(value, str):
+        ln = len(value.encode())
+        return _header_length(ln) + ln
+    elif isinstance(value, (list, tuple)):
+        ln = _header_length(len(value))
+        for x in value:
+            ln += encoded_length(x)
+        return ln
+    elif isinstance(value, dict):
+        ln = _header_length(len(value))
+        for k, v in value.items():
+            ln += encoded_length(k) + encoded_length(v)
+        return ln
+    elif isinstance(value, OrderedMap):
+        ln = _header_length(len(value))
+        for k, v in value:
+            ln += encoded_length(k) + encoded_length(v)
+        return ln
+    elif isinstance(value, Tagged):
+        return _header_length(value.tag) + encoded_length(value.value)
+    elif isinstance(value, IndefiniteLengthArray):
+        ln = 2  # start and break
+        for x in value.array:
+            ln += encoded_length(x)
+        return ln
+    elif isinstance(value, Raw):
+        return len(value.value)
+    else:
+        raise NotImplementedError
+
+
 def _read_length(r: BufferReader, aux: int) -> int:
     from . import readers
 
@@ -215,6 +299,128 @@ def _cbor_decode(r: BufferReader) -> Value:
         raise NotImplementedError
 
 
+class Reader:
+    """
+    Pull decoder, reads the items of an encoded value one by one without
+    building the decoded tree. Strings are returned as views into the buffer.
+
+        r = cbor.Reader(data)
+        for _ in range(r.read_map_header()):
+            key = r.read_int()
+            if key == 3:
+                public_key = r.read_bytes()
+            else:
+                r.skip()
+    """
+
+    def __init__(self, cbor: bytes | memoryview, offset: int = 0) -> None:
+        self.r = BufferReader(cbor)
+        self.r.seek(offset)
+
+    def remaining_count(self) -> int:
+        return self.r.remaining_count()
+
+    def peek_type(self) -> int:
+        """Returns the major type of the next item, one of the TYPE_* constants."""
+        return self.r.peek() & _CBOR_TYPE_MASK
+
+    def read_header(self) -> tuple[int, int | None]:
+        """
+        Reads the header of the next item and returns its major type and its
+        argument: the value of an int, the length of a string, an array or a
+        map, the tag number or the simple value. The length of indefinite
+        length items is None.
+        """
+        fb = self.r.get()
+        fb_type = fb & _CBOR_TYPE_MASK
+        fb_aux = fb & _CBOR_INFO_BITS
+        if fb_aux == _CBOR_VAR_FOLLOWS and fb_type in (
+            _CBOR_BYTE_STRING,
+            _CBOR_TEXT_STRING,
+            _CBOR_ARRAY,
+            _CBOR_MAP,
+        ):
+            return fb_type, None
+        if fb_type == _CBOR_PRIMITIVE:
+            if _CBOR_UINT8_FOLLOWS <= fb_aux < _CBOR_BREAK:
+                raise NotImplementedError  # floats and extended simple values
+            return fb_type, fb_aux
+        return fb_type, _read_length(self.r, fb_aux)
+
+    def _read_argument(self, expected_type: int) -> int:
+        typ, arg = self.read_header()
+        if typ != expected_type or arg is None:
+            raise ValueError
+        return arg
+
+    def read_int(self) -> int:
+        typ, arg = self.read_header()
+        if typ == _CBOR_UNSIGNED_INT:
+            return arg  # type: ignore [int-or-none]
+        elif typ == _CBOR_NEGATIVE_INT:
+            return -1 - arg  # type: ignore [int-or-none]
+        raise ValueError
+
+    def read_bytes(self) -> memoryview:
+        return self.r.read_memoryview(self._read_argument(_CBOR_BYTE_STRING))
+
+    def read_text(self) -> str:
+        return bytes(
+            self.r.read_memoryview(self._read_argument(_CBOR_TEXT_STRING))
+        ).decode()
+
+    def read_array_header(self) -> int | None:
+        """Returns the length of the array, None if it ends with a break."""
+        typ, arg = self.read_header()
+        if typ != _CBOR_ARRAY:
+            raise ValueError
+        return arg
+
+    def read_map_header(self) -> int | None:
+        """Returns the number of pairs of the map, None if it ends with a break."""
+        typ, arg = self.read_header()
+        if typ != _CBOR_MAP:
+            raise ValueError
+        return arg
+
+    def read_tag(self) -> int:
+        return self._read_argument(_CBOR_TAG)
+
+    def read_break(self) -> bool:
+        """Consumes the break ending an indefinite length item, if it is next."""
+        if self.r.peek() == _CBOR_PRIMITIVE + _CBOR_BREAK:
+            self.r.get()
+            return True
+        return False
+
+    def read_value(self) -> Value:
+        """Decodes the next item with all its contents, see `decode`."""
+        return _cbor_decode(self.r)
+
+    def skip(self) -> None:
+        """Skips the next item with all its contents."""
+        typ, arg = self.read_header()
+        if typ in (_CBOR_BYTE_STRING, _CBOR_TEXT_STRING):
+            if arg is None:
+                while not self.read_break():
+                    self.skip()
+            else:
+                self.r.read_memoryview(arg)
+        elif typ in (_CBOR_ARRAY, _CBOR_MAP):
+            items_per_entry = 2 if typ == _CBOR_MAP else 1
+            if arg is None:
+                while not self.read_break():
+                    for _ in range(items_per_entry):
+                        self.skip()
+            else:
+                for _ in range(arg * items_per_entry):
+                    self.skip()
+        elif typ == _CBOR_TAG:
+            self.skip()
+        elif typ == _CBOR_PRIMITIVE and arg == _CBOR_BREAK:
+            raise ValueError  # unexpected break
+
+
 class Tagged:
     def __init__(self, tag: int, value: Value) -> None:
         self.tag = tag
@@ -267,7 +473,18 @@ class OrderedMap(Generic[K, V]):
 
 
 def encode(value: Value) -> bytes:
-    return b"".join(_cbor_encode(value))
+    buffer = bytearray(encoded_length(value))
+    _encode(BufferWriter(buffer), value)
+    return bytes(buffer)
+
+
+def encode_into(w: Writer, value: Value) -> None:
+    """
+    Writes the encoded value into `w` as it is being encoded, without any
+    intermediate chunks. Use a `BufferWriter` to fill a preallocated buffer
+    (see `encoded_length`) or a `HashWriter` to feed a hash directly.
+    """
+    _encode(w, value)
 
 
 def encode_streamed(value: Value) -> Iterator[bytes]:
@@ -276,7 +493,52 @@ def encode_streamed(value: Value) -> Iterator[bytes]:
     CBOR "chunks", removing the need to reserve a continuous
     chunk of memory for the full serialized representation of the value
     """
-    return _cbor_encode(value)
+    if isinstance(value, (list, tuple)):
+        yield _header(_CBOR_ARRAY, len(value))
+        for x in value:
+            yield from encode_streamed(x)
+    elif isinstance(value, dict):
+        yield _header(_CBOR_MAP, len(value))
+        for k in sorted(value, key=_map_key_order):
+            yield encode(k)
+            yield from encode_streamed(value[k])
+    elif isinstance(value, OrderedMap):
+        yield _header(_CBOR_MAP, len(value))
+        for k, v in value:
+            yield encode(k)
+            yield from encode_streamed(v)
+    elif isinstance(value, Tagged):
+        yield _header(_CBOR_TAG, value.tag)
+        yield from encode_streamed(value.value)
+    elif isinstance(value, IndefiniteLengthArray):
+        yield bytes([_CBOR_ARRAY + _CBOR_VAR_FOLLOWS])
+        for x in value.array:
+            yield from encode_streamed(x)
+        yield bytes([_CBOR_PRIMITIVE + _CBOR_BREAK])
+    else:
+        yield encode(value)
+
+
+def encode_chunked(value: Value, max_chunk_size: int) -> Iterator[bytes]:
+    """
+    Returns the encoded value as an iterable of chunks of `max_chunk_size`
+    bytes, only the last one can be shorter.
+    """
+    if max_chunk_size <= 0:
+        raise ValueError
+    chunk = bytearray(max_chunk_size)
+    filled = 0
+    for item in encode_streamed(value):
+        item_offset = 0
+        while item_offset < len(item):
+            copied = memcpy(chunk, filled, item, item_offset)
+            filled += copied
+            item_offset += copied
+            if filled == max_chunk_size:
+                yield bytes(chunk)
+                filled = 0
+    if filled:
+        yield bytes(chunk[:filled])
 
 
 def decode(cbor: bytes, offset: int = 0) -> Value:
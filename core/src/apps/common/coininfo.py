@@ -1,6 +1,7 @@
 # generated from coininfo.py.mako
 # (by running `make templates` in `core`)
 # do not edit manually!
+from micropython import const
 from typing import Any
 
 from trezor import utils
@@ -9,6 +10,39 @@ from trezor.crypto.scripts import blake256_ripemd160, sha256_ripemd160
 
 # flake8: noqa
 
+# NOTE: coins are stored in constants, which stay in flash and need no per-coin
+# code. _COIN_NAMES is sorted, so that a lookup is a binary search, and
+# _COIN_DATA holds the packed parameters of the coin with the same index:
+# - flags (3 bytes), see the _F_* constants
+# - decimals (1 byte), address_type (4), address_type_p2sh (4), maxfee_kb (8)
+# - xpub_magic and the four optional xpub magics (4 bytes each, 0 if absent)
+# - slip44 (4), fork_id (1, 0 if absent), primary_color (3)
+# - coin_shortcut, signed_message_header, bech32_prefix, cashaddr_prefix,
+#   curve_name and icon, each as a length byte and UTF-8 data (empty if absent)
+# - only with _F_CONFIDENTIAL_ASSETS: address_prefix (4), blech32_prefix
+# All integers are big-endian. A CoinInfo is built on the first lookup of its
+# name and cached while this module is loaded, i.e. for the whole workflow.
+
+_F_SEGWIT = const(1 << 0)
+_F_TAPROOT = const(1 << 1)
+_F_FORCE_BIP143 = const(1 << 2)
+_F_DECRED = const(1 << 3)
+_F_NEGATIVE_FEE = const(1 << 4)
+_F_EXTRA_DATA = const(1 << 5)
+_F_TIMESTAMP = const(1 << 6)
+_F_OVERWINTERED = const(1 << 7)
+_F_ALTCOIN = const(1 << 8)
+_F_XPUB_SEGWIT_P2SH = const(1 << 9)
+_F_XPUB_SEGWIT_NATIVE = const(1 << 10)
+_F_XPUB_MULTISIG_SEGWIT_P2SH = const(1 << 11)
+_F_XPUB_MULTISIG_SEGWIT_NATIVE = const(1 << 12)
+_F_BECH32_PREFIX = const(1 << 13)
+_F_CASHADDR_PREFIX = const(1 << 14)
+_F_FORK_ID = const(1 << 15)
+_F_CONFIDENTIAL_ASSETS = const(1 << 16)
+
+_STRINGS_OFFSET = const(48)
+
 
 class CoinInfo:
     def __init__(
@@ -93,1743 +127,269 @@ class CoinInfo:
         return self.coin_name == other.coin_name
 
 
-# fmt: off
+_cache: dict[str, CoinInfo] = {}
+
+
 def by_name(name: str) -> CoinInfo:
-    if name == "Bitcoin":
-        return CoinInfo(
-            coin_name=name,
-            coin_shortcut="BTC",
-            decimals=8,
-            address_type=0,
-            address_type_p2sh=5,
-            maxfee_kb=2000000,
-            signed_message_header="Bitcoin Signed Message:\n",
-            xpub_magic=0x0488b21e,
-            xpub_magic_segwit_p2sh=0x049d7cb2,
-            xpub_magic_segwit_native=0x04b24746,
-            xpub_magic_multisig_segwit_p2sh=0x0295b43f,
-            xpub_magic_multisig_segwit_native=0x02aa7ed3,
-            bech32_prefix="bc",
-            cashaddr_prefix=None,
-            slip44=0,
-            segwit=True,
-            taproot=True,
-            fork_id=None,
-            force_bip143=False,
-            decred=False,
-            negative_fee=False,
-            curve_name='secp256k1',
-            extra_data=False,
-            timestamp=False,
-            overwintered=False,
-            confidential_assets=None,
-            icon="btc-btc.png",
-            primary_color=0xFF9C00,
-        )
-    if name == "Regtest":
-        return CoinInfo(
-            coin_name=name,
-            coin_shortcut="REGTEST",
-            decimals=8,
-            address_type=111,
-            address_type_p2sh=196,
-            maxfee_kb=10000000,
-            signed_message_header="Bitcoin Signed Message:\n",
-            xpub_magic=0x043587cf,
-            xpub_magic_segwit_p2sh=0x044a5262,
-            xpub_magic_segwit_native=0x045f1cf6,
-            xpub_magic_multisig_segwit_p2sh=0x024289ef,
-            xpub_magic_multisig_segwit_native=0x02575483,
-            bech32_prefix="bcrt",
-            cashaddr_prefix=None,
-            slip44=1,
-            segwit=True,
-            taproot=True,
-            fork_id=None,
-            force_bip143=False,
-            decred=False,
-            negative_fee=False,
-            curve_name='secp256k1',
-            extra_data=False,
-            timestamp=False,
-            overwintered=False,
-            confidential_assets=None,
-            icon="btc-regtest.png",
-            primary_color=0xFFFFFF,
-        )
-    if name == "Testnet":
-        return CoinInfo(
-            coin_name=name,
-            coin_shortcut="TEST",
-            decimals=8,
-            address_type=111,
-            address_type_p2sh=196,
-            maxfee_kb=10000000,
-            signed_message_header="Bitcoin Signed Message:\n",
-            xpub_magic=0x043587cf,
-            xpub_magic_segwit_p2sh=0x044a5262,
-            xpub_magic_segwit_native=0x045f1cf6,
-            xpub_magic_multisig_segwit_p2sh=0x024289ef,
-            xpub_magic_multisig_segwit_native=0x02575483,
-            bech32_prefix="tb",
-            cashaddr_prefix=None,
-            slip44=1,
-            segwit=True,
-            taproot=True,
-            fork_id=None,
-            force_bip143=False,
-            decred=False,
-            negative_fee=False,
-            curve_name='secp256k1',
-            extra_data=False,
-            timestamp=False,
-            overwintered=False,
-            confidential_assets=None,
-            icon="btc-test.png",
-            primary_color=0x969696,
-        )
-    if not utils.BITCOIN_ONLY:
-        if name == "Actinium":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="ACM",
-                decimals=8,
-                address_type=53,
-                address_type_p2sh=55,
-                maxfee_kb=320000000000,
-                signed_message_header="Actinium Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="acm",
-                cashaddr_prefix=None,
-                slip44=228,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-acm.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Axe":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="AXE",
-                decimals=8,
-                address_type=55,
-                address_type_p2sh=16,
-                maxfee_kb=21000000000,
-                signed_message_header="DarkCoin Signed Message:\n",
-                xpub_magic=0x02fe52cc,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=4242,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-axe.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Bcash":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="BCH",
-                decimals=8,
-                address_type=0,
-                address_type_p2sh=5,
-                maxfee_kb=14000000,
-                signed_message_header="Bitcoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix="bitcoincash",
-                slip44=145,
-                segwit=False,
-                taproot=False,
-                fork_id=0,
-                force_bip143=True,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-bch.png",
-                primary_color=0x0AC18E,
-            )
-        if name == "Bcash Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="TBCH",
-                decimals=8,
-                address_type=111,
-                address_type_p2sh=196,
-                maxfee_kb=10000000,
-                signed_message_header="Bitcoin Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix="bchtest",
-                slip44=1,
-                segwit=False,
-                taproot=False,
-                fork_id=0,
-                force_bip143=True,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tbch.png",
-                primary_color=0x969696,
-            )
-        if name == "Bgold":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="BTG",
-                decimals=8,
-                address_type=38,
-                address_type_p2sh=23,
-                maxfee_kb=380000000,
-                signed_message_header="Bitcoin Gold Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="btg",
-                cashaddr_prefix=None,
-                slip44=156,
-                segwit=True,
-                taproot=False,
-                fork_id=79,
-                force_bip143=True,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-btg.png",
-                primary_color=0xEBA809,
-            )
-        if name == "Bgold Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="TBTG",
-                decimals=8,
-                address_type=111,
-                address_type_p2sh=196,
-                maxfee_kb=500000,
-                signed_message_header="Bitcoin Gold Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=0x044a5262,
-                xpub_magic_segwit_native=0x045f1cf6,
-                xpub_magic_multisig_segwit_p2sh=0x043587cf,
-                xpub_magic_multisig_segwit_native=0x043587cf,
-                bech32_prefix="tbtg",
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=True,
-                taproot=False,
-                fork_id=79,
-                force_bip143=True,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tbtg.png",
-                primary_color=0x969696,
-            )
-        if name == "Bprivate":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="BTCP",
-                decimals=8,
-                address_type=4901,
-                address_type_p2sh=5039,
-                maxfee_kb=32000000000,
-                signed_message_header="BitcoinPrivate Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=183,
-                segwit=False,
-                taproot=False,
-                fork_id=42,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-btcp.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Bitcore":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="BTX",
-                decimals=8,
-                address_type=3,
-                address_type_p2sh=125,
-                maxfee_kb=14000000000,
-                signed_message_header="BitCore Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="btx",
-                cashaddr_prefix=None,
-                slip44=160,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-btx.png",
-                primary_color=0xF49919,
-            )
-        if name == "CPUchain":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="CPU",
-                decimals=8,
-                address_type=28,
-                address_type_p2sh=30,
-                maxfee_kb=8700000000000,
-                signed_message_header="CPUchain Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="cpu",
-                cashaddr_prefix=None,
-                slip44=363,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-cpu.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Crown":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="CRW",
-                decimals=8,
-                address_type=95495,
-                address_type_p2sh=95473,
-                maxfee_kb=52000000000,
-                signed_message_header="Crown Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=72,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-crw.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Dash":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="DASH",
-                decimals=8,
-                address_type=76,
-                address_type_p2sh=16,
-                maxfee_kb=45000000,
-                signed_message_header="DarkCoin Signed Message:\n",
-                xpub_magic=0x02fe52cc,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=5,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-dash.png",
-                primary_color=0x008DE4,
-            )
-        if name == "Dash Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="tDASH",
-                decimals=8,
-                address_type=140,
-                address_type_p2sh=19,
-                maxfee_kb=100000,
-                signed_message_header="DarkCoin Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tdash.png",
-                primary_color=0x969696,
-            )
-        if name == "Decred":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="DCR",
-                decimals=8,
-                address_type=1855,
-                address_type_p2sh=1818,
-                maxfee_kb=220000000,
-                signed_message_header="Decred Signed Message:\n",
-                xpub_magic=0x02fda926,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=42,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=True,
-                negative_fee=False,
-                curve_name='secp256k1-decred',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-dcr.png",
-                primary_color=0x2970FF,
-            )
-        if name == "Decred Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="TDCR",
-                decimals=8,
-                address_type=3873,
-                address_type_p2sh=3836,
-                maxfee_kb=10000000,
-                signed_message_header="Decred Signed Message:\n",
-                xpub_magic=0x043587d1,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=True,
-                negative_fee=False,
-                curve_name='secp256k1-decred',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tdcr.png",
-                primary_color=0x969696,
-            )
-        if name == "DigiByte":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="DGB",
-                decimals=8,
-                address_type=30,
-                address_type_p2sh=63,
-                maxfee_kb=130000000000,
-                signed_message_header="DigiByte Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="dgb",
-                cashaddr_prefix=None,
-                slip44=20,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-dgb.png",
-                primary_color=0x0977E5,
-            )
-        if name == "Dogecoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="DOGE",
-                decimals=8,
-                address_type=30,
-                address_type_p2sh=22,
-                maxfee_kb=1200000000000,
-                signed_message_header="Dogecoin Signed Message:\n",
-                xpub_magic=0x02facafd,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=3,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-doge.png",
-                primary_color=0xDBBD43,
-            )
-        if name == "Elements":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="ELEMENTS",
-                decimals=8,
-                address_type=235,
-                address_type_p2sh=75,
-                maxfee_kb=10000000,
-                signed_message_header="Bitcoin Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=0x044a5262,
-                xpub_magic_segwit_native=0x045f1cf6,
-                xpub_magic_multisig_segwit_p2sh=0x043587cf,
-                xpub_magic_multisig_segwit_native=0x043587cf,
-                bech32_prefix="ert",
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets={'address_prefix': 4, 'blech32_prefix': 'el'},
-                icon="btc-elements.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Feathercoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="FTC",
-                decimals=8,
-                address_type=14,
-                address_type_p2sh=5,
-                maxfee_kb=390000000000,
-                signed_message_header="Feathercoin Signed Message:\n",
-                xpub_magic=0x0488bc26,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488bc26,
-                xpub_magic_multisig_segwit_native=0x0488bc26,
-                bech32_prefix="fc",
-                cashaddr_prefix=None,
-                slip44=8,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-ftc.png",
-                primary_color=0x547E94,
-            )
-        if name == "Firo":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="FIRO",
-                decimals=8,
-                address_type=82,
-                address_type_p2sh=7,
-                maxfee_kb=640000000,
-                signed_message_header="Zcoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=136,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-firo.png",
-                primary_color=0xAD2336,
-            )
-        if name == "Firo Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="tFIRO",
-                decimals=8,
-                address_type=65,
-                address_type_p2sh=178,
-                maxfee_kb=1000000,
-                signed_message_header="Zcoin Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tfiro.png",
-                primary_color=0x969696,
-            )
-        if name == "Florincoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="FLO",
-                decimals=8,
-                address_type=35,
-                address_type_p2sh=94,
-                maxfee_kb=78000000000,
-                signed_message_header="Florincoin Signed Message:\n",
-                xpub_magic=0x00174921,
-                xpub_magic_segwit_p2sh=0x01b26ef6,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x00174921,
-                xpub_magic_multisig_segwit_native=0x00174921,
-                bech32_prefix="flo",
-                cashaddr_prefix=None,
-                slip44=216,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-flo.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Fujicoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="FJC",
-                decimals=8,
-                address_type=36,
-                address_type_p2sh=16,
-                maxfee_kb=35000000000000,
-                signed_message_header="FujiCoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0295b43f,
-                xpub_magic_multisig_segwit_native=0x02aa7ed3,
-                bech32_prefix="fc",
-                cashaddr_prefix=None,
-                slip44=75,
-                segwit=True,
-                taproot=True,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-fjc.png",
-                primary_color=0x44AEEA,
-            )
-        if name == "Groestlcoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="GRS",
-                decimals=8,
-                address_type=36,
-                address_type_p2sh=5,
-                maxfee_kb=16000000000,
-                signed_message_header="GroestlCoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="grs",
-                cashaddr_prefix=None,
-                slip44=17,
-                segwit=True,
-                taproot=True,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1-groestl',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-grs.png",
-                primary_color=0x377E96,
-            )
-        if name == "Groestlcoin Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="tGRS",
-                decimals=8,
-                address_type=111,
-                address_type_p2sh=196,
-                maxfee_kb=100000,
-                signed_message_header="GroestlCoin Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=0x044a5262,
-                xpub_magic_segwit_native=0x045f1cf6,
-                xpub_magic_multisig_segwit_p2sh=0x043587cf,
-                xpub_magic_multisig_segwit_native=0x043587cf,
-                bech32_prefix="tgrs",
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=True,
-                taproot=True,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1-groestl',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tgrs.png",
-                primary_color=0x969696,
-            )
-        if name == "Komodo":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="KMD",
-                decimals=8,
-                address_type=60,
-                address_type_p2sh=85,
-                maxfee_kb=4800000000,
-                signed_message_header="Komodo Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=141,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=True,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=True,
-                confidential_assets=None,
-                icon="btc-kmd.png",
-                primary_color=0x2B6680,
-            )
-        if name == "Koto":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="KOTO",
-                decimals=8,
-                address_type=6198,
-                address_type_p2sh=6203,
-                maxfee_kb=1000000,
-                signed_message_header="Koto Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=510,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=True,
-                confidential_assets=None,
-                icon="btc-koto.png",
-                primary_color=0xE0AE1B,
-            )
-        if name == "Litecoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="LTC",
-                decimals=8,
-                address_type=48,
-                address_type_p2sh=50,
-                maxfee_kb=67000000,
-                signed_message_header="Litecoin Signed Message:\n",
-                xpub_magic=0x019da462,
-                xpub_magic_segwit_p2sh=0x01b26ef6,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x019da462,
-                xpub_magic_multisig_segwit_native=0x019da462,
-                bech32_prefix="ltc",
-                cashaddr_prefix=None,
-                slip44=2,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-ltc.png",
-                primary_color=0x3683F7,
-            )
-        if name == "Litecoin Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="tLTC",
-                decimals=8,
-                address_type=111,
-                address_type_p2sh=58,
-                maxfee_kb=40000000,
-                signed_message_header="Litecoin Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=0x044a5262,
-                xpub_magic_segwit_native=0x045f1cf6,
-                xpub_magic_multisig_segwit_p2sh=0x043587cf,
-                xpub_magic_multisig_segwit_native=0x043587cf,
-                bech32_prefix="tltc",
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tltc.png",
-                primary_color=0x969696,
-            )
-        if name == "Monacoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="MONA",
-                decimals=8,
-                address_type=50,
-                address_type_p2sh=55,
-                maxfee_kb=2100000000,
-                signed_message_header="Monacoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="mona",
-                cashaddr_prefix=None,
-                slip44=22,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-mona.png",
-                primary_color=0xDEC799,
-            )
-        if name == "MonetaryUnit":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="MUE",
-                decimals=8,
-                address_type=16,
-                address_type_p2sh=76,
-                maxfee_kb=600000000000,
-                signed_message_header="MonetaryUnit Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=31,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-mue.png",
-                primary_color=0xFF9616,
-            )
-        if name == "Namecoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="NMC",
-                decimals=8,
-                address_type=52,
-                address_type_p2sh=5,
-                maxfee_kb=8700000000,
-                signed_message_header="Namecoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=7,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-nmc.png",
-                primary_color=0x6787B6,
-            )
-        if name == "Neurai":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="XNA",
-                decimals=8,
-                address_type=53,
-                address_type_p2sh=122,
-                maxfee_kb=170000000000,
-                signed_message_header="Neurai Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=1900,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-xna.png",
-                primary_color=0x793EAA,
-            )
-        if name == "Peercoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="PPC",
-                decimals=6,
-                address_type=55,
-                address_type_p2sh=117,
-                maxfee_kb=13000000000,
-                signed_message_header="Peercoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="pc",
-                cashaddr_prefix=None,
-                slip44=6,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=True,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-ppc.png",
-                primary_color=0x3CB054,
-            )
-        if name == "Peercoin Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="tPPC",
-                decimals=6,
-                address_type=111,
-                address_type_p2sh=196,
-                maxfee_kb=2000000,
-                signed_message_header="Peercoin Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=0x044a5262,
-                xpub_magic_segwit_native=0x045f1cf6,
-                xpub_magic_multisig_segwit_p2sh=0x043587cf,
-                xpub_magic_multisig_segwit_native=0x043587cf,
-                bech32_prefix="tpc",
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=True,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tppc.png",
-                primary_color=0x969696,
-            )
-        if name == "Primecoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="XPM",
-                decimals=8,
-                address_type=23,
-                address_type_p2sh=83,
-                maxfee_kb=89000000000,
-                signed_message_header="Primecoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=24,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-xpm.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Qtum":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="QTUM",
-                decimals=8,
-                address_type=58,
-                address_type_p2sh=50,
-                maxfee_kb=1000000000,
-                signed_message_header="Qtum Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="qc",
-                cashaddr_prefix=None,
-                slip44=2301,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-qtum.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Qtum Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="tQTUM",
-                decimals=8,
-                address_type=120,
-                address_type_p2sh=110,
-                maxfee_kb=40000000,
-                signed_message_header="Qtum Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=0x044a5262,
-                xpub_magic_segwit_native=0x045f1cf6,
-                xpub_magic_multisig_segwit_p2sh=0x043587cf,
-                xpub_magic_multisig_segwit_native=0x043587cf,
-                bech32_prefix="tq",
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tqtum.png",
-                primary_color=0x969696,
-            )
-        if name == "Ravencoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="RVN",
-                decimals=8,
-                address_type=60,
-                address_type_p2sh=122,
-                maxfee_kb=170000000000,
-                signed_message_header="Raven Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=175,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-rvn.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Ravencoin Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="tRVN",
-                decimals=8,
-                address_type=111,
-                address_type_p2sh=196,
-                maxfee_kb=170000000000,
-                signed_message_header="Raven Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-trvn.png",
-                primary_color=0x969696,
-            )
-        if name == "Ritocoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="RITO",
-                decimals=8,
-                address_type=25,
-                address_type_p2sh=105,
-                maxfee_kb=39000000000000,
-                signed_message_header="Rito Signed Message:\n",
-                xpub_magic=0x0534e7ca,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=19169,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-rito.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "SmartCash":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="SMART",
-                decimals=8,
-                address_type=63,
-                address_type_p2sh=18,
-                maxfee_kb=780000000000,
-                signed_message_header="SmartCash Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=224,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1-smart',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-smart.png",
-                primary_color=0xFEC60D,
-            )
-        if name == "SmartCash Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="tSMART",
-                decimals=8,
-                address_type=65,
-                address_type_p2sh=21,
-                maxfee_kb=1000000,
-                signed_message_header="SmartCash Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1-smart',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-tsmart.png",
-                primary_color=0x969696,
-            )
-        if name == "Stakenet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="XSN",
-                decimals=8,
-                address_type=76,
-                address_type_p2sh=16,
-                maxfee_kb=11000000000,
-                signed_message_header="DarkCoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="xc",
-                cashaddr_prefix=None,
-                slip44=199,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-xsn.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Syscoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="SYS",
-                decimals=8,
-                address_type=63,
-                address_type_p2sh=5,
-                maxfee_kb=42000000000,
-                signed_message_header="Syscoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="sys",
-                cashaddr_prefix=None,
-                slip44=57,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-sys.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Unobtanium":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="UNO",
-                decimals=8,
-                address_type=130,
-                address_type_p2sh=30,
-                maxfee_kb=53000000,
-                signed_message_header="Unobtanium Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=92,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-uno.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "VIPSTARCOIN":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="VIPS",
-                decimals=8,
-                address_type=70,
-                address_type_p2sh=50,
-                maxfee_kb=140000000000000,
-                signed_message_header="VIPSTARCOIN Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="vips",
-                cashaddr_prefix=None,
-                slip44=1919,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-vips.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Verge":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="XVG",
-                decimals=6,
-                address_type=30,
-                address_type_p2sh=33,
-                maxfee_kb=550000000000,
-                signed_message_header="Name: Dogecoin Dark\n",
-                xpub_magic=0x022d2533,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=77,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=True,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-xvg.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Vertcoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="VTC",
-                decimals=8,
-                address_type=71,
-                address_type_p2sh=5,
-                maxfee_kb=13000000000,
-                signed_message_header="Vertcoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="vtc",
-                cashaddr_prefix=None,
-                slip44=28,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-vtc.png",
-                primary_color=0x048657,
-            )
-        if name == "Viacoin":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="VIA",
-                decimals=8,
-                address_type=71,
-                address_type_p2sh=33,
-                maxfee_kb=14000000000,
-                signed_message_header="Viacoin Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=0x049d7cb2,
-                xpub_magic_segwit_native=0x04b24746,
-                xpub_magic_multisig_segwit_p2sh=0x0488b21e,
-                xpub_magic_multisig_segwit_native=0x0488b21e,
-                bech32_prefix="via",
-                cashaddr_prefix=None,
-                slip44=14,
-                segwit=True,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-via.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "ZCore":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="ZCR",
-                decimals=8,
-                address_type=142,
-                address_type_p2sh=145,
-                maxfee_kb=170000000000,
-                signed_message_header="DarkNet Signed Message:\n",
-                xpub_magic=0x04b24746,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=428,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-zcr.png",
-                primary_color=0xFFFFFF,
-            )
-        if name == "Zcash":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="ZEC",
-                decimals=8,
-                address_type=7352,
-                address_type_p2sh=7357,
-                maxfee_kb=51000000,
-                signed_message_header="Zcash Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=133,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=True,
-                confidential_assets=None,
-                icon="btc-zec.png",
-                primary_color=0xECB244,
-            )
-        if name == "Zcash Testnet":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="TAZ",
-                decimals=8,
-                address_type=7461,
-                address_type_p2sh=7354,
-                maxfee_kb=10000000,
-                signed_message_header="Zcash Signed Message:\n",
-                xpub_magic=0x043587cf,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=1,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=True,
-                timestamp=False,
-                overwintered=True,
-                confidential_assets=None,
-                icon="btc-taz.png",
-                primary_color=0x969696,
-            )
-        if name == "Brhodium":
-            return CoinInfo(
-                coin_name=name,
-                coin_shortcut="XRC",
-                decimals=8,
-                address_type=61,
-                address_type_p2sh=123,
-                maxfee_kb=1000000000,
-                signed_message_header="BitCoin Rhodium Signed Message:\n",
-                xpub_magic=0x0488b21e,
-                xpub_magic_segwit_p2sh=None,
-                xpub_magic_segwit_native=None,
-                xpub_magic_multisig_segwit_p2sh=None,
-                xpub_magic_multisig_segwit_native=None,
-                bech32_prefix=None,
-                cashaddr_prefix=None,
-                slip44=10291,
-                segwit=False,
-                taproot=False,
-                fork_id=None,
-                force_bip143=False,
-                decred=False,
-                negative_fee=False,
-                curve_name='secp256k1',
-                extra_data=False,
-                timestamp=False,
-                overwintered=False,
-                confidential_assets=None,
-                icon="btc-xrc.png",
-                primary_color=0xFFFFFF,
-            )
-    raise ValueError  # Unknown coin name
+    coin = _cache.get(name)
+    if coin is None:
+        coin = _decode(name, _COIN_DATA[_find(name)])
+        _cache[name] = coin
+    return coin
+
+
+def _find(name: str) -> int:
+    # binary search of the index of `name` in _COIN_NAMES
+    lo = 0
+    hi = len(_COIN_NAMES)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _COIN_NAMES[mid] < name:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo == len(_COIN_NAMES) or _COIN_NAMES[lo] != name:
+        raise ValueError  # Unknown coin name
+    return lo
+
+
+def _uint(data: bytes, start: int, end: int) -> int:
+    return int.from_bytes(data[start:end], "big")
+
+
+def _optional(data: bytes, flags: int, flag: int, start: int) -> int | None:
+    # optional 4-byte value
+    return _uint(data, start, start + 4) if flags & flag else None
+
+
+def _decode(name: str, data: bytes) -> CoinInfo:
+    flags = _uint(data, 0, 3)
+    if utils.BITCOIN_ONLY and flags & _F_ALTCOIN:
+        raise ValueError  # Unknown coin name
+
+    strings = []
+    pos = _STRINGS_OFFSET
+    for _ in range(6):
+        end = pos + 1 + data[pos]
+        strings.append(data[pos + 1 : end].decode())
+        pos = end
+    shortcut, header, bech32_prefix, cashaddr_prefix, curve_name, icon = strings
+
+    confidential_assets = None
+    if flags & _F_CONFIDENTIAL_ASSETS:
+        confidential_assets = {
+            "address_prefix": _uint(data, pos, pos + 4),
+            "blech32_prefix": data[pos + 5 : pos + 5 + data[pos + 4]].decode(),
+        }
+
+    return CoinInfo(
+        coin_name=name,
+        coin_shortcut=shortcut,
+        decimals=data[3],
+        address_type=_uint(data, 4, 8),
+        address_type_p2sh=_uint(data, 8, 12),
+        maxfee_kb=_uint(data, 12, 20),
+        signed_message_header=header,
+        xpub_magic=_uint(data, 20, 24),
+        xpub_magic_segwit_p2sh=_optional(data, flags, _F_XPUB_SEGWIT_P2SH, 24),
+        xpub_magic_segwit_native=_optional(data, flags, _F_XPUB_SEGWIT_NATIVE, 28),
+        xpub_magic_multisig_segwit_p2sh=_optional(
+            data, flags, _F_XPUB_MULTISIG_SEGWIT_P2SH, 32
+        ),
+        xpub_magic_multisig_segwit_native=_optional(
+            data, flags, _F_XPUB_MULTISIG_SEGWIT_NATIVE, 36
+        ),
+        bech32_prefix=bech32_prefix if flags & _F_BECH32_PREFIX else None,
+        cashaddr_prefix=cashaddr_prefix if flags & _F_CASHADDR_PREFIX else None,
+        slip44=_uint(data, 40, 44),
+        segwit=bool(flags & _F_SEGWIT),
+        taproot=bool(flags & _F_TAPROOT),
+        fork_id=data[44] if flags & _F_FORK_ID else None,
+        force_bip143=bool(flags & _F_FORCE_BIP143),
+        decred=bool(flags & _F_DECRED),
+        negative_fee=bool(flags & _F_NEGATIVE_FEE),
+        curve_name=curve_name,
+        extra_data=bool(flags & _F_EXTRA_DATA),
+        timestamp=bool(flags & _F_TIMESTAMP),
+        overwintered=bool(flags & _F_OVERWINTERED),
+        confidential_assets=confidential_assets,
+        icon=icon,
+        primary_color=_uint(data, 45, 48),
+    )
+
+
+# fmt: off
+_COIN_NAMES = (
+    "Actinium",
+    "Axe",
+    "Bcash",
+    "Bcash Testnet",
+    "Bgold",
+    "Bgold Testnet",
+    "Bitcoin",
+    "Bitcore",
+    "Bprivate",
+    "Brhodium",
+    "CPUchain",
+    "Crown",
+    "Dash",
+    "Dash Testnet",
+    "Decred",
+    "Decred Testnet",
+    "DigiByte",
+    "Dogecoin",
+    "Elements",
+    "Feathercoin",
+    "Firo",
+    "Firo Testnet",
+    "Florincoin",
+    "Fujicoin",
+    "Groestlcoin",
+    "Groestlcoin Testnet",
+    "Komodo",
+    "Koto",
+    "Litecoin",
+    "Litecoin Testnet",
+    "Monacoin",
+    "MonetaryUnit",
+    "Namecoin",
+    "Neurai",
+    "Peercoin",
+    "Peercoin Testnet",
+    "Primecoin",
+    "Qtum",
+    "Qtum Testnet",
+    "Ravencoin",
+    "Ravencoin Testnet",
+    "Regtest",
+    "Ritocoin",
+    "SmartCash",
+    "SmartCash Testnet",
+    "Stakenet",
+    "Syscoin",
+    "Testnet",
+    "Unobtanium",
+    "VIPSTARCOIN",
+    "Verge",
+    "Vertcoin",
+    "Viacoin",
+    "ZCore",
+    "Zcash",
+    "Zcash Testnet",
+)
+
+_COIN_DATA = (
+    # Actinium
+    b"\x00\x3f\x01\x08\x00\x00\x00\x35\x00\x00\x00\x37\x00\x00\x00\x4a\x81\x7c\x80\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\xe4\x00\xff\xff\xff\x03\x41\x43\x4d\x19\x41\x63\x74\x69\x6e\x69\x75\x6d\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x61\x63\x6d\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x61\x63\x6d\x2e\x70\x6e\x67",
+    # Axe
+    b"\x00\x01\x00\x08\x00\x00\x00\x37\x00\x00\x00\x10\x00\x00\x00\x04\xe3\xb2\x92\x00\x02\xfe\x52\xcc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x92\x00\xff\xff\xff\x03\x41\x58\x45\x19\x44\x61\x72\x6b\x43\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x61\x78\x65\x2e\x70\x6e\x67",
+    # Bcash
+    b"\x00\xc1\x04\x08\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\xd5\x9f\x80\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x91\x00\x0a\xc1\x8e\x03\x42\x43\x48\x18\x42\x69\x74\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x0b\x62\x69\x74\x63\x6f\x69\x6e\x63\x61\x73\x68\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x62\x63\x68\x2e\x70\x6e\x67",
+    # Bcash Testnet
+    b"\x00\xc1\x04\x08\x00\x00\x00\x6f\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x98\x96\x80\x04\x35\x87\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x96\x96\x96\x04\x54\x42\x43\x48\x18\x42\x69\x74\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x07\x62\x63\x68\x74\x65\x73\x74\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x74\x62\x63\x68\x2e\x70\x6e\x67",
+    # Bgold
+    b"\x00\xbf\x05\x08\x00\x00\x00\x26\x00\x00\x00\x17\x00\x00\x00\x00\x16\xa6\x57\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\x9c\x4f\xeb\xa8\x09\x03\x42\x54\x47\x1d\x42\x69\x74\x63\x6f\x69\x6e\x20\x47\x6f\x6c\x64\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x62\x74\x67\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x62\x74\x67\x2e\x70\x6e\x67",
+    # Bgold Testnet
+    b"\x00\xbf\x05\x08\x00\x00\x00\x6f\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x07\xa1\x20\x04\x35\x87\xcf\x04\x4a\x52\x62\x04\x5f\x1c\xf6\x04\x35\x87\xcf\x04\x35\x87\xcf\x00\x00\x00\x01\x4f\x96\x96\x96\x04\x54\x42\x54\x47\x1d\x42\x69\x74\x63\x6f\x69\x6e\x20\x47\x6f\x6c\x64\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x04\x74\x62\x74\x67\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x74\x62\x74\x67\x2e\x70\x6e\x67",
+    # Bitcoin
+    b"\x00\x3e\x03\x08\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x1e\x84\x80\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x02\x95\xb4\x3f\x02\xaa\x7e\xd3\x00\x00\x00\x00\x00\xff\x9c\x00\x03\x42\x54\x43\x18\x42\x69\x74\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x02\x62\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x62\x74\x63\x2e\x70\x6e\x67",
+    # Bitcore
+    b"\x00\x3f\x01\x08\x00\x00\x00\x03\x00\x00\x00\x7d\x00\x00\x00\x03\x42\x77\x0c\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\xa0\x00\xf4\x99\x19\x03\x42\x54\x58\x18\x42\x69\x74\x43\x6f\x72\x65\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x62\x74\x78\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x62\x74\x78\x2e\x70\x6e\x67",
+    # Bprivate
+    b"\x00\x81\x00\x08\x00\x00\x13\x25\x00\x00\x13\xaf\x00\x00\x00\x07\x73\x59\x40\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb7\x2a\xff\xff\xff\x04\x42\x54\x43\x50\x1f\x42\x69\x74\x63\x6f\x69\x6e\x50\x72\x69\x76\x61\x74\x65\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x62\x74\x63\x70\x2e\x70\x6e\x67",
+    # Brhodium
+    b"\x00\x01\x00\x08\x00\x00\x00\x3d\x00\x00\x00\x7b\x00\x00\x00\x00\x3b\x9a\xca\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x33\x00\xff\xff\xff\x03\x58\x52\x43\x20\x42\x69\x74\x43\x6f\x69\x6e\x20\x52\x68\x6f\x64\x69\x75\x6d\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x78\x72\x63\x2e\x70\x6e\x67",
+    # CPUchain
+    b"\x00\x3f\x01\x08\x00\x00\x00\x1c\x00\x00\x00\x1e\x00\x00\x07\xe9\xa0\x68\xd8\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x01\x6b\x00\xff\xff\xff\x03\x43\x50\x55\x19\x43\x50\x55\x63\x68\x61\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x63\x70\x75\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x63\x70\x75\x2e\x70\x6e\x67",
+    # Crown
+    b"\x00\x01\x00\x08\x00\x01\x75\x07\x00\x01\x74\xf1\x00\x00\x00\x0c\x1b\x71\x08\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x48\x00\xff\xff\xff\x03\x43\x52\x57\x16\x43\x72\x6f\x77\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x63\x72\x77\x2e\x70\x6e\x67",
+    # Dash
+    b"\x00\x01\x20\x08\x00\x00\x00\x4c\x00\x00\x00\x10\x00\x00\x00\x00\x02\xae\xa5\x40\x02\xfe\x52\xcc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x8d\xe4\x04\x44\x41\x53\x48\x19\x44\x61\x72\x6b\x43\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x64\x61\x73\x68\x2e\x70\x6e\x67",
+    # Dash Testnet
+    b"\x00\x01\x20\x08\x00\x00\x00\x8c\x00\x00\x00\x13\x00\x00\x00\x00\x00\x01\x86\xa0\x04\x35\x87\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x96\x96\x96\x05\x74\x44\x41\x53\x48\x19\x44\x61\x72\x6b\x43\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0d\x62\x74\x63\x2d\x74\x64\x61\x73\x68\x2e\x70\x6e\x67",
+    # Decred
+    b"\x00\x01\x08\x08\x00\x00\x07\x3f\x00\x00\x07\x1a\x00\x00\x00\x00\x0d\x1c\xef\x00\x02\xfd\xa9\x26\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2a\x00\x29\x70\xff\x03\x44\x43\x52\x17\x44\x65\x63\x72\x65\x64\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x10\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x2d\x64\x65\x63\x72\x65\x64\x0b\x62\x74\x63\x2d\x64\x63\x72\x2e\x70\x6e\x67",
+    # Decred Testnet
+    b"\x00\x01\x08\x08\x00\x00\x0f\x21\x00\x00\x0e\xfc\x00\x00\x00\x00\x00\x98\x96\x80\x04\x35\x87\xd1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x96\x96\x96\x04\x54\x44\x43\x52\x17\x44\x65\x63\x72\x65\x64\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x10\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x2d\x64\x65\x63\x72\x65\x64\x0c\x62\x74\x63\x2d\x74\x64\x63\x72\x2e\x70\x6e\x67",
+    # DigiByte
+    b"\x00\x3f\x01\x08\x00\x00\x00\x1e\x00\x00\x00\x3f\x00\x00\x00\x1e\x44\x9a\x94\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\x14\x00\x09\x77\xe5\x03\x44\x47\x42\x19\x44\x69\x67\x69\x42\x79\x74\x65\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x64\x67\x62\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x64\x67\x62\x2e\x70\x6e\x67",
+    # Dogecoin
+    b"\x00\x01\x00\x08\x00\x00\x00\x1e\x00\x00\x00\x16\x00\x00\x01\x17\x65\x92\xe0\x00\x02\xfa\xca\xfd\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\xdb\xbd\x43\x04\x44\x4f\x47\x45\x19\x44\x6f\x67\x65\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x64\x6f\x67\x65\x2e\x70\x6e\x67",
+    # Elements
+    b"\x01\x3f\x01\x08\x00\x00\x00\xeb\x00\x00\x00\x4b\x00\x00\x00\x00\x00\x98\x96\x80\x04\x35\x87\xcf\x04\x4a\x52\x62\x04\x5f\x1c\xf6\x04\x35\x87\xcf\x04\x35\x87\xcf\x00\x00\x00\x01\x00\xff\xff\xff\x08\x45\x4c\x45\x4d\x45\x4e\x54\x53\x18\x42\x69\x74\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x65\x72\x74\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x10\x62\x74\x63\x2d\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2e\x70\x6e\x67\x00\x00\x00\x04\x02\x65\x6c",
+    # Feathercoin
+    b"\x00\x3f\x01\x08\x00\x00\x00\x0e\x00\x00\x00\x05\x00\x00\x00\x5a\xcd\xcf\xbc\x00\x04\x88\xbc\x26\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xbc\x26\x04\x88\xbc\x26\x00\x00\x00\x08\x00\x54\x7e\x94\x03\x46\x54\x43\x1c\x46\x65\x61\x74\x68\x65\x72\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x02\x66\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x66\x74\x63\x2e\x70\x6e\x67",
+    # Firo
+    b"\x00\x01\x20\x08\x00\x00\x00\x52\x00\x00\x00\x07\x00\x00\x00\x00\x26\x25\xa0\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x00\xad\x23\x36\x04\x46\x49\x52\x4f\x16\x5a\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x66\x69\x72\x6f\x2e\x70\x6e\x67",
+    # Firo Testnet
+    b"\x00\x01\x20\x08\x00\x00\x00\x41\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x0f\x42\x40\x04\x35\x87\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x96\x96\x96\x05\x74\x46\x49\x52\x4f\x16\x5a\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0d\x62\x74\x63\x2d\x74\x66\x69\x72\x6f\x2e\x70\x6e\x67",
+    # Florincoin
+    b"\x00\x3f\x21\x08\x00\x00\x00\x23\x00\x00\x00\x5e\x00\x00\x00\x12\x29\x29\x8c\x00\x00\x17\x49\x21\x01\xb2\x6e\xf6\x04\xb2\x47\x46\x00\x17\x49\x21\x00\x17\x49\x21\x00\x00\x00\xd8\x00\xff\xff\xff\x03\x46\x4c\x4f\x1b\x46\x6c\x6f\x72\x69\x6e\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x66\x6c\x6f\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x66\x6c\x6f\x2e\x70\x6e\x67",
+    # Fujicoin
+    b"\x00\x3f\x03\x08\x00\x00\x00\x24\x00\x00\x00\x10\x00\x00\x1f\xd5\x12\x91\x30\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x02\x95\xb4\x3f\x02\xaa\x7e\xd3\x00\x00\x00\x4b\x00\x44\xae\xea\x03\x46\x4a\x43\x19\x46\x75\x6a\x69\x43\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x02\x66\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x66\x6a\x63\x2e\x70\x6e\x67",
+    # Groestlcoin
+    b"\x00\x3f\x03\x08\x00\x00\x00\x24\x00\x00\x00\x05\x00\x00\x00\x03\xb9\xac\xa0\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\x11\x00\x37\x7e\x96\x03\x47\x52\x53\x1c\x47\x72\x6f\x65\x73\x74\x6c\x43\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x67\x72\x73\x00\x11\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x2d\x67\x72\x6f\x65\x73\x74\x6c\x0b\x62\x74\x63\x2d\x67\x72\x73\x2e\x70\x6e\x67",
+    # Groestlcoin Testnet
+    b"\x00\x3f\x03\x08\x00\x00\x00\x6f\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x01\x86\xa0\x04\x35\x87\xcf\x04\x4a\x52\x62\x04\x5f\x1c\xf6\x04\x35\x87\xcf\x04\x35\x87\xcf\x00\x00\x00\x01\x00\x96\x96\x96\x04\x74\x47\x52\x53\x1c\x47\x72\x6f\x65\x73\x74\x6c\x43\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x04\x74\x67\x72\x73\x00\x11\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x2d\x67\x72\x6f\x65\x73\x74\x6c\x0c\x62\x74\x63\x2d\x74\x67\x72\x73\x2e\x70\x6e\x67",
+    # Komodo
+    b"\x00\x01\xb0\x08\x00\x00\x00\x3c\x00\x00\x00\x55\x00\x00\x00\x01\x1e\x1a\x30\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x2b\x66\x80\x03\x4b\x4d\x44\x17\x4b\x6f\x6d\x6f\x64\x6f\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x6b\x6d\x64\x2e\x70\x6e\x67",
+    # Koto
+    b"\x00\x01\xa0\x08\x00\x00\x18\x36\x00\x00\x18\x3b\x00\x00\x00\x00\x00\x0f\x42\x40\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xfe\x00\xe0\xae\x1b\x04\x4b\x4f\x54\x4f\x15\x4b\x6f\x74\x6f\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x6b\x6f\x74\x6f\x2e\x70\x6e\x67",
+    # Litecoin
+    b"\x00\x3f\x01\x08\x00\x00\x00\x30\x00\x00\x00\x32\x00\x00\x00\x00\x03\xfe\x56\xc0\x01\x9d\xa4\x62\x01\xb2\x6e\xf6\x04\xb2\x47\x46\x01\x9d\xa4\x62\x01\x9d\xa4\x62\x00\x00\x00\x02\x00\x36\x83\xf7\x03\x4c\x54\x43\x19\x4c\x69\x74\x65\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x6c\x74\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x6c\x74\x63\x2e\x70\x6e\x67",
+    # Litecoin Testnet
+    b"\x00\x3f\x01\x08\x00\x00\x00\x6f\x00\x00\x00\x3a\x00\x00\x00\x00\x02\x62\x5a\x00\x04\x35\x87\xcf\x04\x4a\x52\x62\x04\x5f\x1c\xf6\x04\x35\x87\xcf\x04\x35\x87\xcf\x00\x00\x00\x01\x00\x96\x96\x96\x04\x74\x4c\x54\x43\x19\x4c\x69\x74\x65\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x04\x74\x6c\x74\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x74\x6c\x74\x63\x2e\x70\x6e\x67",
+    # Monacoin
+    b"\x00\x3f\x01\x08\x00\x00\x00\x32\x00\x00\x00\x37\x00\x00\x00\x00\x7d\x2b\x75\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\x16\x00\xde\xc7\x99\x04\x4d\x4f\x4e\x41\x19\x4d\x6f\x6e\x61\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x04\x6d\x6f\x6e\x61\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x6d\x6f\x6e\x61\x2e\x70\x6e\x67",
+    # MonetaryUnit
+    b"\x00\x01\x00\x08\x00\x00\x00\x10\x00\x00\x00\x4c\x00\x00\x00\x8b\xb2\xc9\x70\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\xff\x96\x16\x03\x4d\x55\x45\x1d\x4d\x6f\x6e\x65\x74\x61\x72\x79\x55\x6e\x69\x74\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x6d\x75\x65\x2e\x70\x6e\x67",
+    # Namecoin
+    b"\x00\x01\x00\x08\x00\x00\x00\x34\x00\x00\x00\x05\x00\x00\x00\x02\x06\x8f\x77\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x67\x87\xb6\x03\x4e\x4d\x43\x19\x4e\x61\x6d\x65\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x6e\x6d\x63\x2e\x70\x6e\x67",
+    # Neurai
+    b"\x00\x01\x00\x08\x00\x00\x00\x35\x00\x00\x00\x7a\x00\x00\x00\x27\x94\xca\x24\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x6c\x00\x79\x3e\xaa\x03\x58\x4e\x41\x17\x4e\x65\x75\x72\x61\x69\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x78\x6e\x61\x2e\x70\x6e\x67",
+    # Peercoin
+    b"\x00\x3f\x41\x06\x00\x00\x00\x37\x00\x00\x00\x75\x00\x00\x00\x03\x06\xdc\x42\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\x06\x00\x3c\xb0\x54\x03\x50\x50\x43\x19\x50\x65\x65\x72\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x02\x70\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x70\x70\x63\x2e\x70\x6e\x67",
+    # Peercoin Testnet
+    b"\x00\x3f\x41\x06\x00\x00\x00\x6f\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x1e\x84\x80\x04\x35\x87\xcf\x04\x4a\x52\x62\x04\x5f\x1c\xf6\x04\x35\x87\xcf\x04\x35\x87\xcf\x00\x00\x00\x01\x00\x96\x96\x96\x04\x74\x50\x50\x43\x19\x50\x65\x65\x72\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x74\x70\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x74\x70\x70\x63\x2e\x70\x6e\x67",
+    # Primecoin
+    b"\x00\x01\x00\x08\x00\x00\x00\x17\x00\x00\x00\x53\x00\x00\x00\x14\xb8\xd0\x3a\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\xff\xff\xff\x03\x58\x50\x4d\x1a\x50\x72\x69\x6d\x65\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x78\x70\x6d\x2e\x70\x6e\x67",
+    # Qtum
+    b"\x00\x3f\x01\x08\x00\x00\x00\x3a\x00\x00\x00\x32\x00\x00\x00\x00\x3b\x9a\xca\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x08\xfd\x00\xff\xff\xff\x04\x51\x54\x55\x4d\x15\x51\x74\x75\x6d\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x02\x71\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x71\x74\x75\x6d\x2e\x70\x6e\x67",
+    # Qtum Testnet
+    b"\x00\x3f\x01\x08\x00\x00\x00\x78\x00\x00\x00\x6e\x00\x00\x00\x00\x02\x62\x5a\x00\x04\x35\x87\xcf\x04\x4a\x52\x62\x04\x5f\x1c\xf6\x04\x35\x87\xcf\x04\x35\x87\xcf\x00\x00\x00\x01\x00\x96\x96\x96\x05\x74\x51\x54\x55\x4d\x15\x51\x74\x75\x6d\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x02\x74\x71\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0d\x62\x74\x63\x2d\x74\x71\x74\x75\x6d\x2e\x70\x6e\x67",
+    # Ravencoin
+    b"\x00\x01\x00\x08\x00\x00\x00\x3c\x00\x00\x00\x7a\x00\x00\x00\x27\x94\xca\x24\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x00\xff\xff\xff\x03\x52\x56\x4e\x16\x52\x61\x76\x65\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x72\x76\x6e\x2e\x70\x6e\x67",
+    # Ravencoin Testnet
+    b"\x00\x01\x00\x08\x00\x00\x00\x6f\x00\x00\x00\xc4\x00\x00\x00\x27\x94\xca\x24\x00\x04\x35\x87\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x96\x96\x96\x04\x74\x52\x56\x4e\x16\x52\x61\x76\x65\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x74\x72\x76\x6e\x2e\x70\x6e\x67",
+    # Regtest
+    b"\x00\x3e\x03\x08\x00\x00\x00\x6f\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x98\x96\x80\x04\x35\x87\xcf\x04\x4a\x52\x62\x04\x5f\x1c\xf6\x02\x42\x89\xef\x02\x57\x54\x83\x00\x00\x00\x01\x00\xff\xff\xff\x07\x52\x45\x47\x54\x45\x53\x54\x18\x42\x69\x74\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x04\x62\x63\x72\x74\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0f\x62\x74\x63\x2d\x72\x65\x67\x74\x65\x73\x74\x2e\x70\x6e\x67",
+    # Ritocoin
+    b"\x00\x01\x00\x08\x00\x00\x00\x19\x00\x00\x00\x69\x00\x00\x23\x78\x65\x25\x70\x00\x05\x34\xe7\xca\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4a\xe1\x00\xff\xff\xff\x04\x52\x49\x54\x4f\x15\x52\x69\x74\x6f\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x72\x69\x74\x6f\x2e\x70\x6e\x67",
+    # SmartCash
+    b"\x00\x01\x00\x08\x00\x00\x00\x3f\x00\x00\x00\x12\x00\x00\x00\xb5\x9b\x9f\x78\x00\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x00\xfe\xc6\x0d\x05\x53\x4d\x41\x52\x54\x1a\x53\x6d\x61\x72\x74\x43\x61\x73\x68\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x0f\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x2d\x73\x6d\x61\x72\x74\x0d\x62\x74\x63\x2d\x73\x6d\x61\x72\x74\x2e\x70\x6e\x67",
+    # SmartCash Testnet
+    b"\x00\x01\x00\x08\x00\x00\x00\x41\x00\x00\x00\x15\x00\x00\x00\x00\x00\x0f\x42\x40\x04\x35\x87\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x96\x96\x96\x06\x74\x53\x4d\x41\x52\x54\x1a\x53\x6d\x61\x72\x74\x43\x61\x73\x68\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x0f\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x2d\x73\x6d\x61\x72\x74\x0e\x62\x74\x63\x2d\x74\x73\x6d\x61\x72\x74\x2e\x70\x6e\x67",
+    # Stakenet
+    b"\x00\x3f\x21\x08\x00\x00\x00\x4c\x00\x00\x00\x10\x00\x00\x00\x02\x8f\xa6\xae\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\xc7\x00\xff\xff\xff\x03\x58\x53\x4e\x19\x44\x61\x72\x6b\x43\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x02\x78\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x78\x73\x6e\x2e\x70\x6e\x67",
+    # Syscoin
+    b"\x00\x3f\x01\x08\x00\x00\x00\x3f\x00\x00\x00\x05\x00\x00\x00\x09\xc7\x65\x24\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\x39\x00\xff\xff\xff\x03\x53\x59\x53\x18\x53\x79\x73\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x73\x79\x73\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x73\x79\x73\x2e\x70\x6e\x67",
+    # Testnet
+    b"\x00\x3e\x03\x08\x00\x00\x00\x6f\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x98\x96\x80\x04\x35\x87\xcf\x04\x4a\x52\x62\x04\x5f\x1c\xf6\x02\x42\x89\xef\x02\x57\x54\x83\x00\x00\x00\x01\x00\x96\x96\x96\x04\x54\x45\x53\x54\x18\x42\x69\x74\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x02\x74\x62\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x74\x65\x73\x74\x2e\x70\x6e\x67",
+    # Unobtanium
+    b"\x00\x01\x00\x08\x00\x00\x00\x82\x00\x00\x00\x1e\x00\x00\x00\x00\x03\x28\xb7\x40\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5c\x00\xff\xff\xff\x03\x55\x4e\x4f\x1b\x55\x6e\x6f\x62\x74\x61\x6e\x69\x75\x6d\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x75\x6e\x6f\x2e\x70\x6e\x67",
+    # VIPSTARCOIN
+    b"\x00\x3f\x01\x08\x00\x00\x00\x46\x00\x00\x00\x32\x00\x00\x7f\x54\x4a\x44\xc0\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x07\x7f\x00\xff\xff\xff\x04\x56\x49\x50\x53\x1c\x56\x49\x50\x53\x54\x41\x52\x43\x4f\x49\x4e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x04\x76\x69\x70\x73\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0c\x62\x74\x63\x2d\x76\x69\x70\x73\x2e\x70\x6e\x67",
+    # Verge
+    b"\x00\x01\x40\x06\x00\x00\x00\x1e\x00\x00\x00\x21\x00\x00\x00\x80\x0e\x8d\xfc\x00\x02\x2d\x25\x33\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4d\x00\xff\xff\xff\x03\x58\x56\x47\x14\x4e\x61\x6d\x65\x3a\x20\x44\x6f\x67\x65\x63\x6f\x69\x6e\x20\x44\x61\x72\x6b\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x78\x76\x67\x2e\x70\x6e\x67",
+    # Vertcoin
+    b"\x00\x3f\x01\x08\x00\x00\x00\x47\x00\x00\x00\x05\x00\x00\x00\x03\x06\xdc\x42\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\x1c\x00\x04\x86\x57\x03\x56\x54\x43\x19\x56\x65\x72\x74\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x76\x74\x63\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x76\x74\x63\x2e\x70\x6e\x67",
+    # Viacoin
+    b"\x00\x3f\x01\x08\x00\x00\x00\x47\x00\x00\x00\x21\x00\x00\x00\x03\x42\x77\x0c\x00\x04\x88\xb2\x1e\x04\x9d\x7c\xb2\x04\xb2\x47\x46\x04\x88\xb2\x1e\x04\x88\xb2\x1e\x00\x00\x00\x0e\x00\xff\xff\xff\x03\x56\x49\x41\x18\x56\x69\x61\x63\x6f\x69\x6e\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x03\x76\x69\x61\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x76\x69\x61\x2e\x70\x6e\x67",
+    # ZCore
+    b"\x00\x01\x00\x08\x00\x00\x00\x8e\x00\x00\x00\x91\x00\x00\x00\x27\x94\xca\x24\x00\x04\xb2\x47\x46\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xac\x00\xff\xff\xff\x03\x5a\x43\x52\x18\x44\x61\x72\x6b\x4e\x65\x74\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x7a\x63\x72\x2e\x70\x6e\x67",
+    # Zcash
+    b"\x00\x01\xa0\x08\x00\x00\x1c\xb8\x00\x00\x1c\xbd\x00\x00\x00\x00\x03\x0a\x32\xc0\x04\x88\xb2\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x85\x00\xec\xb2\x44\x03\x5a\x45\x43\x16\x5a\x63\x61\x73\x68\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x7a\x65\x63\x2e\x70\x6e\x67",
+    # Zcash Testnet
+    b"\x00\x01\xa0\x08\x00\x00\x1d\x25\x00\x00\x1c\xba\x00\x00\x00\x00\x00\x98\x96\x80\x04\x35\x87\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x96\x96\x96\x03\x54\x41\x5a\x16\x5a\x63\x61\x73\x68\x20\x53\x69\x67\x6e\x65\x64\x20\x4d\x65\x73\x73\x61\x67\x65\x3a\x0a\x00\x00\x09\x73\x65\x63\x70\x32\x35\x36\x6b\x31\x0b\x62\x74\x63\x2d\x74\x61\x7a\x2e\x70\x6e\x67",
+)
+# fmt: on
@@ -1,6 +1,7 @@
 # generated from coininfo.py.mako
 # (by running `make templates` in `core`)
 # do not edit manually!
+from micropython import const
 from typing import Any
 
 from trezor import utils
@@ -9,6 +10,39 @@ from trezor.crypto.scripts import blake256_ripemd160, sha256_ripemd160
 
 # flake8: noqa
 
+# NOTE: coins are stored in constants, which stay in flash and need no per-coin
+# code. _COIN_NAMES is sorted, so that a lookup is a binary search, and
+# _COIN_DATA holds the packed parameters of the coin with the same index:
+# - flags (3 bytes), see the _F_* constants
+# - decimals (1 byte), address_type (4), address_type_p2sh (4), maxfee_kb (8)
+# - xpub_magic and the four optional xpub magics (4 bytes each, 0 if absent)
+# - slip44 (4), fork_id (1, 0 if absent), primary_color (3)
+# - coin_shortcut, signed_message_header, bech32_prefix, cashaddr_prefix,
+#   curve_name and icon, each as a length byte and UTF-8 data (empty if absent)
+# - only with _F_CONFIDENTIAL_ASSETS: address_prefix (4), blech32_prefix
+# All integers are big-endian. A CoinInfo is built on the first lookup of its
+# name and cached while this module is loaded, i.e. for the whole workflow.
+
+_F_SEGWIT = const(1 << 0)
+_F_TAPROOT = const(1 << 1)
+_F_FORCE_BIP143 = const(1 << 2)
+_F_DECRED = const(1 << 3)
+_F_NEGATIVE_FEE = const(1 << 4)
+_F_EXTRA_DATA = const(1 << 5)
+_F_TIMESTAMP = const(1 << 6)
+_F_OVERWINTERED = const(1 << 7)
+_F_ALTCOIN = const(1 << 8)
+_F_XPUB_SEGWIT_P2SH = const(1 << 9)
+_F_XPUB_SEGWIT_NATIVE = const(1 << 10)
+_F_XPUB_MULTISIG_SEGWIT_P2SH = const(1 << 11)
+_F_XPUB_MULTISIG_SEGWIT_NATIVE = const(1 << 12)
+_F_BECH32_PREFIX = const(1 << 13)
+_F_CASHADDR_PREFIX = const(1 << 14)
+_F_FORK_ID = const(1 << 15)
+_F_CONFIDENTIAL_ASSETS = const(1 << 16)
+
+_STRINGS_OFFSET = const(48)
+
 
 class CoinInfo:
     def __init__(
@@ -93,72 +127,172 @@ class CoinInfo:
         return self.coin_name == other.coin_name
 
 
-# fmt: off
 <%
-def hexfmt(x):
-    if x is None:
-        return None
-    else:
-        return "0x{:08x}".format(x)
-
-def optional_dict(x):
-    if x is None:
-        return None
-    return dict(x)
-
-ATTRIBUTES = (
-    ("coin_name", lambda _: "name"),
-    ("coin_shortcut", black_repr),
-    ("decimals", int),
-    ("address_type", int),
-    ("address_type_p2sh", int),
-    ("maxfee_kb", int),
-    ("signed_message_header", black_repr),
-    ("xpub_magic", hexfmt),
-    ("xpub_magic_segwit_p2sh", hexfmt),
-    ("xpub_magic_segwit_native", hexfmt),
-    ("xpub_magic_multisig_segwit_p2sh", hexfmt),
-    ("xpub_magic_multisig_segwit_native", hexfmt),
-    ("bech32_prefix", black_repr),
-    ("cashaddr_prefix", black_repr),
-    ("slip44", int),
-    ("segwit", bool),
-    ("taproot", bool),
-    ("fork_id", black_repr),
-    ("force_bip143", bool),
-    ("decred", bool),
-    ("negative_fee", bool),
-    ("curve_name", lambda r: repr(r.replace("_", "-"))),
-    ("extra_data", bool),
-    ("timestamp", bool),
-    ("overwintered", bool),
-    ("confidential_assets", optional_dict),
-    ("icon", black_repr),
-    ("primary_color", lambda i: "0x{:06X}".format(i))
+FLAGS = (
+    "segwit",
+    "taproot",
+    "force_bip143",
+    "decred",
+    "negative_fee",
+    "extra_data",
+    "timestamp",
+    "overwintered",
+)
+OPTIONAL_XPUB_MAGICS = (
+    "xpub_magic_segwit_p2sh",
+    "xpub_magic_segwit_native",
+    "xpub_magic_multisig_segwit_p2sh",
+    "xpub_magic_multisig_segwit_native",
 )
 
 btc_names = ["Bitcoin", "Testnet", "Regtest"]
 
-coins_btc = [c for c in supported_on("trezor2", bitcoin) if c.name in btc_names]
-coins_alt = [c for c in supported_on("trezor2", bitcoin) if c.name not in btc_names]
+coins = sorted(supported_on("trezor2", bitcoin), key=lambda c: c["coin_name"])
+
+def uint(value, length):
+    return (value or 0).to_bytes(length, "big")
+
+def string(value):
+    data = (value or "").encode()
+    assert len(data) < 256
+    return bytes([len(data)]) + data
 
+def pack(coin):
+    flags = 0
+    for i, attr in enumerate(FLAGS):
+        if coin[attr]:
+            flags |= 1 << i
+    if coin["coin_name"] not in btc_names:
+        flags |= 1 << 8
+    for i, attr in enumerate(OPTIONAL_XPUB_MAGICS + ("bech32_prefix", "cashaddr_prefix", "fork_id", "confidential_assets")):
+        if coin[attr] is not None:
+            flags |= 1 << (9 + i)
+
+    data = uint(flags, 3) + uint(coin["decimals"], 1)
+    data += uint(coin["address_type"], 4) + uint(coin["address_type_p2sh"], 4)
+    data += uint(coin["maxfee_kb"], 8) + uint(coin["xpub_magic"], 4)
+    for attr in OPTIONAL_XPUB_MAGICS:
+        data += uint(coin[attr], 4)
+    data += uint(coin["slip44"], 4) + uint(coin["fork_id"], 1)
+    data += uint(coin["primary_color"], 3)
+    assert len(data) == 48
+    for value in (
+        coin["coin_shortcut"],
+        coin["signed_message_header"],
+        coin["bech32_prefix"],
+        coin["cashaddr_prefix"],
+        coin["curve_name"].replace("_", "-"),
+        coin["icon"],
+    ):
+        data += string(value)
+    assets = coin["confidential_assets"]
+    if assets is not None:
+        assert set(assets) == {"address_prefix", "blech32_prefix"}
+        data += uint(assets["address_prefix"], 4) + string(assets["blech32_prefix"])
+    return data
 %>\
+_cache: dict[str, CoinInfo] = {}
+
+
 def by_name(name: str) -> CoinInfo:
-% for coin in coins_btc:
-    if name == ${black_repr(coin["coin_name"])}:
-        return CoinInfo(
-            % for attr, func in ATTRIBUTES:
-            ${attr}=${func(coin[attr])},
-            % endfor
-        )
+    coin = _cache.get(name)
+    if coin is None:
+        coin = _decode(name, _COIN_DATA[_find(name)])
+        _cache[name] = coin
+    return coin
+
+
+def _find(name: str) -> int:
+    # binary search of the index of `name` in _COIN_NAMES
+    lo = 0
+    hi = len(_COIN_NAMES)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _COIN_NAMES[mid] < name:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo == len(_COIN_NAMES) or _COIN_NAMES[lo] != name:
+        raise ValueError  # Unknown coin name
+    return lo
+
+
+def _uint(data: bytes, start: int, end: int) -> int:
+    return int.from_bytes(data[start:end], "big")
+
+
+def _optional(data: bytes, flags: int, flag: int, start: int) -> int | None:
+    # optional 4-byte value
+    return _uint(data, start, start + 4) if flags & flag else None
+
+
+def _decode(name: str, data: bytes) -> CoinInfo:
+    flags = _uint(data, 0, 3)
+    if utils.BITCOIN_ONLY and flags & _F_ALTCOIN:
+        raise ValueError  # Unknown coin name
+
+    strings = []
+    pos = _STRINGS_OFFSET
+    for _ in range(6):
+        end = pos + 1 + data[pos]
+        strings.append(data[pos + 1 : end].decode())
+        pos = end
+    shortcut, header, bech32_prefix, cashaddr_prefix, curve_name, icon = strings
+
+    confidential_assets = None
+    if flags & _F_CONFIDENTIAL_ASSETS:
+        confidential_assets = {
+            "address_prefix": _uint(data, pos, pos + 4),
+            "blech32_prefix": data[pos + 5 : pos + 5 + data[pos + 4]].decode(),
+        }
+
+    return CoinInfo(
+        coin_name=name,
+        coin_shortcut=shortcut,
+        decimals=data[3],
+        address_type=_uint(data, 4, 8),
+        address_type_p2sh=_uint(data, 8, 12),
+        maxfee_kb=_uint(data, 12, 20),
+        signed_message_header=header,
+        xpub_magic=_uint(data, 20, 24),
+        xpub_magic_segwit_p2sh=_optional(data, flags, _F_XPUB_SEGWIT_P2SH, 24),
+        xpub_magic_segwit_native=_optional(data, flags, _F_XPUB_SEGWIT_NATIVE, 28),
+        xpub_magic_multisig_segwit_p2sh=_optional(
+            data, flags, _F_XPUB_MULTISIG_SEGWIT_P2SH, 32
+        ),
+        xpub_magic_multisig_segwit_native=_optional(
+            data, flags, _F_XPUB_MULTISIG_SEGWIT_NATIVE, 36
+        ),
+        bech32_prefix=bech32_prefix if flags & _F_BECH32_PREFIX else None,
+        cashaddr_prefix=cashaddr_prefix if flags & _F_CASHADDR_PREFIX else None,
+        slip44=_uint(data, 40, 44),
+        segwit=bool(flags & _F_SEGWIT),
+        taproot=bool(flags & _F_TAPROOT),
+        fork_id=data[44] if flags & _F_FORK_ID else None,
+        force_bip143=bool(flags & _F_FORCE_BIP143),
+        decred=bool(flags & _F_DECRED),
+        negative_fee=bool(flags & _F_NEGATIVE_FEE),
+        curve_name=curve_name,
+        extra_data=bool(flags & _F_EXTRA_DATA),
+        timestamp=bool(flags & _F_TIMESTAMP),
+        overwintered=bool(flags & _F_OVERWINTERED),
+        confidential_assets=confidential_assets,
+        icon=icon,
+        primary_color=_uint(data, 45, 48),
+    )
+
+
+# fmt: off
+_COIN_NAMES = (
+% for coin in coins:
+    ${black_repr(coin["coin_name"])},
 % endfor
-    if not utils.BITCOIN_ONLY:
-% for coin in coins_alt:
-        if name == ${black_repr(coin["coin_name"])}:
-            return CoinInfo(
-                % for attr, func in ATTRIBUTES:
-                ${attr}=${func(coin[attr])},
-                % endfor
-            )
+)
+
+_COIN_DATA = (
+% for coin in coins:
+    # ${coin["coin_name"] | ascii}
+    ${black_repr(pack(coin))},
 % endfor
-    raise ValueError  # Unknown coin name
+)
+# fmt: on
@@ -47,36 +47,92 @@ if TYPE_CHECKING:
 FORBIDDEN_KEY_PATH = wire.DataError("Forbidden key path")
 
 
+# number of derived nodes a keychain keeps by default
+DEFAULT_CACHE_SIZE = 10
+
+if __debug__:
+    # hits, misses and evictions of all keychain caches released so far
+    _cache_stats = [0, 0, 0]
+
+    def cache_stats() -> tuple[int, int, int]:
+        return _cache_stats[0], _cache_stats[1], _cache_stats[2]
+
+
+# indices into the links of LRUCache
+_PREV = 0
+_NEXT = 1
+_KEY = 2
+_VALUE = 3
+
+
 class LRUCache:
+    """Least-recently-used cache with constant-time `get` and `insert`.
+
+    Entries are links `[prev, next, key, value]` of a circular doubly linked
+    list, most recently used first, looked up through a dict.
+    """
+
     def __init__(self, size: int) -> None:
         self.size = size
-        self.cache_keys: list[Any] = []
-        self.cache: dict[Any, Deletable] = {}
+        self.cache: dict[Any, list[Any]] = {}
+        self.root: list[Any] = []
+        self.root.extend((self.root, self.root, None, None))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _unlink(self, link: list[Any]) -> None:
+        link[_PREV][_NEXT] = link[_NEXT]
+        link[_NEXT][_PREV] = link[_PREV]
+
+    def _link_front(self, link: list[Any]) -> None:
+        root = self.root
+        first = root[_NEXT]
+        link[_PREV] = root
+        link[_NEXT] = first
+        first[_PREV] = link
+        root[_NEXT] = link
 
     def insert(self, key: Any, value: Deletable) -> None:
-        if key in self.cache_keys:
-            self.cache_keys.remove(key)
-        self.cache_keys.insert(0, key)
-        self.cache[key] = value
+        link = self.cache.get(key)
+        if link is not None:
+            self._unlink(link)
+            link[_VALUE] = value
+        else:
+            link = [None, None, key, value]
+            self.cache[key] = link
+        self._link_front(link)
 
-        if len(self.cache_keys) > self.size:
-            dropped_key = self.cache_keys.pop()
-            self.cache[dropped_key].__del__()
-            del self.cache[dropped_key]
+        if len(self.cache) > self.size:
+            last = self.root[_PREV]
+            self._unlink(last)
+            del self.cache[last[_KEY]]
+            last[_VALUE].__del__()
+            self.evictions += 1
 
     def get(self, key: Any) -> Any:
-        if key not in self.cache:
+        link = self.cache.get(key)
+        if link is None:
+            self.misses += 1
             return None
 
-        self.cache_keys.remove(key)
-        self.cache_keys.insert(0, key)
-        return self.cache[key]
+        self.hits += 1
+        if self.root[_NEXT] is not link:
+            self._unlink(link)
+            self._link_front(link)
+        return link[_VALUE]
 
     def __del__(self) -> None:
-        for value in self.cache.values():
-            value.__del__()
+        if __debug__:
+            _cache_stats[0] += self.hits
+            _cache_stats[1] += self.misses
+            _cache_stats[2] += self.evictions
+        for link in self.cache.values():
+            link[_VALUE].__del__()
+            # break the reference cycles of the list
+            link.clear()
         self.cache.clear()
-        self.cache_keys.clear()
+        self.root.clear()
         del self.cache
 
 
@@ -87,13 +143,14 @@ class Keychain:
         curve: str,
         schemas: Iterable[paths.PathSchemaType],
         slip21_namespaces: Iterable[paths.Slip21Path] = (),
+        cache_size: int = DEFAULT_CACHE_SIZE,
     ) -> None:
         self.seed = seed
         self.curve = curve
         self.schemas = tuple(schemas)
         self.slip21_namespaces = tuple(slip21_namespaces)
 
-        self._cache = LRUCache(10)
+        self._cache = LRUCache(cache_size)
         self._root_fingerprint: int | None = None
 
     def __del__(self) -> None:
@@ -191,13 +248,14 @@ async def get_keychain(
     curve: str,
     schemas: Iterable[paths.PathSchemaType],
     slip21_namespaces: Iterable[paths.Slip21Path] = (),
+    cache_size: int = DEFAULT_CACHE_SIZE,
 ) -> Keychain:
     if utils.USE_THD89:
         await get_seed(ctx)
-        keychain = Keychain(b"", curve, schemas, slip21_namespaces)
+        keychain = Keychain(b"", curve, schemas, slip21_namespaces, cache_size)
     else:
         seed = await get_seed(ctx)
-        keychain = Keychain(seed, curve, schemas, slip21_namespaces)
+        keychain = Keychain(seed, curve, schemas, slip21_namespaces, cache_size)
     return keychain
 
 
@@ -206,6 +264,7 @@ def with_slip44_keychain(
     slip44_id: int,
     curve: str = "secp256k1",
     allow_testnet: bool = True,
+    cache_size: int = DEFAULT_CACHE_SIZE,
 ) -> Callable[[HandlerWithKeychain[MsgIn, MsgOut]], Handler[MsgIn, MsgOut]]:
     if not patterns:
         raise ValueError  # specify a pattern
@@ -222,7 +281,7 @@ def with_slip44_keychain(
 
     def decorator(func: HandlerWithKeychain[MsgIn, MsgOut]) -> Handler[MsgIn, MsgOut]:
         async def wrapper(ctx: wire.Context, msg: MsgIn) -> MsgOut:
-            keychain = await get_keychain(ctx, curve, schemas)
+            keychain = await get_keychain(ctx, curve, schemas, cache_size=cache_size)
             with keychain:
                 return await func(ctx, msg, keychain)
 
@@ -232,7 +291,9 @@ def with_slip44_keychain(
 
 
 def auto_keychain(
-    modname: str, allow_testnet: bool = True
+    modname: str,
+    allow_testnet: bool = True,
+    cache_size: int = DEFAULT_CACHE_SIZE,
 ) -> Callable[[HandlerWithKeychain[MsgIn, MsgOut]], Handler[MsgIn, MsgOut]]:
     rdot = modname.rfind(".")
     parent_modname = modname[:rdot]
@@ -243,5 +304,9 @@ def auto_keychain(
     slip44_id = getattr(parent_module, "SLIP44_ID")
     pattern = pattern if isinstance(pattern, tuple) else (pattern,)
     return with_slip44_keychain(
-        *pattern, slip44_id=slip44_id, curve=curve, allow_testnet=allow_testnet
+        *pattern,
+        slip44_id=slip44_id,
+        curve=curve,
+        allow_testnet=allow_testnet,
+        cache_size=cache_size,
     )
@@ -163,13 +163,18 @@ if __debug__:
         ctx: wire.Context, msg: DebugLinkGetState
     ) -> DebugLinkState | None:
         from trezor.messages import DebugLinkState
-        from apps.common import mnemonic, passphrase
+        from apps.common import keychain, mnemonic, passphrase
 
         m = DebugLinkState()
         m.mnemonic_secret = mnemonic.get_secret()
         m.mnemonic_type = mnemonic.get_type()
         m.passphrase_protection = passphrase.is_enabled()
         m.reset_entropy = storage.reset_internal_entropy
+        (
+            m.keychain_cache_hits,
+            m.keychain_cache_misses,
+            m.keychain_cache_evictions,
+        ) = keychain.cache_stats()
 
         if msg.wait_layout:
             if not storage.watch_layout_changes:
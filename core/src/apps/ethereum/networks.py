@@ -2,9 +2,17 @@
 # (by running `make templates` in `core`)
 # do not edit manually!
 
-# NOTE: using positional arguments saves 4400 bytes in flash size,
-# returning tuples instead of classes saved 800 bytes
+# NOTE: networks are stored in bytes constants, which stay in flash and need
+# no per-network objects. Lookups are binary searches over fixed-size records:
+# - _NETWORKS: chain_id (8 bytes), slip44 (4 bytes) and the offset of the
+#   network's entry in _NETWORK_DATA (2 bytes), sorted by chain_id
+# - _SLIP44_INDEX: slip44 (4 bytes) and the number of the network in
+#   _NETWORKS (2 bytes), sorted by slip44 and then chain_id
+# - _NETWORK_DATA: primary color (3 bytes), lengths of the symbol, name and
+#   icon (1 byte each), followed by the UTF-8 symbol, name and icon
+# All integers are big-endian.
 
+from micropython import const
 from typing import TYPE_CHECKING
 
 from trezor.messages import EthereumNetworkInfo
@@ -14,17 +22,10 @@ from apps.common.paths import HARDENED
 if TYPE_CHECKING:
     from typing import Iterator
 
-    # Removing the necessity to construct object to save space
-    # fmt: off
-    NetworkInfoTuple = tuple[
-        int,  # chain_id
-        int,  # slip44
-        str,  # symbol
-        str,  # name
-        str,  # icon
-        int,  # primary_color
-    ]
-    # fmt: on
+_CHAIN_ID_LEN = const(8)
+_SLIP44_LEN = const(4)
+_NETWORK_LEN = const(14)
+_SLIP44_RECORD_LEN = const(6)
 
 UNKNOWN_NETWORK = EthereumNetworkInfo(
     chain_id=0,
@@ -40,1823 +41,739 @@ def shortcut_by_chain_id(chain_id: int) -> str:
 
 
 def all_slip44_ids_hardened() -> Iterator[int]:
-    for n in _networks_iterator():
-        yield n[1] | HARDENED
+    for pos in range(_CHAIN_ID_LEN, len(_NETWORKS), _NETWORK_LEN):
+        yield int.from_bytes(_NETWORKS[pos : pos + _SLIP44_LEN], "big") | HARDENED
 
 
 def by_chain_id(chain_id: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_chain_id = n[0]
-        if n_chain_id == chain_id:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    if chain_id < 0 or chain_id >> 64:
+        return UNKNOWN_NETWORK
+    key = chain_id.to_bytes(_CHAIN_ID_LEN, "big")
+    pos = _lower_bound(_NETWORKS, _NETWORK_LEN, key)
+    if _NETWORKS[pos : pos + _CHAIN_ID_LEN] != key:
+        return UNKNOWN_NETWORK
+    return _network_at(pos)
 
 
 def by_slip44(slip44: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_slip44 = n[1]
-        if n_slip44 == slip44:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    if slip44 < 0 or slip44 >> 32:
+        return UNKNOWN_NETWORK
+    key = slip44.to_bytes(_SLIP44_LEN, "big")
+    pos = _lower_bound(_SLIP44_INDEX, _SLIP44_RECORD_LEN, key)
+    if _SLIP44_INDEX[pos : pos + _SLIP44_LEN] != key:
+        return UNKNOWN_NETWORK
+    number = (_SLIP44_INDEX[pos + 4] << 8) | _SLIP44_INDEX[pos + 5]
+    return _network_at(number * _NETWORK_LEN)
 
 
-# fmt: off
-def _networks_iterator() -> Iterator[NetworkInfoTuple]:
-    yield (
-        1,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Ethereum",  # name
-        "evm-eth.png",  # name
-        0x637FFF,  # primary_color
-    )
-    yield (
-        2,  # chain_id
-        40,  # slip44
-        "EXP",  # symbol
-        "Expanse Network",  # name
-        "evm-exp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Ropsten",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        4,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Rinkeby",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        5,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Goerli",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        6,  # chain_id
-        1,  # slip44
-        "tKOT",  # symbol
-        "Kotti Testnet",  # name
-        "evm-tkot.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        7,  # chain_id
-        60,  # slip44
-        "TCH",  # symbol
-        "ThaiChain",  # name
-        "evm-tch.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8,  # chain_id
-        108,  # slip44
-        "UBQ",  # symbol
-        "Ubiq",  # name
-        "evm-ubq.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9,  # chain_id
-        1,  # slip44
-        "TUBQ",  # symbol
-        "Ubiq Network Testnet",  # name
-        "evm-tubq.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        10,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "OP",  # name
-        "evm-oeth.png",  # name
-        0xFF0420,  # primary_color
-    )
-    yield (
-        11,  # chain_id
-        916,  # slip44
-        "META",  # symbol
-        "Metadium",  # name
-        "evm-meta.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        12,  # chain_id
-        1,  # slip44
-        "tKAL",  # symbol
-        "Metadium Testnet",  # name
-        "evm-tkal.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        13,  # chain_id
-        1,  # slip44
-        "tsDIODE",  # symbol
-        "Diode Testnet Staging",  # name
-        "evm-tsdiode.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        14,  # chain_id
-        60,  # slip44
-        "FLR",  # symbol
-        "Flare",  # name
-        "evm-flr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        15,  # chain_id
-        60,  # slip44
-        "DIODE",  # symbol
-        "Diode Prenet",  # name
-        "evm-diode.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        16,  # chain_id
-        1,  # slip44
-        "tCFLR",  # symbol
-        "Songbird Testnet Coston",  # name
-        "evm-tcflr.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        17,  # chain_id
-        60,  # slip44
-        "TFI",  # symbol
-        "ThaiChain 2.0 ThaiFi",  # name
-        "evm-tfi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        18,  # chain_id
-        1,  # slip44
-        "TST",  # symbol
-        "ThunderCore Testnet",  # name
-        "evm-tst.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        19,  # chain_id
-        60,  # slip44
-        "SGB",  # symbol
-        "Songbird Canary-Network",  # name
-        "evm-sgb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        20,  # chain_id
-        60,  # slip44
-        "ELA",  # symbol
-        "Elastos Smart Chain",  # name
-        "evm-ela.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        25,  # chain_id
-        60,  # slip44
-        "CRO",  # symbol
-        "Cronos",  # name
-        "evm-cro.png",  # name
-        0x1199FA,  # primary_color
-    )
-    yield (
-        27,  # chain_id
-        60,  # slip44
-        "SHIB",  # symbol
-        "ShibaChain",  # name
-        "evm-shib.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        29,  # chain_id
-        60,  # slip44
-        "L1",  # symbol
-        "Genesis L1",  # name
-        "evm-l1.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        30,  # chain_id
-        137,  # slip44
-        "RBTC",  # symbol
-        "Rootstock",  # name
-        "evm-rbtc.png",  # name
-        0xFF9100,  # primary_color
-    )
-    yield (
-        31,  # chain_id
-        1,  # slip44
-        "tRBTC",  # symbol
-        "Rootstock Testnet",  # name
-        "evm-trbtc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        33,  # chain_id
-        60,  # slip44
-        "GooD",  # symbol
-        "GoodData",  # name
-        "evm-good.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        35,  # chain_id
-        60,  # slip44
-        "TBG",  # symbol
-        "TBWG Chain",  # name
-        "evm-tbg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        38,  # chain_id
-        538,  # slip44
-        "VAL",  # symbol
-        "Valorbit",  # name
-        "evm-val.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        40,  # chain_id
-        60,  # slip44
-        "TLOS",  # symbol
-        "Telos EVM",  # name
-        "evm-tlos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        44,  # chain_id
-        60,  # slip44
-        "CRAB",  # symbol
-        "Crab Network",  # name
-        "evm-crab.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        50,  # chain_id
-        60,  # slip44
-        "XDC",  # symbol
-        "XDC Network",  # name
-        "evm-xdc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        51,  # chain_id
-        60,  # slip44
-        "TXDC",  # symbol
-        "XDC Apothem Network",  # name
-        "evm-txdc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        52,  # chain_id
-        60,  # slip44
-        "cet",  # symbol
-        "CoinEx Smart Chain",  # name
-        "evm-cet.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        55,  # chain_id
-        60,  # slip44
-        "ZYX",  # symbol
-        "Zyx",  # name
-        "evm-zyx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        56,  # chain_id
-        714,  # slip44
-        "BNB",  # symbol
-        "BNB Smart Chain",  # name
-        "evm-bnb.png",  # name
-        0xF0B90B,  # primary_color
-    )
-    yield (
-        58,  # chain_id
-        60,  # slip44
-        "ONG",  # symbol
-        "Ontology",  # name
-        "evm-ong.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        60,  # chain_id
-        6060,  # slip44
-        "GO",  # symbol
-        "GoChain",  # name
-        "evm-go.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        61,  # chain_id
-        61,  # slip44
-        "ETC",  # symbol
-        "Ethereum Classic",  # name
-        "evm-etc.png",  # name
-        0x328332,  # primary_color
-    )
-    yield (
-        62,  # chain_id
-        1,  # slip44
-        "TETC",  # symbol
-        "Morden Testnet",  # name
-        "evm-tetc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        63,  # chain_id
-        1,  # slip44
-        "tMETC",  # symbol
-        "Mordor Testnet",  # name
-        "evm-tmetc.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        64,  # chain_id
-        163,  # slip44
-        "ELLA",  # symbol
-        "Ellaism",  # name
-        "evm-ella.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        66,  # chain_id
-        60,  # slip44
-        "OKT",  # symbol
-        "OKXChain",  # name
-        "evm-okt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        67,  # chain_id
-        1,  # slip44
-        "tDBM",  # symbol
-        "DBChain Testnet",  # name
-        "evm-tdbm.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        74,  # chain_id
-        60,  # slip44
-        "EIDI",  # symbol
-        "IDChain",  # name
-        "evm-eidi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        76,  # chain_id
-        76,  # slip44
-        "MIX",  # symbol
-        "Mix",  # name
-        "evm-mix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        77,  # chain_id
-        60,  # slip44
-        "SPOA",  # symbol
-        "POA Network Sokol",  # name
-        "evm-spoa.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        78,  # chain_id
-        60,  # slip44
-        "PETH",  # symbol
-        "PrimusChain",  # name
-        "evm-peth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        80,  # chain_id
-        60,  # slip44
-        "RNA",  # symbol
-        "GeneChain",  # name
-        "evm-rna.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        82,  # chain_id
-        60,  # slip44
-        "MTR",  # symbol
-        "Meter",  # name
-        "evm-mtr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        87,  # chain_id
-        60,  # slip44
-        "SNT",  # symbol
-        "Nova Network",  # name
-        "evm-snt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        88,  # chain_id
-        889,  # slip44
-        "VIC",  # symbol
-        "Viction",  # name
-        "evm-vic.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        90,  # chain_id
-        60,  # slip44
-        "GAR",  # symbol
-        "Garizon Stage0",  # name
-        "evm-gar.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        97,  # chain_id
-        1,  # slip44
-        "tBNB",  # symbol
-        "BNB Smart Chain Testnet",  # name
-        "evm-tbnb.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        99,  # chain_id
-        178,  # slip44
-        "POA",  # symbol
-        "POA Network Core",  # name
-        "evm-poa.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100,  # chain_id
-        700,  # slip44
-        "XDAI",  # symbol
-        "Gnosis",  # name
-        "evm-xdai.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        101,  # chain_id
-        464,  # slip44
-        "ETI",  # symbol
-        "EtherInc",  # name
-        "evm-eti.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        105,  # chain_id
-        60,  # slip44
-        "W3G",  # symbol
-        "Web3Games Devnet",  # name
-        "evm-w3g.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        106,  # chain_id
-        60,  # slip44
-        "VLX",  # symbol
-        "Velas EVM",  # name
-        "evm-vlx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        108,  # chain_id
-        1001,  # slip44
-        "TT",  # symbol
-        "ThunderCore",  # name
-        "evm-tt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        111,  # chain_id
-        60,  # slip44
-        "ETL",  # symbol
-        "EtherLite Chain",  # name
-        "evm-etl.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        122,  # chain_id
-        60,  # slip44
-        "FUSE",  # symbol
-        "Fuse",  # name
-        "evm-fuse.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        123,  # chain_id
-        60,  # slip44
-        "SPARK",  # symbol
-        "Fuse Sparknet",  # name
-        "evm-spark.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        124,  # chain_id
-        60,  # slip44
-        "DWU",  # symbol
-        "Decentralized Web",  # name
-        "evm-dwu.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        126,  # chain_id
-        126,  # slip44
-        "OY",  # symbol
-        "OYchain",  # name
-        "evm-oy.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        127,  # chain_id
-        127,  # slip44
-        "FETH",  # symbol
-        "Factory 127",  # name
-        "evm-feth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        128,  # chain_id
-        1010,  # slip44
-        "HT",  # symbol
-        "Huobi ECO Chain",  # name
-        "evm-ht.png",  # name
-        0x01943F,  # primary_color
-    )
-    yield (
-        137,  # chain_id
-        966,  # slip44
-        "POL",  # symbol
-        "Polygon",  # name
-        "evm-matic.png",  # name
-        0x8247E5,  # primary_color
-    )
-    yield (
-        142,  # chain_id
-        60,  # slip44
-        "DAX",  # symbol
-        "DAX CHAIN",  # name
-        "evm-dax.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        146,  # chain_id
-        60,  # slip44
-        "S",  # symbol
-        "Sonic",  # name
-        "evm-s.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        162,  # chain_id
-        1,  # slip44
-        "tPHT",  # symbol
-        "Lightstreams Testnet",  # name
-        "evm-tpht.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        163,  # chain_id
-        60,  # slip44
-        "PHT",  # symbol
-        "Lightstreams",  # name
-        "evm-pht.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        177,  # chain_id
-        60,  # slip44
-        "HSK",  # symbol
-        "HashKey Chain",  # name
-        "evm-hsk.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        186,  # chain_id
-        60,  # slip44
-        "Seele",  # symbol
-        "Seele",  # name
-        "evm-seele.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        188,  # chain_id
-        60,  # slip44
-        "BTM",  # symbol
-        "BMC",  # name
-        "evm-btm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        199,  # chain_id
-        60,  # slip44
-        "BTT",  # symbol
-        "BitTorrent Chain",  # name
-        "evm-btt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        211,  # chain_id
-        60,  # slip44
-        "0xF",  # symbol
-        "Freight Trust Network",  # name
-        "evm-0xf.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        222,  # chain_id
-        2221,  # slip44
-        "ASK",  # symbol
-        "Permission",  # name
-        "evm-ask.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        225,  # chain_id
-        60,  # slip44
-        "LA",  # symbol
-        "LACHAIN",  # name
-        "evm-la.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246,  # chain_id
-        246,  # slip44
-        "EWT",  # symbol
-        "Energy Web Chain",  # name
-        "evm-ewt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        250,  # chain_id
-        60,  # slip44
-        "FTM",  # symbol
-        "Fantom Opera",  # name
-        "evm-ftm.png",  # name
-        0x1969FF,  # primary_color
-    )
-    yield (
-        256,  # chain_id
-        1,  # slip44
-        "thtt",  # symbol
-        "Huobi ECO Chain Testnet",  # name
-        "evm-thtt.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        258,  # chain_id
-        60,  # slip44
-        "SETM",  # symbol
-        "Setheum",  # name
-        "evm-setm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        262,  # chain_id
-        60,  # slip44
-        "SRN",  # symbol
-        "SUR Blockchain Network",  # name
-        "evm-srn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        269,  # chain_id
-        269,  # slip44
-        "HPB",  # symbol
-        "High Performance Blockchain",  # name
-        "evm-hpb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        288,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Boba Network",  # name
-        "evm-boba.png",  # name
-        0xCCFF00,  # primary_color
-    )
-    yield (
-        314,  # chain_id
-        461,  # slip44
-        "FIL",  # symbol
-        "Filecoin",  # name
-        "evm-filecoin.png",  # name
-        0x0090FF,  # primary_color
-    )
-    yield (
-        321,  # chain_id
-        641,  # slip44
-        "KCS",  # symbol
-        "KCC",  # name
-        "evm-kcs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        324,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "zkSync",  # name
-        "evm-zksync-era.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        333,  # chain_id
-        60,  # slip44
-        "W3Q",  # symbol
-        "Web3Q",  # name
-        "evm-w3q.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        336,  # chain_id
-        60,  # slip44
-        "SDN",  # symbol
-        "Shiden",  # name
-        "evm-sdn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        369,  # chain_id
-        60,  # slip44
-        "PLS",  # symbol
-        "PulseChain",  # name
-        "evm-pls.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        420,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Optimism Goerli Testnet",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        499,  # chain_id
-        499,  # slip44
-        "RUPX",  # symbol
-        "Rupaya",  # name
-        "evm-rupx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        512,  # chain_id
-        1512,  # slip44
-        "AAC",  # symbol
-        "Double-A Chain",  # name
-        "evm-aac.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        555,  # chain_id
-        60,  # slip44
-        "CLASS",  # symbol
-        "Vela1 Chain",  # name
-        "evm-class.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        558,  # chain_id
-        60,  # slip44
-        "TAO",  # symbol
-        "Tao Network",  # name
-        "evm-tao.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        595,  # chain_id
-        1,  # slip44
-        "tmACA",  # symbol
-        "Acala Mandala Testnet TC9",  # name
-        "evm-tmaca.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        686,  # chain_id
-        686,  # slip44
-        "KAR",  # symbol
-        "Karura Network",  # name
-        "evm-kar.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        707,  # chain_id
-        60,  # slip44
-        "BCS",  # symbol
-        "BlockChain Station",  # name
-        "evm-bcs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        777,  # chain_id
-        60,  # slip44
-        "cTH",  # symbol
-        "cheapETH",  # name
-        "evm-cth.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        787,  # chain_id
-        787,  # slip44
-        "ACA",  # symbol
-        "Acala Network",  # name
-        "evm-aca.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        803,  # chain_id
-        60,  # slip44
-        "HAIC",  # symbol
-        "Haic",  # name
-        "evm-haic.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        820,  # chain_id
-        820,  # slip44
-        "CLO",  # symbol
-        "Callisto",  # name
-        "evm-clo.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        821,  # chain_id
-        1,  # slip44
-        "TCLO",  # symbol
-        "Callisto Testnet Deprecated",  # name
-        "evm-tclo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        888,  # chain_id
-        5718350,  # slip44
-        "WAN",  # symbol
-        "Wanchain",  # name
-        "evm-wan.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        977,  # chain_id
-        60,  # slip44
-        "YETI",  # symbol
-        "Nepal Blockchain Network",  # name
-        "evm-yeti.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        998,  # chain_id
-        60,  # slip44
-        "L99",  # symbol
-        "Lucky Network",  # name
-        "evm-l99.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1001,  # chain_id
-        1,  # slip44
-        "tKAIA",  # symbol
-        "Kaia Kairos Testnet",  # name
-        "evm-tkaia.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1007,  # chain_id
-        1,  # slip44
-        "tNEW",  # symbol
-        "Newton Testnet",  # name
-        "evm-tnew.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1010,  # chain_id
-        1020,  # slip44
-        "EVC",  # symbol
-        "Evrice Network",  # name
-        "evm-evc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1012,  # chain_id
-        60,  # slip44
-        "NEW",  # symbol
-        "Newton",  # name
-        "evm-new.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1022,  # chain_id
-        60,  # slip44
-        "SKU",  # symbol
-        "Sakura",  # name
-        "evm-sku.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1024,  # chain_id
-        60,  # slip44
-        "CLV",  # symbol
-        "CLV Parachain",  # name
-        "evm-clv.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1030,  # chain_id
-        60,  # slip44
-        "CFX",  # symbol
-        "Conflux eSpace",  # name
-        "evm-cfx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1088,  # chain_id
-        60,  # slip44
-        "METIS",  # symbol
-        "Metis Andromeda",  # name
-        "evm-metis.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1139,  # chain_id
-        60,  # slip44
-        "MATH",  # symbol
-        "MathChain",  # name
-        "evm-math.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1140,  # chain_id
-        1,  # slip44
-        "tMATH",  # symbol
-        "MathChain Testnet",  # name
-        "evm-tmath.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        1197,  # chain_id
-        60,  # slip44
-        "IORA",  # symbol
-        "Iora Chain",  # name
-        "evm-iora.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1202,  # chain_id
-        60,  # slip44
-        "WTT",  # symbol
-        "World Trade Technical Chain",  # name
-        "evm-wtt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1213,  # chain_id
-        60,  # slip44
-        "POP",  # symbol
-        "Popcateum",  # name
-        "evm-pop.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1214,  # chain_id
-        60,  # slip44
-        "ENTER",  # symbol
-        "EnterChain",  # name
-        "evm-enter.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1280,  # chain_id
-        60,  # slip44
-        "HO",  # symbol
-        "HALO",  # name
-        "evm-ho.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1284,  # chain_id
-        60,  # slip44
-        "GLMR",  # symbol
-        "Moonbeam",  # name
-        "evm-glmr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1285,  # chain_id
-        60,  # slip44
-        "MOVR",  # symbol
-        "Moonriver",  # name
-        "evm-movr.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1287,  # chain_id
-        1,  # slip44
-        "DEV",  # symbol
-        "Moonbase Alpha",  # name
-        "evm-dev.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1618,  # chain_id
-        60,  # slip44
-        "CATE",  # symbol
-        "Catecoin Chain",  # name
-        "evm-cate.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1657,  # chain_id
-        60,  # slip44
-        "BTA",  # symbol
-        "Btachain",  # name
-        "evm-bta.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1856,  # chain_id
-        60,  # slip44
-        "TSF",  # symbol
-        "Teslafunds",  # name
-        "evm-tsf.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1898,  # chain_id
-        60,  # slip44
-        "BOY",  # symbol
-        "BON Network",  # name
-        "evm-boy.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1987,  # chain_id
-        1987,  # slip44
-        "EGEM",  # symbol
-        "EtherGem",  # name
-        "evm-egem.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2021,  # chain_id
-        523,  # slip44
-        "EDG",  # symbol
-        "Edgeware EdgeEVM",  # name
-        "evm-edg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2025,  # chain_id
-        1008,  # slip44
-        "RPG",  # symbol
-        "Rangers Protocol",  # name
-        "evm-rpg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2100,  # chain_id
-        60,  # slip44
-        "ECO",  # symbol
-        "Ecoball",  # name
-        "evm-eco.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2213,  # chain_id
-        60,  # slip44
-        "EVA",  # symbol
-        "Evanesco",  # name
-        "evm-eva.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2559,  # chain_id
-        60,  # slip44
-        "KTO",  # symbol
-        "Kortho",  # name
-        "evm-kto.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3400,  # chain_id
-        60,  # slip44
-        "PRB",  # symbol
-        "Paribu Net",  # name
-        "evm-prb.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3966,  # chain_id
-        60,  # slip44
-        "DYNO",  # symbol
-        "DYNO",  # name
-        "evm-dyno.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        4689,  # chain_id
-        60,  # slip44
-        "IOTX",  # symbol
-        "IoTeX Network",  # name
-        "evm-iotx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5000,  # chain_id
-        60,  # slip44
-        "MNT",  # symbol
-        "Mantle",  # name
-        "evm-mnt.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        5197,  # chain_id
-        60,  # slip44
-        "ES",  # symbol
-        "EraSwap",  # name
-        "evm-es.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5315,  # chain_id
-        60,  # slip44
-        "UZMI",  # symbol
-        "Uzmi Network",  # name
-        "evm-uzmi.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        5869,  # chain_id
-        60,  # slip44
-        "RBD",  # symbol
-        "Wegochain Rubidium",  # name
-        "evm-rbd.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        6626,  # chain_id
-        60,  # slip44
-        "PIX",  # symbol
-        "Pixie Chain",  # name
-        "evm-pix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8000,  # chain_id
-        60,  # slip44
-        "TELE",  # symbol
-        "Teleport",  # name
-        "evm-tele.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8217,  # chain_id
-        8217,  # slip44
-        "KAIA",  # symbol
-        "Kaia",  # name
-        "evm-kaia.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8453,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Base",  # name
-        "evm-base.png",  # name
-        0x0052FF,  # primary_color
-    )
-    yield (
-        8723,  # chain_id
-        479,  # slip44
-        "OLO",  # symbol
-        "TOOL Global",  # name
-        "evm-olo.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        8995,  # chain_id
-        60,  # slip44
-        "U+25B3",  # symbol
-        "bloxberg",  # name
-        "evm-u+25b3.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9001,  # chain_id
-        60,  # slip44
-        "EVMOS",  # symbol
-        "Evmos",  # name
-        "evm-evmos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9100,  # chain_id
-        60,  # slip44
-        "GNC",  # symbol
-        "Genesis Coin",  # name
-        "evm-gnc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        10101,  # chain_id
-        60,  # slip44
-        "GEN",  # symbol
-        "Blockchain Genesis",  # name
-        "evm-gen.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        10823,  # chain_id
-        60,  # slip44
-        "CCP",  # symbol
-        "CryptoCoinPay",  # name
-        "evm-ccp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11111,  # chain_id
-        60,  # slip44
-        "WGM",  # symbol
-        "WAGMI",  # name
-        "evm-wgm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        12052,  # chain_id
-        621,  # slip44
-        "ZERO",  # symbol
-        "Singularity ZERO",  # name
-        "evm-zero.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        13381,  # chain_id
-        60,  # slip44
-        "PHX",  # symbol
-        "Phoenix",  # name
-        "evm-phx.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        16000,  # chain_id
-        60,  # slip44
-        "MTT",  # symbol
-        "MetaDot",  # name
-        "evm-mtt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        19515,  # chain_id
-        1,  # slip44
-        "tSEP",  # symbol
-        "SEC Testnet",  # name
-        "evm-tsep.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        19845,  # chain_id
-        60,  # slip44
-        "BTCIX",  # symbol
-        "BTCIX Network",  # name
-        "evm-btcix.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        24484,  # chain_id
-        227,  # slip44
-        "WEB",  # symbol
-        "Webchain",  # name
-        "evm-web.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        24734,  # chain_id
-        60,  # slip44
-        "MINTME",  # symbol
-        "MintMe.com Coin",  # name
-        "evm-mintme.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        31102,  # chain_id
-        31102,  # slip44
-        "ESN",  # symbol
-        "Ethersocial Network",  # name
-        "evm-esn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        32659,  # chain_id
-        288,  # slip44
-        "FSN",  # symbol
-        "Fusion",  # name
-        "evm-fsn.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        39797,  # chain_id
-        39797,  # slip44
-        "NRG",  # symbol
-        "Energi",  # name
-        "evm-nrg.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        42069,  # chain_id
-        60,  # slip44
-        "peggle",  # symbol
-        "pegglecoin",  # name
-        "evm-peggle.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        42161,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Arbitrum One",  # name
-        "evm-arb1.png",  # name
-        0x28A0F0,  # primary_color
-    )
-    yield (
-        42220,  # chain_id
-        60,  # slip44
-        "CELO",  # symbol
-        "Celo",  # name
-        "evm-celo.png",  # name
-        0x35D07F,  # primary_color
-    )
-    yield (
-        43113,  # chain_id
-        1,  # slip44
-        "tAVAX",  # symbol
-        "Avalanche Fuji Testnet",  # name
-        "evm-tavax.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        43114,  # chain_id
-        9005,  # slip44
-        "AVAX",  # symbol
-        "Avalanche C-Chain",  # name
-        "evm-avax.png",  # name
-        0xE84142,  # primary_color
-    )
-    yield (
-        44787,  # chain_id
-        1,  # slip44
-        "tCELO",  # symbol
-        "Celo Alfajores Testnet",  # name
-        "evm-tcelo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        47805,  # chain_id
-        60,  # slip44
-        "REI",  # symbol
-        "REI Network",  # name
-        "evm-rei.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        49797,  # chain_id
-        1,  # slip44
-        "tNRG",  # symbol
-        "Energi Testnet",  # name
-        "evm-tnrg.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        53935,  # chain_id
-        60,  # slip44
-        "JEWEL",  # symbol
-        "DFK Chain",  # name
-        "evm-jewel.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        59144,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Linea",  # name
-        "evm-linea.png",  # name
-        0xFFFFFF,  # primary_color
-    )
-    yield (
-        62320,  # chain_id
-        1,  # slip44
-        "tCELO",  # symbol
-        "Celo Baklava Testnet",  # name
-        "evm-tcelo.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        63000,  # chain_id
-        60,  # slip44
-        "ECS",  # symbol
-        "eSync Network",  # name
-        "evm-ecs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        73799,  # chain_id
-        1,  # slip44
-        "tVT",  # symbol
-        "Energy Web Volta Testnet",  # name
-        "evm-tvt.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        73927,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Mixin Virtual Machine",  # name
-        "evm-mixin.png",  # name
-        0x5959D8,  # primary_color
-    )
-    yield (
-        78110,  # chain_id
-        1,  # slip44
-        "FIN",  # symbol
-        "Firenze test network",  # name
-        "evm-fin.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        80001,  # chain_id
-        1,  # slip44
-        "tMATIC",  # symbol
-        "Mumbai",  # name
-        "evm-tmatic.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        99999,  # chain_id
-        60,  # slip44
-        "UBC",  # symbol
-        "UB Smart Chain",  # name
-        "evm-ubc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100000,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100001,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100002,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100003,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100004,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100005,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100006,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100007,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        100008,  # chain_id
-        60,  # slip44
-        "QKC",  # symbol
-        "QuarkChain",  # name
-        "evm-qkc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        200625,  # chain_id
-        200625,  # slip44
-        "AKA",  # symbol
-        "Akroma",  # name
-        "evm-aka.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        201018,  # chain_id
-        60,  # slip44
-        "atp",  # symbol
-        "Alaya",  # name
-        "evm-atp.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        210425,  # chain_id
-        60,  # slip44
-        "lat",  # symbol
-        "PlatON",  # name
-        "evm-lat.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246529,  # chain_id
-        246529,  # slip44
-        "ATS",  # symbol
-        "ARTIS sigma1",  # name
-        "evm-ats.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        246785,  # chain_id
-        1,  # slip44
-        "tATS",  # symbol
-        "ARTIS Testnet tau1",  # name
-        "evm-tats.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        281121,  # chain_id
-        60,  # slip44
-        "$OC",  # symbol
-        "Social Smart Chain",  # name
-        "evm-$oc.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        333999,  # chain_id
-        60,  # slip44
-        "POLIS",  # symbol
-        "Polis",  # name
-        "evm-polis.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        888888,  # chain_id
-        60,  # slip44
-        "VS",  # symbol
-        "Vision",  # name
-        "evm-vs.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        955305,  # chain_id
-        1011,  # slip44
-        "ELV",  # symbol
-        "Eluvio Content Fabric",  # name
-        "evm-elv.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313114,  # chain_id
-        1313114,  # slip44
-        "ETHO",  # symbol
-        "Etho Protocol",  # name
-        "evm-etho.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313500,  # chain_id
-        60,  # slip44
-        "XERO",  # symbol
-        "Xerom",  # name
-        "evm-xero.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        7762959,  # chain_id
-        184,  # slip44
-        "MUSIC",  # symbol
-        "Musicoin",  # name
-        "evm-music.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11155111,  # chain_id
-        1,  # slip44
-        "tETH",  # symbol
-        "Sepolia",  # name
-        "evm-teth.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        13371337,  # chain_id
-        60,  # slip44
-        "TPEP",  # symbol
-        "PepChain Churchill",  # name
-        "evm-tpep.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        18289463,  # chain_id
-        60,  # slip44
-        "ILT",  # symbol
-        "IOLite",  # name
-        "evm-ilt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        20181205,  # chain_id
-        60,  # slip44
-        "QKI",  # symbol
-        "quarkblockchain",  # name
-        "evm-qki.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        28945486,  # chain_id
-        344,  # slip44
-        "AUX",  # symbol
-        "Auxilium Network",  # name
-        "evm-aux.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        35855456,  # chain_id
-        60,  # slip44
-        "JOYS",  # symbol
-        "Joys Digital",  # name
-        "evm-joys.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        61717561,  # chain_id
-        61717561,  # slip44
-        "AQUA",  # symbol
-        "Aquachain",  # name
-        "evm-aqua.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        99415706,  # chain_id
-        1,  # slip44
-        "TOYS",  # symbol
-        "Joys Digital TestNet",  # name
-        "evm-toys.png",  # name
-        0x969696,  # primary_color
-    )
-    yield (
-        245022934,  # chain_id
-        60,  # slip44
-        "NEON",  # symbol
-        "Neon EVM",  # name
-        "evm-neon.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        311752642,  # chain_id
-        60,  # slip44
-        "OLT",  # symbol
-        "OneLedger",  # name
-        "evm-olt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1122334455,  # chain_id
-        60,  # slip44
-        "IPOS",  # symbol
-        "IPOS Network",  # name
-        "evm-ipos.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1313161554,  # chain_id
-        60,  # slip44
-        "ETH",  # symbol
-        "Aurora",  # name
-        "evm-aurora.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600000,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0x33D3D5,  # primary_color
-    )
-    yield (
-        1666600001,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600002,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        1666600003,  # chain_id
-        1023,  # slip44
-        "ONE",  # symbol
-        "Harmony",  # name
-        "evm-one.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        2021121117,  # chain_id
-        60,  # slip44
-        "HOP",  # symbol
-        "DataHopper",  # name
-        "evm-hop.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        3125659152,  # chain_id
-        164,  # slip44
-        "PIRL",  # symbol
-        "Pirl",  # name
-        "evm-pirl.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        11297108109,  # chain_id
-        60,  # slip44
-        "PALM",  # symbol
-        "Palm",  # name
-        "evm-palm.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        197710212030,  # chain_id
-        60,  # slip44
-        "NTT",  # symbol
-        "Ntity",  # name
-        "evm-ntt.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        6022140761023,  # chain_id
-        60,  # slip44
-        "MOLE",  # symbol
-        "Molereum Network",  # name
-        "evm-mole.png",  # name
-        0xD2D2D2,  # primary_color
-    )
-    yield (
-        9798,  # chain_id
-        9798,  # slip44
-        "DTT",  # symbol
-        "Data Trade Chain",  # name
-        "evm-dtt.png",  # icon
-        0x1A2A5F,  # primary_color
+def _lower_bound(table: bytes, record_len: int, key: bytes) -> int:
+    # offset of the first record of `table` whose prefix is not less than `key`
+    key_len = len(key)
+    lo = 0
+    hi = len(table) // record_len
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = mid * record_len
+        if table[pos : pos + key_len] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo * record_len
+
+
+def _network_at(pos: int) -> EthereumNetworkInfo:
+    record = _NETWORKS[pos : pos + _NETWORK_LEN]
+    offset = (record[-2] << 8) | record[-1]
+    data = _NETWORK_DATA
+    symbol_start = offset + 6
+    name_start = symbol_start + data[offset + 3]
+    icon_start = name_start + data[offset + 4]
+    return EthereumNetworkInfo(
+        chain_id=int.from_bytes(record[:_CHAIN_ID_LEN], "big"),
+        slip44=int.from_bytes(record[_CHAIN_ID_LEN:-2], "big"),
+        symbol=data[symbol_start:name_start].decode(),
+        name=data[name_start:icon_start].decode(),
+        icon=data[icon_start : icon_start + data[offset + 5]].decode(),
+        primary_color=(data[offset] << 16) | (data[offset + 1] << 8) | data[offset + 2],
     )
+
+
+# fmt: off
+_NETWORKS = (  # chain_id, slip44, data offset
+    b"\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x3c\x00\x00"  # ETH
+    b"\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x28\x00\x1c"  # EXP
+    b"\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x01\x00\x3f"  # tETH
+    b"\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x01\x00\x5c"  # tETH
+    b"\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x01\x00\x79"  # tETH
+    b"\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x01\x00\x95"  # tKOT
+    b"\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x3c\x00\xb8"  # TCH
+    b"\x00\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x6c\x00\xd5"  # UBQ
+    b"\x00\x00\x00\x00\x00\x00\x00\x09\x00\x00\x00\x01\x00\xed"  # TUBQ
+    b"\x00\x00\x00\x00\x00\x00\x00\x0a\x00\x00\x00\x3c\x01\x17"  # ETH
+    b"\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x03\x94\x01\x2e"  # META
+    b"\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x01\x01\x4c"  # tKAL
+    b"\x00\x00\x00\x00\x00\x00\x00\x0d\x00\x00\x00\x01\x01\x72"  # tsDIODE
+    b"\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x3c\x01\xa3"  # FLR
+    b"\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x3c\x01\xbc"  # DIODE
+    b"\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x01\x01\xe0"  # tCFLR
+    b"\x00\x00\x00\x00\x00\x00\x00\x11\x00\x00\x00\x3c\x02\x0f"  # TFI
+    b"\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x01\x02\x37"  # TST
+    b"\x00\x00\x00\x00\x00\x00\x00\x13\x00\x00\x00\x3c\x02\x5e"  # SGB
+    b"\x00\x00\x00\x00\x00\x00\x00\x14\x00\x00\x00\x3c\x02\x89"  # ELA
+    b"\x00\x00\x00\x00\x00\x00\x00\x19\x00\x00\x00\x3c\x02\xb0"  # CRO
+    b"\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x00\x00\x3c\x02\xca"  # SHIB
+    b"\x00\x00\x00\x00\x00\x00\x00\x1d\x00\x00\x00\x3c\x02\xea"  # L1
+    b"\x00\x00\x00\x00\x00\x00\x00\x1e\x00\x00\x00\x89\x03\x06"  # RBTC
+    b"\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x00\x00\x01\x03\x25"  # tRBTC
+    b"\x00\x00\x00\x00\x00\x00\x00\x21\x00\x00\x00\x3c\x03\x4e"  # GooD
+    b"\x00\x00\x00\x00\x00\x00\x00\x23\x00\x00\x00\x3c\x03\x6c"  # TBG
+    b"\x00\x00\x00\x00\x00\x00\x00\x26\x00\x00\x02\x1a\x03\x8a"  # VAL
+    b"\x00\x00\x00\x00\x00\x00\x00\x28\x00\x00\x00\x3c\x03\xa6"  # TLOS
+    b"\x00\x00\x00\x00\x00\x00\x00\x2c\x00\x00\x00\x3c\x03\xc5"  # CRAB
+    b"\x00\x00\x00\x00\x00\x00\x00\x32\x00\x00\x00\x3c\x03\xe7"  # XDC
+    b"\x00\x00\x00\x00\x00\x00\x00\x33\x00\x00\x00\x3c\x04\x06"  # TXDC
+    b"\x00\x00\x00\x00\x00\x00\x00\x34\x00\x00\x00\x3c\x04\x2f"  # cet
+    b"\x00\x00\x00\x00\x00\x00\x00\x37\x00\x00\x00\x3c\x04\x55"  # ZYX
+    b"\x00\x00\x00\x00\x00\x00\x00\x38\x00\x00\x02\xca\x04\x6c"  # BNB
+    b"\x00\x00\x00\x00\x00\x00\x00\x3a\x00\x00\x00\x3c\x04\x8f"  # ONG
+    b"\x00\x00\x00\x00\x00\x00\x00\x3c\x00\x00\x17\xac\x04\xab"  # GO
+    b"\x00\x00\x00\x00\x00\x00\x00\x3d\x00\x00\x00\x3d\x04\xc4"  # ETC
+    b"\x00\x00\x00\x00\x00\x00\x00\x3e\x00\x00\x00\x01\x04\xe8"  # TETC
+    b"\x00\x00\x00\x00\x00\x00\x00\x3f\x00\x00\x00\x01\x05\x0c"  # tMETC
+    b"\x00\x00\x00\x00\x00\x00\x00\x40\x00\x00\x00\xa3\x05\x32"  # ELLA
+    b"\x00\x00\x00\x00\x00\x00\x00\x42\x00\x00\x00\x3c\x05\x4f"  # OKT
+    b"\x00\x00\x00\x00\x00\x00\x00\x43\x00\x00\x00\x01\x05\x6b"  # tDBM
+    b"\x00\x00\x00\x00\x00\x00\x00\x4a\x00\x00\x00\x3c\x05\x90"  # EIDI
+    b"\x00\x00\x00\x00\x00\x00\x00\x4c\x00\x00\x00\x4c\x05\xad"  # MIX
+    b"\x00\x00\x00\x00\x00\x00\x00\x4d\x00\x00\x00\x3c\x05\xc4"  # SPOA
+    b"\x00\x00\x00\x00\x00\x00\x00\x4e\x00\x00\x00\x3c\x05\xeb"  # PETH
+    b"\x00\x00\x00\x00\x00\x00\x00\x50\x00\x00\x00\x3c\x06\x0c"  # RNA
+    b"\x00\x00\x00\x00\x00\x00\x00\x52\x00\x00\x00\x3c\x06\x29"  # MTR
+    b"\x00\x00\x00\x00\x00\x00\x00\x57\x00\x00\x00\x3c\x06\x42"  # SNT
+    b"\x00\x00\x00\x00\x00\x00\x00\x58\x00\x00\x03\x79\x06\x62"  # VIC
+    b"\x00\x00\x00\x00\x00\x00\x00\x5a\x00\x00\x00\x3c\x06\x7d"  # GAR
+    b"\x00\x00\x00\x00\x00\x00\x00\x61\x00\x00\x00\x01\x06\x9f"  # tBNB
+    b"\x00\x00\x00\x00\x00\x00\x00\x63\x00\x00\x00\xb2\x06\xcc"  # POA
+    b"\x00\x00\x00\x00\x00\x00\x00\x64\x00\x00\x02\xbc\x06\xf0"  # XDAI
+    b"\x00\x00\x00\x00\x00\x00\x00\x65\x00\x00\x01\xd0\x07\x0c"  # ETI
+    b"\x00\x00\x00\x00\x00\x00\x00\x69\x00\x00\x00\x3c\x07\x28"  # W3G
+    b"\x00\x00\x00\x00\x00\x00\x00\x6a\x00\x00\x00\x3c\x07\x4c"  # VLX
+    b"\x00\x00\x00\x00\x00\x00\x00\x6c\x00\x00\x03\xe9\x07\x69"  # TT
+    b"\x00\x00\x00\x00\x00\x00\x00\x6f\x00\x00\x00\x3c\x07\x86"  # ETL
+    b"\x00\x00\x00\x00\x00\x00\x00\x7a\x00\x00\x00\x3c\x07\xa9"  # FUSE
+    b"\x00\x00\x00\x00\x00\x00\x00\x7b\x00\x00\x00\x3c\x07\xc3"  # SPARK
+    b"\x00\x00\x00\x00\x00\x00\x00\x7c\x00\x00\x00\x3c\x07\xe8"  # DWU
+    b"\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x00\x00\x7e\x08\x0d"  # OY
+    b"\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x7f\x08\x26"  # FETH
+    b"\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x03\xf2\x08\x47"  # HT
+    b"\x00\x00\x00\x00\x00\x00\x00\x89\x00\x00\x03\xc6\x08\x68"  # POL
+    b"\x00\x00\x00\x00\x00\x00\x00\x8e\x00\x00\x00\x3c\x08\x85"  # DAX
+    b"\x00\x00\x00\x00\x00\x00\x00\x92\x00\x00\x00\x3c\x08\xa2"  # S
+    b"\x00\x00\x00\x00\x00\x00\x00\xa2\x00\x00\x00\x01\x08\xb7"  # tPHT
+    b"\x00\x00\x00\x00\x00\x00\x00\xa3\x00\x00\x00\x3c\x08\xe1"  # PHT
+    b"\x00\x00\x00\x00\x00\x00\x00\xb1\x00\x00\x00\x3c\x09\x01"  # HSK
+    b"\x00\x00\x00\x00\x00\x00\x00\xba\x00\x00\x00\x3c\x09\x22"  # Seele
+    b"\x00\x00\x00\x00\x00\x00\x00\xbc\x00\x00\x00\x3c\x09\x3f"  # BTM
+    b"\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\x00\x3c\x09\x56"  # BTT
+    b"\x00\x00\x00\x00\x00\x00\x00\xd3\x00\x00\x00\x3c\x09\x7a"  # 0xF
+    b"\x00\x00\x00\x00\x00\x00\x00\xde\x00\x00\x08\xad\x09\xa3"  # ASK
+    b"\x00\x00\x00\x00\x00\x00\x00\xe1\x00\x00\x00\x3c\x09\xc1"  # LA
+    b"\x00\x00\x00\x00\x00\x00\x00\xf6\x00\x00\x00\xf6\x09\xda"  # EWT
+    b"\x00\x00\x00\x00\x00\x00\x00\xfa\x00\x00\x00\x3c\x09\xfe"  # FTM
+    b"\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x01\x0a\x1e"  # thtt
+    b"\x00\x00\x00\x00\x00\x00\x01\x02\x00\x00\x00\x3c\x0a\x4b"  # SETM
+    b"\x00\x00\x00\x00\x00\x00\x01\x06\x00\x00\x00\x3c\x0a\x68"  # SRN
+    b"\x00\x00\x00\x00\x00\x00\x01\x0d\x00\x00\x01\x0d\x0a\x92"  # HPB
+    b"\x00\x00\x00\x00\x00\x00\x01\x20\x00\x00\x00\x3c\x0a\xc1"  # ETH
+    b"\x00\x00\x00\x00\x00\x00\x01\x3a\x00\x00\x01\xcd\x0a\xe2"  # FIL
+    b"\x00\x00\x00\x00\x00\x00\x01\x41\x00\x00\x02\x81\x0b\x03"  # KCS
+    b"\x00\x00\x00\x00\x00\x00\x01\x44\x00\x00\x00\x3c\x0b\x1a"  # ETH
+    b"\x00\x00\x00\x00\x00\x00\x01\x4d\x00\x00\x00\x3c\x0b\x3b"  # W3Q
+    b"\x00\x00\x00\x00\x00\x00\x01\x50\x00\x00\x00\x3c\x0b\x54"  # SDN
+    b"\x00\x00\x00\x00\x00\x00\x01\x71\x00\x00\x00\x3c\x0b\x6e"  # PLS
+    b"\x00\x00\x00\x00\x00\x00\x01\xa4\x00\x00\x00\x01\x0b\x8c"  # tETH
+    b"\x00\x00\x00\x00\x00\x00\x01\xf3\x00\x00\x01\xf3\x0b\xb9"  # RUPX
+    b"\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\xe8\x0b\xd5"  # AAC
+    b"\x00\x00\x00\x00\x00\x00\x02\x2b\x00\x00\x00\x3c\x0b\xf7"  # CLASS
+    b"\x00\x00\x00\x00\x00\x00\x02\x2e\x00\x00\x00\x3c\x0c\x1a"  # TAO
+    b"\x00\x00\x00\x00\x00\x00\x02\x53\x00\x00\x00\x01\x0c\x39"  # tmACA
+    b"\x00\x00\x00\x00\x00\x00\x02\xae\x00\x00\x02\xae\x0c\x6a"  # KAR
+    b"\x00\x00\x00\x00\x00\x00\x02\xc3\x00\x00\x00\x3c\x0c\x8c"  # BCS
+    b"\x00\x00\x00\x00\x00\x00\x03\x09\x00\x00\x00\x3c\x0c\xb2"  # cTH
+    b"\x00\x00\x00\x00\x00\x00\x03\x13\x00\x00\x03\x13\x0c\xce"  # ACA
+    b"\x00\x00\x00\x00\x00\x00\x03\x23\x00\x00\x00\x3c\x0c\xef"  # HAIC
+    b"\x00\x00\x00\x00\x00\x00\x03\x34\x00\x00\x03\x34\x0d\x09"  # CLO
+    b"\x00\x00\x00\x00\x00\x00\x03\x35\x00\x00\x00\x01\x0d\x25"  # TCLO
+    b"\x00\x00\x00\x00\x00\x00\x03\x78\x00\x57\x41\x4e\x0d\x56"  # WAN
+    b"\x00\x00\x00\x00\x00\x00\x03\xd1\x00\x00\x00\x3c\x0d\x72"  # YETI
+    b"\x00\x00\x00\x00\x00\x00\x03\xe6\x00\x00\x00\x3c\x0d\xa0"  # L99
+    b"\x00\x00\x00\x00\x00\x00\x03\xe9\x00\x00\x00\x01\x0d\xc1"  # tKAIA
+    b"\x00\x00\x00\x00\x00\x00\x03\xef\x00\x00\x00\x01\x0d\xec"  # tNEW
+    b"\x00\x00\x00\x00\x00\x00\x03\xf2\x00\x00\x03\xfc\x0e\x10"  # EVC
+    b"\x00\x00\x00\x00\x00\x00\x03\xf4\x00\x00\x00\x3c\x0e\x32"  # NEW
+    b"\x00\x00\x00\x00\x00\x00\x03\xfe\x00\x00\x00\x3c\x0e\x4c"  # SKU
+    b"\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x3c\x0e\x66"  # CLV
+    b"\x00\x00\x00\x00\x00\x00\x04\x06\x00\x00\x00\x3c\x0e\x87"  # CFX
+    b"\x00\x00\x00\x00\x00\x00\x04\x40\x00\x00\x00\x3c\x0e\xa9"  # METIS
+    b"\x00\x00\x00\x00\x00\x00\x04\x73\x00\x00\x00\x3c\x0e\xd0"  # MATH
+    b"\x00\x00\x00\x00\x00\x00\x04\x74\x00\x00\x00\x01\x0e\xef"  # tMATH
+    b"\x00\x00\x00\x00\x00\x00\x04\xad\x00\x00\x00\x3c\x0f\x18"  # IORA
+    b"\x00\x00\x00\x00\x00\x00\x04\xb2\x00\x00\x00\x3c\x0f\x38"  # WTT
+    b"\x00\x00\x00\x00\x00\x00\x04\xbd\x00\x00\x00\x3c\x0f\x67"  # POP
+    b"\x00\x00\x00\x00\x00\x00\x04\xbe\x00\x00\x00\x3c\x0f\x84"  # ENTER
+    b"\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x3c\x0f\xa6"  # HO
+    b"\x00\x00\x00\x00\x00\x00\x05\x04\x00\x00\x00\x3c\x0f\xbc"  # GLMR
+    b"\x00\x00\x00\x00\x00\x00\x05\x05\x00\x00\x00\x3c\x0f\xda"  # MOVR
+    b"\x00\x00\x00\x00\x00\x00\x05\x07\x00\x00\x00\x01\x0f\xf9"  # DEV
+    b"\x00\x00\x00\x00\x00\x00\x06\x52\x00\x00\x00\x3c\x10\x1b"  # CATE
+    b"\x00\x00\x00\x00\x00\x00\x06\x79\x00\x00\x00\x3c\x10\x3f"  # BTA
+    b"\x00\x00\x00\x00\x00\x00\x07\x40\x00\x00\x00\x3c\x10\x5b"  # TSF
+    b"\x00\x00\x00\x00\x00\x00\x07\x6a\x00\x00\x00\x3c\x10\x79"  # BOY
+    b"\x00\x00\x00\x00\x00\x00\x07\xc3\x00\x00\x07\xc3\x10\x98"  # EGEM
+    b"\x00\x00\x00\x00\x00\x00\x07\xe5\x00\x00\x02\x0b\x10\xb6"  # EDG
+    b"\x00\x00\x00\x00\x00\x00\x07\xe9\x00\x00\x03\xf0\x10\xda"  # RPG
+    b"\x00\x00\x00\x00\x00\x00\x08\x34\x00\x00\x00\x3c\x10\xfe"  # ECO
+    b"\x00\x00\x00\x00\x00\x00\x08\xa5\x00\x00\x00\x3c\x11\x19"  # EVA
+    b"\x00\x00\x00\x00\x00\x00\x09\xff\x00\x00\x00\x3c\x11\x35"  # KTO
+    b"\x00\x00\x00\x00\x00\x00\x0d\x48\x00\x00\x00\x3c\x11\x4f"  # PRB
+    b"\x00\x00\x00\x00\x00\x00\x0f\x7e\x00\x00\x00\x3c\x11\x6d"  # DYNO
+    b"\x00\x00\x00\x00\x00\x00\x12\x51\x00\x00\x00\x3c\x11\x87"  # IOTX
+    b"\x00\x00\x00\x00\x00\x00\x13\x88\x00\x00\x00\x3c\x11\xaa"  # MNT
+    b"\x00\x00\x00\x00\x00\x00\x14\x4d\x00\x00\x00\x3c\x11\xc4"  # ES
+    b"\x00\x00\x00\x00\x00\x00\x14\xc3\x00\x00\x00\x3c\x11\xdd"  # UZMI
+    b"\x00\x00\x00\x00\x00\x00\x16\xed\x00\x00\x00\x3c\x11\xff"  # RBD
+    b"\x00\x00\x00\x00\x00\x00\x19\xe2\x00\x00\x00\x3c\x12\x25"  # PIX
+    b"\x00\x00\x00\x00\x00\x00\x1f\x40\x00\x00\x00\x3c\x12\x44"  # TELE
+    b"\x00\x00\x00\x00\x00\x00\x20\x19\x00\x00\x20\x19\x12\x62"  # KAIA
+    b"\x00\x00\x00\x00\x00\x00\x21\x05\x00\x00\x00\x3c\x12\x7c"  # ETH
+    b"\x00\x00\x00\x00\x00\x00\x22\x13\x00\x00\x01\xdf\x12\x95"  # OLO
+    b"\x00\x00\x00\x00\x00\x00\x23\x23\x00\x00\x00\x3c\x12\xb4"  # U+25B3
+    b"\x00\x00\x00\x00\x00\x00\x23\x29\x00\x00\x00\x3c\x12\xd6"  # EVMOS
+    b"\x00\x00\x00\x00\x00\x00\x23\x8c\x00\x00\x00\x3c\x12\xf3"  # GNC
+    b"\x00\x00\x00\x00\x00\x00\x26\x46\x00\x00\x26\x46\x13\x13"  # DTT
+    b"\x00\x00\x00\x00\x00\x00\x27\x75\x00\x00\x00\x3c\x13\x37"  # GEN
+    b"\x00\x00\x00\x00\x00\x00\x2a\x47\x00\x00\x00\x3c\x13\x5d"  # CCP
+    b"\x00\x00\x00\x00\x00\x00\x2b\x67\x00\x00\x00\x3c\x13\x7e"  # WGM
+    b"\x00\x00\x00\x00\x00\x00\x2f\x14\x00\x00\x02\x6d\x13\x97"  # ZERO
+    b"\x00\x00\x00\x00\x00\x00\x34\x45\x00\x00\x00\x3c\x13\xbd"  # PHX
+    b"\x00\x00\x00\x00\x00\x00\x3e\x80\x00\x00\x00\x3c\x13\xd8"  # MTT
+    b"\x00\x00\x00\x00\x00\x00\x4c\x3b\x00\x00\x00\x01\x13\xf3"  # tSEP
+    b"\x00\x00\x00\x00\x00\x00\x4d\x85\x00\x00\x00\x3c\x14\x14"  # BTCIX
+    b"\x00\x00\x00\x00\x00\x00\x5f\xa4\x00\x00\x00\xe3\x14\x39"  # WEB
+    b"\x00\x00\x00\x00\x00\x00\x60\x9e\x00\x00\x00\x3c\x14\x55"  # MINTME
+    b"\x00\x00\x00\x00\x00\x00\x79\x7e\x00\x00\x79\x7e\x14\x7e"  # ESN
+    b"\x00\x00\x00\x00\x00\x00\x7f\x93\x00\x00\x01\x20\x14\xa5"  # FSN
+    b"\x00\x00\x00\x00\x00\x00\x9b\x75\x00\x00\x9b\x75\x14\xbf"  # NRG
+    b"\x00\x00\x00\x00\x00\x00\xa4\x55\x00\x00\x00\x3c\x14\xd9"  # peggle
+    b"\x00\x00\x00\x00\x00\x00\xa4\xb1\x00\x00\x00\x3c\x14\xfd"  # ETH
+    b"\x00\x00\x00\x00\x00\x00\xa4\xec\x00\x00\x00\x3c\x15\x1e"  # CELO
+    b"\x00\x00\x00\x00\x00\x00\xa8\x69\x00\x00\x00\x01\x15\x38"  # tAVAX
+    b"\x00\x00\x00\x00\x00\x00\xa8\x6a\x00\x00\x23\x2d\x15\x66"  # AVAX
+    b"\x00\x00\x00\x00\x00\x00\xae\xf3\x00\x00\x00\x01\x15\x8d"  # tCELO
+    b"\x00\x00\x00\x00\x00\x00\xba\xbd\x00\x00\x00\x3c\x15\xbb"  # REI
+    b"\x00\x00\x00\x00\x00\x00\xc2\x85\x00\x00\x00\x01\x15\xda"  # tNRG
+    b"\x00\x00\x00\x00\x00\x00\xd2\xaf\x00\x00\x00\x3c\x15\xfe"  # JEWEL
+    b"\x00\x00\x00\x00\x00\x00\xe7\x08\x00\x00\x00\x3c\x16\x1f"  # ETH
+    b"\x00\x00\x00\x00\x00\x00\xf3\x70\x00\x00\x00\x01\x16\x3a"  # tCELO
+    b"\x00\x00\x00\x00\x00\x00\xf6\x18\x00\x00\x00\x3c\x16\x66"  # ECS
+    b"\x00\x00\x00\x00\x00\x01\x20\x47\x00\x00\x00\x01\x16\x87"  # tVT
+    b"\x00\x00\x00\x00\x00\x01\x20\xc7\x00\x00\x00\x3c\x16\xb3"  # ETH
+    b"\x00\x00\x00\x00\x00\x01\x31\x1e\x00\x00\x00\x01\x16\xde"  # FIN
+    b"\x00\x00\x00\x00\x00\x01\x38\x81\x00\x00\x00\x01\x17\x06"  # tMATIC
+    b"\x00\x00\x00\x00\x00\x01\x86\x9f\x00\x00\x00\x3c\x17\x26"  # UBC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa0\x00\x00\x00\x3c\x17\x48"  # QKC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa1\x00\x00\x00\x3c\x17\x66"  # QKC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa2\x00\x00\x00\x3c\x17\x84"  # QKC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa3\x00\x00\x00\x3c\x17\xa2"  # QKC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa4\x00\x00\x00\x3c\x17\xc0"  # QKC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa5\x00\x00\x00\x3c\x17\xde"  # QKC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa6\x00\x00\x00\x3c\x17\xfc"  # QKC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa7\x00\x00\x00\x3c\x18\x1a"  # QKC
+    b"\x00\x00\x00\x00\x00\x01\x86\xa8\x00\x00\x00\x3c\x18\x38"  # QKC
+    b"\x00\x00\x00\x00\x00\x03\x0f\xb1\x00\x03\x0f\xb1\x18\x56"  # AKA
+    b"\x00\x00\x00\x00\x00\x03\x11\x3a\x00\x00\x00\x3c\x18\x70"  # atp
+    b"\x00\x00\x00\x00\x00\x03\x35\xf9\x00\x00\x00\x3c\x18\x89"  # lat
+    b"\x00\x00\x00\x00\x00\x03\xc3\x01\x00\x03\xc3\x01\x18\xa3"  # ATS
+    b"\x00\x00\x00\x00\x00\x03\xc4\x01\x00\x00\x00\x01\x18\xc3"  # tATS
+    b"\x00\x00\x00\x00\x00\x04\x4a\x21\x00\x00\x00\x3c\x18\xeb"  # $OC
+    b"\x00\x00\x00\x00\x00\x05\x18\xaf\x00\x00\x00\x3c\x19\x11"  # POLIS
+    b"\x00\x00\x00\x00\x00\x0d\x90\x38\x00\x00\x00\x3c\x19\x2e"  # VS
+    b"\x00\x00\x00\x00\x00\x0e\x93\xa9\x00\x00\x03\xf3\x19\x46"  # ELV
+    b"\x00\x00\x00\x00\x00\x14\x09\x5a\x00\x14\x09\x5a\x19\x6f"  # ETHO
+    b"\x00\x00\x00\x00\x00\x14\x0a\xdc\x00\x00\x00\x3c\x19\x92"  # XERO
+    b"\x00\x00\x00\x00\x00\x76\x74\x0f\x00\x00\x00\xb8\x19\xad"  # MUSIC
+    b"\x00\x00\x00\x00\x00\xaa\x36\xa7\x00\x00\x00\x01\x19\xcd"  # tETH
+    b"\x00\x00\x00\x00\x00\xcc\x07\xc9\x00\x00\x00\x3c\x19\xea"  # TPEP
+    b"\x00\x00\x00\x00\x01\x17\x13\x37\x00\x00\x00\x3c\x1a\x12"  # ILT
+    b"\x00\x00\x00\x00\x01\x33\xf0\xd5\x00\x00\x00\x3c\x1a\x2c"  # QKI
+    b"\x00\x00\x00\x00\x01\xb9\xac\x4e\x00\x00\x01\x58\x1a\x4f"  # AUX
+    b"\x00\x00\x00\x00\x02\x23\x1c\x60\x00\x00\x00\x3c\x1a\x73"  # JOYS
+    b"\x00\x00\x00\x00\x03\xad\xbc\x39\x03\xad\xbc\x39\x1a\x95"  # AQUA
+    b"\x00\x00\x00\x00\x05\xec\xf6\x9a\x00\x00\x00\x01\x1a\xb4"  # TOYS
+    b"\x00\x00\x00\x00\x0e\x9a\xc0\xd6\x00\x00\x00\x3c\x1a\xde"  # NEON
+    b"\x00\x00\x00\x00\x12\x94\xf7\xc2\x00\x00\x00\x3c\x1a\xfc"  # OLT
+    b"\x00\x00\x00\x00\x42\xe5\x76\xf7\x00\x00\x00\x3c\x1b\x19"  # IPOS
+    b"\x00\x00\x00\x00\x4e\x45\x41\x52\x00\x00\x00\x3c\x1b\x3b"  # ETH
+    b"\x00\x00\x00\x00\x63\x56\x4c\x40\x00\x00\x03\xff\x1b\x58"  # ONE
+    b"\x00\x00\x00\x00\x63\x56\x4c\x41\x00\x00\x03\xff\x1b\x73"  # ONE
+    b"\x00\x00\x00\x00\x63\x56\x4c\x42\x00\x00\x03\xff\x1b\x8e"  # ONE
+    b"\x00\x00\x00\x00\x63\x56\x4c\x43\x00\x00\x03\xff\x1b\xa9"  # ONE
+    b"\x00\x00\x00\x00\x78\x77\xdc\x5d\x00\x00\x00\x3c\x1b\xc4"  # HOP
+    b"\x00\x00\x00\x00\xba\x4d\xc6\x10\x00\x00\x00\xa4\x1b\xe2"  # PIRL
+    b"\x00\x00\x00\x02\xa1\x5c\x30\x8d\x00\x00\x00\x3c\x1b\xfc"  # PALM
+    b"\x00\x00\x00\x2e\x08\x72\x6b\xbe\x00\x00\x00\x3c\x1c\x16"  # NTT
+    b"\x00\x00\x05\x7a\x23\x8f\x93\xbf\x00\x00\x00\x3c\x1c\x2f"  # MOLE
+)
+
+_SLIP44_INDEX = (  # slip44, network number
+    b"\x00\x00\x00\x01\x00\x02"  # tETH
+    b"\x00\x00\x00\x01\x00\x03"  # tETH
+    b"\x00\x00\x00\x01\x00\x04"  # tETH
+    b"\x00\x00\x00\x01\x00\x05"  # tKOT
+    b"\x00\x00\x00\x01\x00\x08"  # TUBQ
+    b"\x00\x00\x00\x01\x00\x0b"  # tKAL
+    b"\x00\x00\x00\x01\x00\x0c"  # tsDIODE
+    b"\x00\x00\x00\x01\x00\x0f"  # tCFLR
+    b"\x00\x00\x00\x01\x00\x11"  # TST
+    b"\x00\x00\x00\x01\x00\x18"  # tRBTC
+    b"\x00\x00\x00\x01\x00\x26"  # TETC
+    b"\x00\x00\x00\x01\x00\x27"  # tMETC
+    b"\x00\x00\x00\x01\x00\x2a"  # tDBM
+    b"\x00\x00\x00\x01\x00\x34"  # tBNB
+    b"\x00\x00\x00\x01\x00\x45"  # tPHT
+    b"\x00\x00\x00\x01\x00\x50"  # thtt
+    b"\x00\x00\x00\x01\x00\x5b"  # tETH
+    b"\x00\x00\x00\x01\x00\x60"  # tmACA
+    b"\x00\x00\x00\x01\x00\x67"  # TCLO
+    b"\x00\x00\x00\x01\x00\x6b"  # tKAIA
+    b"\x00\x00\x00\x01\x00\x6c"  # tNEW
+    b"\x00\x00\x00\x01\x00\x74"  # tMATH
+    b"\x00\x00\x00\x01\x00\x7c"  # DEV
+    b"\x00\x00\x00\x01\x00\x9d"  # tSEP
+    b"\x00\x00\x00\x01\x00\xa7"  # tAVAX
+    b"\x00\x00\x00\x01\x00\xa9"  # tCELO
+    b"\x00\x00\x00\x01\x00\xab"  # tNRG
+    b"\x00\x00\x00\x01\x00\xae"  # tCELO
+    b"\x00\x00\x00\x01\x00\xb0"  # tVT
+    b"\x00\x00\x00\x01\x00\xb2"  # FIN
+    b"\x00\x00\x00\x01\x00\xb3"  # tMATIC
+    b"\x00\x00\x00\x01\x00\xc2"  # tATS
+    b"\x00\x00\x00\x01\x00\xca"  # tETH
+    b"\x00\x00\x00\x01\x00\xd1"  # TOYS
+    b"\x00\x00\x00\x28\x00\x01"  # EXP
+    b"\x00\x00\x00\x3c\x00\x00"  # ETH
+    b"\x00\x00\x00\x3c\x00\x06"  # TCH
+    b"\x00\x00\x00\x3c\x00\x09"  # ETH
+    b"\x00\x00\x00\x3c\x00\x0d"  # FLR
+    b"\x00\x00\x00\x3c\x00\x0e"  # DIODE
+    b"\x00\x00\x00\x3c\x00\x10"  # TFI
+    b"\x00\x00\x00\x3c\x00\x12"  # SGB
+    b"\x00\x00\x00\x3c\x00\x13"  # ELA
+    b"\x00\x00\x00\x3c\x00\x14"  # CRO
+    b"\x00\x00\x00\x3c\x00\x15"  # SHIB
+    b"\x00\x00\x00\x3c\x00\x16"  # L1
+    b"\x00\x00\x00\x3c\x00\x19"  # GooD
+    b"\x00\x00\x00\x3c\x00\x1a"  # TBG
+    b"\x00\x00\x00\x3c\x00\x1c"  # TLOS
+    b"\x00\x00\x00\x3c\x00\x1d"  # CRAB
+    b"\x00\x00\x00\x3c\x00\x1e"  # XDC
+    b"\x00\x00\x00\x3c\x00\x1f"  # TXDC
+    b"\x00\x00\x00\x3c\x00\x20"  # cet
+    b"\x00\x00\x00\x3c\x00\x21"  # ZYX
+    b"\x00\x00\x00\x3c\x00\x23"  # ONG
+    b"\x00\x00\x00\x3c\x00\x29"  # OKT
+    b"\x00\x00\x00\x3c\x00\x2b"  # EIDI
+    b"\x00\x00\x00\x3c\x00\x2d"  # SPOA
+    b"\x00\x00\x00\x3c\x00\x2e"  # PETH
+    b"\x00\x00\x00\x3c\x00\x2f"  # RNA
+    b"\x00\x00\x00\x3c\x00\x30"  # MTR
+    b"\x00\x00\x00\x3c\x00\x31"  # SNT
+    b"\x00\x00\x00\x3c\x00\x33"  # GAR
+    b"\x00\x00\x00\x3c\x00\x38"  # W3G
+    b"\x00\x00\x00\x3c\x00\x39"  # VLX
+    b"\x00\x00\x00\x3c\x00\x3b"  # ETL
+    b"\x00\x00\x00\x3c\x00\x3c"  # FUSE
+    b"\x00\x00\x00\x3c\x00\x3d"  # SPARK
+    b"\x00\x00\x00\x3c\x00\x3e"  # DWU
+    b"\x00\x00\x00\x3c\x00\x43"  # DAX
+    b"\x00\x00\x00\x3c\x00\x44"  # S
+    b"\x00\x00\x00\x3c\x00\x46"  # PHT
+    b"\x00\x00\x00\x3c\x00\x47"  # HSK
+    b"\x00\x00\x00\x3c\x00\x48"  # Seele
+    b"\x00\x00\x00\x3c\x00\x49"  # BTM
+    b"\x00\x00\x00\x3c\x00\x4a"  # BTT
+    b"\x00\x00\x00\x3c\x00\x4b"  # 0xF
+    b"\x00\x00\x00\x3c\x00\x4d"  # LA
+    b"\x00\x00\x00\x3c\x00\x4f"  # FTM
+    b"\x00\x00\x00\x3c\x00\x51"  # SETM
+    b"\x00\x00\x00\x3c\x00\x52"  # SRN
+    b"\x00\x00\x00\x3c\x00\x54"  # ETH
+    b"\x00\x00\x00\x3c\x00\x57"  # ETH
+    b"\x00\x00\x00\x3c\x00\x58"  # W3Q
+    b"\x00\x00\x00\x3c\x00\x59"  # SDN
+    b"\x00\x00\x00\x3c\x00\x5a"  # PLS
+    b"\x00\x00\x00\x3c\x00\x5e"  # CLASS
+    b"\x00\x00\x00\x3c\x00\x5f"  # TAO
+    b"\x00\x00\x00\x3c\x00\x62"  # BCS
+    b"\x00\x00\x00\x3c\x00\x63"  # cTH
+    b"\x00\x00\x00\x3c\x00\x65"  # HAIC
+    b"\x00\x00\x00\x3c\x00\x69"  # YETI
+    b"\x00\x00\x00\x3c\x00\x6a"  # L99
+    b"\x00\x00\x00\x3c\x00\x6e"  # NEW
+    b"\x00\x00\x00\x3c\x00\x6f"  # SKU
+    b"\x00\x00\x00\x3c\x00\x70"  # CLV
+    b"\x00\x00\x00\x3c\x00\x71"  # CFX
+    b"\x00\x00\x00\x3c\x00\x72"  # METIS
+    b"\x00\x00\x00\x3c\x00\x73"  # MATH
+    b"\x00\x00\x00\x3c\x00\x75"  # IORA
+    b"\x00\x00\x00\x3c\x00\x76"  # WTT
+    b"\x00\x00\x00\x3c\x00\x77"  # POP
+    b"\x00\x00\x00\x3c\x00\x78"  # ENTER
+    b"\x00\x00\x00\x3c\x00\x79"  # HO
+    b"\x00\x00\x00\x3c\x00\x7a"  # GLMR
+    b"\x00\x00\x00\x3c\x00\x7b"  # MOVR
+    b"\x00\x00\x00\x3c\x00\x7d"  # CATE
+    b"\x00\x00\x00\x3c\x00\x7e"  # BTA
+    b"\x00\x00\x00\x3c\x00\x7f"  # TSF
+    b"\x00\x00\x00\x3c\x00\x80"  # BOY
+    b"\x00\x00\x00\x3c\x00\x84"  # ECO
+    b"\x00\x00\x00\x3c\x00\x85"  # EVA
+    b"\x00\x00\x00\x3c\x00\x86"  # KTO
+    b"\x00\x00\x00\x3c\x00\x87"  # PRB
+    b"\x00\x00\x00\x3c\x00\x88"  # DYNO
+    b"\x00\x00\x00\x3c\x00\x89"  # IOTX
+    b"\x00\x00\x00\x3c\x00\x8a"  # MNT
+    b"\x00\x00\x00\x3c\x00\x8b"  # ES
+    b"\x00\x00\x00\x3c\x00\x8c"  # UZMI
+    b"\x00\x00\x00\x3c\x00\x8d"  # RBD
+    b"\x00\x00\x00\x3c\x00\x8e"  # PIX
+    b"\x00\x00\x00\x3c\x00\x8f"  # TELE
+    b"\x00\x00\x00\x3c\x00\x91"  # ETH
+    b"\x00\x00\x00\x3c\x00\x93"  # U+25B3
+    b"\x00\x00\x00\x3c\x00\x94"  # EVMOS
+    b"\x00\x00\x00\x3c\x00\x95"  # GNC
+    b"\x00\x00\x00\x3c\x00\x97"  # GEN
+    b"\x00\x00\x00\x3c\x00\x98"  # CCP
+    b"\x00\x00\x00\x3c\x00\x99"  # WGM
+    b"\x00\x00\x00\x3c\x00\x9b"  # PHX
+    b"\x00\x00\x00\x3c\x00\x9c"  # MTT
+    b"\x00\x00\x00\x3c\x00\x9e"  # BTCIX
+    b"\x00\x00\x00\x3c\x00\xa0"  # MINTME
+    b"\x00\x00\x00\x3c\x00\xa4"  # peggle
+    b"\x00\x00\x00\x3c\x00\xa5"  # ETH
+    b"\x00\x00\x00\x3c\x00\xa6"  # CELO
+    b"\x00\x00\x00\x3c\x00\xaa"  # REI
+    b"\x00\x00\x00\x3c\x00\xac"  # JEWEL
+    b"\x00\x00\x00\x3c\x00\xad"  # ETH
+    b"\x00\x00\x00\x3c\x00\xaf"  # ECS
+    b"\x00\x00\x00\x3c\x00\xb1"  # ETH
+    b"\x00\x00\x00\x3c\x00\xb4"  # UBC
+    b"\x00\x00\x00\x3c\x00\xb5"  # QKC
+    b"\x00\x00\x00\x3c\x00\xb6"  # QKC
+    b"\x00\x00\x00\x3c\x00\xb7"  # QKC
+    b"\x00\x00\x00\x3c\x00\xb8"  # QKC
+    b"\x00\x00\x00\x3c\x00\xb9"  # QKC
+    b"\x00\x00\x00\x3c\x00\xba"  # QKC
+    b"\x00\x00\x00\x3c\x00\xbb"  # QKC
+    b"\x00\x00\x00\x3c\x00\xbc"  # QKC
+    b"\x00\x00\x00\x3c\x00\xbd"  # QKC
+    b"\x00\x00\x00\x3c\x00\xbf"  # atp
+    b"\x00\x00\x00\x3c\x00\xc0"  # lat
+    b"\x00\x00\x00\x3c\x00\xc3"  # $OC
+    b"\x00\x00\x00\x3c\x00\xc4"  # POLIS
+    b"\x00\x00\x00\x3c\x00\xc5"  # VS
+    b"\x00\x00\x00\x3c\x00\xc8"  # XERO
+    b"\x00\x00\x00\x3c\x00\xcb"  # TPEP
+    b"\x00\x00\x00\x3c\x00\xcc"  # ILT
+    b"\x00\x00\x00\x3c\x00\xcd"  # QKI
+    b"\x00\x00\x00\x3c\x00\xcf"  # JOYS
+    b"\x00\x00\x00\x3c\x00\xd2"  # NEON
+    b"\x00\x00\x00\x3c\x00\xd3"  # OLT
+    b"\x00\x00\x00\x3c\x00\xd4"  # IPOS
+    b"\x00\x00\x00\x3c\x00\xd5"  # ETH
+    b"\x00\x00\x00\x3c\x00\xda"  # HOP
+    b"\x00\x00\x00\x3c\x00\xdc"  # PALM
+    b"\x00\x00\x00\x3c\x00\xdd"  # NTT
+    b"\x00\x00\x00\x3c\x00\xde"  # MOLE
+    b"\x00\x00\x00\x3d\x00\x25"  # ETC
+    b"\x00\x00\x00\x4c\x00\x2c"  # MIX
+    b"\x00\x00\x00\x6c\x00\x07"  # UBQ
+    b"\x00\x00\x00\x7e\x00\x3f"  # OY
+    b"\x00\x00\x00\x7f\x00\x40"  # FETH
+    b"\x00\x00\x00\x89\x00\x17"  # RBTC
+    b"\x00\x00\x00\xa3\x00\x28"  # ELLA
+    b"\x00\x00\x00\xa4\x00\xdb"  # PIRL
+    b"\x00\x00\x00\xb2\x00\x35"  # POA
+    b"\x00\x00\x00\xb8\x00\xc9"  # MUSIC
+    b"\x00\x00\x00\xe3\x00\x9f"  # WEB
+    b"\x00\x00\x00\xf6\x00\x4e"  # EWT
+    b"\x00\x00\x01\x0d\x00\x53"  # HPB
+    b"\x00\x00\x01\x20\x00\xa2"  # FSN
+    b"\x00\x00\x01\x58\x00\xce"  # AUX
+    b"\x00\x00\x01\xcd\x00\x55"  # FIL
+    b"\x00\x00\x01\xd0\x00\x37"  # ETI
+    b"\x00\x00\x01\xdf\x00\x92"  # OLO
+    b"\x00\x00\x01\xf3\x00\x5c"  # RUPX
+    b"\x00\x00\x02\x0b\x00\x82"  # EDG
+    b"\x00\x00\x02\x1a\x00\x1b"  # VAL
+    b"\x00\x00\x02\x6d\x00\x9a"  # ZERO
+    b"\x00\x00\x02\x81\x00\x56"  # KCS
+    b"\x00\x00\x02\xae\x00\x61"  # KAR
+    b"\x00\x00\x02\xbc\x00\x36"  # XDAI
+    b"\x00\x00\x02\xca\x00\x22"  # BNB
+    b"\x00\x00\x03\x13\x00\x64"  # ACA
+    b"\x00\x00\x03\x34\x00\x66"  # CLO
+    b"\x00\x00\x03\x79\x00\x32"  # VIC
+    b"\x00\x00\x03\x94\x00\x0a"  # META
+    b"\x00\x00\x03\xc6\x00\x42"  # POL
+    b"\x00\x00\x03\xe9\x00\x3a"  # TT
+    b"\x00\x00\x03\xf0\x00\x83"  # RPG
+    b"\x00\x00\x03\xf2\x00\x41"  # HT
+    b"\x00\x00\x03\xf3\x00\xc6"  # ELV
+    b"\x00\x00\x03\xfc\x00\x6d"  # EVC
+    b"\x00\x00\x03\xff\x00\xd6"  # ONE
+    b"\x00\x00\x03\xff\x00\xd7"  # ONE
+    b"\x00\x00\x03\xff\x00\xd8"  # ONE
+    b"\x00\x00\x03\xff\x00\xd9"  # ONE
+    b"\x00\x00\x05\xe8\x00\x5d"  # AAC
+    b"\x00\x00\x07\xc3\x00\x81"  # EGEM
+    b"\x00\x00\x08\xad\x00\x4c"  # ASK
+    b"\x00\x00\x17\xac\x00\x24"  # GO
+    b"\x00\x00\x20\x19\x00\x90"  # KAIA
+    b"\x00\x00\x23\x2d\x00\xa8"  # AVAX
+    b"\x00\x00\x26\x46\x00\x96"  # DTT
+    b"\x00\x00\x79\x7e\x00\xa1"  # ESN
+    b"\x00\x00\x9b\x75\x00\xa3"  # NRG
+    b"\x00\x03\x0f\xb1\x00\xbe"  # AKA
+    b"\x00\x03\xc3\x01\x00\xc1"  # ATS
+    b"\x00\x14\x09\x5a\x00\xc7"  # ETHO
+    b"\x00\x57\x41\x4e\x00\x68"  # WAN
+    b"\x03\xad\xbc\x39\x00\xd0"  # AQUA
+)
+
+_NETWORK_DATA = (  # primary color, symbol, name and icon lengths, symbol, name, icon
+    b"\x63\x7f\xff\x03\x08\x0b\x45\x54\x48\x45\x74\x68\x65\x72\x65\x75\x6d\x65\x76\x6d\x2d\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0f\x0b\x45\x58\x50\x45\x78\x70\x61\x6e\x73\x65\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x65\x78\x70\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x07\x0c\x74\x45\x54\x48\x52\x6f\x70\x73\x74\x65\x6e\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x07\x0c\x74\x45\x54\x48\x52\x69\x6e\x6b\x65\x62\x79\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x06\x0c\x74\x45\x54\x48\x47\x6f\x65\x72\x6c\x69\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x0d\x0c\x74\x4b\x4f\x54\x4b\x6f\x74\x74\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6b\x6f\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x09\x0b\x54\x43\x48\x54\x68\x61\x69\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x74\x63\x68\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x04\x0b\x55\x42\x51\x55\x62\x69\x71\x65\x76\x6d\x2d\x75\x62\x71\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x14\x0c\x54\x55\x42\x51\x55\x62\x69\x71\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x75\x62\x71\x2e\x70\x6e\x67"
+    b"\xff\x04\x20\x03\x02\x0c\x45\x54\x48\x4f\x50\x65\x76\x6d\x2d\x6f\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x08\x0c\x4d\x45\x54\x41\x4d\x65\x74\x61\x64\x69\x75\x6d\x65\x76\x6d\x2d\x6d\x65\x74\x61\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x10\x0c\x74\x4b\x41\x4c\x4d\x65\x74\x61\x64\x69\x75\x6d\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6b\x61\x6c\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x07\x15\x0f\x74\x73\x44\x49\x4f\x44\x45\x44\x69\x6f\x64\x65\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x53\x74\x61\x67\x69\x6e\x67\x65\x76\x6d\x2d\x74\x73\x64\x69\x6f\x64\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x05\x0b\x46\x4c\x52\x46\x6c\x61\x72\x65\x65\x76\x6d\x2d\x66\x6c\x72\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x0c\x0d\x44\x49\x4f\x44\x45\x44\x69\x6f\x64\x65\x20\x50\x72\x65\x6e\x65\x74\x65\x76\x6d\x2d\x64\x69\x6f\x64\x65\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x17\x0d\x74\x43\x46\x4c\x52\x53\x6f\x6e\x67\x62\x69\x72\x64\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x43\x6f\x73\x74\x6f\x6e\x65\x76\x6d\x2d\x74\x63\x66\x6c\x72\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x14\x0b\x54\x46\x49\x54\x68\x61\x69\x43\x68\x61\x69\x6e\x20\x32\x2e\x30\x20\x54\x68\x61\x69\x46\x69\x65\x76\x6d\x2d\x74\x66\x69\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x03\x13\x0b\x54\x53\x54\x54\x68\x75\x6e\x64\x65\x72\x43\x6f\x72\x65\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x73\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x17\x0b\x53\x47\x42\x53\x6f\x6e\x67\x62\x69\x72\x64\x20\x43\x61\x6e\x61\x72\x79\x2d\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x73\x67\x62\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x13\x0b\x45\x4c\x41\x45\x6c\x61\x73\x74\x6f\x73\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x6c\x61\x2e\x70\x6e\x67"
+    b"\x11\x99\xfa\x03\x06\x0b\x43\x52\x4f\x43\x72\x6f\x6e\x6f\x73\x65\x76\x6d\x2d\x63\x72\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0a\x0c\x53\x48\x49\x42\x53\x68\x69\x62\x61\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x73\x68\x69\x62\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x02\x0a\x0a\x4c\x31\x47\x65\x6e\x65\x73\x69\x73\x20\x4c\x31\x65\x76\x6d\x2d\x6c\x31\x2e\x70\x6e\x67"
+    b"\xff\x91\x00\x04\x09\x0c\x52\x42\x54\x43\x52\x6f\x6f\x74\x73\x74\x6f\x63\x6b\x65\x76\x6d\x2d\x72\x62\x74\x63\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x11\x0d\x74\x52\x42\x54\x43\x52\x6f\x6f\x74\x73\x74\x6f\x63\x6b\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x72\x62\x74\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x08\x0c\x47\x6f\x6f\x44\x47\x6f\x6f\x64\x44\x61\x74\x61\x65\x76\x6d\x2d\x67\x6f\x6f\x64\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x54\x42\x47\x54\x42\x57\x47\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x74\x62\x67\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x56\x41\x4c\x56\x61\x6c\x6f\x72\x62\x69\x74\x65\x76\x6d\x2d\x76\x61\x6c\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x09\x0c\x54\x4c\x4f\x53\x54\x65\x6c\x6f\x73\x20\x45\x56\x4d\x65\x76\x6d\x2d\x74\x6c\x6f\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0c\x0c\x43\x52\x41\x42\x43\x72\x61\x62\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x63\x72\x61\x62\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0b\x0b\x58\x44\x43\x58\x44\x43\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x78\x64\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x13\x0c\x54\x58\x44\x43\x58\x44\x43\x20\x41\x70\x6f\x74\x68\x65\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x74\x78\x64\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x12\x0b\x63\x65\x74\x43\x6f\x69\x6e\x45\x78\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x63\x65\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x03\x0b\x5a\x59\x58\x5a\x79\x78\x65\x76\x6d\x2d\x7a\x79\x78\x2e\x70\x6e\x67"
+    b"\xf0\xb9\x0b\x03\x0f\x0b\x42\x4e\x42\x42\x4e\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x62\x6e\x62\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x4f\x4e\x47\x4f\x6e\x74\x6f\x6c\x6f\x67\x79\x65\x76\x6d\x2d\x6f\x6e\x67\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x02\x07\x0a\x47\x4f\x47\x6f\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x67\x6f\x2e\x70\x6e\x67"
+    b"\x32\x83\x32\x03\x10\x0b\x45\x54\x43\x45\x74\x68\x65\x72\x65\x75\x6d\x20\x43\x6c\x61\x73\x73\x69\x63\x65\x76\x6d\x2d\x65\x74\x63\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x0e\x0c\x54\x45\x54\x43\x4d\x6f\x72\x64\x65\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x65\x74\x63\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x0e\x0d\x74\x4d\x45\x54\x43\x4d\x6f\x72\x64\x6f\x72\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6d\x65\x74\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x07\x0c\x45\x4c\x4c\x41\x45\x6c\x6c\x61\x69\x73\x6d\x65\x76\x6d\x2d\x65\x6c\x6c\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x4f\x4b\x54\x4f\x4b\x58\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x6f\x6b\x74\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x0f\x0c\x74\x44\x42\x4d\x44\x42\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x64\x62\x6d\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x07\x0c\x45\x49\x44\x49\x49\x44\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x69\x64\x69\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x03\x0b\x4d\x49\x58\x4d\x69\x78\x65\x76\x6d\x2d\x6d\x69\x78\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x11\x0c\x53\x50\x4f\x41\x50\x4f\x41\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x53\x6f\x6b\x6f\x6c\x65\x76\x6d\x2d\x73\x70\x6f\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0b\x0c\x50\x45\x54\x48\x50\x72\x69\x6d\x75\x73\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x70\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x09\x0b\x52\x4e\x41\x47\x65\x6e\x65\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x72\x6e\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x05\x0b\x4d\x54\x52\x4d\x65\x74\x65\x72\x65\x76\x6d\x2d\x6d\x74\x72\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0c\x0b\x53\x4e\x54\x4e\x6f\x76\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x73\x6e\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x07\x0b\x56\x49\x43\x56\x69\x63\x74\x69\x6f\x6e\x65\x76\x6d\x2d\x76\x69\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0e\x0b\x47\x41\x52\x47\x61\x72\x69\x7a\x6f\x6e\x20\x53\x74\x61\x67\x65\x30\x65\x76\x6d\x2d\x67\x61\x72\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x17\x0c\x74\x42\x4e\x42\x42\x4e\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x62\x6e\x62\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x10\x0b\x50\x4f\x41\x50\x4f\x41\x20\x4e\x65\x74\x77\x6f\x72\x6b\x20\x43\x6f\x72\x65\x65\x76\x6d\x2d\x70\x6f\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x06\x0c\x58\x44\x41\x49\x47\x6e\x6f\x73\x69\x73\x65\x76\x6d\x2d\x78\x64\x61\x69\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x45\x54\x49\x45\x74\x68\x65\x72\x49\x6e\x63\x65\x76\x6d\x2d\x65\x74\x69\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x10\x0b\x57\x33\x47\x57\x65\x62\x33\x47\x61\x6d\x65\x73\x20\x44\x65\x76\x6e\x65\x74\x65\x76\x6d\x2d\x77\x33\x67\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x09\x0b\x56\x4c\x58\x56\x65\x6c\x61\x73\x20\x45\x56\x4d\x65\x76\x6d\x2d\x76\x6c\x78\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x02\x0b\x0a\x54\x54\x54\x68\x75\x6e\x64\x65\x72\x43\x6f\x72\x65\x65\x76\x6d\x2d\x74\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0f\x0b\x45\x54\x4c\x45\x74\x68\x65\x72\x4c\x69\x74\x65\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x74\x6c\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x04\x0c\x46\x55\x53\x45\x46\x75\x73\x65\x65\x76\x6d\x2d\x66\x75\x73\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x0d\x0d\x53\x50\x41\x52\x4b\x46\x75\x73\x65\x20\x53\x70\x61\x72\x6b\x6e\x65\x74\x65\x76\x6d\x2d\x73\x70\x61\x72\x6b\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x11\x0b\x44\x57\x55\x44\x65\x63\x65\x6e\x74\x72\x61\x6c\x69\x7a\x65\x64\x20\x57\x65\x62\x65\x76\x6d\x2d\x64\x77\x75\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x02\x07\x0a\x4f\x59\x4f\x59\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x6f\x79\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0b\x0c\x46\x45\x54\x48\x46\x61\x63\x74\x6f\x72\x79\x20\x31\x32\x37\x65\x76\x6d\x2d\x66\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\x01\x94\x3f\x02\x0f\x0a\x48\x54\x48\x75\x6f\x62\x69\x20\x45\x43\x4f\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x68\x74\x2e\x70\x6e\x67"
+    b"\x82\x47\xe5\x03\x07\x0d\x50\x4f\x4c\x50\x6f\x6c\x79\x67\x6f\x6e\x65\x76\x6d\x2d\x6d\x61\x74\x69\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x09\x0b\x44\x41\x58\x44\x41\x58\x20\x43\x48\x41\x49\x4e\x65\x76\x6d\x2d\x64\x61\x78\x2e\x70\x6e\x67"
+    b"\xff\xff\xff\x01\x05\x09\x53\x53\x6f\x6e\x69\x63\x65\x76\x6d\x2d\x73\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x14\x0c\x74\x50\x48\x54\x4c\x69\x67\x68\x74\x73\x74\x72\x65\x61\x6d\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x70\x68\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0c\x0b\x50\x48\x54\x4c\x69\x67\x68\x74\x73\x74\x72\x65\x61\x6d\x73\x65\x76\x6d\x2d\x70\x68\x74\x2e\x70\x6e\x67"
+    b"\xff\xff\xff\x03\x0d\x0b\x48\x53\x4b\x48\x61\x73\x68\x4b\x65\x79\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x68\x73\x6b\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x05\x0d\x53\x65\x65\x6c\x65\x53\x65\x65\x6c\x65\x65\x76\x6d\x2d\x73\x65\x65\x6c\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x03\x0b\x42\x54\x4d\x42\x4d\x43\x65\x76\x6d\x2d\x62\x74\x6d\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x10\x0b\x42\x54\x54\x42\x69\x74\x54\x6f\x72\x72\x65\x6e\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x62\x74\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x15\x0b\x30\x78\x46\x46\x72\x65\x69\x67\x68\x74\x20\x54\x72\x75\x73\x74\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x30\x78\x66\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x41\x53\x4b\x50\x65\x72\x6d\x69\x73\x73\x69\x6f\x6e\x65\x76\x6d\x2d\x61\x73\x6b\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x02\x07\x0a\x4c\x41\x4c\x41\x43\x48\x41\x49\x4e\x65\x76\x6d\x2d\x6c\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x10\x0b\x45\x57\x54\x45\x6e\x65\x72\x67\x79\x20\x57\x65\x62\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x77\x74\x2e\x70\x6e\x67"
+    b"\x19\x69\xff\x03\x0c\x0b\x46\x54\x4d\x46\x61\x6e\x74\x6f\x6d\x20\x4f\x70\x65\x72\x61\x65\x76\x6d\x2d\x66\x74\x6d\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x17\x0c\x74\x68\x74\x74\x48\x75\x6f\x62\x69\x20\x45\x43\x4f\x20\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x68\x74\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x07\x0c\x53\x45\x54\x4d\x53\x65\x74\x68\x65\x75\x6d\x65\x76\x6d\x2d\x73\x65\x74\x6d\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x16\x0b\x53\x52\x4e\x53\x55\x52\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x73\x72\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x1b\x0b\x48\x50\x42\x48\x69\x67\x68\x20\x50\x65\x72\x66\x6f\x72\x6d\x61\x6e\x63\x65\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x68\x70\x62\x2e\x70\x6e\x67"
+    b"\xcc\xff\x00\x03\x0c\x0c\x45\x54\x48\x42\x6f\x62\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x62\x6f\x62\x61\x2e\x70\x6e\x67"
+    b"\x00\x90\xff\x03\x08\x10\x46\x49\x4c\x46\x69\x6c\x65\x63\x6f\x69\x6e\x65\x76\x6d\x2d\x66\x69\x6c\x65\x63\x6f\x69\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x03\x0b\x4b\x43\x53\x4b\x43\x43\x65\x76\x6d\x2d\x6b\x63\x73\x2e\x70\x6e\x67"
+    b"\xff\xff\xff\x03\x06\x12\x45\x54\x48\x7a\x6b\x53\x79\x6e\x63\x65\x76\x6d\x2d\x7a\x6b\x73\x79\x6e\x63\x2d\x65\x72\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x05\x0b\x57\x33\x51\x57\x65\x62\x33\x51\x65\x76\x6d\x2d\x77\x33\x71\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x53\x44\x4e\x53\x68\x69\x64\x65\x6e\x65\x76\x6d\x2d\x73\x64\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x50\x4c\x53\x50\x75\x6c\x73\x65\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x70\x6c\x73\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x17\x0c\x74\x45\x54\x48\x4f\x70\x74\x69\x6d\x69\x73\x6d\x20\x47\x6f\x65\x72\x6c\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x06\x0c\x52\x55\x50\x58\x52\x75\x70\x61\x79\x61\x65\x76\x6d\x2d\x72\x75\x70\x78\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0e\x0b\x41\x41\x43\x44\x6f\x75\x62\x6c\x65\x2d\x41\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x61\x61\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x0b\x0d\x43\x4c\x41\x53\x53\x56\x65\x6c\x61\x31\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x63\x6c\x61\x73\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0b\x0b\x54\x41\x4f\x54\x61\x6f\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x74\x61\x6f\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x19\x0d\x74\x6d\x41\x43\x41\x41\x63\x61\x6c\x61\x20\x4d\x61\x6e\x64\x61\x6c\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x54\x43\x39\x65\x76\x6d\x2d\x74\x6d\x61\x63\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0e\x0b\x4b\x41\x52\x4b\x61\x72\x75\x72\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x6b\x61\x72\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x12\x0b\x42\x43\x53\x42\x6c\x6f\x63\x6b\x43\x68\x61\x69\x6e\x20\x53\x74\x61\x74\x69\x6f\x6e\x65\x76\x6d\x2d\x62\x63\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x63\x54\x48\x63\x68\x65\x61\x70\x45\x54\x48\x65\x76\x6d\x2d\x63\x74\x68\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0d\x0b\x41\x43\x41\x41\x63\x61\x6c\x61\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x61\x63\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x04\x0c\x48\x41\x49\x43\x48\x61\x69\x63\x65\x76\x6d\x2d\x68\x61\x69\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x43\x4c\x4f\x43\x61\x6c\x6c\x69\x73\x74\x6f\x65\x76\x6d\x2d\x63\x6c\x6f\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x1b\x0c\x54\x43\x4c\x4f\x43\x61\x6c\x6c\x69\x73\x74\x6f\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x44\x65\x70\x72\x65\x63\x61\x74\x65\x64\x65\x76\x6d\x2d\x74\x63\x6c\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x57\x41\x4e\x57\x61\x6e\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x77\x61\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x18\x0c\x59\x45\x54\x49\x4e\x65\x70\x61\x6c\x20\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x79\x65\x74\x69\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0d\x0b\x4c\x39\x39\x4c\x75\x63\x6b\x79\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x6c\x39\x39\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x13\x0d\x74\x4b\x41\x49\x41\x4b\x61\x69\x61\x20\x4b\x61\x69\x72\x6f\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6b\x61\x69\x61\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x0e\x0c\x74\x4e\x45\x57\x4e\x65\x77\x74\x6f\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6e\x65\x77\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0e\x0b\x45\x56\x43\x45\x76\x72\x69\x63\x65\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x65\x76\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x4e\x45\x57\x4e\x65\x77\x74\x6f\x6e\x65\x76\x6d\x2d\x6e\x65\x77\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x53\x4b\x55\x53\x61\x6b\x75\x72\x61\x65\x76\x6d\x2d\x73\x6b\x75\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0d\x0b\x43\x4c\x56\x43\x4c\x56\x20\x50\x61\x72\x61\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x63\x6c\x76\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0e\x0b\x43\x46\x58\x43\x6f\x6e\x66\x6c\x75\x78\x20\x65\x53\x70\x61\x63\x65\x65\x76\x6d\x2d\x63\x66\x78\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x0f\x0d\x4d\x45\x54\x49\x53\x4d\x65\x74\x69\x73\x20\x41\x6e\x64\x72\x6f\x6d\x65\x64\x61\x65\x76\x6d\x2d\x6d\x65\x74\x69\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x09\x0c\x4d\x41\x54\x48\x4d\x61\x74\x68\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x6d\x61\x74\x68\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x11\x0d\x74\x4d\x41\x54\x48\x4d\x61\x74\x68\x43\x68\x61\x69\x6e\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6d\x61\x74\x68\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0a\x0c\x49\x4f\x52\x41\x49\x6f\x72\x61\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x69\x6f\x72\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x1b\x0b\x57\x54\x54\x57\x6f\x72\x6c\x64\x20\x54\x72\x61\x64\x65\x20\x54\x65\x63\x68\x6e\x69\x63\x61\x6c\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x77\x74\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x09\x0b\x50\x4f\x50\x50\x6f\x70\x63\x61\x74\x65\x75\x6d\x65\x76\x6d\x2d\x70\x6f\x70\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x0a\x0d\x45\x4e\x54\x45\x52\x45\x6e\x74\x65\x72\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x65\x6e\x74\x65\x72\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x02\x04\x0a\x48\x4f\x48\x41\x4c\x4f\x65\x76\x6d\x2d\x68\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x08\x0c\x47\x4c\x4d\x52\x4d\x6f\x6f\x6e\x62\x65\x61\x6d\x65\x76\x6d\x2d\x67\x6c\x6d\x72\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x09\x0c\x4d\x4f\x56\x52\x4d\x6f\x6f\x6e\x72\x69\x76\x65\x72\x65\x76\x6d\x2d\x6d\x6f\x76\x72\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0e\x0b\x44\x45\x56\x4d\x6f\x6f\x6e\x62\x61\x73\x65\x20\x41\x6c\x70\x68\x61\x65\x76\x6d\x2d\x64\x65\x76\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0e\x0c\x43\x41\x54\x45\x43\x61\x74\x65\x63\x6f\x69\x6e\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x63\x61\x74\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x42\x54\x41\x42\x74\x61\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x62\x74\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x54\x53\x46\x54\x65\x73\x6c\x61\x66\x75\x6e\x64\x73\x65\x76\x6d\x2d\x74\x73\x66\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0b\x0b\x42\x4f\x59\x42\x4f\x4e\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x62\x6f\x79\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x08\x0c\x45\x47\x45\x4d\x45\x74\x68\x65\x72\x47\x65\x6d\x65\x76\x6d\x2d\x65\x67\x65\x6d\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x10\x0b\x45\x44\x47\x45\x64\x67\x65\x77\x61\x72\x65\x20\x45\x64\x67\x65\x45\x56\x4d\x65\x76\x6d\x2d\x65\x64\x67\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x10\x0b\x52\x50\x47\x52\x61\x6e\x67\x65\x72\x73\x20\x50\x72\x6f\x74\x6f\x63\x6f\x6c\x65\x76\x6d\x2d\x72\x70\x67\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x07\x0b\x45\x43\x4f\x45\x63\x6f\x62\x61\x6c\x6c\x65\x76\x6d\x2d\x65\x63\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x45\x56\x41\x45\x76\x61\x6e\x65\x73\x63\x6f\x65\x76\x6d\x2d\x65\x76\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x4b\x54\x4f\x4b\x6f\x72\x74\x68\x6f\x65\x76\x6d\x2d\x6b\x74\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x50\x52\x42\x50\x61\x72\x69\x62\x75\x20\x4e\x65\x74\x65\x76\x6d\x2d\x70\x72\x62\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x04\x0c\x44\x59\x4e\x4f\x44\x59\x4e\x4f\x65\x76\x6d\x2d\x64\x79\x6e\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0d\x0c\x49\x4f\x54\x58\x49\x6f\x54\x65\x58\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x69\x6f\x74\x78\x2e\x70\x6e\x67"
+    b"\xff\xff\xff\x03\x06\x0b\x4d\x4e\x54\x4d\x61\x6e\x74\x6c\x65\x65\x76\x6d\x2d\x6d\x6e\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x02\x07\x0a\x45\x53\x45\x72\x61\x53\x77\x61\x70\x65\x76\x6d\x2d\x65\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0c\x0c\x55\x5a\x4d\x49\x55\x7a\x6d\x69\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x75\x7a\x6d\x69\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x12\x0b\x52\x42\x44\x57\x65\x67\x6f\x63\x68\x61\x69\x6e\x20\x52\x75\x62\x69\x64\x69\x75\x6d\x65\x76\x6d\x2d\x72\x62\x64\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0b\x0b\x50\x49\x58\x50\x69\x78\x69\x65\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x70\x69\x78\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x08\x0c\x54\x45\x4c\x45\x54\x65\x6c\x65\x70\x6f\x72\x74\x65\x76\x6d\x2d\x74\x65\x6c\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x04\x0c\x4b\x41\x49\x41\x4b\x61\x69\x61\x65\x76\x6d\x2d\x6b\x61\x69\x61\x2e\x70\x6e\x67"
+    b"\x00\x52\xff\x03\x04\x0c\x45\x54\x48\x42\x61\x73\x65\x65\x76\x6d\x2d\x62\x61\x73\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0b\x0b\x4f\x4c\x4f\x54\x4f\x4f\x4c\x20\x47\x6c\x6f\x62\x61\x6c\x65\x76\x6d\x2d\x6f\x6c\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x06\x08\x0e\x55\x2b\x32\x35\x42\x33\x62\x6c\x6f\x78\x62\x65\x72\x67\x65\x76\x6d\x2d\x75\x2b\x32\x35\x62\x33\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x05\x0d\x45\x56\x4d\x4f\x53\x45\x76\x6d\x6f\x73\x65\x76\x6d\x2d\x65\x76\x6d\x6f\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0c\x0b\x47\x4e\x43\x47\x65\x6e\x65\x73\x69\x73\x20\x43\x6f\x69\x6e\x65\x76\x6d\x2d\x67\x6e\x63\x2e\x70\x6e\x67"
+    b"\x1a\x2a\x5f\x03\x10\x0b\x44\x54\x54\x44\x61\x74\x61\x20\x54\x72\x61\x64\x65\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x64\x74\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x12\x0b\x47\x45\x4e\x42\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x20\x47\x65\x6e\x65\x73\x69\x73\x65\x76\x6d\x2d\x67\x65\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0d\x0b\x43\x43\x50\x43\x72\x79\x70\x74\x6f\x43\x6f\x69\x6e\x50\x61\x79\x65\x76\x6d\x2d\x63\x63\x70\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x05\x0b\x57\x47\x4d\x57\x41\x47\x4d\x49\x65\x76\x6d\x2d\x77\x67\x6d\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x10\x0c\x5a\x45\x52\x4f\x53\x69\x6e\x67\x75\x6c\x61\x72\x69\x74\x79\x20\x5a\x45\x52\x4f\x65\x76\x6d\x2d\x7a\x65\x72\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x07\x0b\x50\x48\x58\x50\x68\x6f\x65\x6e\x69\x78\x65\x76\x6d\x2d\x70\x68\x78\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x07\x0b\x4d\x54\x54\x4d\x65\x74\x61\x44\x6f\x74\x65\x76\x6d\x2d\x6d\x74\x74\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x0b\x0c\x74\x53\x45\x50\x53\x45\x43\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x73\x65\x70\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x0d\x0d\x42\x54\x43\x49\x58\x42\x54\x43\x49\x58\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x62\x74\x63\x69\x78\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x08\x0b\x57\x45\x42\x57\x65\x62\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x77\x65\x62\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x06\x0f\x0e\x4d\x49\x4e\x54\x4d\x45\x4d\x69\x6e\x74\x4d\x65\x2e\x63\x6f\x6d\x20\x43\x6f\x69\x6e\x65\x76\x6d\x2d\x6d\x69\x6e\x74\x6d\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x13\x0b\x45\x53\x4e\x45\x74\x68\x65\x72\x73\x6f\x63\x69\x61\x6c\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x65\x73\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x46\x53\x4e\x46\x75\x73\x69\x6f\x6e\x65\x76\x6d\x2d\x66\x73\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x4e\x52\x47\x45\x6e\x65\x72\x67\x69\x65\x76\x6d\x2d\x6e\x72\x67\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x06\x0a\x0e\x70\x65\x67\x67\x6c\x65\x70\x65\x67\x67\x6c\x65\x63\x6f\x69\x6e\x65\x76\x6d\x2d\x70\x65\x67\x67\x6c\x65\x2e\x70\x6e\x67"
+    b"\x28\xa0\xf0\x03\x0c\x0c\x45\x54\x48\x41\x72\x62\x69\x74\x72\x75\x6d\x20\x4f\x6e\x65\x65\x76\x6d\x2d\x61\x72\x62\x31\x2e\x70\x6e\x67"
+    b"\x35\xd0\x7f\x04\x04\x0c\x43\x45\x4c\x4f\x43\x65\x6c\x6f\x65\x76\x6d\x2d\x63\x65\x6c\x6f\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x16\x0d\x74\x41\x56\x41\x58\x41\x76\x61\x6c\x61\x6e\x63\x68\x65\x20\x46\x75\x6a\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x61\x76\x61\x78\x2e\x70\x6e\x67"
+    b"\xe8\x41\x42\x04\x11\x0c\x41\x56\x41\x58\x41\x76\x61\x6c\x61\x6e\x63\x68\x65\x20\x43\x2d\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x61\x76\x61\x78\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x16\x0d\x74\x43\x45\x4c\x4f\x43\x65\x6c\x6f\x20\x41\x6c\x66\x61\x6a\x6f\x72\x65\x73\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x63\x65\x6c\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0b\x0b\x52\x45\x49\x52\x45\x49\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x72\x65\x69\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x0e\x0c\x74\x4e\x52\x47\x45\x6e\x65\x72\x67\x69\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x6e\x72\x67\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x09\x0d\x4a\x45\x57\x45\x4c\x44\x46\x4b\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x6a\x65\x77\x65\x6c\x2e\x70\x6e\x67"
+    b"\xff\xff\xff\x03\x05\x0d\x45\x54\x48\x4c\x69\x6e\x65\x61\x65\x76\x6d\x2d\x6c\x69\x6e\x65\x61\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x05\x14\x0d\x74\x43\x45\x4c\x4f\x43\x65\x6c\x6f\x20\x42\x61\x6b\x6c\x61\x76\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x63\x65\x6c\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0d\x0b\x45\x43\x53\x65\x53\x79\x6e\x63\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x65\x63\x73\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x03\x18\x0b\x74\x56\x54\x45\x6e\x65\x72\x67\x79\x20\x57\x65\x62\x20\x56\x6f\x6c\x74\x61\x20\x54\x65\x73\x74\x6e\x65\x74\x65\x76\x6d\x2d\x74\x76\x74\x2e\x70\x6e\x67"
+    b"\x59\x59\xd8\x03\x15\x0d\x45\x54\x48\x4d\x69\x78\x69\x6e\x20\x56\x69\x72\x74\x75\x61\x6c\x20\x4d\x61\x63\x68\x69\x6e\x65\x65\x76\x6d\x2d\x6d\x69\x78\x69\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x14\x0b\x46\x49\x4e\x46\x69\x72\x65\x6e\x7a\x65\x20\x74\x65\x73\x74\x20\x6e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x66\x69\x6e\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x06\x06\x0e\x74\x4d\x41\x54\x49\x43\x4d\x75\x6d\x62\x61\x69\x65\x76\x6d\x2d\x74\x6d\x61\x74\x69\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0e\x0b\x55\x42\x43\x55\x42\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x75\x62\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x51\x4b\x43\x51\x75\x61\x72\x6b\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x41\x4b\x41\x41\x6b\x72\x6f\x6d\x61\x65\x76\x6d\x2d\x61\x6b\x61\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x05\x0b\x61\x74\x70\x41\x6c\x61\x79\x61\x65\x76\x6d\x2d\x61\x74\x70\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x6c\x61\x74\x50\x6c\x61\x74\x4f\x4e\x65\x76\x6d\x2d\x6c\x61\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0c\x0b\x41\x54\x53\x41\x52\x54\x49\x53\x20\x73\x69\x67\x6d\x61\x31\x65\x76\x6d\x2d\x61\x74\x73\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x12\x0c\x74\x41\x54\x53\x41\x52\x54\x49\x53\x20\x54\x65\x73\x74\x6e\x65\x74\x20\x74\x61\x75\x31\x65\x76\x6d\x2d\x74\x61\x74\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x12\x0b\x24\x4f\x43\x53\x6f\x63\x69\x61\x6c\x20\x53\x6d\x61\x72\x74\x20\x43\x68\x61\x69\x6e\x65\x76\x6d\x2d\x24\x6f\x63\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x05\x0d\x50\x4f\x4c\x49\x53\x50\x6f\x6c\x69\x73\x65\x76\x6d\x2d\x70\x6f\x6c\x69\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x02\x06\x0a\x56\x53\x56\x69\x73\x69\x6f\x6e\x65\x76\x6d\x2d\x76\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x15\x0b\x45\x4c\x56\x45\x6c\x75\x76\x69\x6f\x20\x43\x6f\x6e\x74\x65\x6e\x74\x20\x46\x61\x62\x72\x69\x63\x65\x76\x6d\x2d\x65\x6c\x76\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0d\x0c\x45\x54\x48\x4f\x45\x74\x68\x6f\x20\x50\x72\x6f\x74\x6f\x63\x6f\x6c\x65\x76\x6d\x2d\x65\x74\x68\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x05\x0c\x58\x45\x52\x4f\x58\x65\x72\x6f\x6d\x65\x76\x6d\x2d\x78\x65\x72\x6f\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x05\x08\x0d\x4d\x55\x53\x49\x43\x4d\x75\x73\x69\x63\x6f\x69\x6e\x65\x76\x6d\x2d\x6d\x75\x73\x69\x63\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x07\x0c\x74\x45\x54\x48\x53\x65\x70\x6f\x6c\x69\x61\x65\x76\x6d\x2d\x74\x65\x74\x68\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x12\x0c\x54\x50\x45\x50\x50\x65\x70\x43\x68\x61\x69\x6e\x20\x43\x68\x75\x72\x63\x68\x69\x6c\x6c\x65\x76\x6d\x2d\x74\x70\x65\x70\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0b\x49\x4c\x54\x49\x4f\x4c\x69\x74\x65\x65\x76\x6d\x2d\x69\x6c\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0f\x0b\x51\x4b\x49\x71\x75\x61\x72\x6b\x62\x6c\x6f\x63\x6b\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x71\x6b\x69\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x10\x0b\x41\x55\x58\x41\x75\x78\x69\x6c\x69\x75\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x61\x75\x78\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0c\x0c\x4a\x4f\x59\x53\x4a\x6f\x79\x73\x20\x44\x69\x67\x69\x74\x61\x6c\x65\x76\x6d\x2d\x6a\x6f\x79\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x09\x0c\x41\x51\x55\x41\x41\x71\x75\x61\x63\x68\x61\x69\x6e\x65\x76\x6d\x2d\x61\x71\x75\x61\x2e\x70\x6e\x67"
+    b"\x96\x96\x96\x04\x14\x0c\x54\x4f\x59\x53\x4a\x6f\x79\x73\x20\x44\x69\x67\x69\x74\x61\x6c\x20\x54\x65\x73\x74\x4e\x65\x74\x65\x76\x6d\x2d\x74\x6f\x79\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x08\x0c\x4e\x45\x4f\x4e\x4e\x65\x6f\x6e\x20\x45\x56\x4d\x65\x76\x6d\x2d\x6e\x65\x6f\x6e\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x09\x0b\x4f\x4c\x54\x4f\x6e\x65\x4c\x65\x64\x67\x65\x72\x65\x76\x6d\x2d\x6f\x6c\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x0c\x0c\x49\x50\x4f\x53\x49\x50\x4f\x53\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x69\x70\x6f\x73\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x06\x0e\x45\x54\x48\x41\x75\x72\x6f\x72\x61\x65\x76\x6d\x2d\x61\x75\x72\x6f\x72\x61\x2e\x70\x6e\x67"
+    b"\x33\xd3\xd5\x03\x07\x0b\x4f\x4e\x45\x48\x61\x72\x6d\x6f\x6e\x79\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x07\x0b\x4f\x4e\x45\x48\x61\x72\x6d\x6f\x6e\x79\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x07\x0b\x4f\x4e\x45\x48\x61\x72\x6d\x6f\x6e\x79\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x07\x0b\x4f\x4e\x45\x48\x61\x72\x6d\x6f\x6e\x79\x65\x76\x6d\x2d\x6f\x6e\x65\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x0a\x0b\x48\x4f\x50\x44\x61\x74\x61\x48\x6f\x70\x70\x65\x72\x65\x76\x6d\x2d\x68\x6f\x70\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x04\x0c\x50\x49\x52\x4c\x50\x69\x72\x6c\x65\x76\x6d\x2d\x70\x69\x72\x6c\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x04\x0c\x50\x41\x4c\x4d\x50\x61\x6c\x6d\x65\x76\x6d\x2d\x70\x61\x6c\x6d\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x03\x05\x0b\x4e\x54\x54\x4e\x74\x69\x74\x79\x65\x76\x6d\x2d\x6e\x74\x74\x2e\x70\x6e\x67"
+    b"\xd2\xd2\xd2\x04\x10\x0c\x4d\x4f\x4c\x45\x4d\x6f\x6c\x65\x72\x65\x75\x6d\x20\x4e\x65\x74\x77\x6f\x72\x6b\x65\x76\x6d\x2d\x6d\x6f\x6c\x65\x2e\x70\x6e\x67"
+)
+# fmt: on
@@ -2,9 +2,17 @@
 # (by running `make templates` in `core`)
 # do not edit manually!
 
-# NOTE: using positional arguments saves 4400 bytes in flash size,
-# returning tuples instead of classes saved 800 bytes
-
+# NOTE: networks are stored in bytes constants, which stay in flash and need
+# no per-network objects. Lookups are binary searches over fixed-size records:
+# - _NETWORKS: chain_id (8 bytes), slip44 (4 bytes) and the offset of the
+#   network's entry in _NETWORK_DATA (2 bytes), sorted by chain_id
+# - _SLIP44_INDEX: slip44 (4 bytes) and the number of the network in
+#   _NETWORKS (2 bytes), sorted by slip44 and then chain_id
+# - _NETWORK_DATA: primary color (3 bytes), lengths of the symbol, name and
+#   icon (1 byte each), followed by the UTF-8 symbol, name and icon
+# All integers are big-endian.
+
+from micropython import const
 from typing import TYPE_CHECKING
 
 from trezor.messages import EthereumNetworkInfo
@@ -13,18 +21,49 @@ from apps.common.paths import HARDENED
 
 if TYPE_CHECKING:
     from typing import Iterator
+<%
+EXTRA_NETWORKS = [
+    (9798, 9798, "DTT", "Data Trade Chain", "evm-dtt.png", 0x1A2A5F),
+]
+
+def color(value):
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+def all_networks():
+    networks = [
+        (int(n.chain_id), int(n.slip44), n.shortcut, n.name, n.icon, color(n.primary_color))
+        for n in sorted(supported_on("trezor2", eth), key=lambda network: (int(network.chain_id), network.name))
+    ] + EXTRA_NETWORKS
+    # stable sort, the first of networks with the same chain_id wins
+    return sorted(networks, key=lambda n: n[0])
+
+def network_tables():
+    networks = all_networks()
+    records = []
+    entries = []
+    offset = 0
+    for chain_id, slip44, symbol, name, icon, primary_color in networks:
+        strings = [s.encode() for s in (symbol, name, icon)]
+        assert all(len(s) < 256 for s in strings)
+        assert offset < 0x10000
+        records.append(
+            chain_id.to_bytes(8, "big") + slip44.to_bytes(4, "big") + offset.to_bytes(2, "big")
+        )
+        entry = primary_color.to_bytes(3, "big") + bytes(len(s) for s in strings) + b"".join(strings)
+        entries.append(entry)
+        offset += len(entry)
+    slip44_index = sorted(
+        (n[1].to_bytes(4, "big") + i.to_bytes(2, "big"), n)
+        for i, n in enumerate(networks)
+    )
+    return networks, records, entries, slip44_index
+%>\
+<% networks, records, entries, slip44_index = network_tables() %>\
 
-    # Removing the necessity to construct object to save space
-    # fmt: off
-    NetworkInfoTuple = tuple[
-        int,  # chain_id
-        int,  # slip44
-        str,  # symbol
-        str,  # name
-        str,  # icon
-        int,  # primary_color
-    ]
-    # fmt: on
+_CHAIN_ID_LEN = const(8)
+_SLIP44_LEN = const(4)
+_NETWORK_LEN = const(14)
+_SLIP44_RECORD_LEN = const(6)
 
 UNKNOWN_NETWORK = EthereumNetworkInfo(
     chain_id=0,
@@ -40,57 +79,79 @@ def shortcut_by_chain_id(chain_id: int) -> str:
 
 
 def all_slip44_ids_hardened() -> Iterator[int]:
-    for n in _networks_iterator():
-        yield n[1] | HARDENED
+    for pos in range(_CHAIN_ID_LEN, len(_NETWORKS), _NETWORK_LEN):
+        yield int.from_bytes(_NETWORKS[pos : pos + _SLIP44_LEN], "big") | HARDENED
 
 
 def by_chain_id(chain_id: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_chain_id = n[0]
-        if n_chain_id == chain_id:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    if chain_id < 0 or chain_id >> 64:
+        return UNKNOWN_NETWORK
+    key = chain_id.to_bytes(_CHAIN_ID_LEN, "big")
+    pos = _lower_bound(_NETWORKS, _NETWORK_LEN, key)
+    if _NETWORKS[pos : pos + _CHAIN_ID_LEN] != key:
+        return UNKNOWN_NETWORK
+    return _network_at(pos)
 
 
 def by_slip44(slip44: int) -> EthereumNetworkInfo:
-    for n in _networks_iterator():
-        n_slip44 = n[1]
-        if n_slip44 == slip44:
-            return EthereumNetworkInfo(
-                chain_id=n[0],
-                slip44=n[1],
-                symbol=n[2],
-                name=n[3],
-                icon=n[4],
-                primary_color=n[5],
-            )
-    return UNKNOWN_NETWORK
+    if slip44 < 0 or slip44 >> 32:
+        return UNKNOWN_NETWORK
+    key = slip44.to_bytes(_SLIP44_LEN, "big")
+    pos = _lower_bound(_SLIP44_INDEX, _SLIP44_RECORD_LEN, key)
+    if _SLIP44_INDEX[pos : pos + _SLIP44_LEN] != key:
+        return UNKNOWN_NETWORK
+    number = (_SLIP44_INDEX[pos + 4] << 8) | _SLIP44_INDEX[pos + 5]
+    return _network_at(number * _NETWORK_LEN)
+
+
+def _lower_bound(table: bytes, record_len: int, key: bytes) -> int:
+    # offset of the first record of `table` whose prefix is not less than `key`
+    key_len = len(key)
+    lo = 0
+    hi = len(table) // record_len
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = mid * record_len
+        if table[pos : pos + key_len] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo * record_len
+
+
+def _network_at(pos: int) -> EthereumNetworkInfo:
+    record = _NETWORKS[pos : pos + _NETWORK_LEN]
+    offset = (record[-2] << 8) | record[-1]
+    data = _NETWORK_DATA
+    symbol_start = offset + 6
+    name_start = symbol_start + data[offset + 3]
+    icon_start = name_start + data[offset + 4]
+    return EthereumNetworkInfo(
+        chain_id=int.from_bytes(record[:_CHAIN_ID_LEN], "big"),
+        slip44=int.from_bytes(record[_CHAIN_ID_LEN:-2], "big"),
+        symbol=data[symbol_start:name_start].decode(),
+        name=data[name_start:icon_start].decode(),
+        icon=data[icon_start : icon_start + data[offset + 5]].decode(),
+        primary_color=(data[offset] << 16) | (data[offset + 1] << 8) | data[offset + 2],
+    )
 
 
 # fmt: off
-def _networks_iterator() -> Iterator[NetworkInfoTuple]:
-% for n in sorted(supported_on("trezor2", eth), key=lambda network: (int(network.chain_id), network.name)):
-    yield (
-        ${n.chain_id},  # chain_id
-        ${n.slip44},  # slip44
-        "${n.shortcut}",  # symbol
-        "${n.name}",  # name
-        "${n.icon}",  # name
-        ${n.primary_color},  # primary_color
-    )
+_NETWORKS = (  # chain_id, slip44, data offset
+% for n, record in zip(networks, records):
+    ${black_repr(record)}  # ${n[2] | ascii}
 % endfor
-    yield (
-        9798,  # chain_id
-        9798,  # slip44
-        "DTT",  # symbol
-        "Data Trade Chain",  # name
-        "evm-dtt.png",  # icon
-        0x1A2A5F,  # primary_color
-    )
+)
+
+_SLIP44_INDEX = (  # slip44, network number
+% for record, n in slip44_index:
+    ${black_repr(record)}  # ${n[2] | ascii}
+% endfor
+)
+
+_NETWORK_DATA = (  # primary color, symbol, name and icon lengths, symbol, name, icon
+% for entry in entries:
+    ${black_repr(entry)}
+% endfor
+)
+# fmt: on
@@ -3,30 +3,56 @@
 # do not edit manually!
 # fmt: off
 
-# NOTE: returning a tuple instead of `TokenInfo` from the "data" function
-# saves 5600 bytes of flash size. Implementing the `_token_iterator`
-# instead of if-tree approach saves another 5600 bytes.
+# NOTE: the tokens of each chain are stored in two bytes constants, which stay
+# in flash and need no per-token objects:
+# - index: fixed-size records sorted by address, looked up by binary search,
+#   so a lookup takes O(log n) comparisons instead of a scan over all tokens
+# - data: for each token a 3-byte header (decimals, length of the symbol,
+#   length of the name) followed by the UTF-8 symbol and name
+# Each index record is the 20-byte address and the big-endian uint16 offset
+# of the token's entry in data.
 
 # NOTE: interestingly, it did not save much flash size to use smaller
 # parts of the address, for example address length of 10 bytes saves
 # 1 byte per entry, so 1887 bytes overall (and further decrease does not help).
 # (The idea was not having to store the whole address, even a smaller part
 # of it has enough collision-resistance.)
-# (In the if-tree approach the address length did not have any effect whatsoever.)
 
-from typing import Iterator
+from micropython import const
 
 from trezor.messages import EthereumTokenInfo
 <%
 from collections import defaultdict
 
+ADDRESS_LEN = 20
+
 def group_tokens(tokens):
     r = defaultdict(list)
     for t in sorted(tokens, key=lambda t: t.chain_id):
         r[t.chain_id].append(t)
     return r
+
+def token_tables(tokens):
+    # stable sort keeps the first of duplicate addresses first, which is the
+    # one the lower-bound search finds
+    offset = 0
+    result = []
+    for t in sorted(tokens, key=lambda t: t.address_bytes):
+        assert len(t.address_bytes) == ADDRESS_LEN
+        symbol = t.symbol.encode()
+        name = t.name.strip().encode()
+        assert t.decimals < 256 and len(symbol) < 256 and len(name) < 256
+        assert offset < 0x10000
+        record = t.address_bytes + offset.to_bytes(2, "big")
+        entry = bytes([t.decimals, len(symbol), len(name)]) + symbol + name
+        result.append((t, record, entry))
+        offset += len(entry)
+    return result
 %>\
 
+_ADDRESS_LEN = const(${ADDRESS_LEN})
+_RECORD_LEN = const(${ADDRESS_LEN + 2})
+
 UNKNOWN_TOKEN = EthereumTokenInfo(
     symbol="Token",
     decimals=0,
@@ -37,27 +63,51 @@ UNKNOWN_TOKEN = EthereumTokenInfo(
 
 
 def token_by_chain_address(chain_id: int, address: bytes) -> EthereumTokenInfo:
-    for addr, symbol, decimal, name in _token_iterator(chain_id):
-        if address == addr:
-            return EthereumTokenInfo(
-                symbol=symbol,
-                decimals=decimal,
-                address=address,
-                chain_id=chain_id,
-                name=name,
-            )
-    return UNKNOWN_TOKEN
-
-
-def _token_iterator(chain_id: int) -> Iterator[tuple[bytes, str, int, str]]:
+    tables = _token_tables(chain_id)
+    if tables is None:
+        return UNKNOWN_TOKEN
+    index, data = tables
+
+    # lower bound of `address` among the index records
+    lo = 0
+    hi = len(index) // _RECORD_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = mid * _RECORD_LEN
+        if index[pos : pos + _ADDRESS_LEN] < address:
+            lo = mid + 1
+        else:
+            hi = mid
+    pos = lo * _RECORD_LEN
+    if pos == len(index) or index[pos : pos + _ADDRESS_LEN] != address:
+        return UNKNOWN_TOKEN
+
+    offset = (index[pos + _ADDRESS_LEN] << 8) | index[pos + _ADDRESS_LEN + 1]
+    symbol_start = offset + 3
+    name_start = symbol_start + data[offset + 1]
+    return EthereumTokenInfo(
+        symbol=data[symbol_start:name_start].decode(),
+        decimals=data[offset],
+        address=address,
+        chain_id=chain_id,
+        name=data[name_start : name_start + data[offset + 2]].decode(),
+    )
+
+
+def _token_tables(chain_id: int) -> tuple[bytes, bytes] | None:
 % for token_chain_id, tokens in group_tokens(erc20).items():
+<% tables = token_tables(tokens) %>\
     if chain_id == ${token_chain_id}:  # ${tokens[0].chain}
-        % for t in tokens:
-        yield (  # address, symbol, decimals, name
-            ${black_repr(t.address_bytes)},
-            ${black_repr(t.symbol)},
-            ${t.decimals},
-            ${black_repr(t.name.strip())},
+        index = (  # address, data offset
+            % for t, record, _ in tables:
+            ${black_repr(record)}  # ${t.symbol | ascii}
+            % endfor
+        )
+        data = (  # decimals, symbol length, name length, symbol, name
+            % for _, _, entry in tables:
+            ${black_repr(entry)}
+            % endfor
         )
-        % endfor
+        return index, data
 % endfor
+    return None
@@ -844,6 +844,37 @@ class PSBT:
         f = BufferReader(psbt)
         end = len(psbt)
 
+        input_count, output_count = self.deserialize_global(f)
+
+        # Read input data
+        for i in range(input_count):
+            if f.tell() == end:
+                break
+            self.inputs.append(self.deserialize_input(f, i))
+
+        if len(self.inputs) != input_count:
+            raise Exception(
+                "Inputs provided does not match the number of inputs in transaction"
+            )
+
+        # Read output data
+        for i in range(output_count):
+            if f.tell() == end:
+                break
+            self.outputs.append(self.deserialize_output(f, i))
+
+        if len(self.outputs) != output_count:
+            raise Exception(
+                "Outputs provided does not match the number of outputs in transaction"
+            )
+
+    def deserialize_global(self, f: Readable) -> Tuple[int, int]:
+        """
+        Deserialize the magic bytes and the global map.
+
+        :param f: A byte stream containing the start of a serialized PSBT
+        :returns: The number of inputs and the number of outputs
+        """
         # Read the magic bytes
         magic = f.read(5)
         if magic != b"psbt\xff":
@@ -1006,47 +1037,54 @@ class PSBT:
             if not self.tx.is_null():
                 raise Exception("PSBT_GLOBAL_UNSIGNED_TX is not allowed in PSBTv2")
 
-        # Read input data
         if input_count is None:
             input_count = len(self.tx.vin)
-        for i in range(input_count):
-            if f.tell() == end:
-                break
-            psbt_in = PartiallySignedInput(self.version)
-            psbt_in.deserialize(f)
-            self.inputs.append(psbt_in)
+        if output_count is None:
+            output_count = len(self.tx.vout)
+        if self.version == 0:
+            self.tx_version = self.tx.nVersion
+            self.fallback_locktime = self.tx.nLockTime
+        return input_count, output_count
 
-            if self.version >= 2:
-                prev_txid = psbt_in.prev_txid
-            else:
-                prev_txid = ser_uint256(self.tx.vin[i].prevout.hash)
+    def deserialize_input(self, f: Readable, index: int) -> PartiallySignedInput:
+        """
+        Deserialize the map of an input. For PSBTv0 the outpoint and the sequence
+        are filled in from the global unsigned transaction.
 
-            if psbt_in.non_witness_utxo:
-                psbt_in.non_witness_utxo.rehash()
-                if psbt_in.non_witness_utxo.hash != prev_txid:
-                    raise Exception("Non-witness UTXO does not match outpoint hash")
+        :param f: A byte stream containing the serialized PSBT input
+        :param index: The index of the input
+        """
+        psbt_in = PartiallySignedInput(self.version)
+        psbt_in.deserialize(f)
 
-        if len(self.inputs) != input_count:
-            raise Exception(
-                "Inputs provided does not match the number of inputs in transaction"
-            )
+        if self.version == 0:
+            txin = self.tx.vin[index]
+            psbt_in.prev_txid = ser_uint256(txin.prevout.hash)
+            psbt_in.prev_out = txin.prevout.n
+            psbt_in.sequence = txin.nSequence
 
-        # Read output data
-        if output_count is None:
-            output_count = len(self.tx.vout)
-        for i in range(output_count):
-            if f.tell() == end:
-                break
-            output = PartiallySignedOutput(self.version)
-            output.deserialize(f)
-            self.outputs.append(output)
+        if psbt_in.non_witness_utxo:
+            psbt_in.non_witness_utxo.rehash()
+            if psbt_in.non_witness_utxo.hash != psbt_in.prev_txid:
+                raise Exception("Non-witness UTXO does not match outpoint hash")
+        return psbt_in
 
-        if len(self.outputs) != output_count:
-            raise Exception(
-                "Outputs provided does not match the number of outputs in transaction"
-            )
+    def deserialize_output(self, f: Readable, index: int) -> PartiallySignedOutput:
+        """
+        Deserialize the map of an output. For PSBTv0 the amount and the script
+        are filled in from the global unsigned transaction.
 
-        self.cache_unsigned_tx_pieces()
+        :param f: A byte stream containing the serialized PSBT output
+        :param index: The index of the output
+        """
+        output = PartiallySignedOutput(self.version)
+        output.deserialize(f)
+
+        if self.version == 0:
+            txout = self.tx.vout[index]
+            output.amount = txout.nValue
+            output.script = txout.scriptPubKey
+        return output
 
     def serialize(self) -> bytes:
         r = b""
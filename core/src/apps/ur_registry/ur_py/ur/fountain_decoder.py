@@ -5,8 +5,10 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 # pyright: off
-from .fountain_utils import choose_fragments, contains, is_strict_subset, set_difference
-from .utils import crc32_int, join_bytes, take_first, xor_with
+import utime
+
+from .fountain_utils import choose_fragments, indexes_to_mask, mask_to_indexes
+from .utils import bytes_to_int, crc32_int
 
 
 class InvalidPart(Exception):
@@ -17,57 +19,59 @@ class InvalidChecksum(Exception):
     pass
 
 
+# The fragment indexes mixed into a part are a bitmask, see fountain_utils, and
+# the XOR of the fragments is a big integer, so reducing one part by another is
+# two integer XORs. The data is only turned back into bytes when the message is
+# reassembled.
+#
+# The parts are kept in reduced row echelon form over GF(2). Every part we keep
+# has a pivot, the lowest fragment in its mask, which no other kept part contains.
+# A new part is reduced by the kept parts whose pivots it contains, then its own
+# pivot is eliminated from the others. A fragment is recovered as soon as the
+# parts received so far determine it, and the message as soon as they determine
+# all fragments.
 class FountainDecoder:
-    class Part:
-        def __init__(self, indexes, data):
-            self.indexes = frozenset(indexes)
-            self.data = data
-
-        @classmethod
-        def from_encoder_part(cls, p):
-            return cls(choose_fragments(p.seq_num, p.seq_len, p.checksum), p.data[:])
-
-        def indexes(self):
-            return self.indexes
-
-        def data(self):
-            return self.data
-
-        def is_simple(self):
-            return len(self.indexes) == 1
-
-        def index(self):
-            # TODO: Not efficient
-            return list(self.indexes)[0]
-
     # FountainDecoder
     def __init__(self):
-        self.received_part_indexes = set()
+        self.received_part_indexes = 0
         self.last_part_indexes = None
         self.processed_parts_count = 0
         self.result = None
         self.expected_part_indexes = None
+        self.expected_part_len = None
         self.expected_fragment_len = None
         self.expected_message_len = None
         self.expected_checksum = None
+        # recovered fragment (single bit mask) -> data
         self.simple_parts = {}
+        # pivot (single bit mask) -> (indexes, data)
         self.mixed_parts = {}
-        self.queued_parts = []
+        # time of the first and the latest part, and the time spent decoding
+        self.first_part_ticks = None
+        self.last_part_ticks = None
+        self.decode_us = 0
 
     def reset(self):
-        self.received_part_indexes.clear()
+        self.received_part_indexes = 0
         self.last_part_indexes = None
         self.processed_parts_count = 0
         self.result = None
         self.expected_part_indexes = None
+        self.expected_part_len = None
         self.expected_fragment_len = None
         self.expected_message_len = None
         self.expected_checksum = None
         self.simple_parts.clear()
         self.mixed_parts.clear()
-        self.queued_parts.clear()
+        self.first_part_ticks = None
+        self.last_part_ticks = None
+        self.decode_us = 0
+
     def expected_part_count(self):
-        return len(self.expected_part_indexes)  # TODO: Handle None?
+        return self.expected_part_len  # TODO: Handle None?
+
+    def received_part_count(self):
+        return len(self.simple_parts)
 
     def is_success(self):
         result = self.result
@@ -91,8 +95,24 @@ class FountainDecoder:
             return 1
         if self.expected_part_indexes is None:
             return 0
-        estimated_input_parts = self.expected_part_count() * 1.75
-        return min(0.95, self.processed_parts_count / estimated_input_parts)
+        expected_parts = self.expected_part_count()
+        estimated_input_parts = expected_parts * 1.75
+        # every part we keep brings one fragment closer, even if mixed
+        kept_parts = len(self.simple_parts) + len(self.mixed_parts)
+        return min(
+            0.95,
+            max(
+                self.processed_parts_count / estimated_input_parts,
+                kept_parts / expected_parts,
+            ),
+        )
+
+    def decode_rate(self):
+        # parts per second since the first part
+        if self.processed_parts_count < 2:
+            return 0
+        elapsed = utime.ticks_diff(self.last_part_ticks, self.first_part_ticks)
+        return (self.processed_parts_count - 1) * 1000 / max(elapsed, 1)
 
     def receive_part(self, encoder_part):
         # Don't process the part if we're already done
@@ -103,96 +123,90 @@ class FountainDecoder:
         if not self.validate_part(encoder_part):
             return False
 
-        # Add this part to the queue
-        p = FountainDecoder.Part.from_encoder_part(encoder_part)
-        self.last_part_indexes = p.indexes
-        self.enqueue(p)
+        start = utime.ticks_us()
+        indexes = choose_fragments(
+            encoder_part.seq_num, encoder_part.seq_len, encoder_part.checksum
+        )
+        mask = indexes_to_mask(indexes)
+        self.last_part_indexes = mask
+        # self.print_part(mask)
 
-        # Process the queue until we're done or the queue is empty
-        while not self.is_complete() and len(self.queued_parts) != 0:
-            self.process_queue_item()
+        # Don't process duplicate parts
+        if mask & self.received_part_indexes != mask:
+            self.process_part(mask, bytes_to_int(encoder_part.data))
+            # self.print_state()
 
         # Keep track of how many parts we've processed
         self.processed_parts_count += 1
+        now = utime.ticks_ms()
+        if self.first_part_ticks is None:
+            self.first_part_ticks = now
+        self.last_part_ticks = now
+        self.decode_us += utime.ticks_diff(utime.ticks_us(), start)
 
         # self.print_part_end()
 
         return True
 
     # Join all the fragments of a message together, throwing away any padding
-    @staticmethod
-    def join_fragments(fragments, message_len):
-        message = join_bytes(fragments)
-        return take_first(message, message_len)
-
-    def enqueue(self, p):
-        self.queued_parts.append(p)
-
-    def process_queue_item(self):
-        part = self.queued_parts.pop(0)
-        # self.print_part(part)
+    def join_fragments(self):
+        fragment_len = self.expected_fragment_len
+        simple_parts = self.simple_parts
+        message = bytearray()
+        # the masks sort in the order of the fragments
+        for bit in sorted(simple_parts):
+            message.extend(simple_parts[bit].to_bytes(fragment_len, "big"))
+        return message[: self.expected_message_len]
+
+    def process_part(self, mask, data):
+        simple_parts = self.simple_parts
+        mixed_parts = self.mixed_parts
+
+        # Reduce the part by the fragments we have...
+        known = mask & self.received_part_indexes
+        if known:
+            for index in mask_to_indexes(known):
+                data ^= simple_parts[1 << index]
+            mask ^= known
+
+        # ...and by the mixed parts whose pivots it contains. Those contain no
+        # other pivots, so one pass is enough.
+        for pivot, (indexes, mixed) in mixed_parts.items():
+            if mask & pivot:
+                mask ^= indexes
+                data ^= mixed
+
+        if mask == 0:
+            # Nothing new in this part
+            return
 
-        if part.is_simple():
-            self.process_simple_part(part)
-        else:
-            self.process_mixed_part(part)
-        # self.print_state()
-
-    def reduce_mixed_by(self, p):
-        # Reduce all the current mixed parts by the given part
-        reduced_parts = []
-        for value in self.mixed_parts.values():
-            reduced_parts.append(self.reduce_part_by_part(value, p))
-
-        # Collect all the remaining mixed parts
-        new_mixed = {}
-        for reduced_part in reduced_parts:
-            # If this reduced part is now simple
-            if reduced_part.is_simple():
-                # Add it to the queue
-                self.enqueue(reduced_part)
+        # Eliminate the pivot of the part from the mixed parts
+        pivot = mask ^ (mask & (mask - 1))
+        for other in [p for p, (i, _) in mixed_parts.items() if i & pivot]:
+            indexes, mixed = mixed_parts[other]
+            indexes ^= mask
+            mixed ^= data
+            if indexes == other:
+                # The mixed part is down to its pivot
+                del mixed_parts[other]
+                self.process_simple_part(other, mixed)
             else:
-                # Otherwise, add it to the dict of current mixed parts
-                new_mixed[reduced_part.indexes] = reduced_part
-
-        self.mixed_parts = new_mixed
-
-    def reduce_part_by_part(self, a, b):
-        # If the fragments mixed into `b` are a strict (proper) subset of those in `a`...
-        if is_strict_subset(b.indexes, a.indexes):
-            # The new fragments in the revised part are `a` - `b`.
-            new_indexes = set_difference(a.indexes, b.indexes)
-            # The new data in the revised part are `a` XOR `b`
-            new_data = xor_with(bytearray(a.data), b.data)
-            return self.Part(new_indexes, new_data)
-        else:
-            # `a` is not reducable by `b`, so return a
-            return a
+                mixed_parts[other] = (indexes, mixed)
 
-    def process_simple_part(self, p):
-        # Don't process duplicate parts
-        fragment_index = p.index()
-        if contains(self.received_part_indexes, fragment_index):
-            return
+        if mask == pivot:
+            self.process_simple_part(pivot, data)
+        else:
+            mixed_parts[pivot] = (mask, data)
 
+    def process_simple_part(self, bit, data):
         # Record this part
-        self.simple_parts[p.indexes] = p
-        self.received_part_indexes.add(fragment_index)
+        self.simple_parts[bit] = data
+        self.received_part_indexes |= bit
 
         # If we've received all the parts
         if self.received_part_indexes == self.expected_part_indexes:
             # Reassemble the message from its fragments
-            sorted_parts = []
-            for value in self.simple_parts.values():
-                sorted_parts.append(value)
-
-            sorted_parts.sort(key=lambda a: a.index())
-
-            fragments = []
-            for part in sorted_parts:
-                fragments.append(part.data)
-
-            message = self.join_fragments(fragments, self.expected_message_len)
+            message = self.join_fragments()
 
             # Verify the message checksum and note success or failure
             checksum = crc32_int(message)
@@ -201,42 +215,12 @@ class FountainDecoder:
             else:
                 self.result = InvalidChecksum()
 
-        else:
-            # Reduce all the mixed parts by this part
-            self.reduce_mixed_by(p)
-
-    def process_mixed_part(self, p):
-        # Don't process duplicate parts
-        for r in self.mixed_parts.values():
-            if r == p.indexes:
-                return
-
-        # Reduce this part by all the others
-        p2 = p  # TODO: Does this need to make a copy of p?
-        for r in self.simple_parts.values():
-            p2 = self.reduce_part_by_part(p2, r)
-
-        for r in self.mixed_parts.values():
-            p2 = self.reduce_part_by_part(p2, r)
-
-        # If the part is now simple
-        if p2.is_simple():
-            # Add it to the queue
-            self.enqueue(p2)
-        else:
-            # Reduce all the mixed parts by this one
-            self.reduce_mixed_by(p2)
-            # Record this new mixed part
-            self.mixed_parts[p2.indexes] = p2
-
     def validate_part(self, p):
         # If this is the first part we've seen
         if self.expected_part_indexes is None:
             # Record the things that all the other parts we see will have to match to be valid.
-            self.expected_part_indexes = set()
-            for i in range(p.seq_len):
-                self.expected_part_indexes.add(i)
-
+            self.expected_part_indexes = (1 << p.seq_len) - 1
+            self.expected_part_len = p.seq_len
             self.expected_message_len = p.message_len
             self.expected_checksum = p.checksum
             self.expected_fragment_len = len(p.data)
@@ -256,9 +240,7 @@ class FountainDecoder:
 
     # debugging
     def indexes_to_string(self, indexes):
-        i = list(indexes)
-        i.sort()
-        s = [str(j) for j in i]
+        s = [str(j) for j in mask_to_indexes(indexes)]
         return "[{}]".format(", ".join(s))
 
     def result_description(self):
@@ -272,9 +254,9 @@ class FountainDecoder:
         else:
             assert False
 
-    def print_part(self, p):
+    def print_part(self, indexes):
         if __debug__:
-            print("part indexes: {}".format(self.indexes_to_string(p.indexes)))
+            print("part indexes: {}".format(self.indexes_to_string(indexes)))
 
     def print_part_end(self):
         expected = (
@@ -285,11 +267,14 @@ class FountainDecoder:
         percent = int(round(self.estimated_percent_complete() * 100))
         if __debug__:
             print(
-                "processed: {}, expected: {}, received: {}, percent: {}%".format(
+                "processed: {}, expected: {}, received: {}, percent: {}%, "
+                "rate: {:.1f} parts/s, decoding: {} ms".format(
                     self.processed_parts_count,
                     expected,
-                    len(self.received_part_indexes),
+                    self.received_part_count(),
                     percent,
+                    self.decode_rate(),
+                    self.decode_us // 1000,
                 )
             )
 
@@ -301,16 +286,15 @@ class FountainDecoder:
         )
         received = self.indexes_to_string(self.received_part_indexes)
         mixed = []
-        for indexes, p in self.mixed_parts.items():
+        for indexes, _ in self.mixed_parts.values():
             mixed.append(self.indexes_to_string(indexes))
 
         mixed_s = "[{}]".format(", ".join(mixed))
-        queued = len(self.queued_parts)
         res = self.result_description()
         if __debug__:
             print(
-                "parts: {}, received: {}, mixed: {}, queued: {}, result: {}".format(
-                    parts, received, mixed_s, queued, res
+                "parts: {}, received: {}, mixed: {}, result: {}".format(
+                    parts, received, mixed_s, res
                 )
             )
 # pyright: on
@@ -155,7 +155,7 @@ class FountainEncoder:
         return Part(self.seq_num, self.seq_len(), self.message_len, self.checksum, data)
 
     def mix(self, indexes):
-        result = [0] * self.fragment_len
+        result = bytearray(self.fragment_len)
         for index in indexes:
             xor_into(result, self.fragments[index])
         return result
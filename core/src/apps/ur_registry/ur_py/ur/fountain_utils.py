@@ -10,11 +10,14 @@ from .utils import int_to_bytes
 from .xoshiro256 import Xoshiro256
 
 
-# Fisher-Yates shuffle
-def shuffled(items, rng):
+# Fisher-Yates shuffle. With `count`, only the first `count` items are drawn,
+# they are the same as the first `count` items of the full shuffle.
+def shuffled(items, rng, count=None):
     remaining = items
     result = []
-    while len(remaining) > 0:
+    if count is None:
+        count = len(remaining)
+    while len(result) < count:
         index = rng.next_int(0, len(remaining) - 1)
         item = remaining.pop(index)
         result.append(item)
@@ -22,13 +25,21 @@ def shuffled(items, rng):
     return result
 
 
+# The sampler depends only on `seq_len`, which is the same for all parts of a
+# message, so the last one is kept.
+_degree_sampler = None
+
+
 def choose_degree(seq_len, rng):
-    degree_probabilities = []
-    for i in range(1, seq_len + 1):
-        degree_probabilities.append(1.0 / i)
+    global _degree_sampler
+    if _degree_sampler is None or _degree_sampler[0] != seq_len:
+        degree_probabilities = []
+        for i in range(1, seq_len + 1):
+            degree_probabilities.append(1.0 / i)
 
-    degree_chooser = RandomSampler(degree_probabilities)
-    return degree_chooser.next(lambda: rng.next_double()) + 1
+        _degree_sampler = (seq_len, RandomSampler(degree_probabilities))
+    degree_chooser = _degree_sampler[1]
+    return degree_chooser.next(rng.next_double) + 1
 
 
 def choose_fragments(seq_num, seq_len, checksum):
@@ -41,21 +52,25 @@ def choose_fragments(seq_num, seq_len, checksum):
         seed = int_to_bytes(seq_num) + int_to_bytes(checksum)
         rng = Xoshiro256.from_bytes(seed)
         degree = choose_degree(seq_len, rng)
-        indexes = []
-
-        for i in range(seq_len):
-            indexes.append(i)
-        shuffled_indexes = shuffled(indexes, rng)
-        return set(shuffled_indexes[0:degree])
+        indexes = list(range(seq_len))
+        return set(shuffled(indexes, rng, degree))
 
 
-def contains(set_or_list, el):
-    return el in set_or_list
+# Sets of fragment indexes are kept as bitmasks, bit `i` standing for fragment `i`.
+# Subset tests, differences and unions are then single integer operations.
+def indexes_to_mask(indexes):
+    mask = 0
+    for i in indexes:
+        mask |= 1 << i
+    return mask
 
 
-def is_strict_subset(a, b):
-    return a.issubset(b)
-
-
-def set_difference(a, b):
-    return a.difference(b)
+def mask_to_indexes(mask):
+    indexes = []
+    i = 0
+    while mask:
+        if mask & 1:
+            indexes.append(i)
+        mask >>= 1
+        i += 1
+    return indexes
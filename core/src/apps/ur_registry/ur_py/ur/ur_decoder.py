@@ -8,6 +8,7 @@
 # from .bytewords import Bytewords, Bytewords_Style_minimal
 from .fountain_decoder import FountainDecoder
 from .fountain_encoder import Part as FountainEncoderPart
+from .fountain_utils import mask_to_indexes
 from .ur import UR
 from .utils import drop_first, is_ur_type
 
@@ -162,10 +163,14 @@ class URDecoder:
         return self.fountain_decoder.expected_part_count()
 
     def received_part_indexes(self):
-        return self.fountain_decoder.received_part_indexes
+        return set(mask_to_indexes(self.fountain_decoder.received_part_indexes))
 
     def last_part_indexes(self):
-        return self.fountain_decoder.last_part_indexes
+        indexes = self.fountain_decoder.last_part_indexes
+        return set(mask_to_indexes(indexes)) if indexes is not None else None
+
+    def received_part_count(self):
+        return self.fountain_decoder.received_part_count()
 
     def processed_parts_count(self):
         return self.fountain_decoder.processed_parts_count
@@ -173,6 +178,9 @@ class URDecoder:
     def estimated_percent_complete(self) -> int:
         return int(self.fountain_decoder.estimated_percent_complete() * 100)
 
+    def decode_rate(self) -> float:
+        return self.fountain_decoder.decode_rate()
+
     def is_success(self):
         result = self.result
         return result if not isinstance(result, Exception) else False
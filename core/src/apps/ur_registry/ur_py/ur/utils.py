@@ -67,11 +67,15 @@ def join_bytes(list_of_ba):
     return out
 
 
+def xor_bytes(a, b):
+    # XOR whole buffers as big integers, not byte by byte in Python
+    count = len(a)
+    assert count == len(b)  # Must be the same length
+    return (bytes_to_int(a) ^ bytes_to_int(b)).to_bytes(count, "big")
+
+
 def xor_into(target, source):
-    count = len(target)
-    assert count == len(source)  # Must be the same length
-    for i in range(count):
-        target[i] ^= source[i]
+    target[:] = xor_bytes(target, source)
 
 
 def xor_with(a, b):
@@ -15,371 +15,536 @@ def register(wire_type: int, handler: Handler[Msg]) -> None:
     workflow_handlers[wire_type] = handler
 
 
+# generated by tools/codegen/gen_workflow_handlers.py from
+# tools/codegen/workflow_handlers.txt, do not edit manually!
 def find_message_handler_module(msg_type: int) -> str:
     """Statically find the appropriate workflow handler.
 
-    For now, new messages must be registered by hand in the if-elif manner below.
-    The reason for this is memory fragmentation optimization:
-    - using a dict would mean that the whole thing stays in RAM, whereas an if-elif
-      sequence is run from flash
+    The message type is compared against integer constants in a balanced tree, so
+    a lookup takes about log2(n) comparisons instead of one per message. The reason
+    for not using a dict is memory fragmentation optimization:
+    - using a dict would mean that the whole thing stays in RAM, whereas the
+      comparisons are run from flash
     - collecting everything as strings instead of importing directly means that we don't
       need to load any of the modules into memory until we actually need them
     """
-    # debug
-    if __debug__:
-        if msg_type == MessageType.LoadDevice:
-            return "apps.debug.load_device"
-        if msg_type == MessageType.ResetDevice:
-            return "apps.management.reset_device"
-        if msg_type == MessageType.RecoveryDevice:
-            return "apps.management.recovery_device"
-        if msg_type == MessageType.BackupDevice:
-            return "apps.management.backup_device"
-    # management
-    if msg_type == MessageType.WipeDevice:
-        return "apps.management.wipe_device"
-    if msg_type == MessageType.ApplySettings:
-        return "apps.management.apply_settings"
-    if msg_type == MessageType.ApplyFlags:
-        return "apps.management.apply_flags"
-    if msg_type == MessageType.ChangePin:
-        return "apps.management.change_pin"
-    if msg_type == MessageType.ChangeWipeCode:
-        return "apps.management.change_wipe_code"
-    elif msg_type == MessageType.GetNonce:
-        return "apps.management.get_nonce"
-    elif msg_type == MessageType.SESignMessage:
-        return "apps.management.se_sign_message"
-    elif msg_type == MessageType.RebootToBootloader:
-        return "apps.management.reboot_to_bootloader"
-    elif msg_type == MessageType.DeviceBackToBoot:
-        return "apps.management.reboot_to_bootloader"
-    elif msg_type == MessageType.RebootToBoardloader:
-        return "apps.management.reboot_to_boardloader"
-    elif msg_type == MessageType.ReadSEPublicCert:
-        return "apps.management.se_read_cert"
-
-    if utils.MODEL in ("T",) and msg_type == MessageType.SdProtect:
-        return "apps.management.sd_protect"
-    if utils.MODEL == "T" and msg_type == MessageType.ResourceUpload:
-        if utils.EMULATOR:
-            raise ValueError
-        return "apps.management.upload_res"
-    if utils.MODEL == "T" and msg_type == MessageType.ResourceUpdate:
-        if utils.EMULATOR:
-            raise ValueError
-        return "apps.management.update_res"
-    if utils.MODEL == "T" and msg_type == MessageType.ListResDir:
-        if utils.EMULATOR:
-            raise ValueError
-        return "apps.management.list_dir"
-
-    # bitcoin
-    if msg_type == MessageType.AuthorizeCoinJoin:
-        return "apps.bitcoin.authorize_coinjoin"
-    if msg_type == MessageType.GetPublicKey:
-        return "apps.bitcoin.get_public_key"
-    if msg_type == MessageType.GetAddress:
-        return "apps.bitcoin.get_address"
-    if msg_type == MessageType.GetOwnershipId:
-        return "apps.bitcoin.get_ownership_id"
-    if msg_type == MessageType.GetOwnershipProof:
-        return "apps.bitcoin.get_ownership_proof"
-    if msg_type == MessageType.SignTx:
-        return "apps.bitcoin.sign_tx"
-    if msg_type == MessageType.SignMessage:
-        return "apps.bitcoin.sign_message"
-    if msg_type == MessageType.VerifyMessage:
-        return "apps.bitcoin.verify_message"
-    if msg_type == MessageType.SignPsbt:
-        return "apps.bitcoin.sign_taproot"
-
-    # misc
-    if msg_type == MessageType.GetEntropy:
-        return "apps.misc.get_entropy"
-    if msg_type == MessageType.SignIdentity:
-        return "apps.misc.sign_identity"
-    if msg_type == MessageType.GetECDHSessionKey:
-        return "apps.misc.get_ecdh_session_key"
-    if msg_type == MessageType.CipherKeyValue:
-        return "apps.misc.cipher_key_value"
-    if msg_type == MessageType.GetFirmwareHash:
-        return "apps.misc.get_firmware_hash"
-
-    if not utils.BITCOIN_ONLY:
-        if msg_type == MessageType.BatchGetPublickeys:
-            return "apps.misc.batch_get_pubkeys"
-        if msg_type == MessageType.SetU2FCounter:
-            return "apps.management.set_u2f_counter"
-        if msg_type == MessageType.GetNextU2FCounter:
-            return "apps.management.get_next_u2f_counter"
-
-        # webauthn
-        if msg_type == MessageType.WebAuthnListResidentCredentials:
-            return "apps.webauthn.list_resident_credentials"
-        if msg_type == MessageType.WebAuthnAddResidentCredential:
-            return "apps.webauthn.add_resident_credential"
-        if msg_type == MessageType.WebAuthnRemoveResidentCredential:
-            return "apps.webauthn.remove_resident_credential"
-
-        # ethereum
-        if msg_type == MessageType.EthereumGetAddress:
-            return "apps.ethereum.get_address"
-        if msg_type == MessageType.EthereumGetPublicKey:
-            return "apps.ethereum.get_public_key"
-        if msg_type == MessageType.EthereumSignTx:
-            return "apps.ethereum.sign_tx"
-        if msg_type == MessageType.EthereumSignTxEIP1559:
-            return "apps.ethereum.sign_tx_eip1559"
-        if msg_type == MessageType.EthereumSignMessage:
-            return "apps.ethereum.sign_message"
-        if msg_type == MessageType.EthereumVerifyMessage:
-            return "apps.ethereum.verify_message"
-        if msg_type == MessageType.EthereumSignTypedData:
-            return "apps.ethereum.sign_typed_data"
-        if msg_type == MessageType.EthereumSignTypedHash:
-            return "apps.ethereum.sign_typed_data_hash"
-
-        # ethereum onekey
-        if msg_type == MessageType.EthereumGetAddressOneKey:
-            return "apps.ethereum.onekey.get_address"
-        if msg_type == MessageType.EthereumGetPublicKeyOneKey:
-            return "apps.ethereum.onekey.get_public_key"
-        if msg_type == MessageType.EthereumSignTxOneKey:
-            return "apps.ethereum.onekey.sign_tx"
-        if msg_type == MessageType.EthereumSignTxEIP1559OneKey:
-            return "apps.ethereum.onekey.sign_tx_eip1559"
-        if msg_type == MessageType.EthereumSignMessageOneKey:
-            return "apps.ethereum.onekey.sign_message"
-        if msg_type == MessageType.EthereumVerifyMessageOneKey:
-            return "apps.ethereum.onekey.verify_message"
-        if msg_type == MessageType.EthereumSignTypedDataOneKey:
-            return "apps.ethereum.onekey.sign_typed_data"
-        if msg_type == MessageType.EthereumSignTypedHashOneKey:
-            return "apps.ethereum.onekey.sign_typed_data_hash"
-
-        # monero
-        if msg_type == MessageType.MoneroGetAddress:
-            return "apps.monero.get_address"
-        if msg_type == MessageType.MoneroGetWatchKey:
-            return "apps.monero.get_watch_only"
-        if msg_type == MessageType.MoneroTransactionInitRequest:
-            return "apps.monero.sign_tx"
-        if msg_type == MessageType.MoneroKeyImageExportInitRequest:
-            return "apps.monero.key_image_sync"
-        if msg_type == MessageType.MoneroGetTxKeyRequest:
-            return "apps.monero.get_tx_keys"
-        if msg_type == MessageType.MoneroLiveRefreshStartRequest:
-            return "apps.monero.live_refresh"
-        if __debug__ and msg_type == MessageType.DebugMoneroDiagRequest:
-            return "apps.monero.diag"
-
-        # nem
-        if msg_type == MessageType.NEMGetAddress:
-            return "apps.nem.get_address"
-        if msg_type == MessageType.NEMSignTx:
-            return "apps.nem.sign_tx"
-        # neo
-        if msg_type == MessageType.NeoGetAddress:
-            return "apps.neo.get_address"
-        if msg_type == MessageType.NeoSignTx:
-            return "apps.neo.sign_tx"
-
-        # stellar
-        if msg_type == MessageType.StellarGetAddress:
-            return "apps.stellar.get_address"
-        if msg_type == MessageType.StellarSignTx:
-            return "apps.stellar.sign_tx"
-
-        # ripple
-        if msg_type == MessageType.RippleGetAddress:
-            return "apps.ripple.get_address"
-        if msg_type == MessageType.RippleSignTx:
-            return "apps.ripple.sign_tx"
-
-        # cardano
-        if msg_type == MessageType.CardanoGetAddress:
-            return "apps.cardano.get_address"
-        if msg_type == MessageType.CardanoGetPublicKey:
-            return "apps.cardano.get_public_key"
-        if msg_type == MessageType.CardanoSignTxInit:
-            return "apps.cardano.sign_tx"
-        if msg_type == MessageType.CardanoGetNativeScriptHash:
-            return "apps.cardano.get_native_script_hash"
-        if msg_type == MessageType.CardanoSignMessage:
-            return "apps.cardano.sign_message"
-
-        # tezos
-        if msg_type == MessageType.TezosGetAddress:
-            return "apps.tezos.get_address"
-        if msg_type == MessageType.TezosSignTx:
-            return "apps.tezos.sign_tx"
-        if msg_type == MessageType.TezosGetPublicKey:
-            return "apps.tezos.get_public_key"
-
-        # eos
-        if msg_type == MessageType.EosGetPublicKey:
-            return "apps.eos.get_public_key"
-        if msg_type == MessageType.EosSignTx:
-            return "apps.eos.sign_tx"
-
-        # binance
-        if msg_type == MessageType.BinanceGetAddress:
-            return "apps.binance.get_address"
-        if msg_type == MessageType.BinanceGetPublicKey:
-            return "apps.binance.get_public_key"
-        if msg_type == MessageType.BinanceSignTx:
-            return "apps.binance.sign_tx"
-
-        # conflux
-        if msg_type == MessageType.ConfluxGetAddress:
-            return "apps.conflux.get_address"
-        if msg_type == MessageType.ConfluxSignTx:
-            return "apps.conflux.sign_tx"
-        if msg_type == MessageType.ConfluxSignMessage:
-            return "apps.conflux.sign_message"
-        if msg_type == MessageType.ConfluxSignMessageCIP23:
-            return "apps.conflux.sign_message_cip23"
-
-        # ton
-        if msg_type == MessageType.TonGetAddress:
-            return "apps.ton.get_address"
-        if msg_type == MessageType.TonSignMessage:
-            return "apps.ton.sign_message"
-        if msg_type == MessageType.TonSignProof:
-            return "apps.ton.sign_proof"
-
-        # tron
-        if msg_type == MessageType.TronGetAddress:
-            return "apps.tron.get_address"
-        if msg_type == MessageType.TronSignTx:
-            return "apps.tron.sign_tx"
-        if msg_type == MessageType.TronSignMessage:
-            return "apps.tron.sign_message"
-
-        # solana
-        if msg_type == MessageType.SolanaGetAddress:
-            return "apps.solana.get_address"
-        if msg_type == MessageType.SolanaSignTx:
-            return "apps.solana.sign_tx"
-        if msg_type == MessageType.SolanaSignUnsafeMessage:
-            return "apps.solana.sign_unsafe_message"
-        if msg_type == MessageType.SolanaSignOffChainMessage:
-            return "apps.solana.sign_offchain_message"
-
-        # starcoin
-        if msg_type == MessageType.StarcoinGetAddress:
-            return "apps.starcoin.get_address"
-        if msg_type == MessageType.StarcoinGetPublicKey:
-            return "apps.starcoin.get_public_key"
-        if msg_type == MessageType.StarcoinSignTx:
-            return "apps.starcoin.sign_tx"
-        if msg_type == MessageType.StarcoinSignMessage:
-            return "apps.starcoin.sign_message"
-        if msg_type == MessageType.StarcoinVerifyMessage:
-            return "apps.starcoin.verify_message"
-
-        # near
-        if msg_type == MessageType.NearGetAddress:
-            return "apps.near.get_address"
-        if msg_type == MessageType.NearSignTx:
-            return "apps.near.sign_tx"
-        # aptos
-        if msg_type == MessageType.AptosGetAddress:
-            return "apps.aptos.get_address"
-        if msg_type == MessageType.AptosSignTx:
-            return "apps.aptos.sign_tx"
-        if msg_type == MessageType.AptosSignMessage:
-            return "apps.aptos.sign_message"
-
-        # algo
-        if msg_type == MessageType.AlgorandGetAddress:
-            return "apps.algorand.get_address"
-        if msg_type == MessageType.AlgorandSignTx:
-            return "apps.algorand.sign_tx"
-
-        # polkadot
-        if msg_type == MessageType.PolkadotGetAddress:
-            return "apps.polkadot.get_address"
-        if msg_type == MessageType.PolkadotSignTx:
-            return "apps.polkadot.sign_tx"
-
-        # sui
-        if msg_type == MessageType.SuiGetAddress:
-            return "apps.sui.get_address"
-        if msg_type == MessageType.SuiSignTx:
-            return "apps.sui.sign_tx"
-        if msg_type == MessageType.SuiSignMessage:
-            return "apps.sui.sign_message"
-
-        # filecoin
-        if msg_type == MessageType.FilecoinGetAddress:
-            return "apps.filecoin.get_address"
-        if msg_type == MessageType.FilecoinSignTx:
-            return "apps.filecoin.sign_tx"
-
-        # cosmos
-        if msg_type == MessageType.CosmosGetAddress:
-            return "apps.cosmos.get_address"
-        if msg_type == MessageType.CosmosSignTx:
-            return "apps.cosmos.sign_tx"
-
-        # kaspa
-        if msg_type == MessageType.KaspaGetAddress:
-            return "apps.kaspa.get_address"
-        if msg_type == MessageType.KaspaSignTx:
-            return "apps.kaspa.sign_tx"
-
-        # nexa
-        if msg_type == MessageType.NexaGetAddress:
-            return "apps.nexa.get_address"
-        if msg_type == MessageType.NexaSignTx:
-            return "apps.nexa.sign_tx"
-        # nervos
-        if msg_type == MessageType.NervosGetAddress:
-            return "apps.nervos.get_address"
-        if msg_type == MessageType.NervosSignTx:
-            return "apps.nervos.sign_tx"
-
-        if msg_type == MessageType.NostrGetPublicKey:
-            return "apps.nostr.get_public_key"
-        if msg_type == MessageType.NostrSignEvent:
-            return "apps.nostr.sign_event"
-        if msg_type == MessageType.NostrEncryptMessage:
-            return "apps.nostr.encrypt"
-        if msg_type == MessageType.NostrDecryptMessage:
-            return "apps.nostr.decrypt"
-        if msg_type == MessageType.NostrSignSchnorr:
-            return "apps.nostr.schnorr"
-
-        if msg_type == MessageType.LnurlAuth:
-            return "apps.lnurl.auth"
-
-        # scdo
-        if msg_type == MessageType.ScdoGetAddress:
-            return "apps.scdo.get_address"
-        if msg_type == MessageType.ScdoSignTx:
-            return "apps.scdo.sign_tx"
-        if msg_type == MessageType.ScdoSignMessage:
-            return "apps.scdo.sign_message"
-
-        # alephium
-        if msg_type == MessageType.AlephiumGetAddress:
-            return "apps.alephium.get_address"
-        if msg_type == MessageType.AlephiumSignTx:
-            return "apps.alephium.sign_tx"
-        if msg_type == MessageType.AlephiumSignMessage:
-            return "apps.alephium.sign_message"
+    if msg_type < 10018:
+        if msg_type < 152:
+            if msg_type < 49:
+                if msg_type < 25:
+                    if msg_type < 13:
+                        # ChangePin
+                        if msg_type == 4:
+                            return "apps.management.change_pin"
+                        # WipeDevice
+                        if msg_type == 5:
+                            return "apps.management.wipe_device"
+                        # GetEntropy
+                        if msg_type == 9:
+                            return "apps.misc.get_entropy"
+                        # GetPublicKey
+                        if msg_type == 11:
+                            return "apps.bitcoin.get_public_key"
+                    else:
+                        # LoadDevice
+                        if msg_type == 13 and __debug__:
+                            return "apps.debug.load_device"
+                        # ResetDevice
+                        if msg_type == 14 and __debug__:
+                            return "apps.management.reset_device"
+                        # SignTx
+                        if msg_type == 15:
+                            return "apps.bitcoin.sign_tx"
+                        # CipherKeyValue
+                        if msg_type == 23:
+                            return "apps.misc.cipher_key_value"
+                else:
+                    if msg_type < 34:
+                        # ApplySettings
+                        if msg_type == 25:
+                            return "apps.management.apply_settings"
+                        # ApplyFlags
+                        if msg_type == 28:
+                            return "apps.management.apply_flags"
+                        # GetAddress
+                        if msg_type == 29:
+                            return "apps.bitcoin.get_address"
+                        # GetNonce
+                        if msg_type == 31:
+                            return "apps.management.get_nonce"
+                    else:
+                        if msg_type < 39:
+                            # BackupDevice
+                            if msg_type == 34 and __debug__:
+                                return "apps.management.backup_device"
+                            # SignMessage
+                            if msg_type == 38:
+                                return "apps.bitcoin.sign_message"
+                        else:
+                            # VerifyMessage
+                            if msg_type == 39:
+                                return "apps.bitcoin.verify_message"
+                            # GetOwnershipId
+                            if msg_type == 43:
+                                return "apps.bitcoin.get_ownership_id"
+                            # RecoveryDevice
+                            if msg_type == 45 and __debug__:
+                                return "apps.management.recovery_device"
+            else:
+                if msg_type < 65:
+                    if msg_type < 58:
+                        # GetOwnershipProof
+                        if msg_type == 49:
+                            return "apps.bitcoin.get_ownership_proof"
+                        # AuthorizeCoinJoin
+                        if msg_type == 51:
+                            return "apps.bitcoin.authorize_coinjoin"
+                        # SignIdentity
+                        if msg_type == 53:
+                            return "apps.misc.sign_identity"
+                        # EthereumGetAddress
+                        if msg_type == 56 and not utils.BITCOIN_ONLY:
+                            return "apps.ethereum.get_address"
+                    else:
+                        # EthereumSignTx
+                        if msg_type == 58 and not utils.BITCOIN_ONLY:
+                            return "apps.ethereum.sign_tx"
+                        # GetECDHSessionKey
+                        if msg_type == 61:
+                            return "apps.misc.get_ecdh_session_key"
+                        # SetU2FCounter
+                        if msg_type == 63 and not utils.BITCOIN_ONLY:
+                            return "apps.management.set_u2f_counter"
+                        # EthereumSignMessage
+                        if msg_type == 64 and not utils.BITCOIN_ONLY:
+                            return "apps.ethereum.sign_message"
+                else:
+                    if msg_type < 80:
+                        # EthereumVerifyMessage
+                        if msg_type == 65 and not utils.BITCOIN_ONLY:
+                            return "apps.ethereum.verify_message"
+                        # NEMGetAddress
+                        if msg_type == 67 and not utils.BITCOIN_ONLY:
+                            return "apps.nem.get_address"
+                        # NEMSignTx
+                        if msg_type == 69 and not utils.BITCOIN_ONLY:
+                            return "apps.nem.sign_tx"
+                        # SdProtect
+                        if msg_type == 79 and utils.MODEL == "T":
+                            return "apps.management.sd_protect"
+                    else:
+                        if msg_type < 87:
+                            # GetNextU2FCounter
+                            if msg_type == 80 and not utils.BITCOIN_ONLY:
+                                return "apps.management.get_next_u2f_counter"
+                            # ChangeWipeCode
+                            if msg_type == 82:
+                                return "apps.management.change_wipe_code"
+                        else:
+                            # RebootToBootloader
+                            if msg_type == 87:
+                                return "apps.management.reboot_to_bootloader"
+                            # GetFirmwareHash
+                            if msg_type == 88:
+                                return "apps.misc.get_firmware_hash"
+                            # TezosGetAddress
+                            if msg_type == 150 and not utils.BITCOIN_ONLY:
+                                return "apps.tezos.get_address"
+        else:
+            if msg_type < 540:
+                if msg_type < 350:
+                    if msg_type < 305:
+                        # TezosSignTx
+                        if msg_type == 152 and not utils.BITCOIN_ONLY:
+                            return "apps.tezos.sign_tx"
+                        # TezosGetPublicKey
+                        if msg_type == 154 and not utils.BITCOIN_ONLY:
+                            return "apps.tezos.get_public_key"
+                        # StellarSignTx
+                        if msg_type == 202 and not utils.BITCOIN_ONLY:
+                            return "apps.stellar.sign_tx"
+                        # StellarGetAddress
+                        if msg_type == 207 and not utils.BITCOIN_ONLY:
+                            return "apps.stellar.get_address"
+                    else:
+                        # CardanoGetPublicKey
+                        if msg_type == 305 and not utils.BITCOIN_ONLY:
+                            return "apps.cardano.get_public_key"
+                        # CardanoGetAddress
+                        if msg_type == 307 and not utils.BITCOIN_ONLY:
+                            return "apps.cardano.get_address"
+                        # CardanoSignTxInit
+                        if msg_type == 320 and not utils.BITCOIN_ONLY:
+                            return "apps.cardano.sign_tx"
+                        # CardanoGetNativeScriptHash
+                        if msg_type == 330 and not utils.BITCOIN_ONLY:
+                            return "apps.cardano.get_native_script_hash"
+                else:
+                    if msg_type < 452:
+                        # CardanoSignMessage
+                        if msg_type == 350 and not utils.BITCOIN_ONLY:
+                            return "apps.cardano.sign_message"
+                        # RippleGetAddress
+                        if msg_type == 400 and not utils.BITCOIN_ONLY:
+                            return "apps.ripple.get_address"
+                        # RippleSignTx
+                        if msg_type == 402 and not utils.BITCOIN_ONLY:
+                            return "apps.ripple.sign_tx"
+                        # EthereumGetPublicKey
+                        if msg_type == 450 and not utils.BITCOIN_ONLY:
+                            return "apps.ethereum.get_public_key"
+                    else:
+                        if msg_type < 470:
+                            # EthereumSignTxEIP1559
+                            if msg_type == 452 and not utils.BITCOIN_ONLY:
+                                return "apps.ethereum.sign_tx_eip1559"
+                            # EthereumSignTypedData
+                            if msg_type == 464 and not utils.BITCOIN_ONLY:
+                                return "apps.ethereum.sign_typed_data"
+                        else:
+                            # EthereumSignTypedHash
+                            if msg_type == 470 and not utils.BITCOIN_ONLY:
+                                return "apps.ethereum.sign_typed_data_hash"
+                            # MoneroTransactionInitRequest
+                            if msg_type == 501 and not utils.BITCOIN_ONLY:
+                                return "apps.monero.sign_tx"
+                            # MoneroKeyImageExportInitRequest
+                            if msg_type == 530 and not utils.BITCOIN_ONLY:
+                                return "apps.monero.key_image_sync"
+            else:
+                if msg_type < 704:
+                    if msg_type < 552:
+                        # MoneroGetAddress
+                        if msg_type == 540 and not utils.BITCOIN_ONLY:
+                            return "apps.monero.get_address"
+                        # MoneroGetWatchKey
+                        if msg_type == 542 and not utils.BITCOIN_ONLY:
+                            return "apps.monero.get_watch_only"
+                        # DebugMoneroDiagRequest
+                        if msg_type == 546 and not utils.BITCOIN_ONLY and __debug__:
+                            return "apps.monero.diag"
+                        # MoneroGetTxKeyRequest
+                        if msg_type == 550 and not utils.BITCOIN_ONLY:
+                            return "apps.monero.get_tx_keys"
+                    else:
+                        if msg_type < 602:
+                            # MoneroLiveRefreshStartRequest
+                            if msg_type == 552 and not utils.BITCOIN_ONLY:
+                                return "apps.monero.live_refresh"
+                            # EosGetPublicKey
+                            if msg_type == 600 and not utils.BITCOIN_ONLY:
+                                return "apps.eos.get_public_key"
+                        else:
+                            # EosSignTx
+                            if msg_type == 602 and not utils.BITCOIN_ONLY:
+                                return "apps.eos.sign_tx"
+                            # BinanceGetAddress
+                            if msg_type == 700 and not utils.BITCOIN_ONLY:
+                                return "apps.binance.get_address"
+                            # BinanceGetPublicKey
+                            if msg_type == 702 and not utils.BITCOIN_ONLY:
+                                return "apps.binance.get_public_key"
+                else:
+                    if msg_type < 903:
+                        # BinanceSignTx
+                        if msg_type == 704 and not utils.BITCOIN_ONLY:
+                            return "apps.binance.sign_tx"
+                        # WebAuthnListResidentCredentials
+                        if msg_type == 800 and not utils.BITCOIN_ONLY:
+                            return "apps.webauthn.list_resident_credentials"
+                        # WebAuthnAddResidentCredential
+                        if msg_type == 802 and not utils.BITCOIN_ONLY:
+                            return "apps.webauthn.add_resident_credential"
+                        # WebAuthnRemoveResidentCredential
+                        if msg_type == 803 and not utils.BITCOIN_ONLY:
+                            return "apps.webauthn.remove_resident_credential"
+                    else:
+                        if msg_type < 10007:
+                            # DeviceBackToBoot
+                            if msg_type == 903:
+                                return "apps.management.reboot_to_bootloader"
+                            # RebootToBoardloader
+                            if msg_type == 904:
+                                return "apps.management.reboot_to_boardloader"
+                        else:
+                            # ReadSEPublicCert
+                            if msg_type == 10007:
+                                return "apps.management.se_read_cert"
+                            # SESignMessage
+                            if msg_type == 10012:
+                                return "apps.management.se_sign_message"
+                            # BatchGetPublickeys
+                            if msg_type == 10016 and not utils.BITCOIN_ONLY:
+                                return "apps.misc.batch_get_pubkeys"
+    else:
+        if msg_type < 11202:
+            if msg_type < 10501:
+                if msg_type < 10112:
+                    if msg_type < 10100:
+                        # ResourceUpload
+                        if (
+                            msg_type == 10018
+                            and utils.MODEL == "T"
+                            and not utils.EMULATOR
+                        ):
+                            return "apps.management.upload_res"
+                        # ResourceUpdate
+                        if (
+                            msg_type == 10022
+                            and utils.MODEL == "T"
+                            and not utils.EMULATOR
+                        ):
+                            return "apps.management.update_res"
+                        # ListResDir
+                        if (
+                            msg_type == 10023
+                            and utils.MODEL == "T"
+                            and not utils.EMULATOR
+                        ):
+                            return "apps.management.list_dir"
+                        # SignPsbt
+                        if msg_type == 10052:
+                            return "apps.bitcoin.sign_taproot"
+                    else:
+                        # SolanaGetAddress
+                        if msg_type == 10100 and not utils.BITCOIN_ONLY:
+                            return "apps.solana.get_address"
+                        # SolanaSignTx
+                        if msg_type == 10102 and not utils.BITCOIN_ONLY:
+                            return "apps.solana.sign_tx"
+                        # SolanaSignOffChainMessage
+                        if msg_type == 10104 and not utils.BITCOIN_ONLY:
+                            return "apps.solana.sign_offchain_message"
+                        # SolanaSignUnsafeMessage
+                        if msg_type == 10106 and not utils.BITCOIN_ONLY:
+                            return "apps.solana.sign_unsafe_message"
+                else:
+                    if msg_type < 10300:
+                        # ConfluxGetAddress
+                        if msg_type == 10112 and not utils.BITCOIN_ONLY:
+                            return "apps.conflux.get_address"
+                        # ConfluxSignTx
+                        if msg_type == 10114 and not utils.BITCOIN_ONLY:
+                            return "apps.conflux.sign_tx"
+                        # ConfluxSignMessage
+                        if msg_type == 10117 and not utils.BITCOIN_ONLY:
+                            return "apps.conflux.sign_message"
+                        # ConfluxSignMessageCIP23
+                        if msg_type == 10118 and not utils.BITCOIN_ONLY:
+                            return "apps.conflux.sign_message_cip23"
+                    else:
+                        if msg_type < 10304:
+                            # StarcoinGetAddress
+                            if msg_type == 10300 and not utils.BITCOIN_ONLY:
+                                return "apps.starcoin.get_address"
+                            # StarcoinGetPublicKey
+                            if msg_type == 10302 and not utils.BITCOIN_ONLY:
+                                return "apps.starcoin.get_public_key"
+                        else:
+                            # StarcoinSignTx
+                            if msg_type == 10304 and not utils.BITCOIN_ONLY:
+                                return "apps.starcoin.sign_tx"
+                            # StarcoinSignMessage
+                            if msg_type == 10306 and not utils.BITCOIN_ONLY:
+                                return "apps.starcoin.sign_message"
+                            # StarcoinVerifyMessage
+                            if msg_type == 10308 and not utils.BITCOIN_ONLY:
+                                return "apps.starcoin.verify_message"
+            else:
+                if msg_type < 10802:
+                    if msg_type < 10602:
+                        # TronGetAddress
+                        if msg_type == 10501 and not utils.BITCOIN_ONLY:
+                            return "apps.tron.get_address"
+                        # TronSignTx
+                        if msg_type == 10503 and not utils.BITCOIN_ONLY:
+                            return "apps.tron.sign_tx"
+                        # TronSignMessage
+                        if msg_type == 10505 and not utils.BITCOIN_ONLY:
+                            return "apps.tron.sign_message"
+                        # AptosGetAddress
+                        if msg_type == 10600 and not utils.BITCOIN_ONLY:
+                            return "apps.aptos.get_address"
+                    else:
+                        if msg_type < 10701:
+                            # AptosSignTx
+                            if msg_type == 10602 and not utils.BITCOIN_ONLY:
+                                return "apps.aptos.sign_tx"
+                            # AptosSignMessage
+                            if msg_type == 10604 and not utils.BITCOIN_ONLY:
+                                return "apps.aptos.sign_message"
+                        else:
+                            # NearGetAddress
+                            if msg_type == 10701 and not utils.BITCOIN_ONLY:
+                                return "apps.near.get_address"
+                            # NearSignTx
+                            if msg_type == 10703 and not utils.BITCOIN_ONLY:
+                                return "apps.near.sign_tx"
+                            # CosmosGetAddress
+                            if msg_type == 10800 and not utils.BITCOIN_ONLY:
+                                return "apps.cosmos.get_address"
+                else:
+                    if msg_type < 11002:
+                        # CosmosSignTx
+                        if msg_type == 10802 and not utils.BITCOIN_ONLY:
+                            return "apps.cosmos.sign_tx"
+                        # AlgorandGetAddress
+                        if msg_type == 10900 and not utils.BITCOIN_ONLY:
+                            return "apps.algorand.get_address"
+                        # AlgorandSignTx
+                        if msg_type == 10902 and not utils.BITCOIN_ONLY:
+                            return "apps.algorand.sign_tx"
+                        # PolkadotGetAddress
+                        if msg_type == 11000 and not utils.BITCOIN_ONLY:
+                            return "apps.polkadot.get_address"
+                    else:
+                        if msg_type < 11102:
+                            # PolkadotSignTx
+                            if msg_type == 11002 and not utils.BITCOIN_ONLY:
+                                return "apps.polkadot.sign_tx"
+                            # SuiGetAddress
+                            if msg_type == 11100 and not utils.BITCOIN_ONLY:
+                                return "apps.sui.get_address"
+                        else:
+                            # SuiSignTx
+                            if msg_type == 11102 and not utils.BITCOIN_ONLY:
+                                return "apps.sui.sign_tx"
+                            # SuiSignMessage
+                            if msg_type == 11104 and not utils.BITCOIN_ONLY:
+                                return "apps.sui.sign_message"
+                            # FilecoinGetAddress
+                            if msg_type == 11200 and not utils.BITCOIN_ONLY:
+                                return "apps.filecoin.get_address"
+        else:
+            if msg_type < 12003:
+                if msg_type < 11506:
+                    if msg_type < 11402:
+                        # FilecoinSignTx
+                        if msg_type == 11202 and not utils.BITCOIN_ONLY:
+                            return "apps.filecoin.sign_tx"
+                        # KaspaGetAddress
+                        if msg_type == 11300 and not utils.BITCOIN_ONLY:
+                            return "apps.kaspa.get_address"
+                        # KaspaSignTx
+                        if msg_type == 11302 and not utils.BITCOIN_ONLY:
+                            return "apps.kaspa.sign_tx"
+                        # NexaGetAddress
+                        if msg_type == 11400 and not utils.BITCOIN_ONLY:
+                            return "apps.nexa.get_address"
+                    else:
+                        # NexaSignTx
+                        if msg_type == 11402 and not utils.BITCOIN_ONLY:
+                            return "apps.nexa.sign_tx"
+                        # NostrGetPublicKey
+                        if msg_type == 11500 and not utils.BITCOIN_ONLY:
+                            return "apps.nostr.get_public_key"
+                        # NostrSignEvent
+                        if msg_type == 11502 and not utils.BITCOIN_ONLY:
+                            return "apps.nostr.sign_event"
+                        # NostrEncryptMessage
+                        if msg_type == 11504 and not utils.BITCOIN_ONLY:
+                            return "apps.nostr.encrypt"
+                else:
+                    if msg_type < 11703:
+                        # NostrDecryptMessage
+                        if msg_type == 11506 and not utils.BITCOIN_ONLY:
+                            return "apps.nostr.decrypt"
+                        # NostrSignSchnorr
+                        if msg_type == 11508 and not utils.BITCOIN_ONLY:
+                            return "apps.nostr.schnorr"
+                        # LnurlAuth
+                        if msg_type == 11600 and not utils.BITCOIN_ONLY:
+                            return "apps.lnurl.auth"
+                        # NervosGetAddress
+                        if msg_type == 11701 and not utils.BITCOIN_ONLY:
+                            return "apps.nervos.get_address"
+                    else:
+                        if msg_type < 11903:
+                            # NervosSignTx
+                            if msg_type == 11703 and not utils.BITCOIN_ONLY:
+                                return "apps.nervos.sign_tx"
+                            # TonGetAddress
+                            if msg_type == 11901 and not utils.BITCOIN_ONLY:
+                                return "apps.ton.get_address"
+                        else:
+                            # TonSignMessage
+                            if msg_type == 11903 and not utils.BITCOIN_ONLY:
+                                return "apps.ton.sign_message"
+                            # TonSignProof
+                            if msg_type == 11905 and not utils.BITCOIN_ONLY:
+                                return "apps.ton.sign_proof"
+                            # ScdoGetAddress
+                            if msg_type == 12001 and not utils.BITCOIN_ONLY:
+                                return "apps.scdo.get_address"
+            else:
+                if msg_type < 12303:
+                    if msg_type < 12109:
+                        # ScdoSignTx
+                        if msg_type == 12003 and not utils.BITCOIN_ONLY:
+                            return "apps.scdo.sign_tx"
+                        # ScdoSignMessage
+                        if msg_type == 12006 and not utils.BITCOIN_ONLY:
+                            return "apps.scdo.sign_message"
+                        # AlephiumGetAddress
+                        if msg_type == 12101 and not utils.BITCOIN_ONLY:
+                            return "apps.alephium.get_address"
+                        # AlephiumSignTx
+                        if msg_type == 12103 and not utils.BITCOIN_ONLY:
+                            return "apps.alephium.sign_tx"
+                    else:
+                        if msg_type < 12203:
+                            # AlephiumSignMessage
+                            if msg_type == 12109 and not utils.BITCOIN_ONLY:
+                                return "apps.alephium.sign_message"
+                            # BenfenGetAddress
+                            if msg_type == 12201 and not utils.BITCOIN_ONLY:
+                                return "apps.benfen.get_address"
+                        else:
+                            # BenfenSignTx
+                            if msg_type == 12203 and not utils.BITCOIN_ONLY:
+                                return "apps.benfen.sign_tx"
+                            # BenfenSignMessage
+                            if msg_type == 12205 and not utils.BITCOIN_ONLY:
+                                return "apps.benfen.sign_message"
+                            # NeoGetAddress
+                            if msg_type == 12301 and not utils.BITCOIN_ONLY:
+                                return "apps.neo.get_address"
+                else:
+                    if msg_type < 20105:
+                        # NeoSignTx
+                        if msg_type == 12303 and not utils.BITCOIN_ONLY:
+                            return "apps.neo.sign_tx"
+                        # EthereumGetPublicKeyOneKey
+                        if msg_type == 20100 and not utils.BITCOIN_ONLY:
+                            return "apps.ethereum.onekey.get_public_key"
+                        # EthereumGetAddressOneKey
+                        if msg_type == 20102 and not utils.BITCOIN_ONLY:
+                            return "apps.ethereum.onekey.get_address"
+                        # EthereumSignTxOneKey
+                        if msg_type == 20104 and not utils.BITCOIN_ONLY:
+                            return "apps.ethereum.onekey.sign_tx"
+                    else:
+                        if msg_type < 20109:
+                            # EthereumSignTxEIP1559OneKey
+                            if msg_type == 20105 and not utils.BITCOIN_ONLY:
+                                return "apps.ethereum.onekey.sign_tx_eip1559"
+                            # EthereumSignMessageOneKey
+                            if msg_type == 20108 and not utils.BITCOIN_ONLY:
+                                return "apps.ethereum.onekey.sign_message"
+                        else:
+                            # EthereumVerifyMessageOneKey
+                            if msg_type == 20109 and not utils.BITCOIN_ONLY:
+                                return "apps.ethereum.onekey.verify_message"
+                            # EthereumSignTypedDataOneKey
+                            if msg_type == 20111 and not utils.BITCOIN_ONLY:
+                                return "apps.ethereum.onekey.sign_typed_data"
+                            # EthereumSignTypedHashOneKey
+                            if msg_type == 20117 and not utils.BITCOIN_ONLY:
+                                return "apps.ethereum.onekey.sign_typed_data_hash"
+    raise ValueError
 
-        # benfen
-        if msg_type == MessageType.BenfenGetAddress:
-            return "apps.benfen.get_address"
-        if msg_type == MessageType.BenfenSignTx:
-            return "apps.benfen.sign_tx"
-        if msg_type == MessageType.BenfenSignMessage:
-            return "apps.benfen.sign_message"
 
-    raise ValueError
+# end of generated code
 
 
 def find_registered_handler(iface: WireInterface, msg_type: int) -> Handler | None:
@@ -21,6 +21,7 @@ def clean_flash() -> None:
 def wipe() -> None:
     config.wipe()
     cache.clear_all()
+    device.clear_global_cache()
     if not utils.EMULATOR:
         try:
             clean_flash()
@@ -37,7 +38,7 @@ def init_unlocked() -> None:
     # In FWs <= 2.3.1 'version' denoted whether the device is initialized or not.
     # In 2.3.2 we have introduced a new field 'initialized' for that.
     if device.is_version_stored() and not device.is_initialized():
-        common.set_bool(common.APP_DEVICE, device.INITIALIZED, True, public=True)
+        device.set_initialized()
 
 
 def reset() -> None:
@@ -47,6 +48,7 @@ def reset() -> None:
     device_id = device.get_device_id()
     wipe()
     common.set(common.APP_DEVICE, device.DEVICE_ID, device_id.encode(), public=True)
+    device.invalidate(device.DEVICE_ID)
 
 
 def _migrate_from_version_01() -> None:
@@ -57,4 +59,5 @@ def _migrate_from_version_01() -> None:
         device.set_u2f_counter(int.from_bytes(counter, "big"))
         # Delete the old, non-public U2F_COUNTER.
         common.delete(common.APP_DEVICE, device.U2F_COUNTER)
+        device.invalidate(device.U2F_COUNTER)
     set_current_version()
@@ -21,7 +21,15 @@ def set(app: int, key: int, data: bytes, public: bool = False) -> None:
     config.set(app, key, data, public)
 
 
+if __debug__:
+    # Number of config.get calls, reported per workflow by trezor.workflow.
+    get_calls = 0
+
+
 def get(app: int, key: int, public: bool = False) -> bytes | None:
+    if __debug__:
+        global get_calls
+        get_calls += 1
     return config.get(app, key, public)
 
 
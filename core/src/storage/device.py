@@ -7,6 +7,8 @@ from storage import common
 from trezor import config, utils
 
 if TYPE_CHECKING:
+    from typing import Any, Callable
+
     from trezor.enums import BackupType
     from typing_extensions import Literal
 
@@ -25,70 +27,7 @@ SE_4TH_ADDRESS = const(0x13 << 1)
 
 # Namespace:
 _NAMESPACE = common.APP_DEVICE
-_BRIGHTNESS_VALUE: int | None = None
-_LANGUAGE_VALUE: str | None = None
-_LABEL_VALUE: str | None = None
-_USE_PASSPHRASE_VALUE: bool | None = None
-_AUTO_PASSPHRASE_VALUE: bool | None = None
-_PASSPHRASE_ALWAYS_ON_DEVICE_VALUE: bool | None = None
-_AUTOLOCK_DELAY_MS_VALUE: int | None = None
-_HOMESCREEN_VALUE: str | None = None
-_BLE_NAME_VALUE: str | None = None
-_BLE_VERSION_VALUE: str | None = None
-_BLE_ENABLED_VALUE: bool | None = None
-_AUTOSHUTDOWN_DELAY_MS_VALUE: int | None = None
-_WALLPAPER_COUNTS_VALUE: int | None = None
-_USE_USB_PROTECT_VALUE: bool | None = None
-_USE_RANDOM_PIN_MAP_VALUE: bool | None = None
-_TAP_AWAKE_VALUE: bool | None = None
-_KEYBOARD_HAPTIC_VALUE: bool | None = None
-_ANIMATION_VALUE: bool | None = None
-_EXPERIMENTAL_FEATURES_VALUE: bool | None = None
-_ROTATION_VALUE: int | None = None
-
-_INITIALIZED_VALUE: bool | None = None
-_FLAGS_VALUE: int | None = None
-_UNFINISHED_BACKUP_VALUE: bool | None = None
-_NO_BACKUP_VALUE: bool | None = None
-_BACKUP_TYPE_VALUE: int | None = None
-_SAFETY_CHECK_LEVEL_VALUE: int | None = None
-_USE_FINGERPRINT_UNLOCK_VALUE: bool | None = None
-_AIRGAP_MODE_VALUE: bool | None = None
-_HAS_PROMPTED_FINGERPRINT_VALUE: bool | None = None
-_FINGER_FAILED_COUNT_VALUE: int | None = None
-_SE01_HASH_VALUE: bytes | None = None
-_SE01_BUILDID_VALUE: str | None = None
-_SE01_VERSION_VALUE: str | None = None
-_SE01_BOOT_HASH_VALUE: bytes | None = None
-_SE01_BOOT_BUILDID_VALUE: str | None = None
-_SE01_BOOT_VERSION_VALUE: str | None = None
-_SE02_HASH_VALUE: bytes | None = None
-_SE02_BUILDID_VALUE: str | None = None
-_SE02_VERSION_VALUE: str | None = None
-_SE02_BOOT_HASH_VALUE: bytes | None = None
-_SE02_BOOT_BUILDID_VALUE: str | None = None
-_SE02_BOOT_VERSION_VALUE: str | None = None
-_SE03_HASH_VALUE: bytes | None = None
-_SE03_BUILDID_VALUE: str | None = None
-_SE03_VERSION_VALUE: str | None = None
-_SE03_BOOT_HASH_VALUE: bytes | None = None
-_SE03_BOOT_BUILDID_VALUE: str | None = None
-_SE03_BOOT_VERSION_VALUE: str | None = None
-_SE04_HASH_VALUE: bytes | None = None
-_SE04_BUILDID_VALUE: str | None = None
-_SE04_VERSION_VALUE: str | None = None
-_SE04_BOOT_HASH_VALUE: bytes | None = None
-_SE04_BOOT_BUILDID_VALUE: str | None = None
-_SE04_BOOT_VERSION_VALUE: str | None = None
-_STORAGE_SIZE_VALUE: str | None = None
-_SERIAL_NUMBER_VALUE: str | None = None
-_DEVICE_ID_VALUE: str | None = None
-_TREZOR_COMPATIBLE_VALUE: bool | None = None
-_NEEDS_BACKUP_VALUE: bool | None = None
 _FIDO_SEED_GEN = False
-_FIDO2_COUNTER_VALUE: int | None = None
-_FIDO_ENABLED_VALUE: bool | None = None
-_TURBOMODE_VALUE: bool | None = None
 
 if utils.USE_THD89:
     import uctypes
@@ -411,16 +350,142 @@ SD_SALT_AUTH_KEY_LEN_BYTES = const(16)
 PIN_MAX_ATTEMPTS = 5
 
 
+def _decode_bool(raw: bytes) -> bool:
+    return raw == common._TRUE_BYTE
+
+
+def _decode_bool_default_on(raw: bytes) -> bool:
+    # only an explicit False byte disables these
+    return raw != common._FALSE_BYTE
+
+
+def _decode_int(raw: bytes) -> int:
+    return int.from_bytes(raw, "big")
+
+
+def _decode_str(raw: bytes) -> str:
+    return raw.decode()
+
+
+def _decode_bytes(raw: bytes) -> bytes:
+    return raw
+
+
+def _decode_autolock_delay(raw: bytes) -> int:
+    return _normalize_autolock_delay(int.from_bytes(raw, "big"))
+
+
+def _decode_autoshutdown_delay(raw: bytes) -> int:
+    return _normalize_autoshutdown_delay(int.from_bytes(raw, "big"))
+
+
+def _decode_safety_check_level(raw: bytes) -> int:
+    level = int.from_bytes(raw, "big")
+    if level not in (SAFETY_CHECK_LEVEL_STRICT, SAFETY_CHECK_LEVEL_PROMPT):
+        return _DEFAULT_SAFETY_CHECK_LEVEL
+    return level
+
+
+# Settings served from the RAM cache: key -> (public, decoder, default).
+# The decoder turns the stored bytes into the value, the default is used when
+# the key is not set.
+# fmt: off
+_SETTINGS = {
+    _VERSION:                     (False, _decode_bytes, None),
+    _LANGUAGE:                    (True,  _decode_str, "en"),
+    _USE_PASSPHRASE:              (False, _decode_bool, False),
+    _AUTO_PASSPHRASE:             (False, _decode_bool, False),
+    _PASSPHRASE_ALWAYS_ON_DEVICE: (False, _decode_bool, False),
+    _UNFINISHED_BACKUP:           (False, _decode_bool, False),
+    _NO_BACKUP:                   (False, _decode_bool, False),
+    _FLAGS:                       (False, _decode_int, 0),
+    _AUTOLOCK_DELAY_MS:           (False, _decode_autolock_delay, AUTOLOCK_DELAY_DEFAULT),
+    _SAFETY_CHECK_LEVEL:          (False, _decode_safety_check_level, _DEFAULT_SAFETY_CHECK_LEVEL),
+    _SLIP39_IDENTIFIER_DEVICE:    (False, _decode_int, None),
+    _SLIP39_ITERATION_E_DEVICE:   (False, _decode_int, None),
+    _BLE_NAME:                    (True,  _decode_str, "P2170" if utils.EMULATOR else ""),
+    _BLE_VERSION:                 (True,  _decode_str, ""),
+    _BLE_ENABLED:                 (True,  _decode_bool_default_on, True),
+    _AUTOSHUTDOWN_DELAY_MS:       (True,  _decode_autoshutdown_delay, AUTOSHUTDOWN_DELAY_DEFAULT),
+    _WALLPAPER_COUNTS:            (True,  _decode_int, 0),
+    _USE_USB_PROTECT:             (True,  _decode_bool, False),
+    _USE_RANDOM_PIN_MAP:          (True,  _decode_bool, False),
+    _KEYBOARD_HAPTIC:             (True,  _decode_bool_default_on, True),
+    _TAP_AWAKE:                   (True,  _decode_bool_default_on, True),
+    _ANIMATION:                   (True,  _decode_bool_default_on, True),
+    _TREZOR_COMPATIBLE:           (True,  _decode_bool_default_on, True),
+    _ROTATION:                    (True,  _decode_int, 0),
+    _USE_FINGERPRINT_UNLOCK:      (True,  _decode_bool_default_on, True),
+    _AIRGAP_MODE:                 (True,  _decode_bool, False),
+    _HAS_PROMPTED_FINGERPRINT:    (True,  _decode_bool, False),
+    _FINGER_FAILED_COUNT:         (True,  _decode_int, 0),
+    _FIDO_ENABLED:                (True,  _decode_bool_default_on, True),
+    _TURBOMODE:                   (True,  _decode_bool, False),
+}
+# fmt: on
+
+# Decoded values by key, for the settings above and for the few getters with
+# their own decoding (label, homescreen, brightness, ...). Values that are not
+# stored in the device namespace (SE firmware info, serial number, ...) are kept
+# under the string keys below. Setters write through, clear_global_cache() drops
+# everything.
+_CACHE: dict[int | str, Any] = {}
+
+_IS_INITIALIZED = "initialized"
+_STORAGE_SIZE = "storage_size"
+_SERIAL_NUMBER = "serial_number"
+
+
+def _get(key: int) -> Any:
+    if key in _CACHE:
+        return _CACHE[key]
+    public, decode, default = _SETTINGS[key]
+    raw = common.get(_NAMESPACE, key, public)
+    value = decode(raw) if raw else default
+    _CACHE[key] = value
+    return value
+
+
+def _set(key: int, value: Any, raw: bytes) -> None:
+    common.set(_NAMESPACE, key, raw, _SETTINGS[key][0])
+    _CACHE[key] = value
+
+
+def _set_bool(key: int, value: bool) -> None:
+    common.set_bool(_NAMESPACE, key, value, _SETTINGS[key][0])
+    _CACHE[key] = value
+
+
+def _get_derived(key: str, read: Callable[..., Any], *args: Any) -> Any:
+    if key not in _CACHE:
+        _CACHE[key] = read(*args)
+    return _CACHE[key]
+
+
+def invalidate(key: int) -> None:
+    """Forget the cached value of a key written without this module."""
+    _CACHE.pop(key, None)
+
+
+def load_settings() -> None:
+    """
+    Reads all the settings into the cache in one pass, so that the getters do
+    not go to the storage later. Protected settings need an unlocked storage.
+    """
+    for key in _SETTINGS:
+        _get(key)
+
+
 def is_version_stored() -> bool:
-    return bool(common.get(_NAMESPACE, _VERSION))
+    return bool(_get(_VERSION))
 
 
 def get_version() -> bytes | None:
-    return common.get(_NAMESPACE, _VERSION)
+    return _get(_VERSION)
 
 
 def set_version(version: bytes) -> None:
-    common.set(_NAMESPACE, _VERSION, version)
+    _set(_VERSION, version, version)
 
 
 def get_firmware_version() -> str:
@@ -430,69 +495,38 @@ def get_firmware_version() -> str:
 def get_storage() -> str:
     if utils.EMULATOR:
         return "14 GB"
-    global _STORAGE_SIZE_VALUE
-    if _STORAGE_SIZE_VALUE is None:
-        _STORAGE_SIZE_VALUE = config.get_capacity()
-    return _STORAGE_SIZE_VALUE or ""
+    return _get_derived(_STORAGE_SIZE, config.get_capacity) or ""
 
 
 def set_ble_name(name: str) -> None:
     if len(name.encode("utf-8")) > BLE_NAME_MAXLENGTH:
         raise ValueError
-    global _BLE_NAME_VALUE
-    common.set(_NAMESPACE, _BLE_NAME, name.encode(), True)
-    _BLE_NAME_VALUE = name
+    _set(_BLE_NAME, name, name.encode())
 
 
 def get_ble_name() -> str:
-    global _BLE_NAME_VALUE
-    if _BLE_NAME_VALUE is None:
-        ble_name = common.get(_NAMESPACE, _BLE_NAME, public=True)
-        if ble_name is None:
-            return "P2170" if utils.EMULATOR else ""
-        _BLE_NAME_VALUE = ble_name.decode()
-    return _BLE_NAME_VALUE
+    return _get(_BLE_NAME)
 
 
 def ble_enabled() -> bool:
-    global _BLE_ENABLED_VALUE
-    if _BLE_ENABLED_VALUE is None:
-        ble_enabled = common.get(_NAMESPACE, _BLE_ENABLED, public=True)
-        if ble_enabled == common._FALSE_BYTE:
-            _BLE_ENABLED_VALUE = False
-        else:
-            _BLE_ENABLED_VALUE = True
-    return _BLE_ENABLED_VALUE
+    return _get(_BLE_ENABLED)
 
 
 def set_ble_status(enable: bool) -> None:
-    global _BLE_ENABLED_VALUE
-    if _BLE_ENABLED_VALUE == enable:
+    if _get(_BLE_ENABLED) == enable:
         return
-    common.set_bool(
-        _NAMESPACE,
-        _BLE_ENABLED,
-        enable,
-        public=True,
-    )
-    _BLE_ENABLED_VALUE = enable
+    _set_bool(_BLE_ENABLED, enable)
 
 
 def set_ble_version(version: str) -> None:
     """Set ble firmware version."""
     if len(version.encode("utf-8")) > BLE_VERSION_MAXLENGTH:
         raise ValueError
-    global _BLE_VERSION_VALUE
-    common.set(_NAMESPACE, _BLE_VERSION, version.encode(), True)
-    _BLE_VERSION_VALUE = version
+    _set(_BLE_VERSION, version, version.encode())
 
 
 def get_ble_version() -> str:
-    global _BLE_VERSION_VALUE
-    if _BLE_VERSION_VALUE is None:
-        ble_version = common.get(_NAMESPACE, _BLE_VERSION, public=True)
-        _BLE_VERSION_VALUE = ble_version.decode() if ble_version else ""
-    return _BLE_VERSION_VALUE
+    return _get(_BLE_VERSION)
 
 
 def get_model() -> str:
@@ -502,252 +536,129 @@ def get_model() -> str:
 def get_serial() -> str:
     if utils.EMULATOR:
         return "PRB00O0000B"  # emulator serial number
-    global _SERIAL_NUMBER_VALUE
-    if _SERIAL_NUMBER_VALUE is None:
-        _SERIAL_NUMBER_VALUE = config.get_serial()
-    return _SERIAL_NUMBER_VALUE or ""
+    return _get_derived(_SERIAL_NUMBER, config.get_serial) or ""
 
 
 def set_brightness(brightness: int) -> None:
     from trezor.ui import style
 
     # valid value range  0-255
-    global _BRIGHTNESS_VALUE
     if brightness < style.BACKLIGHT_MIN:
         brightness = style.BACKLIGHT_MIN
     common.set(_NAMESPACE, _BRIGHTNESS, brightness.to_bytes(2, "big"), public=True)
-    _BRIGHTNESS_VALUE = brightness
+    _CACHE[_BRIGHTNESS] = brightness
 
 
 def get_brightness() -> int:
     from trezor.ui import style
 
-    global _BRIGHTNESS_VALUE
-    if _BRIGHTNESS_VALUE is None:
+    if _BRIGHTNESS not in _CACHE:
         brightness = common.get(_NAMESPACE, _BRIGHTNESS, public=True)
-        if brightness is None:
-            # default brightness is 150
-            _BRIGHTNESS_VALUE = 150
-        else:
-            _BRIGHTNESS_VALUE = int.from_bytes(brightness, "big")
-        if _BRIGHTNESS_VALUE < style.BACKLIGHT_MIN:
-            _BRIGHTNESS_VALUE = style.BACKLIGHT_MIN
-        return _BRIGHTNESS_VALUE
-    else:
-        return _BRIGHTNESS_VALUE
+        # default brightness is 150
+        value = int.from_bytes(brightness, "big") if brightness is not None else 150
+        _CACHE[_BRIGHTNESS] = max(value, style.BACKLIGHT_MIN)
+    return _CACHE[_BRIGHTNESS]
 
 
 def set_random_pin_map_enable(enable: bool):
-    global _USE_RANDOM_PIN_MAP_VALUE
-    common.set_bool(_NAMESPACE, _USE_RANDOM_PIN_MAP, enable, public=True)
-    _USE_RANDOM_PIN_MAP_VALUE = enable
+    _set_bool(_USE_RANDOM_PIN_MAP, enable)
 
 
 def is_random_pin_map_enabled() -> bool:
-    global _USE_RANDOM_PIN_MAP_VALUE
-    if _USE_RANDOM_PIN_MAP_VALUE is None:
-        _USE_RANDOM_PIN_MAP_VALUE = common.get_bool(
-            _NAMESPACE, _USE_RANDOM_PIN_MAP, public=True
-        )
-    return _USE_RANDOM_PIN_MAP_VALUE
+    return _get(_USE_RANDOM_PIN_MAP)
 
 
 def is_usb_lock_enabled() -> bool:
-    global _USE_USB_PROTECT_VALUE
-    if _USE_USB_PROTECT_VALUE is None:
-        _USE_USB_PROTECT_VALUE = common.get_bool(
-            _NAMESPACE, _USE_USB_PROTECT, public=True
-        )
-    return _USE_USB_PROTECT_VALUE
+    return _get(_USE_USB_PROTECT)
 
 
 def set_usb_lock_enable(enable: bool) -> None:
-    global _USE_USB_PROTECT_VALUE
-    common.set_bool(_NAMESPACE, _USE_USB_PROTECT, enable, public=True)
-    _USE_USB_PROTECT_VALUE = enable
+    _set_bool(_USE_USB_PROTECT, enable)
 
 
 def enable_fingerprint_unlock(enable: bool) -> None:
-
-    global _USE_FINGERPRINT_UNLOCK_VALUE
-    common.set_bool(_NAMESPACE, _USE_FINGERPRINT_UNLOCK, enable, public=True)
-    _USE_FINGERPRINT_UNLOCK_VALUE = enable
+    _set_bool(_USE_FINGERPRINT_UNLOCK, enable)
 
 
 def is_fingerprint_unlock_enabled() -> bool:
-    global _USE_FINGERPRINT_UNLOCK_VALUE
-    if _USE_FINGERPRINT_UNLOCK_VALUE is None:
-        use_finger_unlock = common.get(_NAMESPACE, _USE_FINGERPRINT_UNLOCK, public=True)
-        if use_finger_unlock == common._FALSE_BYTE:
-            _USE_FINGERPRINT_UNLOCK_VALUE = False
-        else:
-            _USE_FINGERPRINT_UNLOCK_VALUE = True
-    return _USE_FINGERPRINT_UNLOCK_VALUE
+    return _get(_USE_FINGERPRINT_UNLOCK)
 
 
 def has_prompted_fingerprint() -> bool:
-    global _HAS_PROMPTED_FINGERPRINT_VALUE
-    if _HAS_PROMPTED_FINGERPRINT_VALUE is None:
-        _HAS_PROMPTED_FINGERPRINT_VALUE = common.get_bool(
-            _NAMESPACE, _HAS_PROMPTED_FINGERPRINT, public=True
-        )
-    return _HAS_PROMPTED_FINGERPRINT_VALUE
+    return _get(_HAS_PROMPTED_FINGERPRINT)
 
 
 def set_fingerprint_prompted() -> None:
-    global _HAS_PROMPTED_FINGERPRINT_VALUE
-    common.set_bool(_NAMESPACE, _HAS_PROMPTED_FINGERPRINT, True, public=True)
-    _HAS_PROMPTED_FINGERPRINT_VALUE = True
+    _set_bool(_HAS_PROMPTED_FINGERPRINT, True)
 
 
 def finger_failed_count() -> int:
-    global _FINGER_FAILED_COUNT_VALUE
-    if _FINGER_FAILED_COUNT_VALUE is None:
-        failed_count = common.get(_NAMESPACE, _FINGER_FAILED_COUNT, public=True)
-        if failed_count is None:
-            _FINGER_FAILED_COUNT_VALUE = 0
-        else:
-            _FINGER_FAILED_COUNT_VALUE = int.from_bytes(failed_count, "big")
-    return _FINGER_FAILED_COUNT_VALUE
+    return _get(_FINGER_FAILED_COUNT)
 
 
 def finger_failed_count_incr() -> None:
-    global _FINGER_FAILED_COUNT_VALUE
     cur = finger_failed_count()
     if cur > utils.MAX_FP_ATTEMPTS:
         raise ValueError("finger_failed_count is too large")
     count = cur + 1
-    common.set(_NAMESPACE, _FINGER_FAILED_COUNT, count.to_bytes(1, "big"), public=True)
-    _FINGER_FAILED_COUNT_VALUE = count
+    _set(_FINGER_FAILED_COUNT, count, count.to_bytes(1, "big"))
 
 
 def finger_failed_count_reset() -> None:
-    global _FINGER_FAILED_COUNT_VALUE
-    common.set(_NAMESPACE, _FINGER_FAILED_COUNT, b"\x00", public=True)
-    _FINGER_FAILED_COUNT_VALUE = 0
+    _set(_FINGER_FAILED_COUNT, 0, b"\x00")
 
 
 def is_tap_awake_enabled() -> bool:
-    global _TAP_AWAKE_VALUE
-    if _TAP_AWAKE_VALUE is None:
-        tap_awake = common.get(_NAMESPACE, _TAP_AWAKE, public=True)
-        if tap_awake == common._FALSE_BYTE:
-            _TAP_AWAKE_VALUE = False
-        else:
-            _TAP_AWAKE_VALUE = True
-    return _TAP_AWAKE_VALUE
+    return _get(_TAP_AWAKE)
 
 
 def set_tap_awake_enable(enable: bool) -> None:
-    global _TAP_AWAKE_VALUE
-    common.set_bool(
-        _NAMESPACE,
-        _TAP_AWAKE,
-        enable,
-        public=True,
-    )
-    _TAP_AWAKE_VALUE = enable
+    _set_bool(_TAP_AWAKE, enable)
 
 
 def is_fido_enabled() -> bool:
-    global _FIDO_ENABLED_VALUE
-    if _FIDO_ENABLED_VALUE is None:
-        fido_enabled = common.get(_NAMESPACE, _FIDO_ENABLED, public=True)
-        if fido_enabled == common._FALSE_BYTE:
-            _FIDO_ENABLED_VALUE = False
-        else:
-            _FIDO_ENABLED_VALUE = True
-    return _FIDO_ENABLED_VALUE
+    return _get(_FIDO_ENABLED)
 
 
 def set_fido_enable(enable: bool) -> None:
-    global _FIDO_ENABLED_VALUE
-    common.set_bool(_NAMESPACE, _FIDO_ENABLED, enable, public=True)
-    _FIDO_ENABLED_VALUE = enable
+    _set_bool(_FIDO_ENABLED, enable)
 
 
 def is_animation_enabled() -> bool:
-    global _ANIMATION_VALUE
-    if _ANIMATION_VALUE is None:
-        animation_enabled = common.get(_NAMESPACE, _ANIMATION, public=True)
-        if animation_enabled == common._FALSE_BYTE:
-            _ANIMATION_VALUE = False
-        else:
-            _ANIMATION_VALUE = True
-    return _ANIMATION_VALUE
+    return _get(_ANIMATION)
 
 
 def set_animation_enable(enable: bool) -> None:
-    global _ANIMATION_VALUE
-    common.set_bool(
-        _NAMESPACE,
-        _ANIMATION,
-        enable,
-        public=True,
-    )
-    _ANIMATION_VALUE = enable
+    _set_bool(_ANIMATION, enable)
 
 
 def is_turbomode_enabled() -> bool:
-    global _TURBOMODE_VALUE
-    if _TURBOMODE_VALUE is None:
-        _TURBOMODE_VALUE = common.get_bool(_NAMESPACE, _TURBOMODE, public=True)
-    return _TURBOMODE_VALUE
+    return _get(_TURBOMODE)
 
 
 def set_turbomode_enable(enable: bool) -> None:
-    global _TURBOMODE_VALUE
-    common.set_bool(
-        _NAMESPACE,
-        _TURBOMODE,
-        enable,
-        public=True,
-    )
-    _TURBOMODE_VALUE = enable
+    _set_bool(_TURBOMODE, enable)
 
 
 def keyboard_haptic_enabled() -> bool:
-    global _KEYBOARD_HAPTIC_VALUE
-    if _KEYBOARD_HAPTIC_VALUE is None:
-        haptic_enabled = common.get(_NAMESPACE, _KEYBOARD_HAPTIC, public=True)
-        if haptic_enabled == common._FALSE_BYTE:
-            _KEYBOARD_HAPTIC_VALUE = False
-        else:
-            _KEYBOARD_HAPTIC_VALUE = True
-
-    return _KEYBOARD_HAPTIC_VALUE
+    return _get(_KEYBOARD_HAPTIC)
 
 
 def toggle_keyboard_haptic(enable: bool) -> None:
-    global _KEYBOARD_HAPTIC_VALUE
-    common.set_bool(
-        _NAMESPACE,
-        _KEYBOARD_HAPTIC,
-        enable,
-        public=True,
-    )
-    _KEYBOARD_HAPTIC_VALUE = enable
+    _set_bool(_KEYBOARD_HAPTIC, enable)
 
 
 def increase_wp_cnts() -> None:
-    global _WALLPAPER_COUNTS_VALUE
-    cur_cnt = get_wp_cnts()
-    cnts = cur_cnt + 1
-    common.set(_NAMESPACE, _WALLPAPER_COUNTS, cnts.to_bytes(2, "big"), public=True)
-    _WALLPAPER_COUNTS_VALUE = cnts
+    cnts = get_wp_cnts() + 1
+    _set(_WALLPAPER_COUNTS, cnts, cnts.to_bytes(2, "big"))
 
 
 def get_wp_cnts() -> int:
-    global _WALLPAPER_COUNTS_VALUE
-    if _WALLPAPER_COUNTS_VALUE is None:
-        cnts = common.get(_NAMESPACE, _WALLPAPER_COUNTS, public=True)
-        _WALLPAPER_COUNTS_VALUE = int.from_bytes(cnts, "big") if cnts is not None else 0
-    return _WALLPAPER_COUNTS_VALUE
+    return _get(_WALLPAPER_COUNTS)
 
 
 def get_fido2_counter() -> int:
-    global _FIDO2_COUNTER_VALUE
-    if _FIDO2_COUNTER_VALUE is None:
+    if _FIDO2_COUNTER not in _CACHE:
         counter = common.get(_NAMESPACE, _FIDO2_COUNTER, public=True)
         if counter is None:
             from .resident_credentials import get, MAX_RESIDENT_CREDENTIALS
@@ -759,30 +670,33 @@ def get_fido2_counter() -> int:
                     find += 1
             set_fido2_counter(find)
         else:
-            _FIDO2_COUNTER_VALUE = int.from_bytes(counter[:1], "big")
-    assert _FIDO2_COUNTER_VALUE is not None
-    return _FIDO2_COUNTER_VALUE
+            _CACHE[_FIDO2_COUNTER] = int.from_bytes(counter[:1], "big")
+    return _CACHE[_FIDO2_COUNTER]
 
 
 def set_fido2_counter(value: int) -> None:
-    global _FIDO2_COUNTER_VALUE
     from .resident_credentials import MAX_RESIDENT_CREDENTIALS
 
     assert (
         0 <= value <= MAX_RESIDENT_CREDENTIALS
     ), f"FIDO2 counter cannot be greater than {MAX_RESIDENT_CREDENTIALS}"
     common.set(_NAMESPACE, _FIDO2_COUNTER, value.to_bytes(1, "big"), public=True)
-    _FIDO2_COUNTER_VALUE = value
+    _CACHE[_FIDO2_COUNTER] = value
 
 
 def is_initialized() -> bool:
-    global _INITIALIZED_VALUE
-    if utils.EMULATOR:
-        return common.get_bool(_NAMESPACE, INITIALIZED, public=True)
-    else:
-        if _INITIALIZED_VALUE is None:
-            _INITIALIZED_VALUE = config.is_initialized()
-        return _INITIALIZED_VALUE or False
+    if _IS_INITIALIZED not in _CACHE:
+        if utils.EMULATOR:
+            initialized = common.get_bool(_NAMESPACE, INITIALIZED, public=True)
+        else:
+            initialized = config.is_initialized()
+        _CACHE[_IS_INITIALIZED] = initialized or False
+    return _CACHE[_IS_INITIALIZED]
+
+
+def set_initialized() -> None:
+    common.set_bool(_NAMESPACE, INITIALIZED, True, public=True)
+    _CACHE[_IS_INITIALIZED] = True
 
 
 def _new_device_id() -> str:
@@ -792,30 +706,23 @@ def _new_device_id() -> str:
 
 
 def get_device_id() -> str:
-    global _DEVICE_ID_VALUE
-    if _DEVICE_ID_VALUE is None:
+    if DEVICE_ID not in _CACHE:
         dev_id = common.get(_NAMESPACE, DEVICE_ID, public=True)
         if not dev_id:
             dev_id = _new_device_id().encode()
             common.set(_NAMESPACE, DEVICE_ID, dev_id, public=True)
-        _DEVICE_ID_VALUE = dev_id.decode()
-    return _DEVICE_ID_VALUE
+        _CACHE[DEVICE_ID] = dev_id.decode()
+    return _CACHE[DEVICE_ID]
 
 
 def get_rotation() -> int:
-    global _ROTATION_VALUE
-    if _ROTATION_VALUE is None:
-        rotation = common.get(_NAMESPACE, _ROTATION, public=True)
-        _ROTATION_VALUE = int.from_bytes(rotation, "big") if rotation else 0
-    return _ROTATION_VALUE
+    return _get(_ROTATION)
 
 
 def set_rotation(value: int) -> None:
     if value not in (0, 90, 180, 270):
         raise ValueError  # unsupported display rotation
-    global _ROTATION_VALUE
-    common.set(_NAMESPACE, _ROTATION, value.to_bytes(2, "big"), True)  # public
-    _ROTATION_VALUE = value
+    _set(_ROTATION, value, value.to_bytes(2, "big"))
 
 
 def get_label() -> str:
@@ -824,8 +731,7 @@ def get_label() -> str:
     Returns:
         str: if label == "", return default label "OneKey Pro" instead
     """
-    global _LABEL_VALUE
-    if _LABEL_VALUE is None:
+    if _LABEL not in _CACHE:
         label = common.get(_NAMESPACE, _LABEL, True)  # public
         if label is None:
             previous_label_len = common.get_val_len(_NAMESPACE, _LABEL_DEPRECATED, True)
@@ -834,32 +740,22 @@ def get_label() -> str:
                 and 0 < previous_label_len < PREVIOUS_LABEL_MAXLENGTH
             ):
                 label = common.get(_NAMESPACE, _LABEL_DEPRECATED, True)
-        _LABEL_VALUE = label.decode() if label else utils.DEFAULT_LABEL
-    return _LABEL_VALUE
+        _CACHE[_LABEL] = label.decode() if label else utils.DEFAULT_LABEL
+    return _CACHE[_LABEL]
 
 
 def set_label(label: str) -> None:
-    global _LABEL_VALUE
     if len(label.encode("utf-8")) > LABEL_MAXLENGTH:
         raise ValueError  # label too long
     common.set(_NAMESPACE, _LABEL, label.encode(), True)  # public
-    _LABEL_VALUE = label
+    _CACHE[_LABEL] = label
 
 
 def get_language() -> str:
-    global _LANGUAGE_VALUE
-    if _LANGUAGE_VALUE is None:
-        lang = common.get(_NAMESPACE, _LANGUAGE, True)  # public
-        if lang is None:
-            _LANGUAGE_VALUE = "en"
-        else:
-            _LANGUAGE_VALUE = lang.decode()
-
-    return _LANGUAGE_VALUE
+    return _get(_LANGUAGE)
 
 
 def set_language(lang: str) -> None:
-    global _LANGUAGE_VALUE
     from trezor.langs import langs_keys
 
     if len(lang.encode("utf-8")) > LANGUAGE_MAXLENGTH:
@@ -871,8 +767,7 @@ def set_language(lang: str) -> None:
         raise ValueError(
             f"all support ISO_639-1 language keys include {' '.join(langs_keys)})"
         )
-    _LANGUAGE_VALUE = lang
-    common.set(_NAMESPACE, _LANGUAGE, lang.encode(), True)  # public
+    _set(_LANGUAGE, lang, lang.encode())
 
 
 def get_mnemonic_secret() -> bytes | None:
@@ -885,8 +780,7 @@ def get_mnemonic_secret() -> bytes | None:
 def get_backup_type() -> BackupType:
     from trezor.enums import BackupType
 
-    global _BACKUP_TYPE_VALUE
-    if _BACKUP_TYPE_VALUE is None:
+    if _BACKUP_TYPE not in _CACHE:
         backup_type = common.get_uint8(_NAMESPACE, _BACKUP_TYPE)
         if backup_type is None:
             backup_type = BackupType.Bip39
@@ -901,44 +795,34 @@ def get_backup_type() -> BackupType:
         ):
             # Invalid backup type
             raise RuntimeError
-        _BACKUP_TYPE_VALUE = backup_type
-    return _BACKUP_TYPE_VALUE  # type: ignore [int-into-enum]
+        _CACHE[_BACKUP_TYPE] = backup_type
+    return _CACHE[_BACKUP_TYPE]  # type: ignore [int-into-enum]
 
 
 def is_passphrase_enabled() -> bool:
-    global _USE_PASSPHRASE_VALUE
-    if _USE_PASSPHRASE_VALUE is None:
-        _USE_PASSPHRASE_VALUE = common.get_bool(_NAMESPACE, _USE_PASSPHRASE)
-    return _USE_PASSPHRASE_VALUE
+    return _get(_USE_PASSPHRASE)
 
 
 def set_passphrase_enabled(enable: bool) -> None:
-    global _USE_PASSPHRASE_VALUE
-    global _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE
-    common.set_bool(_NAMESPACE, _USE_PASSPHRASE, enable)
+    _set_bool(_USE_PASSPHRASE, enable)
     if not enable:
         set_passphrase_always_on_device(False)
-        _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE = False
-    _USE_PASSPHRASE_VALUE = enable
 
 
 def get_homescreen() -> str | None:
-    global _HOMESCREEN_VALUE
-
-    if _HOMESCREEN_VALUE is None:
+    if _HOMESCREEN not in _CACHE:
         homescreen = common.get(_NAMESPACE, _HOMESCREEN, public=True)
-        _HOMESCREEN_VALUE = (
+        _CACHE[_HOMESCREEN] = (
             homescreen.decode() if homescreen else utils.get_default_wallpaper()
         )
-    return _HOMESCREEN_VALUE
+    return _CACHE[_HOMESCREEN]
 
 
 def set_homescreen(full_path: str) -> None:
     if len(full_path.encode("utf-8")) > HOMESCREEN_PATH_MAXSIZE:
         raise ValueError  # homescreen too large
-    global _HOMESCREEN_VALUE
     common.set(_NAMESPACE, _HOMESCREEN, full_path.encode(), public=True)
-    _HOMESCREEN_VALUE = full_path
+    _CACHE[_HOMESCREEN] = full_path
 
 
 def store_mnemonic_secret(
@@ -951,63 +835,53 @@ def store_mnemonic_secret(
 ) -> None:
     from trezor.enums import BackupType
 
-    global _NO_BACKUP_VALUE
-    global _NEEDS_BACKUP_VALUE
-    global _INITIALIZED_VALUE
     set_version(common.STORAGE_VERSION_CURRENT)
     if utils.EMULATOR:
         common.set(_NAMESPACE, _MNEMONIC_SECRET, secret)
-        common.set_bool(_NAMESPACE, INITIALIZED, True, public=True)
+        set_initialized()
     else:
         if backup_type == BackupType.Bip39:
             config.se_import_mnemonic(secret)
         else:
             config.se_import_slip39(secret, backup_type, identifier, iteration_exponent)
     common.set_uint8(_NAMESPACE, _BACKUP_TYPE, backup_type)
+    _CACHE[_BACKUP_TYPE] = backup_type
     common.set_true_or_delete(_NAMESPACE, _NO_BACKUP, no_backup)
+    _CACHE[_NO_BACKUP] = no_backup
     if not no_backup:
         set_backed_up(needs_backup)
-        _NEEDS_BACKUP_VALUE = needs_backup
-    _NO_BACKUP_VALUE = no_backup
-    _INITIALIZED_VALUE = True
+    _CACHE[_IS_INITIALIZED] = True
 
 
 def needs_backup() -> bool:
-    if utils.EMULATOR:
-        return common.get_bool(_NAMESPACE, _NEEDS_BACKUP)
-    global _NEEDS_BACKUP_VALUE
-    if _NEEDS_BACKUP_VALUE is None:
-        _NEEDS_BACKUP_VALUE = config.get_needs_backup()
-    return _NEEDS_BACKUP_VALUE or False
+    if _NEEDS_BACKUP not in _CACHE:
+        if utils.EMULATOR:
+            value = common.get_bool(_NAMESPACE, _NEEDS_BACKUP)
+        else:
+            value = config.get_needs_backup()
+        _CACHE[_NEEDS_BACKUP] = value or False
+    return _CACHE[_NEEDS_BACKUP]
 
 
 def set_backed_up(stat: bool) -> None:
     if utils.EMULATOR:
-        return common.delete(_NAMESPACE, _NEEDS_BACKUP)
-    global _NEEDS_BACKUP_VALUE
-    config.set_needs_backup(stat)
-    _NEEDS_BACKUP_VALUE = stat
-    return None
+        common.delete(_NAMESPACE, _NEEDS_BACKUP)
+        _CACHE[_NEEDS_BACKUP] = False
+    else:
+        config.set_needs_backup(stat)
+        _CACHE[_NEEDS_BACKUP] = stat
 
 
 def unfinished_backup() -> bool:
-    global _UNFINISHED_BACKUP_VALUE
-    if _UNFINISHED_BACKUP_VALUE is None:
-        _UNFINISHED_BACKUP_VALUE = common.get_bool(_NAMESPACE, _UNFINISHED_BACKUP)
-    return _UNFINISHED_BACKUP_VALUE
+    return _get(_UNFINISHED_BACKUP)
 
 
 def set_unfinished_backup(state: bool) -> None:
-    global _UNFINISHED_BACKUP_VALUE
-    common.set_bool(_NAMESPACE, _UNFINISHED_BACKUP, state)
-    _UNFINISHED_BACKUP_VALUE = state
+    _set_bool(_UNFINISHED_BACKUP, state)
 
 
 def no_backup() -> bool:
-    global _NO_BACKUP_VALUE
-    if _NO_BACKUP_VALUE is None:
-        _NO_BACKUP_VALUE = common.get_bool(_NAMESPACE, _NO_BACKUP)
-    return _NO_BACKUP_VALUE
+    return _get(_NO_BACKUP)
 
 
 def get_passphrase_always_on_device() -> bool:
@@ -1021,40 +895,23 @@ def get_passphrase_always_on_device() -> bool:
     # Some models do not support passphrase input on device
     if utils.MODEL in ("1", "R"):
         return False
-    global _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE
-    if _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE is None:
-        _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE = common.get_bool(
-            _NAMESPACE, _PASSPHRASE_ALWAYS_ON_DEVICE
-        )
-    return _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE
+    return _get(_PASSPHRASE_ALWAYS_ON_DEVICE)
     # return is_passphrase_enabled()
 
 
 def set_passphrase_always_on_device(enable: bool) -> None:
-    global _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE
-    common.set_bool(_NAMESPACE, _PASSPHRASE_ALWAYS_ON_DEVICE, enable)
-    _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE = enable
+    _set_bool(_PASSPHRASE_ALWAYS_ON_DEVICE, enable)
 
 
 def get_flags() -> int:
-    global _FLAGS_VALUE
-    if _FLAGS_VALUE is None:
-        b = common.get(_NAMESPACE, _FLAGS)
-        _FLAGS_VALUE = int.from_bytes(b, "big") if b else 0
-    return _FLAGS_VALUE
+    return _get(_FLAGS)
 
 
 def set_flags(flags: int) -> None:
-    global _FLAGS_VALUE
-    b = common.get(_NAMESPACE, _FLAGS)
-    if b is None:
-        i = 0
-    else:
-        i = int.from_bytes(b, "big")
+    i = get_flags()
     flags = (flags | i) & 0xFFFF_FFFF
     if flags != i:
-        common.set(_NAMESPACE, _FLAGS, flags.to_bytes(4, "big"))
-        _FLAGS_VALUE = flags
+        _set(_FLAGS, flags, flags.to_bytes(4, "big"))
 
 
 def _normalize_autolock_delay(delay_ms: int) -> int:
@@ -1064,23 +921,13 @@ def _normalize_autolock_delay(delay_ms: int) -> int:
 
 
 def get_autolock_delay_ms() -> int:
-    global _AUTOLOCK_DELAY_MS_VALUE
-    if _AUTOLOCK_DELAY_MS_VALUE is None:
-        b = common.get(_NAMESPACE, _AUTOLOCK_DELAY_MS)
-        _AUTOLOCK_DELAY_MS_VALUE = (
-            _normalize_autolock_delay(int.from_bytes(b, "big"))
-            if b
-            else AUTOLOCK_DELAY_DEFAULT
-        )
-    return _AUTOLOCK_DELAY_MS_VALUE
+    return _get(_AUTOLOCK_DELAY_MS)
 
 
 def set_autolock_delay_ms(delay_ms: int) -> None:
-    global _AUTOLOCK_DELAY_MS_VALUE
     delay_ms = _normalize_autolock_delay(delay_ms)
-    common.set(_NAMESPACE, _AUTOLOCK_DELAY_MS, delay_ms.to_bytes(4, "big"))
+    _set(_AUTOLOCK_DELAY_MS, delay_ms, delay_ms.to_bytes(4, "big"))
     utils.AUTO_POWER_OFF = False
-    _AUTOLOCK_DELAY_MS_VALUE = delay_ms
 
 
 def _normalize_autoshutdown_delay(delay_ms: int) -> int:
@@ -1090,24 +937,12 @@ def _normalize_autoshutdown_delay(delay_ms: int) -> int:
 
 
 def get_autoshutdown_delay_ms() -> int:
-    global _AUTOSHUTDOWN_DELAY_MS_VALUE
-    if _AUTOSHUTDOWN_DELAY_MS_VALUE is None:
-        b = common.get(_NAMESPACE, _AUTOSHUTDOWN_DELAY_MS, public=True)
-        _AUTOSHUTDOWN_DELAY_MS_VALUE = (
-            _normalize_autoshutdown_delay(int.from_bytes(b, "big"))
-            if b
-            else AUTOSHUTDOWN_DELAY_DEFAULT
-        )
-    return _AUTOSHUTDOWN_DELAY_MS_VALUE
+    return _get(_AUTOSHUTDOWN_DELAY_MS)
 
 
 def set_autoshutdown_delay_ms(delay_ms: int) -> None:
-    global _AUTOSHUTDOWN_DELAY_MS_VALUE
-    _AUTOSHUTDOWN_DELAY_MS_VALUE = delay_ms
     delay_ms = _normalize_autoshutdown_delay(delay_ms)
-    common.set(
-        _NAMESPACE, _AUTOSHUTDOWN_DELAY_MS, delay_ms.to_bytes(4, "big"), public=True
-    )
+    _set(_AUTOSHUTDOWN_DELAY_MS, delay_ms, delay_ms.to_bytes(4, "big"))
 
 
 def next_u2f_counter() -> int:
@@ -1124,12 +959,12 @@ def set_slip39_identifier(identifier: int) -> None:
     Not to be confused with recovery.identifier, which is stored only during
     the recovery process and it is copied here upon success.
     """
-    common.set_uint16(_NAMESPACE, _SLIP39_IDENTIFIER_DEVICE, identifier)
+    _set(_SLIP39_IDENTIFIER_DEVICE, identifier, identifier.to_bytes(2, "big"))
 
 
 def get_slip39_identifier() -> int | None:
     """The device's actual SLIP-39 identifier used in passphrase derivation."""
-    return common.get_uint16(_NAMESPACE, _SLIP39_IDENTIFIER_DEVICE)
+    return _get(_SLIP39_IDENTIFIER_DEVICE)
 
 
 def set_slip39_iteration_exponent(exponent: int) -> None:
@@ -1138,14 +973,14 @@ def set_slip39_iteration_exponent(exponent: int) -> None:
     Not to be confused with recovery.iteration_exponent, which is stored only during
     the recovery process and it is copied here upon success.
     """
-    common.set_uint8(_NAMESPACE, _SLIP39_ITERATION_E_DEVICE, exponent)
+    _set(_SLIP39_ITERATION_E_DEVICE, exponent, exponent.to_bytes(1, "big"))
 
 
 def get_slip39_iteration_exponent() -> int | None:
     """
     The device's actual SLIP-39 iteration exponent used in passphrase derivation.
     """
-    return common.get_uint8(_NAMESPACE, _SLIP39_ITERATION_E_DEVICE)
+    return _get(_SLIP39_ITERATION_E_DEVICE)
 
 
 def get_sd_salt_auth_key() -> bytes | None:
@@ -1172,24 +1007,14 @@ def set_sd_salt_auth_key(auth_key: bytes | None) -> None:
 
 # do not use this function directly, see apps.common.safety_checks instead
 def safety_check_level() -> StorageSafetyCheckLevel:
-    global _SAFETY_CHECK_LEVEL_VALUE
-    if _SAFETY_CHECK_LEVEL_VALUE is None:
-        level = common.get_uint8(_NAMESPACE, _SAFETY_CHECK_LEVEL)
-        if level not in (SAFETY_CHECK_LEVEL_STRICT, SAFETY_CHECK_LEVEL_PROMPT):
-            _SAFETY_CHECK_LEVEL_VALUE = _DEFAULT_SAFETY_CHECK_LEVEL
-        else:
-            _SAFETY_CHECK_LEVEL_VALUE = level
-    assert _SAFETY_CHECK_LEVEL_VALUE is not None
-    return _SAFETY_CHECK_LEVEL_VALUE  # type: ignore [int-into-enum]
+    return _get(_SAFETY_CHECK_LEVEL)  # type: ignore [int-into-enum]
 
 
 # do not use this function directly, see apps.common.safety_checks instead
 def set_safety_check_level(level: StorageSafetyCheckLevel) -> None:
-    global _SAFETY_CHECK_LEVEL_VALUE
     if level not in (SAFETY_CHECK_LEVEL_STRICT, SAFETY_CHECK_LEVEL_PROMPT):
         raise ValueError
-    common.set_uint8(_NAMESPACE, _SAFETY_CHECK_LEVEL, level)
-    _SAFETY_CHECK_LEVEL_VALUE = level
+    _set(_SAFETY_CHECK_LEVEL, level, level.to_bytes(1, "big"))
 
 
 @storage.cache.stored(storage.cache.STORAGE_DEVICE_EXPERIMENTAL_FEATURES)
@@ -1213,211 +1038,115 @@ def set_experimental_features(enabled: bool) -> None:
 def is_trezor_compatible() -> bool:
     if utils.EMULATOR:  # in order to work with hwi
         return False
-    global _TREZOR_COMPATIBLE_VALUE
-    if _TREZOR_COMPATIBLE_VALUE is None:
-        enabled = common.get(_NAMESPACE, _TREZOR_COMPATIBLE, public=True)
-        if enabled == common._FALSE_BYTE:
-            _TREZOR_COMPATIBLE_VALUE = False
-        else:
-            _TREZOR_COMPATIBLE_VALUE = True
-    return _TREZOR_COMPATIBLE_VALUE
+    return _get(_TREZOR_COMPATIBLE)
 
 
 def enable_trezor_compatible(enable: bool) -> None:
-    global _TREZOR_COMPATIBLE_VALUE
-    common.set(
-        _NAMESPACE,
-        _TREZOR_COMPATIBLE,
-        common._TRUE_BYTE if enable else common._FALSE_BYTE,
-        public=True,
-    )
-    _TREZOR_COMPATIBLE_VALUE = enable
+    _set_bool(_TREZOR_COMPATIBLE, enable)
 
 
 def is_airgap_mode() -> bool:
-    global _AIRGAP_MODE_VALUE
-    if _AIRGAP_MODE_VALUE is None:
-        _AIRGAP_MODE_VALUE = common.get_bool(_NAMESPACE, _AIRGAP_MODE, public=True)
-    return _AIRGAP_MODE_VALUE
+    return _get(_AIRGAP_MODE)
 
 
 def enable_airgap_mode(enable: bool) -> None:
-    global _AIRGAP_MODE_VALUE
-    common.set_bool(
-        _NAMESPACE,
-        _AIRGAP_MODE,
-        enable,
-        public=True,
-    )
-    _AIRGAP_MODE_VALUE = enable
+    _set_bool(_AIRGAP_MODE, enable)
 
 
 def get_se01_hash() -> bytes:
-    global _SE01_HASH_VALUE
-    if _SE01_HASH_VALUE is None:
-        _SE01_HASH_VALUE = utils.se_hash(SE_1ST_ADDRESS)
-    return _SE01_HASH_VALUE
+    return _get_derived("se01_hash", utils.se_hash, SE_1ST_ADDRESS)
 
 
 def get_se01_build_id() -> str:
-    global _SE01_BUILDID_VALUE
-    if _SE01_BUILDID_VALUE is None:
-        _SE01_BUILDID_VALUE = utils.se_build_id(SE_1ST_ADDRESS)
-    return _SE01_BUILDID_VALUE
+    return _get_derived("se01_build_id", utils.se_build_id, SE_1ST_ADDRESS)
 
 
 def get_se01_version() -> str:
-    global _SE01_VERSION_VALUE
-    if _SE01_VERSION_VALUE is None:
-        _SE01_VERSION_VALUE = utils.se_version(SE_1ST_ADDRESS)
-    return _SE01_VERSION_VALUE
+    return _get_derived("se01_version", utils.se_version, SE_1ST_ADDRESS)
 
 
 def get_se01_boot_hash() -> bytes:
-    global _SE01_BOOT_HASH_VALUE
-    if _SE01_BOOT_HASH_VALUE is None:
-        _SE01_BOOT_HASH_VALUE = utils.se_boot_hash(SE_1ST_ADDRESS)
-    return _SE01_BOOT_HASH_VALUE
+    return _get_derived("se01_boot_hash", utils.se_boot_hash, SE_1ST_ADDRESS)
 
 
 def get_se01_boot_build_id() -> str:
-    global _SE01_BOOT_BUILDID_VALUE
-    if _SE01_BOOT_BUILDID_VALUE is None:
-        _SE01_BOOT_BUILDID_VALUE = utils.se_boot_build_id(SE_1ST_ADDRESS)
-    return _SE01_BOOT_BUILDID_VALUE
+    return _get_derived("se01_boot_build_id", utils.se_boot_build_id, SE_1ST_ADDRESS)
 
 
 def get_se01_boot_version() -> str:
-    global _SE01_BOOT_VERSION_VALUE
-    if _SE01_BOOT_VERSION_VALUE is None:
-        _SE01_BOOT_VERSION_VALUE = utils.se_boot_version(SE_1ST_ADDRESS)
-    return _SE01_BOOT_VERSION_VALUE
+    return _get_derived("se01_boot_version", utils.se_boot_version, SE_1ST_ADDRESS)
 
 
 def get_se02_hash() -> bytes:
-    global _SE02_HASH_VALUE
-    if _SE02_HASH_VALUE is None:
-        _SE02_HASH_VALUE = utils.se_hash(SE_2ND_ADDRESS)
-    return _SE02_HASH_VALUE
+    return _get_derived("se02_hash", utils.se_hash, SE_2ND_ADDRESS)
 
 
 def get_se02_build_id() -> str:
-    global _SE02_BUILDID_VALUE
-    if _SE02_BUILDID_VALUE is None:
-        _SE02_BUILDID_VALUE = utils.se_build_id(SE_2ND_ADDRESS)
-    return _SE02_BUILDID_VALUE
+    return _get_derived("se02_build_id", utils.se_build_id, SE_2ND_ADDRESS)
 
 
 def get_se02_version() -> str:
-    global _SE02_VERSION_VALUE
-    if _SE02_VERSION_VALUE is None:
-        _SE02_VERSION_VALUE = utils.se_version(SE_2ND_ADDRESS)
-    return _SE02_VERSION_VALUE
+    return _get_derived("se02_version", utils.se_version, SE_2ND_ADDRESS)
 
 
 def get_se02_boot_hash() -> bytes:
-    global _SE02_BOOT_HASH_VALUE
-    if _SE02_BOOT_HASH_VALUE is None:
-        _SE02_BOOT_HASH_VALUE = utils.se_boot_hash(SE_2ND_ADDRESS)
-    return _SE02_BOOT_HASH_VALUE
+    return _get_derived("se02_boot_hash", utils.se_boot_hash, SE_2ND_ADDRESS)
 
 
 def get_se02_boot_build_id() -> str:
-    global _SE02_BOOT_BUILDID_VALUE
-    if _SE02_BOOT_BUILDID_VALUE is None:
-        _SE02_BOOT_BUILDID_VALUE = utils.se_boot_build_id(SE_2ND_ADDRESS)
-    return _SE02_BOOT_BUILDID_VALUE
+    return _get_derived("se02_boot_build_id", utils.se_boot_build_id, SE_2ND_ADDRESS)
 
 
 def get_se02_boot_version() -> str:
-    global _SE02_BOOT_VERSION_VALUE
-    if _SE02_BOOT_VERSION_VALUE is None:
-        _SE02_BOOT_VERSION_VALUE = utils.se_boot_version(SE_2ND_ADDRESS)
-    return _SE02_BOOT_VERSION_VALUE
+    return _get_derived("se02_boot_version", utils.se_boot_version, SE_2ND_ADDRESS)
 
 
 def get_se03_hash() -> bytes:
-    global _SE03_HASH_VALUE
-    if _SE03_HASH_VALUE is None:
-        _SE03_HASH_VALUE = utils.se_hash(SE_3RD_ADDRESS)
-    return _SE03_HASH_VALUE
+    return _get_derived("se03_hash", utils.se_hash, SE_3RD_ADDRESS)
 
 
 def get_se03_build_id() -> str:
-    global _SE03_BUILDID_VALUE
-    if _SE03_BUILDID_VALUE is None:
-        _SE03_BUILDID_VALUE = utils.se_build_id(SE_3RD_ADDRESS)
-    return _SE03_BUILDID_VALUE
+    return _get_derived("se03_build_id", utils.se_build_id, SE_3RD_ADDRESS)
 
 
 def get_se03_version() -> str:
-    global _SE03_VERSION_VALUE
-    if _SE03_VERSION_VALUE is None:
-        _SE03_VERSION_VALUE = utils.se_version(SE_3RD_ADDRESS)
-    return _SE03_VERSION_VALUE
+    return _get_derived("se03_version", utils.se_version, SE_3RD_ADDRESS)
 
 
 def get_se03_boot_hash() -> bytes:
-    global _SE03_BOOT_HASH_VALUE
-    if _SE03_BOOT_HASH_VALUE is None:
-        _SE03_BOOT_HASH_VALUE = utils.se_boot_hash(SE_3RD_ADDRESS)
-    return _SE03_BOOT_HASH_VALUE
+    return _get_derived("se03_boot_hash", utils.se_boot_hash, SE_3RD_ADDRESS)
 
 
 def get_se03_boot_build_id() -> str:
-    global _SE03_BOOT_BUILDID_VALUE
-    if _SE03_BOOT_BUILDID_VALUE is None:
-        _SE03_BOOT_BUILDID_VALUE = utils.se_boot_build_id(SE_3RD_ADDRESS)
-    return _SE03_BOOT_BUILDID_VALUE
+    return _get_derived("se03_boot_build_id", utils.se_boot_build_id, SE_3RD_ADDRESS)
 
 
 def get_se03_boot_version() -> str:
-    global _SE03_BOOT_VERSION_VALUE
-    if _SE03_BOOT_VERSION_VALUE is None:
-        _SE03_BOOT_VERSION_VALUE = utils.se_boot_version(SE_3RD_ADDRESS)
-    return _SE03_BOOT_VERSION_VALUE
+    return _get_derived("se03_boot_version", utils.se_boot_version, SE_3RD_ADDRESS)
 
 
 def get_se04_hash() -> bytes:
-    global _SE04_HASH_VALUE
-    if _SE04_HASH_VALUE is None:
-        _SE04_HASH_VALUE = utils.se_hash(SE_4TH_ADDRESS)
-    return _SE04_HASH_VALUE
+    return _get_derived("se04_hash", utils.se_hash, SE_4TH_ADDRESS)
 
 
 def get_se04_build_id() -> str:
-    global _SE04_BUILDID_VALUE
-    if _SE04_BUILDID_VALUE is None:
-        _SE04_BUILDID_VALUE = utils.se_build_id(SE_4TH_ADDRESS)
-    return _SE04_BUILDID_VALUE
+    return _get_derived("se04_build_id", utils.se_build_id, SE_4TH_ADDRESS)
 
 
 def get_se04_version() -> str:
-    global _SE04_VERSION_VALUE
-    if _SE04_VERSION_VALUE is None:
-        _SE04_VERSION_VALUE = utils.se_version(SE_4TH_ADDRESS)
-    return _SE04_VERSION_VALUE
+    return _get_derived("se04_version", utils.se_version, SE_4TH_ADDRESS)
 
 
 def get_se04_boot_hash() -> bytes:
-    global _SE04_BOOT_HASH_VALUE
-    if _SE04_BOOT_HASH_VALUE is None:
-        _SE04_BOOT_HASH_VALUE = utils.se_boot_hash(SE_4TH_ADDRESS)
-    return _SE04_BOOT_HASH_VALUE
+    return _get_derived("se04_boot_hash", utils.se_boot_hash, SE_4TH_ADDRESS)
 
 
 def get_se04_boot_build_id() -> str:
-    global _SE04_BOOT_BUILDID_VALUE
-    if _SE04_BOOT_BUILDID_VALUE is None:
-        _SE04_BOOT_BUILDID_VALUE = utils.se_boot_build_id(SE_4TH_ADDRESS)
-    return _SE04_BOOT_BUILDID_VALUE
+    return _get_derived("se04_boot_build_id", utils.se_boot_build_id, SE_4TH_ADDRESS)
 
 
 def get_se04_boot_version() -> str:
-    global _SE04_BOOT_VERSION_VALUE
-    if _SE04_BOOT_VERSION_VALUE is None:
-        _SE04_BOOT_VERSION_VALUE = utils.se_boot_version(SE_4TH_ADDRESS)
-    return _SE04_BOOT_VERSION_VALUE
+    return _get_derived("se04_boot_version", utils.se_boot_version, SE_4TH_ADDRESS)
 
 
 def is_passphrase_pin_enabled() -> bool:
@@ -1453,10 +1182,7 @@ def is_passphrase_auto_status() -> bool:
     Returns True if the device is currently in passphrase pin mode.
     In this mode, a separate PIN is used to access the passphrase.
     """
-    global _AUTO_PASSPHRASE_VALUE
-    if _AUTO_PASSPHRASE_VALUE is None:
-        _AUTO_PASSPHRASE_VALUE = common.get_bool(_NAMESPACE, _AUTO_PASSPHRASE)
-    return _AUTO_PASSPHRASE_VALUE
+    return _get(_AUTO_PASSPHRASE)
 
 
 def set_passphrase_auto_status(enable: bool) -> None:
@@ -1466,90 +1192,11 @@ def set_passphrase_auto_status(enable: bool) -> None:
 
     Note: This requires passphrase to be enabled first.
     """
-    global _AUTO_PASSPHRASE_VALUE
-
     # if enable and not is_passphrase_auto_status():
     #     raise ValueError("Cannot enable passphrase PIN without enabling passphrase first")
 
-    common.set_bool(_NAMESPACE, _AUTO_PASSPHRASE, enable)
-    _AUTO_PASSPHRASE_VALUE = enable
+    _set_bool(_AUTO_PASSPHRASE, enable)
 
 
 def clear_global_cache() -> None:
-    global _LANGUAGE_VALUE
-    global _LABEL_VALUE
-    global _USE_PASSPHRASE_VALUE
-    global _AUTO_PASSPHRASE_VALUE
-    global _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE
-    global _AUTOLOCK_DELAY_MS_VALUE
-    global _HOMESCREEN_VALUE
-    global _BLE_NAME_VALUE
-    global _BLE_VERSION_VALUE
-    global _BLE_ENABLED_VALUE
-    global _AUTOSHUTDOWN_DELAY_MS_VALUE
-    global _WALLPAPER_COUNTS_VALUE
-    global _USE_USB_PROTECT_VALUE
-    global _USE_RANDOM_PIN_MAP_VALUE
-    global _TAP_AWAKE_VALUE
-    global _KEYBOARD_HAPTIC_VALUE
-    global _ANIMATION_VALUE
-    global _EXPERIMENTAL_FEATURES_VALUE
-    global _ROTATION_VALUE
-
-    global _INITIALIZED_VALUE
-    global _FLAGS_VALUE
-    global _UNFINISHED_BACKUP_VALUE
-    global _NO_BACKUP_VALUE
-    global _NEEDS_BACKUP_VALUE
-    global _BACKUP_TYPE_VALUE
-    global _SAFETY_CHECK_LEVEL_VALUE
-    global _AIRGAP_MODE_VALUE
-    global _USE_FINGERPRINT_UNLOCK_VALUE
-    global _HAS_PROMPTED_FINGERPRINT_VALUE
-    global _FINGER_FAILED_COUNT_VALUE
-    global _SE01_HASH_VALUE
-    global _SE01_BUILDID_VALUE
-    global _SE01_VERSION_VALUE
-    global _DEVICE_ID_VALUE
-    global _STORAGE_SIZE_VALUE
-    global _SERIAL_NUMBER_VALUE
-    global _TREZOR_COMPATIBLE_VALUE
-
-    _LANGUAGE_VALUE = None
-    _LABEL_VALUE = None
-    _USE_PASSPHRASE_VALUE = None
-    _AUTO_PASSPHRASE_VALUE = None
-    _PASSPHRASE_ALWAYS_ON_DEVICE_VALUE = None
-    _AUTOLOCK_DELAY_MS_VALUE = None
-    _HOMESCREEN_VALUE = None
-    _BLE_NAME_VALUE = None
-    _BLE_VERSION_VALUE = None
-    _BLE_ENABLED_VALUE = None
-    _AUTOSHUTDOWN_DELAY_MS_VALUE = None
-    _WALLPAPER_COUNTS_VALUE = None
-    _USE_USB_PROTECT_VALUE = None
-    _USE_RANDOM_PIN_MAP_VALUE = None
-    _TAP_AWAKE_VALUE = None
-    _KEYBOARD_HAPTIC_VALUE = None
-    _ANIMATION_VALUE = None
-    _EXPERIMENTAL_FEATURES_VALUE = None
-    _ROTATION_VALUE = None
-
-    _INITIALIZED_VALUE = None
-    _FLAGS_VALUE = None
-    _UNFINISHED_BACKUP_VALUE = None
-    _NO_BACKUP_VALUE = None
-    _NEEDS_BACKUP_VALUE = None
-    _BACKUP_TYPE_VALUE = None
-    _SAFETY_CHECK_LEVEL_VALUE = None
-    _AIRGAP_MODE_VALUE = None
-    _USE_FINGERPRINT_UNLOCK_VALUE = None
-    _HAS_PROMPTED_FINGERPRINT_VALUE = None
-    _FINGER_FAILED_COUNT_VALUE = None
-    _SE01_HASH_VALUE = None
-    _SE01_BUILDID_VALUE = None
-    _SE01_VERSION_VALUE = None
-    _STORAGE_SIZE_VALUE = None
-    _DEVICE_ID_VALUE = None
-    _SERIAL_NUMBER_VALUE = None
-    _TREZOR_COMPATIBLE_VALUE = None
+    _CACHE.clear()
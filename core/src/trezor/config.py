@@ -2,10 +2,21 @@ import trezorconfig as config
 from typing import Any
 
 
+def _reload_settings(unlocked: bool) -> None:
+    from storage import device
+
+    # Too many wrong PINs wipe the storage, a right one makes the protected
+    # settings readable. Either way the cached settings are stale.
+    device.clear_global_cache()
+    if unlocked:
+        device.load_settings()
+
+
 def unlock(
     pin: str, salt: bytes | None = None, pin_type: int = 0, auto_vibrate: bool = True
 ) -> tuple[bool, int]:
     result = config.unlock(pin, salt, pin_type)
+    _reload_settings(result[0])
     if auto_vibrate and not result[0]:
         from trezor import motor
 
@@ -13,10 +24,19 @@ def unlock(
     return result
 
 
+def fingerprint_unlock() -> bool:
+    result = config.fingerprint_unlock()
+    if result:
+        _reload_settings(True)
+    return result
+
+
 def check_pin(
     pin: str, salt: bytes | None = None, pin_type: int = 0, auto_vibrate: bool = False
 ) -> tuple[bool, int]:
+    # the native check_pin is an unlock attempt too, it may wipe the storage
     result = config.check_pin(pin, salt, pin_type)
+    _reload_settings(result[0])
     if auto_vibrate and not result[0]:
         from trezor import motor
 
@@ -69,6 +69,8 @@ OwnershipProof = 50
 AuthorizeCoinJoin = 51
 SignPsbt = 10052
 SignedPsbt = 10053
+PsbtRequest = 10054
+PsbtAck = 10055
 CipherKeyValue = 23
 CipheredKeyValue = 48
 SignIdentity = 53
@@ -0,0 +1,9 @@
+# Automatically generated by pb2py
+# fmt: off
+# isort:skip_file
+
+PSBT_GLOBAL = 0
+PSBT_INPUT = 1
+PSBT_OUTPUT = 2
+PSBT_SIGNATURE = 3
+PSBT_FINISHED = 4
@@ -97,6 +97,8 @@ if TYPE_CHECKING:
         AuthorizeCoinJoin = 51
         SignPsbt = 10052
         SignedPsbt = 10053
+        PsbtRequest = 10054
+        PsbtAck = 10055
         CipherKeyValue = 23
         CipheredKeyValue = 48
         SignIdentity = 53
@@ -534,6 +536,13 @@ if TYPE_CHECKING:
         TXORIGOUTPUT = 6
         TXPAYMENTREQ = 7
 
+    class PsbtRequestType(IntEnum):
+        PSBT_GLOBAL = 0
+        PSBT_INPUT = 1
+        PSBT_OUTPUT = 2
+        PSBT_SIGNATURE = 3
+        PSBT_FINISHED = 4
+
     class CardanoDerivationType(IntEnum):
         LEDGER = 0
         ICARUS = 1
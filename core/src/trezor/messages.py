@@ -56,6 +56,7 @@ if TYPE_CHECKING:
     from trezor.enums import OneKeySeType  # noqa: F401
     from trezor.enums import OutputScriptType  # noqa: F401
     from trezor.enums import PinMatrixRequestType  # noqa: F401
+    from trezor.enums import PsbtRequestType  # noqa: F401
     from trezor.enums import RecoveryDeviceType  # noqa: F401
     from trezor.enums import RequestType  # noqa: F401
     from trezor.enums import ResourceType  # noqa: F401
@@ -1468,13 +1469,13 @@ if TYPE_CHECKING:
             return isinstance(msg, cls)
 
     class SignPsbt(protobuf.MessageType):
-        psbt: "bytes"
+        psbt: "bytes | None"
         coin_name: "str"
 
         def __init__(
             self,
             *,
-            psbt: "bytes",
+            psbt: "bytes | None" = None,
             coin_name: "str | None" = None,
         ) -> None:
             pass
@@ -1497,6 +1498,38 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["SignedPsbt"]:
             return isinstance(msg, cls)
 
+    class PsbtRequest(protobuf.MessageType):
+        request_type: "PsbtRequestType"
+        request_index: "int | None"
+        record: "PsbtRecord | None"
+
+        def __init__(
+            self,
+            *,
+            request_type: "PsbtRequestType",
+            request_index: "int | None" = None,
+            record: "PsbtRecord | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["PsbtRequest"]:
+            return isinstance(msg, cls)
+
+    class PsbtAck(protobuf.MessageType):
+        map: "bytes | None"
+
+        def __init__(
+            self,
+            *,
+            map: "bytes | None" = None,
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["PsbtAck"]:
+            return isinstance(msg, cls)
+
     class HDNodePathType(protobuf.MessageType):
         node: "HDNodeType"
         address_n: "list[int]"
@@ -1711,6 +1744,22 @@ if TYPE_CHECKING:
         def is_type_of(cls, msg: Any) -> TypeGuard["TxAckPrevExtraDataWrapper"]:
             return isinstance(msg, cls)
 
+    class PsbtRecord(protobuf.MessageType):
+        key: "bytes"
+        value: "bytes"
+
+        def __init__(
+            self,
+            *,
+            key: "bytes",
+            value: "bytes",
+        ) -> None:
+            pass
+
+        @classmethod
+        def is_type_of(cls, msg: Any) -> TypeGuard["PsbtRecord"]:
+            return isinstance(msg, cls)
+
     class CardanoBlockchainPointerType(protobuf.MessageType):
         block_index: "int"
         tx_index: "int"
@@ -4121,6 +4170,9 @@ if TYPE_CHECKING:
         reset_word_pos: "int | None"
         mnemonic_type: "BackupType | None"
         layout_lines: "list[str]"
+        keychain_cache_hits: "int | None"
+        keychain_cache_misses: "int | None"
+        keychain_cache_evictions: "int | None"
 
         def __init__(
             self,
@@ -4138,6 +4190,9 @@ if TYPE_CHECKING:
             recovery_word_pos: "int | None" = None,
             reset_word_pos: "int | None" = None,
             mnemonic_type: "BackupType | None" = None,
+            keychain_cache_hits: "int | None" = None,
+            keychain_cache_misses: "int | None" = None,
+            keychain_cache_evictions: "int | None" = None,
         ) -> None:
             pass
 
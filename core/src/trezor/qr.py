@@ -234,6 +234,11 @@ def scan_qr(callback_obj):
                     # await loop.sleep(100)
                     continue
                 else:
+                    if __debug__:
+                        print(
+                            f"ur: {decoder.received_part_count()}/{decoder.expected_part_count()} "
+                            f"fragments, {decoder.decode_rate():.1f} parts/s"
+                        )
                     await callback_obj.on_process_update(
                         decoder.estimated_percent_complete()
                     )
@@ -14,8 +14,12 @@ if __debug__:
 
     import micropython
 
+    import storage.common
     from trezor import utils
 
+    # storage.common.get_calls when each workflow started
+    _config_get_calls: dict[loop.spawn, int] = {}
+
 
 # Set of workflow tasks.  Multiple workflows can be running at the same time.
 tasks: set[loop.spawn] = set()
@@ -35,6 +39,7 @@ def _on_start(workflow: loop.spawn) -> None:
     # Take note that this workflow task is running.
     if __debug__:
         log.debug(__name__, "start: %s", workflow.task)
+        _config_get_calls[workflow] = storage.common.get_calls
     idle_timer.touch()
     tasks.add(workflow)
 
@@ -43,7 +48,12 @@ def _on_close(workflow: loop.spawn) -> None:
     """Called when a workflow task has finished running."""
     # Remove task from the running set.
     if __debug__:
-        log.debug(__name__, "close: %s", workflow.task)
+        log.debug(
+            __name__,
+            "close: %s, config.get calls: %d",
+            workflow.task,
+            storage.common.get_calls - _config_get_calls.pop(workflow),
+        )
     tasks.remove(workflow)
     if not tasks and default_constructor:
         # If no workflows are running, we should create a new default workflow
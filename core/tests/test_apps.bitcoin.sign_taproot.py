@@ -0,0 +1,178 @@
+from common import unittest  # isort:skip
+
+import ustruct
+
+from trezor import wire
+from trezor.crypto import bip39
+from trezor.crypto.curve import bip340
+from trezor.messages import SignTx
+from trezor.utils import BufferReader
+
+from apps.bitcoin.common import SigHashType
+from apps.bitcoin.sign_taproot import TaprootSigner
+from apps.common import coins
+from apps.common.keychain import Keychain
+from apps.common.paths import HARDENED, AlwaysMatchingSchema
+from apps.ur_registry.chains.bitcoin.psbt.psbt import PSBT
+from apps.ur_registry.chains.bitcoin.psbt.serialize import ser_compact_size, ser_string
+
+PATH = [86 | HARDENED, 0 | HARDENED, 0 | HARDENED, 0, 0]
+LOCK_TIME = 82011
+
+
+def record(key, value):
+    return ser_string(key) + ser_string(value)
+
+
+def u32(value):
+    return ustruct.pack("<I", value)
+
+
+def amount(value):
+    return ustruct.pack("<q", value)
+
+
+def make_psbt(keychain, version):
+    """Two key path inputs of ours and one output, as PSBTv0 or PSBTv2."""
+    xonly = keychain.derive(PATH).public_key()[1:]
+    fingerprint = keychain.root_fingerprint().to_bytes(4, "big")
+    derivation = ser_compact_size(0) + fingerprint + b"".join(u32(i) for i in PATH)
+    txids = [bytes([i + 1]) * 32 for i in range(2)]
+    out_script = b"\x51\x20" + b"\x33" * 32
+
+    if version == 0:
+        tx = u32(2) + ser_compact_size(2)
+        for i, txid in enumerate(txids):
+            tx += txid + u32(i) + b"\x00" + u32(0xFFFF_FFFD)
+        tx += ser_compact_size(1) + amount(9000) + ser_string(out_script)
+        tx += u32(LOCK_TIME)
+        raw = b"psbt\xff" + record(b"\x00", tx) + b"\x00"
+    else:
+        raw = (
+            b"psbt\xff"
+            + record(b"\x02", u32(2))
+            + record(b"\x03", u32(LOCK_TIME))
+            + record(b"\x04", ser_compact_size(2))
+            + record(b"\x05", ser_compact_size(1))
+            + record(b"\xfb", u32(2))
+            + b"\x00"
+        )
+
+    for i, txid in enumerate(txids):
+        raw += record(b"\x01", amount(5000) + ser_string(b"\x51\x20" + xonly))
+        raw += record(b"\x16" + xonly, derivation) + record(b"\x17", xonly)
+        if version == 2:
+            raw += record(b"\x0e", txid) + record(b"\x0f", u32(i))
+            raw += record(b"\x10", u32(0xFFFF_FFFD))
+        raw += b"\x00"
+
+    if version == 2:
+        raw += record(b"\x03", amount(9000)) + record(b"\x04", out_script)
+    raw += b"\x00"
+    return raw
+
+
+def parse_maps(raw):
+    psbt = PSBT()
+    r = BufferReader(raw)
+    inputs_count, outputs_count = psbt.deserialize_global(r)
+    inputs = [psbt.deserialize_input(r, i) for i in range(inputs_count)]
+    outputs = [psbt.deserialize_output(r, i) for i in range(outputs_count)]
+    if r.remaining_count():
+        raise ValueError("Trailing data")
+    return psbt, inputs, outputs
+
+
+class TestSignTaproot(unittest.TestCase):
+    def setUp(self):
+        self.coin = coins.by_name("Bitcoin")
+        seed = bip39.seed(" ".join(["all"] * 12), "")
+        self.keychain = Keychain(seed, self.coin.curve_name, [AlwaysMatchingSchema])
+
+    def test_parse_maps(self):
+        for version in (0, 2):
+            raw = make_psbt(self.keychain, version)
+            whole = PSBT()
+            whole.deserialize(raw)
+            psbt, inputs, outputs = parse_maps(raw)
+
+            for p in (whole, psbt):
+                self.assertEqual(p.tx_version, 2)
+                self.assertEqual(p.fallback_locktime, LOCK_TIME)
+            self.assertEqual(len(inputs), 2)
+            for i, (a, b) in enumerate(zip(whole.inputs, inputs)):
+                self.assertEqual(b.prev_txid, bytes([i + 1]) * 32)
+                self.assertEqual(b.prev_out, i)
+                self.assertEqual(b.sequence, 0xFFFF_FFFD)
+                self.assertEqual(
+                    (a.prev_txid, a.prev_out, a.sequence),
+                    (b.prev_txid, b.prev_out, b.sequence),
+                )
+            self.assertEqual(len(outputs), 1)
+            self.assertEqual(outputs[0].amount, 9000)
+            self.assertEqual(whole.outputs[0].script, outputs[0].script)
+
+    def test_parse_maps_invalid(self):
+        with self.assertRaises(Exception):
+            PSBT().deserialize_global(BufferReader(b"psbu\xff\x00"))
+        # PSBTv2 fields are not allowed in PSBTv0
+        raw = make_psbt(self.keychain, 0)
+        raw = raw[:5] + record(b"\x02", u32(2)) + raw[5:]
+        with self.assertRaises(Exception):
+            PSBT().deserialize_global(BufferReader(raw))
+
+    def test_signer(self):
+        xonly = self.keychain.derive(PATH).public_key()[1:]
+        signatures = []
+        for version in (0, 2):
+            psbt, inputs, _ = parse_maps(make_psbt(self.keychain, version))
+            signer = TaprootSigner(None, self.keychain, self.coin)
+            signer.inputs_count = len(inputs)
+            keys = [signer.add_input(input) for input in inputs]
+            self.assertEqual(keys, [[(xonly, PATH, None)]] * 2)
+            self.assertEqual(signer.total_in, 10000)
+            self.assertFalse(signer.lock_time_disabled)
+
+            result = signer.sign_input(1, keys[1], psbt.tx_version, LOCK_TIME)
+            self.assertEqual(len(result), 1)
+            key, leaf_hash, signature = result[0]
+            self.assertEqual((key, leaf_hash), (xonly, None))
+            digest = signer.sig_hasher.hash341(
+                1,
+                SignTx(
+                    outputs_count=0, inputs_count=0, version=2, lock_time=LOCK_TIME
+                ),
+                SigHashType.SIGHASH_ALL_TAPROOT,
+            )
+            output_key = bip340.tweak_public_key(xonly)
+            self.assertTrue(bip340.verify(output_key, signature, digest))
+            signatures.append(signature)
+
+        # the same transaction as PSBTv0 and as PSBTv2
+        self.assertEqual(signatures[0], signatures[1])
+
+    def test_signer_lock_time(self):
+        _, inputs, _ = parse_maps(make_psbt(self.keychain, 2))
+        signer = TaprootSigner(None, self.keychain, self.coin)
+        inputs[0].height_locktime = 800000
+        inputs[1].time_locktime = 1700000000
+        signer.add_input(inputs[0])
+        self.assertEqual(signer.height_lock, 800000)
+        with self.assertRaises(wire.DataError):
+            signer.add_input(inputs[1])
+
+    def test_signer_not_ours(self):
+        _, inputs, _ = parse_maps(make_psbt(self.keychain, 2))
+        signer = TaprootSigner(None, self.keychain, self.coin)
+        inputs[0].tap_bip32_paths.clear()
+        signer.add_input(inputs[0])
+        with self.assertRaises(wire.DataError):
+            signer.check_ours()
+
+        inputs[1].witness_utxo = None
+        with self.assertRaises(wire.DataError):
+            signer.add_input(inputs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
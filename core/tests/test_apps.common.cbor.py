@@ -2,17 +2,25 @@ import math
 
 from common import *
 
+from trezor.crypto.hashlib import sha256
+from trezor.utils import BufferWriter, HashWriter
+
 from apps.common.cbor import (
     IndefiniteLengthArray,
     OrderedMap,
+    Reader,
     Tagged,
+    TYPE_ARRAY,
+    TYPE_BYTE_STRING,
     create_array_header,
     create_map_header,
     create_embedded_cbor_bytes_header,
     decode,
     encode,
     encode_chunked,
+    encode_into,
     encode_streamed,
+    encoded_length,
 )
 
 
@@ -214,6 +222,68 @@ class TestCardanoCbor(unittest.TestCase):
 
             self.assertEqual(b''.join(encoded_chunks), encoded)
 
+    def test_encode_into(self):
+        value = {
+            'b': [1, -1000, b'\x01\x02', IndefiniteLengthArray([None, True])],
+            1: Tagged(24, {2: 'P\u0159\xed'}),
+            -5: bytearray(300),
+            b'key': 2 ** 40,
+        }
+        encoded = encode(value)
+        self.assertEqual(encoded_length(value), len(encoded))
+
+        buffer = bytearray(len(encoded) + 2)
+        w = BufferWriter(buffer)
+        w.seek(2)
+        encode_into(w, value)
+        self.assertEqual(w.offset, len(buffer))
+        self.assertEqual(bytes(buffer[2:]), encoded)
+
+        w = HashWriter(sha256())
+        encode_into(w, value)
+        self.assertEqual(w.get_digest(), sha256(encoded).digest())
+
+    def test_map_key_order(self):
+        # keys are ordered like their encodings, bytewise
+        value = {'aa': 1, b'a': 2, 'b': 3, -1: 4, 24: 5, 23: 6, (1,): 7, 1000: 8}
+        self.assertEqual(
+            encode(value),
+            unhexlify('a817061818051903e808200441610261620362616101810107'),
+        )
+
+    def test_reader(self):
+        encoded = encode(
+            [
+                {1: b'\x01\x02', 2: 'text'},
+                Tagged(258, [1, 2]),
+                IndefiniteLengthArray([-1, [2, 3]]),
+                None,
+            ]
+        )
+        r = Reader(encoded)
+        self.assertEqual(r.read_array_header(), 4)
+        self.assertEqual(r.read_map_header(), 2)
+        self.assertEqual(r.read_int(), 1)
+        self.assertEqual(r.peek_type(), TYPE_BYTE_STRING)
+        self.assertEqual(bytes(r.read_bytes()), b'\x01\x02')
+        self.assertEqual(r.read_int(), 2)
+        self.assertEqual(r.read_text(), 'text')
+        self.assertEqual(r.read_tag(), 258)
+        r.skip()
+        self.assertEqual(r.peek_type(), TYPE_ARRAY)
+        self.assertEqual(r.read_array_header(), None)
+        self.assertEqual(r.read_int(), -1)
+        self.assertFalse(r.read_break())
+        self.assertEqual(r.read_value(), [2, 3])
+        self.assertTrue(r.read_break())
+        self.assertEqual(r.read_value(), None)
+        self.assertEqual(r.remaining_count(), 0)
+
+        with self.assertRaises(ValueError):
+            Reader(encode(1)).read_bytes()
+        with self.assertRaises(EOFError):
+            Reader(encode(b'1234')[:-1]).skip()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,6 @@
 from common import *
 
-from apps.common import coins
+from apps.common import coininfo, coins
 
 
 class TestCoins(unittest.TestCase):
@@ -30,9 +30,44 @@ class TestCoins(unittest.TestCase):
             self.assertEqual(c.address_type, a)
             self.assertEqual(c.coin_shortcut, s)
 
+    @unittest.skipUnless(not utils.BITCOIN_ONLY, "altcoin")
+    def test_packed_parameters(self):
+        c = coins.by_name('Elements')
+        self.assertEqual(c.confidential_assets, {'address_prefix': 4, 'blech32_prefix': 'el'})
+        self.assertEqual(c.bech32_prefix, 'ert')
+        self.assertIsNone(c.cashaddr_prefix)
+        c = coins.by_name('Bcash')
+        self.assertEqual(c.cashaddr_prefix, 'bitcoincash')
+        self.assertEqual(c.fork_id, 0)
+        self.assertIsNone(c.xpub_magic_segwit_p2sh)
+        c = coins.by_name('Decred')
+        self.assertEqual(c.curve_name, 'secp256k1-decred')
+        self.assertTrue(c.decred)
+        self.assertEqual(c.signed_message_header, 'Decred Signed Message:\n')
+
+    def test_all_names(self):
+        for name in coininfo._COIN_NAMES:
+            try:
+                c = coins.by_name(name)
+            except ValueError:
+                self.assertTrue(utils.BITCOIN_ONLY)
+                continue
+            self.assertEqual(c.coin_name, name)
+
+    def test_cache(self):
+        coininfo._cache.clear()
+        c = coins.by_name('Bitcoin')
+        self.assertIs(coins.by_name('Bitcoin'), c)
+        self.assertIs(coininfo._cache['Bitcoin'], c)
+
     def test_failure(self):
         with self.assertRaises(ValueError):
             coins.by_name('XXXXX')
+        with self.assertRaises(ValueError):
+            coins.by_name('')
+        with self.assertRaises(ValueError):
+            coins.by_name('Zzzzz')
+        self.assertNotIn('XXXXX', coininfo._cache)
 
 
 if __name__ == '__main__':
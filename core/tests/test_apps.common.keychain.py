@@ -5,7 +5,14 @@ from mock_storage import mock_storage
 from storage import cache
 from apps.common import safety_checks
 from apps.common.paths import PATTERN_SEP5, PathSchema
-from apps.common.keychain import LRUCache, Keychain, with_slip44_keychain, get_keychain
+from apps.common.keychain import (
+    LRUCache,
+    Keychain,
+    with_slip44_keychain,
+    get_keychain,
+    cache_stats,
+    DEFAULT_CACHE_SIZE,
+)
 from trezor import wire
 from trezor.crypto import bip39
 from trezor.enums import SafetyCheckLevel
@@ -163,6 +170,66 @@ class TestKeychain(unittest.TestCase):
         # "a" is recently used so should not be evicted now
         self.assertIs(cache.get("a"), obj_a)
 
+    def test_lru_cache_order(self):
+        class Deletable:
+            def __del__(self):
+                pass
+
+        cache = LRUCache(3)
+        for key in "abc":
+            cache.insert(key, Deletable())
+        # touch "a", so that "b" is now the least recently used entry
+        self.assertIsNotNone(cache.get("a"))
+        # re-inserting "c" makes it the most recent one
+        cache.insert("c", Deletable())
+        cache.insert("d", Deletable())
+        self.assertIsNone(cache.get("b"))
+        cache.insert("e", Deletable())
+        self.assertIsNone(cache.get("a"))
+        for key in "cde":
+            self.assertIsNotNone(cache.get(key))
+        self.assertEqual(len(cache.cache), 3)
+
+        self.assertEqual(cache.hits, 4)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_cache_size_and_stats(self):
+        seed = bip39.seed(" ".join(["all"] * 12), "")
+        cache.set(cache.APP_COMMON_SEED, seed)
+        hits, misses, evictions = cache_stats()
+
+        @with_slip44_keychain(PATTERN_SEP5, slip44_id=42, cache_size=2)
+        async def derive_accounts(ctx, msg, keychain):
+            self.assertEqual(keychain._cache.size, 2)
+            for _ in range(2):
+                for account in range(3):
+                    keychain.derive([H_(44), H_(42), H_(account), 0, 0])
+
+        await_result(derive_accounts(wire.DUMMY_CONTEXT, None))
+        # three accounts do not fit into a cache of two, so every derivation
+        # misses and evicts the least recently used account
+        self.assertEqual(cache_stats(), (hits, misses + 6, evictions + 4))
+
+    def test_cache_default_size(self):
+        seed = bip39.seed(" ".join(["all"] * 12), "")
+        cache.set(cache.APP_COMMON_SEED, seed)
+        hits, misses, evictions = cache_stats()
+
+        @with_slip44_keychain(PATTERN_SEP5, slip44_id=42)
+        async def derive_accounts(ctx, msg, keychain):
+            self.assertEqual(keychain._cache.size, DEFAULT_CACHE_SIZE)
+            for _ in range(2):
+                for account in range(DEFAULT_CACHE_SIZE + 1):
+                    keychain.derive([H_(44), H_(42), H_(account), 0, 0])
+
+        await_result(derive_accounts(wire.DUMMY_CONTEXT, None))
+        # one account more than fits, so every derivation misses and evicts the
+        # least recently used account once the cache is full
+        derived = 2 * (DEFAULT_CACHE_SIZE + 1)
+        evicted = derived - DEFAULT_CACHE_SIZE
+        self.assertEqual(cache_stats(), (hits, misses + derived, evictions + evicted))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+from common import *
+from apps.common.paths import HARDENED
+
+if not utils.BITCOIN_ONLY:
+    from apps.ethereum import networks
+
+
+@unittest.skipUnless(not utils.BITCOIN_ONLY, "altcoin")
+class TestEthereumNetworks(unittest.TestCase):
+
+    def test_by_chain_id(self):
+        network = networks.by_chain_id(1)
+        self.assertEqual(network.chain_id, 1)
+        self.assertEqual(network.slip44, 60)
+        self.assertEqual(network.symbol, "ETH")
+        self.assertEqual(network.name, "Ethereum")
+
+        network = networks.by_chain_id(9798)
+        self.assertEqual(network.symbol, "DTT")
+        self.assertEqual(network.primary_color, 0x1A2A5F)
+
+        # chain_id wider than 32 bits
+        network = networks.by_chain_id(6022140761023)
+        self.assertEqual(network.chain_id, 6022140761023)
+
+        for chain_id in (0, -1, 123456789, 2**64, 2**80):
+            self.assertIs(networks.by_chain_id(chain_id), networks.UNKNOWN_NETWORK)
+
+    def test_by_slip44(self):
+        # first network with the slip44, in order of chain_id
+        self.assertEqual(networks.by_slip44(60).chain_id, 1)
+        self.assertEqual(networks.by_slip44(1).chain_id, 3)
+        self.assertEqual(networks.by_slip44(9798).symbol, "DTT")
+        for slip44 in (-1, 123456789, 2**32):
+            self.assertIs(networks.by_slip44(slip44), networks.UNKNOWN_NETWORK)
+
+    def test_all_slip44_ids_hardened(self):
+        slip44_ids = list(networks.all_slip44_ids_hardened())
+        self.assertIn(60 | HARDENED, slip44_ids)
+        self.assertIn(9798 | HARDENED, slip44_ids)
+        self.assertNotIn(60, slip44_ids)
+
+    def test_shortcut_by_chain_id(self):
+        self.assertEqual(networks.shortcut_by_chain_id(1), "ETH")
+        self.assertEqual(networks.shortcut_by_chain_id(123456789), "UNKN")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+from common import *
+
+from apps.ur_registry.ur_py.ur.crc32 import crc32, crc32n
+from apps.ur_registry.ur_py.ur.fountain_decoder import FountainDecoder, InvalidChecksum
+from apps.ur_registry.ur_py.ur.fountain_encoder import FountainEncoder
+from apps.ur_registry.ur_py.ur.fountain_utils import (
+    choose_fragments,
+    indexes_to_mask,
+    mask_to_indexes,
+    shuffled,
+)
+from apps.ur_registry.ur_py.ur.ur import UR
+from apps.ur_registry.ur_py.ur.ur_decoder import URDecoder
+from apps.ur_registry.ur_py.ur.ur_encoder import UREncoder
+from apps.ur_registry.ur_py.ur.utils import xor_bytes, xor_into
+from apps.ur_registry.ur_py.ur.xoshiro256 import Xoshiro256
+
+
+def make_message(length, seed="Wolf"):
+    return Xoshiro256.from_string(seed).next_data(length)
+
+
+def fountain_parts(message, max_fragment_len, count):
+    encoder = FountainEncoder(message, max_fragment_len)
+    return [encoder.next_part() for _ in range(count)]
+
+
+def ur_parts(message, max_fragment_len, count):
+    encoder = UREncoder(UR("bytes", message), max_fragment_len)
+    return [encoder.next_part() for _ in range(count)]
+
+
+class TestUrFountainDecoder(unittest.TestCase):
+    def test_crc32(self):
+        self.assertEqual(crc32(b"Hello, world!"), 0xEBE6C6E6)
+        self.assertEqual(crc32(b"Wolf"), 0x598C84DC)
+        self.assertEqual(crc32n(b"Wolf"), unhexlify("598c84dc"))
+
+    def test_xor(self):
+        a = bytearray(b"\x00\x0f\xf0\xff")
+        self.assertEqual(xor_bytes(a, b"\xff\xff\x00\x01"), b"\xff\xf0\xf0\xfe")
+        xor_into(a, b"\x00\x0f\xf0\xff")
+        self.assertEqual(a, bytearray(4))
+        with self.assertRaises(AssertionError):
+            xor_bytes(b"\x00", b"\x00\x00")
+
+    def test_masks(self):
+        for indexes in ([], [0], [5], [0, 1, 2], [3, 64, 65, 200]):
+            mask = indexes_to_mask(indexes)
+            self.assertEqual(mask_to_indexes(mask), indexes)
+        self.assertEqual(indexes_to_mask({1, 3}), 0b1010)
+
+    def test_shuffled_prefix(self):
+        for seed in ("Wolf", "Fox"):
+            full = shuffled(list(range(50)), Xoshiro256.from_string(seed))
+            self.assertEqual(sorted(full), list(range(50)))
+            for count in (1, 2, 7, 50):
+                prefix = shuffled(list(range(50)), Xoshiro256.from_string(seed), count)
+                self.assertEqual(prefix, full[:count])
+
+    def test_choose_fragments(self):
+        # test vectors from the reference implementation
+        message = make_message(1024)
+        checksum = crc32(message)
+        vectors = [
+            [0],
+            [1],
+            [2],
+            [3],
+            [4],
+            [5],
+            [6],
+            [7],
+            [8],
+            [9],
+            [10],
+            [9],
+            [2, 5, 6, 8, 9, 10],
+            [8],
+            [1, 5],
+            [1],
+            [0, 2, 4, 5, 8, 10],
+            [5],
+            [2],
+            [2],
+            [0, 1, 3, 4, 5, 7, 9, 10],
+            [0, 1, 2, 3, 5, 6, 8, 9, 10],
+            [0, 2, 4, 5, 7, 8, 9, 10],
+            [3, 5],
+            [4],
+            [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+            [0, 1, 3, 4, 5, 6, 7, 9, 10],
+            [6],
+            [5, 6],
+            [7],
+        ]
+        for seq_num, expected in enumerate(vectors, 1):
+            indexes = choose_fragments(seq_num, 11, checksum)
+            self.assertEqual(sorted(indexes), expected)
+
+    def test_decode_pure_fragments(self):
+        message = make_message(32767)
+        parts = fountain_parts(message, 1000, 33)
+        decoder = FountainDecoder()
+        for part in parts:
+            self.assertFalse(decoder.is_complete())
+            self.assertTrue(decoder.receive_part(part))
+        self.assertEqual(decoder.result_message(), message)
+        self.assertEqual(decoder.received_part_count(), 33)
+        self.assertFalse(decoder.receive_part(parts[0]))
+
+    def test_decode_mixed_parts(self):
+        message = make_message(10000)
+        parts = fountain_parts(message, 100, 400)
+        for step in (2, 3):
+            decoder = FountainDecoder()
+            # lose all but every step-th part, including most of the pure ones
+            for part in parts[::step]:
+                decoder.receive_part(part)
+                if decoder.is_complete():
+                    break
+            self.assertTrue(decoder.is_success())
+            self.assertEqual(decoder.result_message(), message)
+
+    def test_decode_duplicates_and_order(self):
+        message = make_message(5000)
+        parts = fountain_parts(message, 100, 150)
+        parts = parts[100:] + parts[90:] + parts[:10]
+        decoder = FountainDecoder()
+        processed = 0
+        for part in parts:
+            decoder.receive_part(part)
+            processed += 1
+            self.assertEqual(decoder.processed_parts_count, processed)
+            if decoder.is_complete():
+                break
+        self.assertEqual(decoder.result_message(), message)
+
+    def test_invalid_checksum(self):
+        parts = fountain_parts(make_message(1000), 100, 10)
+        parts[3].data = bytes(len(parts[3].data))
+        decoder = FountainDecoder()
+        for part in parts:
+            decoder.receive_part(part)
+        self.assertTrue(decoder.is_failure())
+        self.assertIsInstance(decoder.result_error(), InvalidChecksum)
+
+    def test_ur_decoder(self):
+        message = make_message(3000)
+        parts = ur_parts(message, 100, 100)
+        decoder = URDecoder()
+        percent = 0
+        for part in parts[1::2]:
+            decoder.receive_part(part)
+            self.assertTrue(decoder.estimated_percent_complete() >= percent)
+            percent = decoder.estimated_percent_complete()
+            received = decoder.received_part_indexes()
+            self.assertEqual(len(received), decoder.received_part_count())
+            self.assertTrue(decoder.last_part_indexes())
+            if decoder.is_complete():
+                break
+        self.assertTrue(decoder.is_success())
+        self.assertEqual(decoder.result_message(), UR("bytes", message))
+        self.assertEqual(decoder.estimated_percent_complete(), 100)
+        self.assertTrue(decoder.decode_rate() >= 0)
+
+        decoder.reset()
+        self.assertFalse(decoder.is_complete())
+        self.assertEqual(decoder.received_part_indexes(), set())
+        self.assertIsNone(decoder.last_part_indexes())
+        self.assertEqual(decoder.estimated_percent_complete(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
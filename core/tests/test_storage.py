@@ -1,6 +1,8 @@
 from common import *
 from trezor import config
-from storage import device
+import storage
+from storage import common, device
+from trezor.enums import BackupType
 
 
 class TestConfig(unittest.TestCase):
@@ -16,6 +18,67 @@ class TestConfig(unittest.TestCase):
         device.set_u2f_counter(0)
         self.assertEqual(device.next_u2f_counter(), 1)
 
+    def test_settings_cache(self):
+        config.init()
+        storage.wipe()
+        self.assertEqual(device.get_rotation(), 0)
+        self.assertTrue(device.is_animation_enabled())
+        device.set_rotation(90)
+        device.set_animation_enable(False)
+
+        calls = common.get_calls
+        self.assertEqual(device.get_rotation(), 90)
+        self.assertFalse(device.is_animation_enabled())
+        device.load_settings()
+        self.assertEqual(common.get_calls, calls + len(device._SETTINGS) - 2)
+        calls = common.get_calls
+        device.load_settings()
+        self.assertEqual(common.get_calls, calls)
+
+        # the values come from the storage again after a wipe
+        storage.wipe()
+        self.assertEqual(device.get_rotation(), 0)
+        self.assertTrue(device.is_animation_enabled())
+
+    def test_check_pin_wipe(self):
+        config.init()
+        storage.wipe()
+        device.set_rotation(90)
+        self.assertEqual(device.get_rotation(), 90)
+
+        native = config.config
+
+        class WipingConfig:
+            # the last allowed wrong PIN wipes the storage
+            def check_pin(self, pin, salt, pin_type):
+                native.wipe()
+                return False, 0
+
+        config.config = WipingConfig()
+        try:
+            self.assertFalse(config.check_pin("1234", None)[0])
+        finally:
+            config.config = native
+        self.assertEqual(device.get_rotation(), 0)
+
+    def test_initialized_cache(self):
+        config.init()
+        storage.wipe()
+        self.assertFalse(device.is_initialized())
+        device.store_mnemonic_secret(b"secret", BackupType.Bip39)
+        calls = common.get_calls
+        self.assertTrue(device.is_initialized())
+        self.assertFalse(device.needs_backup())
+        self.assertEqual(common.get_calls, calls)
+
+        storage.wipe()
+        self.assertFalse(device.is_initialized())
+        # a stored version without the initialized flag, as in FWs <= 2.3.1
+        device.set_version(common.STORAGE_VERSION_CURRENT)
+        self.assertFalse(device.is_initialized())
+        storage.init_unlocked()
+        self.assertTrue(device.is_initialized())
+
 
 if __name__ == '__main__':
     unittest.main()
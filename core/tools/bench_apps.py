@@ -0,0 +1,271 @@
+# Benchmarks of app internals, timed in the unix emulator.
+#
+# Run it from this directory:
+#   ../build/unix/trezor-emu-core -X heapsize=2M bench_apps.py BENCHMARK [FILE]
+#
+# BENCHMARK is one of:
+#   cbor                  CBOR encoding and decoding of a Cardano transaction body
+#                         and a WebAuthn attestation object; "chunks" joins the
+#                         output of encode_streamed, as before encode_into existed
+#   coininfo              coin lookup by name, the first and the last coin of the
+#                         former `if name == ...` chain and of the sorted table
+#   ethereum_definitions  built-in network and token lookups
+#   fountain_decoder      replay of an animated UR QR code, recorded in FILE one UR
+#                         per line, or of a 60 kB message in 300 fragments with
+#                         every third frame missed
+#   workflow_handlers     dispatch of message types to handler modules, compared
+#                         to a lookup in the order of workflow_handlers.txt, like
+#                         the former chain of `if msg_type == ...`
+
+import sys
+
+sys.path.append("../src")
+
+import gc  # isort:skip
+import utime  # isort:skip
+
+from trezor import utils  # noqa: F401, isort:skip
+
+ROUNDS = 20
+
+
+def measure(fn, args, rounds=ROUNDS):
+    """Call `fn(*arg)` for every `arg` in `args`, `rounds` times.
+
+    Return the microseconds and the bytes allocated per call.
+    """
+    fn(*args[0])
+    gc.collect()
+    alloc_before = gc.mem_alloc()
+    start = utime.ticks_us()
+    for _ in range(rounds):
+        for arg in args:
+            fn(*arg)
+    elapsed = utime.ticks_diff(utime.ticks_us(), start)
+    # without collections in between, the allocated amount only grows
+    allocated = gc.mem_alloc() - alloc_before
+    count = rounds * len(args)
+    return elapsed / count, allocated // count
+
+
+def report(label, fn, args, rounds=ROUNDS):
+    us, allocated = measure(fn, args, rounds)
+    print("%-40s %10.2f us/call %8d B/call" % (label, us, allocated))
+
+
+def bench_cbor():
+    from trezor.crypto.hashlib import blake2b
+    from trezor.utils import BufferWriter, HashWriter
+
+    from apps.common import cbor
+
+    inputs = [[bytes([i]) * 32, i] for i in range(20)]
+    outputs = [
+        [bytes([0x61]) + bytes([i]) * 28, [1000000 + i, {bytes(28): {b"tok": i}}]]
+        for i in range(20)
+    ]
+    cardano = {0: inputs, 1: outputs, 2: 170000, 3: 90000000}
+    cose_key = {1: 2, 3: -7, -1: 1, -2: bytes(32), -3: bytes(range(32))}
+    webauthn = {
+        "fmt": "packed",
+        "attStmt": {"alg": -7, "sig": bytes(71), "x5c": [bytes(400)]},
+        "authData": bytes(37) + cbor.encode(cose_key),
+    }
+
+    def encode_chunks(value):
+        return b"".join(cbor.encode_streamed(value))
+
+    def hash_chunks(value):
+        h = blake2b(outlen=32)
+        for chunk in cbor.encode_streamed(value):
+            h.update(chunk)
+        return h.digest()
+
+    def hash_into(value):
+        w = HashWriter(blake2b(outlen=32))
+        cbor.encode_into(w, value)
+        return w.get_digest()
+
+    def skip(encoded):
+        cbor.Reader(encoded).skip()
+
+    for name, value in (("cardano", cardano), ("webauthn", webauthn)):
+        encoded = cbor.encode(value)
+        print("%s: %d bytes" % (name, len(encoded)))
+        buffer = bytearray(len(encoded))
+
+        def encode_preallocated(value):
+            cbor.encode_into(BufferWriter(buffer), value)
+
+        report("encode, chunks", encode_chunks, [(value,)])
+        report("encode", cbor.encode, [(value,)])
+        report("encode_into, buffer", encode_preallocated, [(value,)])
+        report("hash, chunks", hash_chunks, [(value,)])
+        report("hash, encode_into", hash_into, [(value,)])
+        report("decode", cbor.decode, [(encoded,)])
+        report("Reader.skip", skip, [(encoded,)])
+
+
+def bench_coininfo():
+    from apps.common import coininfo
+
+    def uncached(name):
+        coininfo._cache.clear()
+        coininfo.by_name(name)
+
+    names = ["Bitcoin"]
+    if not utils.BITCOIN_ONLY:
+        names += ["Brhodium", coininfo._COIN_NAMES[0], coininfo._COIN_NAMES[-1]]
+    print("%d coins" % len(coininfo._COIN_NAMES))
+    for name in names:
+        report("by_name(%r)" % name, uncached, [(name,)], rounds=200)
+        report("by_name(%r), cached" % name, coininfo.by_name, [(name,)], rounds=200)
+
+
+def bench_ethereum_definitions():
+    from apps.ethereum import networks, tokens
+
+    def token_args(hit):
+        args = []
+        for chain_id in range(0, 100000):
+            tables = tokens._token_tables(chain_id)
+            if tables is None:
+                continue
+            index = tables[0]
+            for pos in range(0, len(index), 22):
+                address = index[pos : pos + 20]
+                if not hit:
+                    address = address[:-1] + bytes([address[-1] ^ 0xFF])
+                args.append((chain_id, address))
+        return args
+
+    chain_ids = [
+        int.from_bytes(networks._NETWORKS[pos : pos + 8], "big")
+        for pos in range(0, len(networks._NETWORKS), 14)
+    ]
+    slip44s = [n & 0x7FFF_FFFF for n in networks.all_slip44_ids_hardened()]
+    known, unknown = token_args(True), token_args(False)
+    print("%d networks, %d tokens" % (len(chain_ids), len(known)))
+
+    report("by_chain_id", networks.by_chain_id, [(c,) for c in chain_ids])
+    report(
+        "by_chain_id (unknown)",
+        networks.by_chain_id,
+        [(c + 10**9,) for c in chain_ids],
+    )
+    report("by_slip44", networks.by_slip44, [(s,) for s in slip44s])
+    report("token_by_chain_address", tokens.token_by_chain_address, known)
+    report("token_by_chain_address (unknown)", tokens.token_by_chain_address, unknown)
+
+
+def bench_fountain_decoder():
+    from apps.ur_registry.ur_py.ur.fountain_decoder import FountainDecoder
+    from apps.ur_registry.ur_py.ur.fountain_encoder import Part
+    from apps.ur_registry.ur_py.ur.ur import UR
+    from apps.ur_registry.ur_py.ur.ur_decoder import URDecoder
+    from apps.ur_registry.ur_py.ur.ur_encoder import UREncoder
+    from apps.ur_registry.ur_py.ur.xoshiro256 import Xoshiro256
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2]) as f:
+            frames = [line.strip() for line in f if line.strip()]
+    else:
+        message = Xoshiro256.from_string("bench").next_data(60000)
+        encoder = UREncoder(UR("crypto-psbt", message), 200)
+        frames = [encoder.next_part() for _ in range(900)]
+        frames = [frame for i, frame in enumerate(frames) if i % 3 != 2]
+    print("%d frames recorded" % len(frames))
+
+    def replay(label, decoder, frames):
+        start = utime.ticks_us()
+        count = 0
+        for frame in frames:
+            decoder.receive_part(frame)
+            count += 1
+            if decoder.is_complete():
+                break
+        elapsed = utime.ticks_diff(utime.ticks_us(), start) / 1000
+        print(
+            "%-10s %6d frames %10.1f ms %8.2f ms/frame"
+            % (label, count, elapsed, elapsed / count)
+        )
+        return count
+
+    decoder = URDecoder()
+    count = replay("ur", decoder, frames)
+    if not decoder.is_success():
+        print("stream incomplete after %d frames" % count)
+        return
+    print(
+        "%d bytes in %d fragments, %d fragments recovered"
+        % (
+            len(decoder.result_message().cbor),
+            decoder.expected_part_count(),
+            decoder.received_part_count(),
+        )
+    )
+
+    parts = []
+    for frame in frames[:count]:
+        _, components = URDecoder.parse(frame)
+        cbor = URDecoder.decode_by_type("bytes", components[1]).cbor
+        parts.append(Part.from_cbor(cbor))
+    fountain = FountainDecoder()
+    replay("fountain", fountain, parts)
+    print("decoder time %d ms" % (fountain.decode_us // 1000))
+
+
+def bench_workflow_handlers():
+    from trezor.enums import MessageType
+
+    from apps.workflow_handlers import find_message_handler_module
+
+    table = []
+    with open("codegen/workflow_handlers.txt") as f:
+        for line in f:
+            fields = line.split("#")[0].split()
+            if fields and hasattr(MessageType, fields[0]):
+                table.append((fields[0], fields[1]))
+
+    def tree(msg_type):
+        try:
+            find_message_handler_module(msg_type)
+        except ValueError:
+            pass
+
+    def linear(msg_type):
+        for name, module in table:
+            if msg_type == getattr(MessageType, name):
+                return module
+
+    msg_types = sorted(
+        getattr(MessageType, name) for name in dir(MessageType) if name[0] != "_"
+    )
+    msg_types = [t for t in msg_types if isinstance(t, int)]
+    print("%d message types" % len(msg_types))
+    for lo, hi in ((0, 1000), (1000, 10000), (10000, 20000), (20000, 30000)):
+        selected = [(t,) for t in msg_types if lo <= t < hi]
+        if selected:
+            report("tree, %d-%d" % (lo, hi - 1), tree, selected)
+            report("linear, %d-%d" % (lo, hi - 1), linear, selected)
+    report("tree, all", tree, [(t,) for t in msg_types])
+    report("linear, all", linear, [(t,) for t in msg_types])
+
+
+BENCHMARKS = {
+    "cbor": bench_cbor,
+    "coininfo": bench_coininfo,
+    "ethereum_definitions": bench_ethereum_definitions,
+    "fountain_decoder": bench_fountain_decoder,
+    "workflow_handlers": bench_workflow_handlers,
+}
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        print("usage: bench_apps.py {%s} [FILE]" % ",".join(BENCHMARKS))
+        sys.exit(1)
+    BENCHMARKS[sys.argv[1]]()
+
+
+main()
@@ -4,7 +4,6 @@ from pathlib import Path
 import sys
 
 import click
-from PIL import Image
 
 from trezorlib import toif
 
@@ -37,16 +36,17 @@ def build_icons(check, remove):
 
     total_size = 0
 
+    with_icon = []
     for app in apps:
         if app["icon"] is None:
             if not app.get("no_icon"):
                 raise click.ClickException(f"Icon not found for: {app['key']}")
             else:
                 continue
+        with_icon.append(app)
 
-        im = Image.open(app["icon"])
-        resized = im.resize(ICON_SIZE, Image.BOX)
-        toi = toif.from_image(resized)
+    toifs = toif.from_files([app["icon"] for app in with_icon], resize=ICON_SIZE)
+    for app, toi in zip(with_icon, toifs):
         dest_path = DESTINATION / f"icon_{app['key']}.toif"
 
         total_size += len(toi.to_bytes())
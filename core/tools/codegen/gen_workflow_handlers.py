@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+# script used to generate find_message_handler_module() in
+# /src/apps/workflow_handlers.py from workflow_handlers.txt
+
+import itertools
+import re
+import sys
+from pathlib import Path
+
+import click
+
+HERE = Path(__file__).resolve().parent
+CORE = HERE.parent.parent
+
+TABLE = HERE / "workflow_handlers.txt"
+TARGET = CORE / "src" / "apps" / "workflow_handlers.py"
+ENUM = CORE / "src" / "trezor" / "enums" / "MessageType.py"
+
+BEGIN = "# generated by tools/codegen/gen_workflow_handlers.py from\n"
+END = "# end of generated code\n"
+
+# number of equality comparisons in the leaves of the comparison tree
+LEAF_SIZE = 4
+LINE_LENGTH = 88
+
+CONDITIONS = {
+    "debug": "__debug__",
+    "altcoin": "not utils.BITCOIN_ONLY",
+    "model_t": 'utils.MODEL == "T"',
+    "device": "not utils.EMULATOR",
+}
+
+DOCSTRING = '''\
+    """Statically find the appropriate workflow handler.
+
+    The message type is compared against integer constants in a balanced tree, so
+    a lookup takes about log2(n) comparisons instead of one per message. The reason
+    for not using a dict is memory fragmentation optimization:
+    - using a dict would mean that the whole thing stays in RAM, whereas the
+      comparisons are run from flash
+    - collecting everything as strings instead of importing directly means that we don't
+      need to load any of the modules into memory until we actually need them
+    """
+'''
+
+
+class Entry:
+    def __init__(self, name: str, value: int, module: str, conditions: list) -> None:
+        self.name = name
+        self.value = value
+        self.module = module
+        self.conditions = conditions
+
+
+def read_enum():
+    """Values of MessageType and the names defined only with altcoins."""
+    values = {}
+    altcoin = set()
+    in_altcoin = False
+    for line in ENUM.read_text().splitlines():
+        if line == "if not utils.BITCOIN_ONLY:":
+            in_altcoin = True
+            continue
+        m = re.match(r"^(\s*)(\w+) = (\d+)$", line)
+        if m:
+            values[m.group(2)] = int(m.group(3))
+            if m.group(1):
+                if not in_altcoin:
+                    raise click.ClickException(f"Unexpected indentation: {line}")
+                altcoin.add(m.group(2))
+            else:
+                in_altcoin = False
+    return values, altcoin
+
+
+def read_table(values):
+    entries = []
+    errors = []
+    for lineno, line in enumerate(TABLE.read_text().splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        fields = line.split()
+        if len(fields) not in (2, 3):
+            errors.append(f"{TABLE.name}:{lineno}: expected 2 or 3 fields")
+            continue
+        name, module = fields[:2]
+        conditions = fields[2].split(",") if len(fields) == 3 else []
+        for condition in conditions:
+            if condition not in CONDITIONS:
+                errors.append(f"{TABLE.name}:{lineno}: unknown condition {condition}")
+        if name not in values:
+            errors.append(f"{TABLE.name}:{lineno}: unknown message type {name}")
+            continue
+        entries.append(Entry(name, values[name], module, conditions))
+    return entries, errors
+
+
+def check_table(entries, altcoin):
+    """Check that the table is consistent with the source tree."""
+    errors = []
+    seen = {}
+    for e in entries:
+        if e.name in seen:
+            errors.append(f"{e.name}: listed twice")
+        seen[e.name] = e
+        if e.name in altcoin and "altcoin" not in e.conditions:
+            errors.append(f"{e.name}: defined only with altcoins, needs 'altcoin'")
+
+        path = CORE / "src" / Path(*e.module.split("."))
+        for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+            if candidate.exists():
+                break
+        else:
+            errors.append(f"{e.name}: module {e.module} not found")
+            continue
+        handler = e.module.rsplit(".", 1)[-1]
+        pattern = rf"^\s*(async )?def {handler}\("
+        if not re.search(pattern, candidate.read_text(), re.M):
+            errors.append(f"{e.name}: {e.module} does not define {handler}()")
+    return errors
+
+
+def gen_if(entry, pad):
+    # wrapped the same way as black would
+    terms = [f"msg_type == {entry.value}"] + [CONDITIONS[c] for c in entry.conditions]
+    condition = " and ".join(terms)
+    if len(f"{pad}if {condition}:") <= LINE_LENGTH:
+        return [f"{pad}if {condition}:"]
+    if len(f"{pad}    {condition}") <= LINE_LENGTH:
+        return [f"{pad}if (", f"{pad}    {condition}", f"{pad}):"]
+    return (
+        [f"{pad}if (", f"{pad}    {terms[0]}"]
+        + [f"{pad}    and {term}" for term in terms[1:]]
+        + [f"{pad}):"]
+    )
+
+
+def gen_tree(entries, indent):
+    pad = " " * indent
+    if len(entries) <= LEAF_SIZE:
+        lines = []
+        for e in entries:
+            lines.append(f"{pad}# {e.name}")
+            lines += gen_if(e, pad)
+            lines.append(f'{pad}    return "{e.module}"')
+        return lines
+
+    mid = len(entries) // 2
+    return (
+        [f"{pad}if msg_type < {entries[mid].value}:"]
+        + gen_tree(entries[:mid], indent + 4)
+        + [f"{pad}else:"]
+        + gen_tree(entries[mid:], indent + 4)
+    )
+
+
+def gen_function(entries):
+    entries = sorted(entries, key=lambda e: e.value)
+    lines = [
+        BEGIN.rstrip("\n"),
+        "# tools/codegen/workflow_handlers.txt, do not edit manually!",
+        "def find_message_handler_module(msg_type: int) -> str:",
+        DOCSTRING.rstrip("\n"),
+    ]
+    lines += gen_tree(entries, 4)
+    lines += ["    raise ValueError", "", "", END.rstrip("\n")]
+    return "\n".join(lines) + "\n"
+
+
+def check_dispatch(code, entries, values):
+    """Run the generated function for every message type and configuration."""
+    errors = []
+    code = code.replace("__debug__", "DEBUG")
+    by_value = {e.value: e for e in entries}
+    msg_types = sorted(set(range(max(values.values()) + 2)) | {-1, 1 << 16})
+
+    class Utils:
+        pass
+
+    for debug, btc_only, model, emulator in itertools.product(
+        (False, True), (False, True), ("T", "1"), (False, True)
+    ):
+        utils = Utils()
+        utils.BITCOIN_ONLY = btc_only
+        utils.MODEL = model
+        utils.EMULATOR = emulator
+        namespace = {"utils": utils, "DEBUG": debug}
+        exec(code, namespace)
+        find = namespace["find_message_handler_module"]
+        holds = {
+            "debug": debug,
+            "altcoin": not btc_only,
+            "model_t": model == "T",
+            "device": not emulator,
+        }
+
+        for msg_type in msg_types:
+            e = by_value.get(msg_type)
+            if e is not None and all(holds[c] for c in e.conditions):
+                expected = e.module
+            else:
+                expected = None
+            try:
+                result = find(msg_type)
+            except ValueError:
+                result = None
+            if result != expected:
+                errors.append(
+                    f"{msg_type} with debug={debug} bitcoin_only={btc_only} "
+                    f"model={model} emulator={emulator}: {result} != {expected}"
+                )
+    return errors
+
+
+def replace_function(source, function):
+    try:
+        start = source.index(BEGIN)
+        end = source.index(END, start) + len(END)
+    except ValueError:
+        raise click.ClickException(f"Generated code markers not found in {TARGET}")
+    return source[:start] + function + source[end:]
+
+
+@click.command()
+@click.option("-c", "--check", is_flag=True, help="Do not write, only check.")
+def gen_workflow_handlers(check):
+    """Generate the dispatch of wire messages to workflow handler modules."""
+    values, altcoin = read_enum()
+    entries, errors = read_table(values)
+    errors += check_table(entries, altcoin)
+    if errors:
+        raise click.ClickException("\n".join(errors))
+
+    function = gen_function(entries)
+    errors = check_dispatch(function, entries, values)
+    if errors:
+        raise click.ClickException("\n".join(errors[:20]))
+
+    source = TARGET.read_text()
+    result = replace_function(source, function)
+    if check:
+        if result != source:
+            raise click.ClickException(
+                f"{TARGET} is outdated, run tools/codegen/gen_workflow_handlers.py"
+            )
+    elif result != source:
+        TARGET.write_text(result)
+    print(f"{len(entries)} message types dispatched", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    gen_workflow_handlers()
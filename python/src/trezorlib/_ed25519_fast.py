@@ -0,0 +1,279 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""
+Faster pure-Python Ed25519 verification, a drop-in for the routines of `_ed25519`.
+
+NB: Like `_ed25519`, this code is not safe for use with secret keys or secret
+data. All scalar multiplications run in variable time. The only safe use is for
+verifying signatures on public messages.
+
+Points are kept in extended coordinates (X:Y:Z:T), the same as in `_ed25519`.
+Addends are prepared in "cached" form (Y+X, Y-X, 2Z, 2dT), which saves field
+multiplications in every addition. Scalar multiplication of the base point uses
+a table of the affine multiples j * 16^i * B, computed on first use, so it takes
+at most 64 additions and no doublings. Other scalar multiplications process four
+bits at a time, and `multiscalarmult` shares the doublings among all points of a
+sum (Straus' method).
+
+`checkvalid` accepts and rejects exactly the same signatures as
+`_ed25519.checkvalid`.
+"""
+
+from typing import List, Sequence, Tuple
+
+from ._ed25519 import (
+    B,
+    Hint,
+    Point,
+    SignatureMismatch,
+    b,
+    bit,
+    d,
+    decodeint,
+    encodeint,
+    ident,
+    isoncurve,
+    l,
+    q,
+)
+
+Cached = Tuple[int, int, int, int]
+Affine = Tuple[int, int, int]
+
+D2 = 2 * d % q
+I = pow(2, (q - 1) // 4, q)
+
+_WINDOW = 4
+_WINDOW_MASK = (1 << _WINDOW) - 1
+
+
+def inv(z: int) -> int:
+    """$= z^{-1} mod q$, for z != 0"""
+    return pow(z, q - 2, q)
+
+
+def xrecover(y: int) -> int:
+    xx = (y * y - 1) * inv(d * y * y + 1)
+    x = pow(xx, (q + 3) // 8, q)
+
+    if (x * x - xx) % q != 0:
+        x = (x * I) % q
+
+    if x % 2 != 0:
+        x = q - x
+
+    return x
+
+
+def to_cached(P: Point) -> Cached:
+    x, y, z, t = P
+    return ((y + x) % q, (y - x) % q, 2 * z % q, D2 * t % q)
+
+
+def add_cached(P: Point, C: Cached) -> Point:
+    # 'addition-add-2008-hwcd-3' with the second point in cached form
+    x1, y1, z1, t1 = P
+    ypx2, ymx2, z2, t2 = C
+
+    a = (y1 - x1) * ymx2 % q
+    b = (y1 + x1) * ypx2 % q
+    c = t1 * t2 % q
+    dd = z1 * z2 % q
+    e = b - a
+    f = dd - c
+    g = dd + c
+    h = b + a
+
+    return Point((e * f % q, g * h % q, f * g % q, e * h % q))
+
+
+def add_affine(P: Point, C: Affine) -> Point:
+    # like add_cached, for a point with Z = 1 stored as (y+x, y-x, 2dxy)
+    x1, y1, z1, t1 = P
+    ypx2, ymx2, t2 = C
+
+    a = (y1 - x1) * ymx2 % q
+    b = (y1 + x1) * ypx2 % q
+    c = t1 * t2 % q
+    dd = 2 * z1
+    e = b - a
+    f = dd - c
+    g = dd + c
+    h = b + a
+
+    return Point((e * f % q, g * h % q, f * g % q, e * h % q))
+
+
+def edwards_add(P: Point, Q: Point) -> Point:
+    return add_cached(P, to_cached(Q))
+
+
+def edwards_double(P: Point) -> Point:
+    # This is formula sequence 'dbl-2008-hwcd' from
+    # http://www.hyperelliptic.org/EFD/g1p/auto-twisted-extended-1.html
+    x1, y1, z1, _ = P
+
+    a = x1 * x1 % q
+    b = y1 * y1 % q
+    c = 2 * z1 * z1 % q
+    e = ((x1 + y1) * (x1 + y1) - a - b) % q
+    g = b - a
+    f = g - c
+    h = -a - b
+
+    return Point((e * f % q, g * h % q, f * g % q, e * h % q))
+
+
+def points_equal(P: Point, Q: Point) -> bool:
+    x1, y1, z1, _ = P
+    x2, y2, z2, _ = Q
+    return (x1 * z2 - x2 * z1) % q == 0 and (y1 * z2 - y2 * z1) % q == 0
+
+
+# _B_TABLE[i][j - 1] == j * 16**i * B in affine form, for j in 1..15
+_B_TABLE: List[List[Affine]] = []
+
+
+def _batch_inv(values: List[int]) -> List[int]:
+    # Montgomery's trick: one inversion and three multiplications per value
+    prefix = [1]
+    for v in values:
+        prefix.append(prefix[-1] * v % q)
+    acc = inv(prefix[-1])
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = acc * prefix[i] % q
+        acc = acc * values[i] % q
+    return result
+
+
+def _make_B_table() -> None:
+    points = []
+    row_base = B
+    for _ in range((b + _WINDOW - 1) // _WINDOW):
+        P = row_base
+        for _ in range(_WINDOW_MASK):
+            points.append(P)
+            P = edwards_add(P, row_base)
+        # P == 16 * row_base now
+        row_base = P
+
+    inverses = _batch_inv([z for _, _, z, _ in points])
+    affine = []
+    for (x, y, _, _), zi in zip(points, inverses):
+        x = x * zi % q
+        y = y * zi % q
+        affine.append(((y + x) % q, (y - x) % q, D2 * x * y % q))
+    for i in range(0, len(affine), _WINDOW_MASK):
+        _B_TABLE.append(affine[i : i + _WINDOW_MASK])
+
+
+def scalarmult_B(e: int) -> Point:
+    if not _B_TABLE:
+        _make_B_table()
+    # scalarmult(B, l) is the identity
+    e = e % l
+    P = ident
+    for row in _B_TABLE:
+        digit = e & _WINDOW_MASK
+        if digit:
+            P = add_affine(P, row[digit - 1])
+        e >>= _WINDOW
+    return P
+
+
+def _multiples(P: Point) -> List[Cached]:
+    # j * P in cached form, for j in 1..15
+    C = to_cached(P)
+    result = [C]
+    Q = P
+    for _ in range(_WINDOW_MASK - 1):
+        Q = add_cached(Q, C)
+        result.append(to_cached(Q))
+    return result
+
+
+def multiscalarmult(terms: Sequence[Tuple[int, Point]]) -> Point:
+    """Sum of scalar multiples `e * P` of `terms`, with shared doublings."""
+    tables = [_multiples(P) for _, P in terms]
+    scalars = [e for e, _ in terms]
+    top = max(e.bit_length() for e in scalars) if scalars else 0
+    shift = (top + _WINDOW - 1) // _WINDOW * _WINDOW
+
+    P = ident
+    while shift > 0:
+        shift -= _WINDOW
+        if P is not ident:
+            for _ in range(_WINDOW):
+                P = edwards_double(P)
+        for e, table in zip(scalars, tables):
+            digit = (e >> shift) & _WINDOW_MASK
+            if digit:
+                P = add_cached(P, table[digit - 1])
+    return P
+
+
+def scalarmult(P: Point, e: int) -> Point:
+    return multiscalarmult(((e, P),))
+
+
+def encodepoint(P: Point) -> bytes:
+    x, y, z, _ = P
+    zi = inv(z)
+    x = (x * zi) % q
+    y = (y * zi) % q
+    return encodeint(y | ((x & 1) << (b - 1)))
+
+
+def decodepoint(s: bytes) -> Point:
+    y = decodeint(s) & ~(1 << b - 1)  # y without the highest bit
+    x = xrecover(y)
+    if x & 1 != bit(s, b - 1):
+        x = q - x
+    P = Point((x, y, 1, (x * y) % q))
+    if not isoncurve(P):
+        raise ValueError("decoding point that is not on curve")
+    return P
+
+
+def _decode_signature(s: bytes, m: bytes, pk: bytes) -> Tuple[Point, Point, int, int]:
+    if len(s) != b // 4:
+        raise ValueError("signature length is wrong")
+
+    if len(pk) != b // 8:
+        raise ValueError("public-key length is wrong")
+
+    R = decodepoint(s[: b // 8])
+    A = decodepoint(pk)
+    S = decodeint(s[b // 8 : b // 4])
+    h = Hint(encodepoint(R) + pk + m)
+    return R, A, S, h
+
+
+def checkvalid(s: bytes, m: bytes, pk: bytes) -> None:
+    """
+    Not safe to use when any argument is secret.
+
+    Verify the signature `s` of `m` by `pk`, raise `SignatureMismatch` if
+    it is invalid, or `ValueError` if it cannot be decoded.
+    """
+    R, A, S, h = _decode_signature(s, m, pk)
+    P = scalarmult_B(S)
+    # the order of any point divides 8 * l
+    Q = add_cached(scalarmult(A, h % (8 * l)), to_cached(R))
+    if not points_equal(P, Q):
+        raise SignatureMismatch("signature does not pass verification")
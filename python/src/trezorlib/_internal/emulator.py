@@ -16,6 +16,7 @@
 
 import logging
 import os
+import select
 import subprocess
 import time
 from pathlib import Path
@@ -27,6 +28,8 @@ from ..transport.udp import UdpTransport
 LOG = logging.getLogger(__name__)
 
 EMULATOR_WAIT_TIME = 60
+# Emulators which do not report readiness are pinged in this interval
+PING_INTERVAL = 0.1
 
 
 def _rm_f(path: Path) -> None:
@@ -74,8 +77,10 @@ class Emulator:
 
         self.client: Optional[TrezorClientDebugLink] = None
         self.process: Optional[subprocess.Popen] = None
+        # read end of the pipe on which the emulator reports that it is listening
+        self._notify_fd: Optional[int] = None
 
-        self.port = 54935
+        self.port = UdpTransport.DEFAULT_PORT
         self.headless = headless
         self.debug = debug
         self.auto_interact = auto_interact
@@ -90,7 +95,36 @@ class Emulator:
     def _get_transport(self) -> UdpTransport:
         return UdpTransport(f"127.0.0.1:{self.port}")
 
+    def _close_notify_fd(self) -> None:
+        if self._notify_fd is not None:
+            os.close(self._notify_fd)
+            self._notify_fd = None
+
+    def _wait_for_notification(self, timeout: float) -> None:
+        """Wait up to `timeout` seconds for the emulator to report that it is listening.
+
+        The emulator writes to the pipe in TREZOR_NOTIFY_FD once its interfaces are
+        bound. The pipe is also closed when the process exits.
+        """
+        assert self._notify_fd is not None
+        readable, _, _ = select.select([self._notify_fd], [], [], timeout)
+        if not readable:
+            return
+        if not os.read(self._notify_fd, 64):
+            # the process exited, wait for the exit status
+            assert self.process is not None
+            try:
+                self.process.wait(1)
+            except subprocess.TimeoutExpired:
+                pass
+        self._close_notify_fd()
+
     def wait_until_ready(self, timeout: float = EMULATOR_WAIT_TIME) -> None:
+        """Wait until the emulator answers on its port.
+
+        Instead of polling, the emulator is pinged once it reports that it is
+        listening. Emulators built without the report are pinged periodically.
+        """
         assert self.process is not None, "Emulator not started"
         transport = self._get_transport()
         transport.open()
@@ -98,18 +132,24 @@ class Emulator:
         start = time.monotonic()
         try:
             while True:
+                remaining = max(timeout - (time.monotonic() - start), 0)
+                if self._notify_fd is not None:
+                    self._wait_for_notification(min(PING_INTERVAL, remaining))
+                else:
+                    time.sleep(min(PING_INTERVAL, remaining))
+
+                if self.process.poll() is not None:
+                    raise RuntimeError("Emulator process died")
+                # the ping waits for the reply, which comes once the firmware
+                # starts handling messages
                 if transport._ping():
                     break
-                if self.process.poll() is not None:
-                    raise RuntimeError("Emulator proces died")
 
-                elapsed = time.monotonic() - start
-                if elapsed >= timeout:
+                if time.monotonic() - start >= timeout:
                     raise TimeoutError("Can't connect to emulator")
-
-                time.sleep(0.1)
         finally:
             transport.close()
+            self._close_notify_fd()
 
         LOG.info(f"Emulator ready after {time.monotonic() - start:.3f} seconds")
 
@@ -131,13 +171,26 @@ class Emulator:
             assert isinstance(self.logfile, (str, Path))
             output = open(self.logfile, "w")
 
-        return subprocess.Popen(
-            [str(self.executable)] + args + self.extra_args,
-            cwd=self.workdir,
-            stdout=cast(TextIO, output),
-            stderr=subprocess.STDOUT,
-            env=env,
-        )
+        self._close_notify_fd()
+        read_fd, write_fd = os.pipe()
+        env["TREZOR_NOTIFY_FD"] = str(write_fd)
+        try:
+            process = subprocess.Popen(
+                [str(self.executable)] + args + self.extra_args,
+                cwd=self.workdir,
+                stdout=cast(TextIO, output),
+                stderr=subprocess.STDOUT,
+                env=env,
+                pass_fds=(write_fd,),
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            # only the emulator keeps the write end open
+            os.close(write_fd)
+        self._notify_fd = read_fd
+        return process
 
     def start(self) -> None:
         if self.process:
@@ -183,6 +236,7 @@ class Emulator:
                 LOG.info("Emulator seems stuck. Sending kill signal.")
                 self.process.kill()
 
+        self._close_notify_fd()
         _rm_f(self.profile_dir / "onekey.pid")
         _rm_f(self.profile_dir / "onekey.port")
         self.process = None
@@ -191,6 +245,19 @@ class Emulator:
         self.stop()
         self.start()
 
+    def restore_storage(self, storage: bytes) -> None:
+        """Restart the emulator with `storage` as the contents of its flash.
+
+        Restores a snapshot taken by `get_storage()`. The firmware keeps the state
+        of the storage in RAM, so the flash can only be replaced while the emulator
+        is stopped, and every restore pays for a full restart.
+        """
+        start = time.monotonic()
+        self.stop()
+        self.storage.write_bytes(storage)
+        self.start()
+        LOG.info(f"Storage restored after {time.monotonic() - start:.3f} seconds")
+
     def __enter__(self) -> "Emulator":
         return self
 
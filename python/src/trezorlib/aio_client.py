@@ -0,0 +1,363 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""asyncio Trezor client.
+
+`AsyncTrezorClient` is the counterpart of `TrezorClient` over an `AsyncTransport`:
+
+>>> transport = AsyncUdpTransport("127.0.0.1:21324")
+>>> client = await AsyncTrezorClient.connect(transport, ui)
+>>> await client.call(messages.Ping(message="hello"))
+
+Several clients can share one event loop. Calls on a single client are
+serialized, so concurrent tasks never interleave messages on the same device.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
+
+from mnemonic import Mnemonic
+
+from . import exceptions, mapping, messages, models
+from .client import (
+    MAX_PASSPHRASE_LENGTH,
+    MAX_PIN_LENGTH,
+    PASSPHRASE_ON_DEVICE,
+    TrezorClient,
+)
+from .log import DUMP_BYTES
+from .messages import Capability
+
+if TYPE_CHECKING:
+    from typing_extensions import Protocol
+
+    from .protobuf import MessageType
+    from .transport.aio import AsyncTransport
+    from .ui import TrezorClientUI
+
+    class AsyncTrezorClientUI(Protocol):
+        async def button_request(self, br: messages.ButtonRequest) -> None:
+            ...
+
+        async def get_pin(self, code: Optional[messages.PinMatrixRequestType]) -> str:
+            ...
+
+        async def get_passphrase(
+            self, available_on_device: bool
+        ) -> Union[str, object]:
+            ...
+
+
+LOG = logging.getLogger(__name__)
+
+
+async def _resolve(value: Any) -> Any:
+    """Await the result of a UI callback if it is a coroutine."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncTrezorClient:
+    """Trezor client over an asyncio transport.
+
+    The `ui` may be a regular `TrezorClientUI` or an object with the same methods
+    defined as coroutines; `ClickUI` works, but blocks the event loop while it
+    waits for input.
+
+    Unlike `TrezorClient`, the constructor performs no I/O. Use `connect()`, or
+    call `init_device()` before anything that needs `features`.
+    """
+
+    def __init__(
+        self,
+        transport: "AsyncTransport",
+        ui: Union["TrezorClientUI", "AsyncTrezorClientUI"],
+        session_id: Optional[bytes] = None,
+        model: Optional[models.TrezorModel] = None,
+    ) -> None:
+        LOG.info(f"creating async client instance for device: {transport.get_path()}")
+        self.model = model
+        if self.model:
+            self.mapping = self.model.default_mapping
+        else:
+            self.mapping = mapping.DEFAULT_MAPPING
+        self.transport = transport
+        self.ui = ui
+        self.session_counter = 0
+        self.session_id = session_id
+        self._lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    async def connect(
+        cls,
+        transport: "AsyncTransport",
+        ui: Union["TrezorClientUI", "AsyncTrezorClientUI"],
+        session_id: Optional[bytes] = None,
+        derive_cardano: Optional[bool] = None,
+        model: Optional[models.TrezorModel] = None,
+    ) -> "AsyncTrezorClient":
+        """Create a client and initialize the device, like `TrezorClient()`."""
+        client = cls(transport, ui, session_id=session_id, model=model)
+        await client.init_device(session_id=session_id, derive_cardano=derive_cardano)
+        return client
+
+    # Feature bookkeeping involves no I/O and is shared with TrezorClient.
+    _refresh_features = TrezorClient._refresh_features
+    is_outdated = TrezorClient.is_outdated
+    check_firmware_version = TrezorClient.check_firmware_version
+    get_device_id = TrezorClient.get_device_id
+
+    @property
+    def message_lock(self) -> asyncio.Lock:
+        """Serializes message exchanges with the device."""
+        # created lazily, so that the client can be created outside the event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def open(self) -> None:
+        if self.session_counter == 0:
+            await self.transport.begin_session()
+        self.session_counter += 1
+
+    async def close(self) -> None:
+        self.session_counter = max(self.session_counter - 1, 0)
+        if self.session_counter == 0:
+            await self.transport.end_session()
+
+    async def __aenter__(self) -> "AsyncTrezorClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def cancel(self) -> None:
+        # deliberately not serialized: used to interrupt a call in progress
+        await self._raw_write(messages.Cancel())
+
+    async def call_raw(
+        self, msg: "MessageType", encoded: Optional[Tuple[int, bytes]] = None
+    ) -> "MessageType":
+        async with self.message_lock, self:
+            return await self._call_raw(msg, encoded)
+
+    async def _call_raw(
+        self, msg: "MessageType", encoded: Optional[Tuple[int, bytes]] = None
+    ) -> "MessageType":
+        __tracebackhide__ = True  # for pytest # pylint: disable=W0612
+        await self._raw_write(msg, encoded)
+        return await self._raw_read()
+
+    async def _raw_write(
+        self, msg: "MessageType", encoded: Optional[Tuple[int, bytes]] = None
+    ) -> None:
+        __tracebackhide__ = True  # for pytest # pylint: disable=W0612
+        LOG.debug(
+            f"sending message: {msg.__class__.__name__}",
+            extra={"protobuf": msg},
+        )
+        if encoded is None:
+            encoded = self.mapping.encode(msg)
+        msg_type, msg_bytes = encoded
+        LOG.log(
+            DUMP_BYTES,
+            f"encoded as type {msg_type} ({len(msg_bytes)} bytes): {msg_bytes.hex()}",
+        )
+        await self.transport.write(msg_type, msg_bytes)
+
+    async def _raw_read(self) -> "MessageType":
+        __tracebackhide__ = True  # for pytest # pylint: disable=W0612
+        msg_type, msg_bytes = await self.transport.read()
+        LOG.log(
+            DUMP_BYTES,
+            f"received type {msg_type} ({len(msg_bytes)} bytes): {msg_bytes.hex()}",
+        )
+        msg = self.mapping.decode(msg_type, msg_bytes)
+        LOG.debug(
+            f"received message: {msg.__class__.__name__}",
+            extra={"protobuf": msg},
+        )
+        return msg
+
+    async def _callback_pin(self, msg: messages.PinMatrixRequest) -> "MessageType":
+        try:
+            pin = await _resolve(self.ui.get_pin(msg.type))
+        except exceptions.Cancelled:
+            await self._call_raw(messages.Cancel())
+            raise
+
+        if any(d not in "1234567890" for d in pin) or not (
+            1 <= len(pin) <= MAX_PIN_LENGTH
+        ):
+            await self._call_raw(messages.Cancel())
+            raise ValueError("Invalid PIN provided")
+
+        resp = await self._call_raw(messages.PinMatrixAck(pin=pin))
+        if isinstance(resp, messages.Failure) and resp.code in (
+            messages.FailureType.PinInvalid,
+            messages.FailureType.PinCancelled,
+            messages.FailureType.PinExpected,
+        ):
+            raise exceptions.PinException(resp.code, resp.message)
+        else:
+            return resp
+
+    async def _callback_passphrase(
+        self, msg: messages.PassphraseRequest
+    ) -> "MessageType":
+        available_on_device = Capability.PassphraseEntry in self.features.capabilities
+
+        async def send_passphrase(
+            passphrase: Optional[str] = None, on_device: Optional[bool] = None
+        ) -> "MessageType":
+            msg = messages.PassphraseAck(passphrase=passphrase, on_device=on_device)
+            resp = await self._call_raw(msg)
+            if isinstance(resp, messages.Deprecated_PassphraseStateRequest):
+                self.session_id = resp.state
+                resp = await self._call_raw(messages.Deprecated_PassphraseStateAck())
+            return resp
+
+        # short-circuit old style entry
+        if msg._on_device is True:
+            return await send_passphrase(None, None)
+
+        try:
+            passphrase = await _resolve(
+                self.ui.get_passphrase(available_on_device=available_on_device)
+            )
+        except exceptions.Cancelled:
+            await self._call_raw(messages.Cancel())
+            raise
+
+        if passphrase is PASSPHRASE_ON_DEVICE:
+            if not available_on_device:
+                await self._call_raw(messages.Cancel())
+                raise RuntimeError("Device is not capable of entering passphrase")
+            else:
+                return await send_passphrase(on_device=True)
+
+        # else process host-entered passphrase
+        if not isinstance(passphrase, str):
+            raise RuntimeError("Passphrase must be a str")
+        passphrase = Mnemonic.normalize_string(passphrase)
+        if len(passphrase) > MAX_PASSPHRASE_LENGTH:
+            await self._call_raw(messages.Cancel())
+            raise ValueError("Passphrase too long")
+
+        return await send_passphrase(passphrase, on_device=False)
+
+    async def _callback_button(self, msg: messages.ButtonRequest) -> "MessageType":
+        __tracebackhide__ = True  # for pytest # pylint: disable=W0612
+        # do this raw - send ButtonAck first, notify UI later
+        await self._raw_write(messages.ButtonAck())
+        await _resolve(self.ui.button_request(msg))
+        return await self._raw_read()
+
+    async def call(
+        self, msg: "MessageType", encoded: Optional[Tuple[int, bytes]] = None
+    ) -> "MessageType":
+        async with self.message_lock, self:
+            self.check_firmware_version()
+            resp = await self._call_raw(msg, encoded)
+            while True:
+                if isinstance(resp, messages.PinMatrixRequest):
+                    resp = await self._callback_pin(resp)
+                elif isinstance(resp, messages.PassphraseRequest):
+                    resp = await self._callback_passphrase(resp)
+                elif isinstance(resp, messages.ButtonRequest):
+                    resp = await self._callback_button(resp)
+                elif isinstance(resp, messages.Failure):
+                    if resp.code == messages.FailureType.ActionCancelled:
+                        raise exceptions.Cancelled
+                    raise exceptions.TrezorFailure(resp)
+                else:
+                    return resp
+
+    async def refresh_features(self) -> messages.Features:
+        """Reload features from the device."""
+        resp = await self.call_raw(messages.GetFeatures())
+        if not isinstance(resp, messages.Features):
+            raise exceptions.TrezorException("Unexpected response to GetFeatures")
+        self._refresh_features(resp)
+        return resp
+
+    async def init_device(
+        self,
+        *,
+        session_id: Optional[bytes] = None,
+        new_session: bool = False,
+        derive_cardano: Optional[bool] = None,
+    ) -> Optional[bytes]:
+        """Initialize the device and return a session ID.
+
+        See `TrezorClient.init_device` for details.
+        """
+        if new_session:
+            self.session_id = None
+        elif session_id is not None:
+            self.session_id = session_id
+
+        resp = await self.call_raw(
+            messages.Initialize(
+                session_id=self.session_id,
+                derive_cardano=derive_cardano,
+            )
+        )
+        if isinstance(resp, messages.Failure):
+            # can happen if `derive_cardano` does not match the current session
+            raise exceptions.TrezorFailure(resp)
+        if not isinstance(resp, messages.Features):
+            raise exceptions.TrezorException("Unexpected response to Initialize")
+
+        if self.session_id is not None and resp.session_id == self.session_id:
+            LOG.info("Successfully resumed session")
+        elif session_id is not None:
+            LOG.info("Failed to resume session")
+
+        reported_session_id = resp.session_id
+        self._refresh_features(resp)
+        return reported_session_id
+
+    async def ping(self, msg: str, button_protection: bool = False) -> str:
+        if not button_protection:
+            # same short-circuit as TrezorClient.ping, works on outdated firmware
+            async with self.message_lock, self:
+                resp = await self._call_raw(messages.Ping(message=msg))
+                if isinstance(resp, messages.ButtonRequest):
+                    # device is PIN-locked.
+                    # respond and hope for the best
+                    resp = await self._callback_button(resp)
+        else:
+            resp = await self.call(
+                messages.Ping(message=msg, button_protection=button_protection)
+            )
+        if not isinstance(resp, messages.Success):
+            raise RuntimeError(f"Got {resp.__class__}, expected {messages.Success}")
+        return resp.message
+
+    async def end_session(self) -> None:
+        """Close the current session and clear cached passphrase."""
+        try:
+            if not self.features.bootloader_mode:
+                await self.call(messages.EndSession())
+        except exceptions.TrezorFailure:
+            # see TrezorClient.end_session
+            pass
+        self.session_id = None
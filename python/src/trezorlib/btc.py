@@ -14,10 +14,23 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import logging
+import time
 import warnings
 from copy import copy
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AnyStr, List, Optional, Sequence, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    BinaryIO,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 # TypedDict is not available in typing for python < 3.8
 from typing_extensions import Protocol, TypedDict
@@ -27,9 +40,12 @@ from .tools import expect, prepare_message_bytes, session
 
 if TYPE_CHECKING:
     from .client import TrezorClient
+    from .mapping import ProtobufMapping
     from .tools import Address
     from .protobuf import MessageType
 
+    _EncodedAck = Tuple[messages.TxAck, Tuple[int, bytes]]
+
     class ScriptSig(TypedDict):
         asm: str
         hex: str
@@ -73,6 +89,9 @@ if TYPE_CHECKING:
             ...
 
 
+LOG = logging.getLogger(__name__)
+
+
 def from_json(json_dict: "Transaction") -> messages.TransactionType:
     def make_input(vin: "Vin") -> messages.TxInputType:
         if "coinbase" in vin:
@@ -267,165 +286,281 @@ def verify_message(
     return isinstance(resp, messages.Success)
 
 
-@session
-def sign_tx(
-    client: "TrezorClient",
-    coin_name: str,
-    inputs: Sequence[messages.TxInputType],
-    outputs: Sequence[messages.TxOutputType],
-    details: Optional[messages.SignTx] = None,
-    prev_txes: Optional["TxCacheType"] = None,
-    payment_reqs: Sequence[messages.TxAckPaymentRequest] = (),
-    preauthorized: bool = False,
-    unlock_path: Optional[List[int]] = None,
-    unlock_path_mac: Optional[bytes] = None,
-    **kwargs: Any,
-) -> Tuple[Sequence[Optional[bytes]], bytes]:
-    """Sign a Bitcoin-like transaction.
+def _copy_tx_meta(tx: messages.TransactionType) -> messages.TransactionType:
+    tx_copy = copy(tx)
+    # clear fields
+    tx_copy.inputs_cnt = len(tx.inputs)
+    tx_copy.inputs = []
+    tx_copy.outputs_cnt = len(tx.bin_outputs or tx.outputs)
+    tx_copy.outputs = []
+    tx_copy.bin_outputs = []
+    tx_copy.extra_data_len = len(tx.extra_data or b"")
+    tx_copy.extra_data = None
+    return tx_copy
 
-    Returns a list of signatures (one for each provided input) and the
-    network-serialized transaction.
 
-    In addition to the required arguments, it is possible to specify additional
-    transaction properties (version, lock time, expiry...). Each additional argument
-    must correspond to a field in the `SignTx` data type. Note that some fields
-    (`inputs_count`, `outputs_count`, `coin_name`) will be inferred from the arguments
-    and cannot be overriden by kwargs.
+class _TxAckCache:
+    """Pre-built `TxAck` replies for the parts of one transaction.
+
+    Replies for the metadata, every input and every output are built and encoded
+    when the cache is created. Extra data chunks are encoded on first request,
+    because their boundaries are chosen by the device.
     """
-    if prev_txes is None:
-        prev_txes = {}
-
-    if details is not None:
-        warnings.warn(
-            "'details' argument is deprecated, use kwargs instead",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-        signtx = details
-        signtx.coin_name = coin_name
-        signtx.inputs_count = len(inputs)
-        signtx.outputs_count = len(outputs)
 
-    else:
-        signtx = messages.SignTx(
-            coin_name=coin_name,
-            inputs_count=len(inputs),
-            outputs_count=len(outputs),
-        )
-        for name, value in kwargs.items():
-            if hasattr(signtx, name):
-                setattr(signtx, name, value)
+    def __init__(
+        self, tx: messages.TransactionType, mapping: "ProtobufMapping"
+    ) -> None:
+        self.tx = tx
+        self.mapping = mapping
+        self.meta = self._ack(_copy_tx_meta(tx))
+        self.inputs = [
+            self._ack(messages.TransactionType(inputs=[i])) for i in tx.inputs
+        ]
+        self.outputs = [
+            self._ack(messages.TransactionType(outputs=[o])) for o in tx.outputs
+        ]
+        self.bin_outputs = [
+            self._ack(messages.TransactionType(bin_outputs=[o])) for o in tx.bin_outputs
+        ]
+        self.extra_data: Dict[Tuple[int, int], "_EncodedAck"] = {}
+
+    def _ack(self, tx: messages.TransactionType) -> "_EncodedAck":
+        msg = messages.TxAck(tx=tx)
+        return msg, self.mapping.encode(msg)
+
+    def get_extra_data(self, offset: int, length: int) -> "_EncodedAck":
+        ack = self.extra_data.get((offset, length))
+        if ack is None:
+            assert self.tx.extra_data is not None
+            chunk = self.tx.extra_data[offset : offset + length]
+            ack = self._ack(messages.TransactionType(extra_data=chunk))
+            self.extra_data[offset, length] = ack
+        return ack
+
+
+class SignTxDriver:
+    """Host side of the `SignTx` workflow.
+
+    Answers the device's `TxRequest`s from pre-built and pre-encoded `TxAck`
+    replies. Each previous transaction is loaded from `prev_txes` at most once and
+    its replies are kept, so a single driver can be reused for several `sign_tx`
+    calls that spend outputs of the same transactions.
+
+    After each call, `timings` holds the seconds spent in individual phases:
+    `prepare` (indexing the signed transaction), `prev_txes` (loading and indexing
+    previous transactions), `device` (waiting for the device) and `total`.
+    """
 
-    if unlock_path:
-        res = client.call(
-            messages.UnlockPath(address_n=unlock_path, mac=unlock_path_mac)
+    def __init__(self, prev_txes: Optional["TxCacheType"] = None) -> None:
+        self.prev_txes: "TxCacheType" = prev_txes if prev_txes is not None else {}
+        self.timings: Dict[str, float] = {}
+        self._prev_acks: Dict[bytes, _TxAckCache] = {}
+
+    def _get_prev_acks(self, client: "TrezorClient", tx_hash: bytes) -> _TxAckCache:
+        acks = self._prev_acks.get(tx_hash)
+        if acks is None or acks.mapping is not client.mapping:
+            start = time.perf_counter()
+            if tx_hash not in self.prev_txes:
+                raise ValueError(f"Previous transaction {tx_hash.hex()} not available")
+            acks = _TxAckCache(self.prev_txes[tx_hash], client.mapping)
+            self._prev_acks[tx_hash] = acks
+            self.timings["prev_txes"] += time.perf_counter() - start
+        return acks
+
+    def _call(
+        self,
+        client: "TrezorClient",
+        msg: "MessageType",
+        encoded: Optional[Tuple[int, bytes]] = None,
+    ) -> "MessageType":
+        start = time.perf_counter()
+        try:
+            return client.call(msg, encoded)
+        finally:
+            self.timings["device"] += time.perf_counter() - start
+
+    def sign_tx(
+        self,
+        client: "TrezorClient",
+        coin_name: str,
+        inputs: Sequence[messages.TxInputType],
+        outputs: Sequence[messages.TxOutputType],
+        details: Optional[messages.SignTx] = None,
+        payment_reqs: Sequence[messages.TxAckPaymentRequest] = (),
+        preauthorized: bool = False,
+        unlock_path: Optional[List[int]] = None,
+        unlock_path_mac: Optional[bytes] = None,
+        **kwargs: Any,
+    ) -> Tuple[Sequence[Optional[bytes]], bytes]:
+        """Sign a Bitcoin-like transaction. See `sign_tx` for details."""
+        self.timings = dict.fromkeys(("prepare", "prev_txes", "device", "total"), 0.0)
+        total_start = time.perf_counter()
+
+        if details is not None:
+            warnings.warn(
+                "'details' argument is deprecated, use kwargs instead",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            signtx = details
+            signtx.coin_name = coin_name
+            signtx.inputs_count = len(inputs)
+            signtx.outputs_count = len(outputs)
+
+        else:
+            signtx = messages.SignTx(
+                coin_name=coin_name,
+                inputs_count=len(inputs),
+                outputs_count=len(outputs),
+            )
+            for name, value in kwargs.items():
+                if hasattr(signtx, name):
+                    setattr(signtx, name, value)
+
+        if unlock_path:
+            res = self._call(
+                client, messages.UnlockPath(address_n=unlock_path, mac=unlock_path_mac)
+            )
+            if not isinstance(res, messages.UnlockedPathRequest):
+                raise exceptions.TrezorException("Unexpected message")
+        elif preauthorized:
+            res = self._call(client, messages.DoPreauthorized())
+            if not isinstance(res, messages.PreauthorizedRequest):
+                raise exceptions.TrezorException("Unexpected message")
+
+        start = time.perf_counter()
+        this_tx = _TxAckCache(
+            messages.TransactionType(
+                inputs=inputs,
+                outputs=outputs,
+                inputs_cnt=len(inputs),
+                outputs_cnt=len(outputs),
+                # pick either kw-provided or default value from the SignTx request
+                version=signtx.version,
+            ),
+            client.mapping,
         )
-        if not isinstance(res, messages.UnlockedPathRequest):
-            raise exceptions.TrezorException("Unexpected message")
-    elif preauthorized:
-        res = client.call(messages.DoPreauthorized())
-        if not isinstance(res, messages.PreauthorizedRequest):
-            raise exceptions.TrezorException("Unexpected message")
+        self.timings["prepare"] = time.perf_counter() - start
 
-    res = client.call(signtx)
-
-    # Prepare structure for signatures
-    signatures: List[Optional[bytes]] = [None] * len(inputs)
-    serialized_tx = b""
-
-    def copy_tx_meta(tx: messages.TransactionType) -> messages.TransactionType:
-        tx_copy = copy(tx)
-        # clear fields
-        tx_copy.inputs_cnt = len(tx.inputs)
-        tx_copy.inputs = []
-        tx_copy.outputs_cnt = len(tx.bin_outputs or tx.outputs)
-        tx_copy.outputs = []
-        tx_copy.bin_outputs = []
-        tx_copy.extra_data_len = len(tx.extra_data or b"")
-        tx_copy.extra_data = None
-        return tx_copy
-
-    this_tx = messages.TransactionType(
-        inputs=inputs,
-        outputs=outputs,
-        inputs_cnt=len(inputs),
-        outputs_cnt=len(outputs),
-        # pick either kw-provided or default value from the SignTx request
-        version=signtx.version,
-    )
+        res = self._call(client, signtx)
 
-    R = messages.RequestType
-    while isinstance(res, messages.TxRequest):
-        # If there's some part of signed transaction, let's add it
-        if res.serialized:
-            if res.serialized.serialized_tx:
-                serialized_tx += res.serialized.serialized_tx
-
-            if res.serialized.signature_index is not None:
-                idx = res.serialized.signature_index
-                sig = res.serialized.signature
-                if signatures[idx] is not None:
-                    raise ValueError(f"Signature for index {idx} already filled")
-                signatures[idx] = sig
-
-        if res.request_type == R.TXFINISHED:
-            break
+        # Prepare structure for signatures
+        signatures: List[Optional[bytes]] = [None] * len(inputs)
+        serialized_tx = b""
 
-        assert res.details is not None, "device did not provide details"
+        R = messages.RequestType
+        while isinstance(res, messages.TxRequest):
+            # If there's some part of signed transaction, let's add it
+            if res.serialized:
+                if res.serialized.serialized_tx:
+                    serialized_tx += res.serialized.serialized_tx
 
-        # Device asked for one more information, let's process it.
-        if res.details.tx_hash is not None:
-            if res.details.tx_hash not in prev_txes:
-                raise ValueError(
-                    f"Previous transaction {res.details.tx_hash.hex()} not available"
-                )
-            current_tx = prev_txes[res.details.tx_hash]
-        else:
-            current_tx = this_tx
+                if res.serialized.signature_index is not None:
+                    idx = res.serialized.signature_index
+                    sig = res.serialized.signature
+                    if signatures[idx] is not None:
+                        raise ValueError(f"Signature for index {idx} already filled")
+                    signatures[idx] = sig
 
-        if res.request_type == R.TXPAYMENTREQ:
-            assert res.details.request_index is not None
-            msg = payment_reqs[res.details.request_index]
-            res = client.call(msg)
-        else:
-            msg = messages.TransactionType()
+            if res.request_type == R.TXFINISHED:
+                break
+
+            assert res.details is not None, "device did not provide details"
+
+            # Device asked for one more information, let's process it.
+            if res.details.tx_hash is not None:
+                current_tx = self._get_prev_acks(client, res.details.tx_hash)
+            else:
+                current_tx = this_tx
+
+            if res.request_type == R.TXPAYMENTREQ:
+                assert res.details.request_index is not None
+                res = self._call(client, payment_reqs[res.details.request_index])
+                continue
+
+            index = res.details.request_index
             if res.request_type == R.TXMETA:
-                msg = copy_tx_meta(current_tx)
+                ack = current_tx.meta
             elif res.request_type in (R.TXINPUT, R.TXORIGINPUT):
-                assert res.details.request_index is not None
-                msg.inputs = [current_tx.inputs[res.details.request_index]]
+                assert index is not None
+                ack = current_tx.inputs[index]
             elif res.request_type == R.TXOUTPUT:
-                assert res.details.request_index is not None
+                assert index is not None
                 if res.details.tx_hash:
-                    msg.bin_outputs = [
-                        current_tx.bin_outputs[res.details.request_index]
-                    ]
+                    ack = current_tx.bin_outputs[index]
                 else:
-                    msg.outputs = [current_tx.outputs[res.details.request_index]]
+                    ack = current_tx.outputs[index]
             elif res.request_type == R.TXORIGOUTPUT:
-                assert res.details.request_index is not None
-                msg.outputs = [current_tx.outputs[res.details.request_index]]
+                assert index is not None
+                ack = current_tx.outputs[index]
             elif res.request_type == R.TXEXTRADATA:
                 assert res.details.extra_data_offset is not None
                 assert res.details.extra_data_len is not None
-                assert current_tx.extra_data is not None
-                o, l = res.details.extra_data_offset, res.details.extra_data_len
-                msg.extra_data = current_tx.extra_data[o : o + l]
+                ack = current_tx.get_extra_data(
+                    res.details.extra_data_offset, res.details.extra_data_len
+                )
             else:
                 raise exceptions.TrezorException(
                     f"Unknown request type - {res.request_type}."
                 )
 
-            res = client.call(messages.TxAck(tx=msg))
+            res = self._call(client, *ack)
 
-    if not isinstance(res, messages.TxRequest):
-        raise exceptions.TrezorException("Unexpected message")
+        if not isinstance(res, messages.TxRequest):
+            raise exceptions.TrezorException("Unexpected message")
+
+        for i, sig in zip(inputs, signatures):
+            if i.script_type != messages.InputScriptType.EXTERNAL and sig is None:
+                raise exceptions.TrezorException("Some signatures are missing!")
+
+        self.timings["total"] = time.perf_counter() - total_start
+        LOG.debug(
+            "sign_tx timings: "
+            + ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in self.timings.items())
+        )
+        return signatures, serialized_tx
+
+
+@session
+def sign_tx(
+    client: "TrezorClient",
+    coin_name: str,
+    inputs: Sequence[messages.TxInputType],
+    outputs: Sequence[messages.TxOutputType],
+    details: Optional[messages.SignTx] = None,
+    prev_txes: Optional["TxCacheType"] = None,
+    payment_reqs: Sequence[messages.TxAckPaymentRequest] = (),
+    preauthorized: bool = False,
+    unlock_path: Optional[List[int]] = None,
+    unlock_path_mac: Optional[bytes] = None,
+    **kwargs: Any,
+) -> Tuple[Sequence[Optional[bytes]], bytes]:
+    """Sign a Bitcoin-like transaction.
+
+    Returns a list of signatures (one for each provided input) and the
+    network-serialized transaction.
 
-    for i, sig in zip(inputs, signatures):
-        if i.script_type != messages.InputScriptType.EXTERNAL and sig is None:
-            raise exceptions.TrezorException("Some signatures are missing!")
+    In addition to the required arguments, it is possible to specify additional
+    transaction properties (version, lock time, expiry...). Each additional argument
+    must correspond to a field in the `SignTx` data type. Note that some fields
+    (`inputs_count`, `outputs_count`, `coin_name`) will be inferred from the arguments
+    and cannot be overriden by kwargs.
 
-    return signatures, serialized_tx
+    To reuse previous transactions across several calls, or to inspect timing of
+    individual signing phases, use `SignTxDriver` directly.
+    """
+    return SignTxDriver(prev_txes).sign_tx(
+        client,
+        coin_name,
+        inputs,
+        outputs,
+        details=details,
+        payment_reqs=payment_reqs,
+        preauthorized=preauthorized,
+        unlock_path=unlock_path,
+        unlock_path_mac=unlock_path_mac,
+        **kwargs,
+    )
 
 
 @expect(messages.Success, field="message", ret_type=str)
@@ -452,10 +587,126 @@ def authorize_coinjoin(
     )
 
 
+PSBT_MAGIC = b"psbt\xff"
+
+
+def _read_compact_size(f: BinaryIO) -> int:
+    prefix = _read_exact(f, 1)[0]
+    if prefix < 0xFD:
+        return prefix
+    size = {0xFD: 2, 0xFE: 4, 0xFF: 8}[prefix]
+    return int.from_bytes(_read_exact(f, size), "little")
+
+
+def _read_exact(f: BinaryIO, length: int) -> bytes:
+    data = f.read(length)
+    if len(data) != length:
+        raise ValueError("Truncated PSBT")
+    return data
+
+
+def _compact_size(n: int) -> bytes:
+    if n < 0xFD:
+        return bytes([n])
+    elif n <= 0xFFFF:
+        return b"\xfd" + n.to_bytes(2, "little")
+    elif n <= 0xFFFF_FFFF:
+        return b"\xfe" + n.to_bytes(4, "little")
+    else:
+        return b"\xff" + n.to_bytes(8, "little")
+
+
+def _read_psbt_map(f: BinaryIO) -> List[Tuple[bytes, bytes]]:
+    """Read the key-value records of one PSBT map, up to and including the separator."""
+    records = []
+    while True:
+        key = _read_exact(f, _read_compact_size(f))
+        if not key:
+            return records
+        records.append((key, _read_exact(f, _read_compact_size(f))))
+
+
+def _serialize_psbt_map(records: Sequence[Tuple[bytes, bytes]]) -> bytes:
+    parts = []
+    for key, value in records:
+        parts += (_compact_size(len(key)), key, _compact_size(len(value)), value)
+    parts.append(b"\x00")
+    return b"".join(parts)
+
+
 @expect(messages.SignedPsbt, field="psbt", ret_type=bytes)
-def sign_taproot(
-        client: "TrezorClient",
-        coin_name: str,
-        psbt: bytes,
-) -> "MessageType":
+def _sign_psbt(client: "TrezorClient", coin_name: str, psbt: bytes) -> "MessageType":
     return client.call(messages.SignPsbt(coin_name=coin_name, psbt=psbt))
+
+
+@session
+def sign_taproot(
+    client: "TrezorClient",
+    coin_name: str,
+    psbt: Union[bytes, BinaryIO],
+) -> bytes:
+    """Sign a taproot transaction given as a PSBT, return the signed PSBT.
+
+    A PSBT given as bytes is sent whole in the `SignPsbt` message. A PSBT given as a
+    binary file is streamed: the device asks for the global map and then for the
+    input and output maps one by one with `PsbtRequest`s, so the size of the PSBT is
+    not limited by the device memory. Only one map is read from the file at a time.
+    The device returns the signatures as input records, which are added to the input
+    maps when the file is read again, so it must be seekable.
+    """
+    if isinstance(psbt, (bytes, bytearray)):
+        return _sign_psbt(client, coin_name, bytes(psbt))
+
+    R = messages.PsbtRequestType
+    start = psbt.tell()
+    inputs_count = 0
+    outputs_count = 0
+    signatures: Dict[int, List[messages.PsbtRecord]] = {}
+
+    res = client.call(messages.SignPsbt(coin_name=coin_name))
+    while isinstance(res, messages.PsbtRequest):
+        if res.request_type == R.PSBT_FINISHED:
+            break
+
+        if res.request_type == R.PSBT_SIGNATURE:
+            if res.record is None or res.request_index not in range(inputs_count):
+                raise exceptions.TrezorException("Invalid signature record")
+            signatures.setdefault(res.request_index, []).append(res.record)
+            res = client.call(messages.PsbtAck())
+            continue
+
+        # the maps are requested in the order of the serialization
+        if res.request_type == R.PSBT_GLOBAL and psbt.tell() == start:
+            if _read_exact(psbt, len(PSBT_MAGIC)) != PSBT_MAGIC:
+                raise ValueError("Invalid PSBT magic")
+            data = PSBT_MAGIC + _serialize_psbt_map(_read_psbt_map(psbt))
+        elif (
+            res.request_type == R.PSBT_INPUT
+            and res.request_index == inputs_count
+            and not outputs_count
+        ):
+            data = _serialize_psbt_map(_read_psbt_map(psbt))
+            inputs_count += 1
+        elif res.request_type == R.PSBT_OUTPUT and res.request_index == outputs_count:
+            data = _serialize_psbt_map(_read_psbt_map(psbt))
+            outputs_count += 1
+        else:
+            raise exceptions.TrezorException(
+                f"Unexpected request - {res.request_type} {res.request_index}."
+            )
+        res = client.call(messages.PsbtAck(map=data))
+
+    if not isinstance(res, messages.PsbtRequest):
+        raise exceptions.TrezorException("Unexpected message")
+
+    psbt.seek(start)
+    _read_exact(psbt, len(PSBT_MAGIC))
+    signed = [PSBT_MAGIC, _serialize_psbt_map(_read_psbt_map(psbt))]
+    for i in range(inputs_count):
+        records = dict(_read_psbt_map(psbt))
+        for record in signatures.get(i, ()):
+            records[record.key] = record.value
+        signed.append(_serialize_psbt_map(list(records.items())))
+    for _ in range(outputs_count):
+        signed.append(_serialize_psbt_map(_read_psbt_map(psbt)))
+    return b"".join(signed)
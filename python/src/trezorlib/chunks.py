@@ -0,0 +1,148 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Streaming of large payloads to the device in chunks.
+
+Signing flows like `EthereumSignTx` pass the payload in chunks whose size is given
+by the device in each request. `ChunkReader` serves these chunks from bytes, from a
+binary file or from an iterable of bytes. Bytes are sliced through a `memoryview`,
+so serving a chunk copies only the chunk and never the rest of the payload, and
+files and iterables are only read as far as the device asked. `send_chunks` runs
+the request/ack loop.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from . import exceptions
+
+if TYPE_CHECKING:
+    from .client import TrezorClient
+    from .protobuf import MessageType
+
+    MT = TypeVar("MT", bound=MessageType)
+
+Payload = Union[bytes, bytearray, memoryview, BinaryIO, Iterable[bytes]]
+
+
+class ChunkReader:
+    """Sequential reader of a payload that is sent to the device in chunks.
+
+    The payload is bytes-like, a binary file or an iterable of bytes-like pieces.
+    The `length` of the payload is required for an iterable; for a file, it defaults
+    to the size from the current position to the end.
+    """
+
+    def __init__(self, data: Payload, length: Optional[int] = None) -> None:
+        self._view = memoryview(b"")
+        self._file: Optional[BinaryIO] = None
+        self._pieces: Optional[Iterator[bytes]] = None
+
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self._view = memoryview(data).cast("B")
+            length = len(self._view)
+        elif hasattr(data, "read"):
+            self._file = cast(BinaryIO, data)
+            if length is None:
+                start = self._file.tell()
+                length = self._file.seek(0, 2) - start
+                self._file.seek(start)
+        elif length is None:
+            raise ValueError("Length of an iterable payload must be given")
+        else:
+            self._pieces = iter(cast(Iterable[bytes], data))
+
+        self.length = length
+        self.remaining = length
+
+    def read(self, size: int) -> bytes:
+        """Return the next `size` bytes of the payload, or what is left of it.
+
+        The chunk is always `bytes`, so that the messages built from it can be
+        copied, e.g. by the debuglink message filters.
+        """
+        size = min(size, self.remaining)
+        chunk = self._read(size)
+        if len(chunk) != size:
+            raise ValueError("Payload is shorter than its length")
+        self.remaining -= size
+        return chunk
+
+    def _read(self, size: int) -> bytes:
+        if self._file is not None:
+            return self._file.read(size)
+        parts = []
+        while size:
+            if not self._view:
+                piece = next(self._pieces, None) if self._pieces else None
+                if piece is None:
+                    break
+                self._view = memoryview(piece).cast("B")
+            part, self._view = self._view[:size], self._view[size:]
+            parts.append(part)
+            size -= len(part)
+        if len(parts) == 1:
+            return bytes(parts[0])
+        # the chunk spans several pieces of an iterable payload
+        return b"".join(parts)
+
+
+def as_reader(data: Union[Payload, ChunkReader]) -> ChunkReader:
+    """Wrap a payload into a `ChunkReader`, unless it already is one."""
+    return data if isinstance(data, ChunkReader) else ChunkReader(data)
+
+
+def iter_chunks(
+    data: Union[Payload, ChunkReader], chunk_size: int, length: Optional[int] = None
+) -> Iterator[bytes]:
+    """Split a payload into chunks of `chunk_size` bytes, the last one may be shorter."""
+    reader = data if isinstance(data, ChunkReader) else ChunkReader(data, length)
+    while reader.remaining:
+        yield reader.read(chunk_size)
+
+
+def send_chunks(
+    client: "TrezorClient",
+    msg: "MessageType",
+    reader: ChunkReader,
+    request_type: "Type[MT]",
+    make_ack: Callable[[bytes], "MessageType"],
+    length_field: str = "data_length",
+) -> "MT":
+    """Send `msg` and answer the device's requests for chunks of the payload.
+
+    The device asks for the next chunk with a `request_type` message whose
+    `length_field` is set, `make_ack` wraps the chunk into the reply. The first
+    `request_type` message without it is returned.
+    """
+    resp = client.call(msg)
+    while True:
+        if not isinstance(resp, request_type):
+            raise exceptions.TrezorException(f"Unexpected message {resp}")
+        length = getattr(resp, length_field)
+        if length is None:
+            return resp
+        resp = client.call(make_ack(reader.read(length)))
@@ -16,7 +16,7 @@
 
 import base64
 import json
-from typing import TYPE_CHECKING, Dict, List, Optional, TextIO, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, TextIO, Tuple
 
 import click
 import construct as c
@@ -428,14 +428,28 @@ def verify_message(
 
 @cli.command()
 @click.option("-c", "--coin", default=DEFAULT_COIN)
-@click.argument("psbt")
+@click.option(
+    "-f", "--file", "psbt_file", type=click.File("rb"), help="Stream a binary PSBT"
+)
+@click.argument("psbt", required=False)
 @with_client
 def sign_taproot(
-    client: "TrezorClient", coin: str, psbt: str
+    client: "TrezorClient",
+    coin: str,
+    psbt_file: Optional[BinaryIO],
+    psbt: Optional[str],
 ) -> Dict[str, str]:
-    """Sign taproot transaction."""
-    psbt_bytes = bytes.fromhex(psbt)
-    signed_psbt = btc.sign_taproot(client, coin, psbt_bytes)
+    """Sign taproot transaction.
+
+    The PSBT is given in hex, or with --file as a binary file which is streamed to
+    the device map by map.
+    """
+    if psbt_file is not None:
+        signed_psbt = btc.sign_taproot(client, coin, psbt_file)
+    elif psbt is not None:
+        signed_psbt = btc.sign_taproot(client, coin, bytes.fromhex(psbt))
+    else:
+        raise click.ClickException("Provide the PSBT in hex or with --file")
     return {
         "psbt": signed_psbt.hex(),
     }
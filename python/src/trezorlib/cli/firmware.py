@@ -14,9 +14,20 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import mmap
 import os
 import sys
-from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 import click
@@ -35,6 +46,9 @@ ALLOWED_FIRMWARE_FORMATS = {
     2: (firmware.FirmwareFormat.TREZOR_T,),
 }
 
+# firmware file contents, or the file mapped into memory with --stream
+FirmwareData = Union[bytes, mmap.mmap]
+
 
 def _print_version(version: dict) -> None:
     vstr = "Firmware version {major}.{minor}.{patch} build {build}".format(**version)
@@ -84,6 +98,7 @@ def print_firmware_version(
 def validate_signatures(
     version: firmware.FirmwareFormat,
     fw: "c.Container",
+    chunk_digests: Optional[firmware.ChunkDigests] = None,
 ) -> None:
     """Check the signatures on the firmware.
 
@@ -92,13 +107,17 @@ def validate_signatures(
     Exits if the validation fails.
     """
     try:
-        firmware.validate(version, fw, allow_unsigned=False)
+        firmware.validate(
+            version, fw, allow_unsigned=False, chunk_digests=chunk_digests
+        )
         click.echo("Signatures are valid.")
     except firmware.Unsigned:
         if not click.confirm("No signatures found. Continue?", default=False):
             sys.exit(1)
         try:
-            firmware.validate(version, fw, allow_unsigned=True)
+            firmware.validate(
+                version, fw, allow_unsigned=True, chunk_digests=chunk_digests
+            )
             click.echo("Unsigned firmware looking OK.")
         except firmware.FirmwareIntegrityError as e:
             click.echo(e)
@@ -335,26 +354,45 @@ def download_firmware_data(url: str) -> bytes:
         sys.exit(3)
 
 
+def read_firmware_file(filename: BinaryIO, stream: bool) -> FirmwareData:
+    """Read the firmware file, or with `stream`, map it into memory."""
+    if not stream:
+        return filename.read()
+    try:
+        return mmap.mmap(filename.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        click.echo(f"Cannot map the firmware file into memory: {e}")
+        sys.exit(1)
+
+
 def validate_firmware(
-    firmware_data: bytes,
+    firmware_data: FirmwareData,
     fingerprint: Optional[str] = None,
     bootloader_onev2: Optional[bool] = None,
     trezor_major_version: Optional[int] = None,
+    chunk_digests: Optional[firmware.ChunkDigests] = None,
 ) -> None:
     """Validate the firmware through multiple tests.
 
     - parsing it properly
     - containing valid signatures and fingerprint (when chosen)
     - being compatible with the device (when chosen)
+
+    With `chunk_digests`, only the headers are parsed and the code is hashed
+    straight from `firmware_data`. The digests of the code chunks are collected
+    in `chunk_digests`, for the upload.
     """
     try:
-        version, fw = firmware.parse(firmware_data)
+        if chunk_digests is None and isinstance(firmware_data, bytes):
+            version, fw = firmware.parse(firmware_data)
+        else:
+            version, fw = firmware.parse_headers(firmware_data)
     except Exception as e:
         click.echo(e)
         sys.exit(2)
 
     print_firmware_version(version, fw)
-    validate_signatures(version, fw)
+    validate_signatures(version, fw, chunk_digests)
     validate_fingerprint(version, fw, fingerprint)
 
     if bootloader_onev2 is not None and trezor_major_version is not None:
@@ -368,9 +406,9 @@ def validate_firmware(
 
 
 def extract_embedded_fw(
-    firmware_data: bytes,
+    firmware_data: FirmwareData,
     bootloader_onev2: bool,
-) -> bytes:
+) -> FirmwareData:
     """Modify the firmware data for sending into Trezor, if necessary."""
     # special handling for embedded-OneV2 format:
     # for bootloader < 1.8, keep the embedding
@@ -388,7 +426,8 @@ def extract_embedded_fw(
 
 def upload_firmware_into_device(
     client: "TrezorClient",
-    firmware_data: bytes,
+    firmware_data: FirmwareData,
+    chunk_digests: Optional[firmware.ChunkDigests] = None,
 ) -> None:
     """Perform the final act of loading the firmware into Trezor."""
     f = client.features
@@ -401,7 +440,7 @@ def upload_firmware_into_device(
         with click.progressbar(
             label="Uploading", length=len(firmware_data), show_eta=False
         ) as bar:
-            firmware.update(client, firmware_data, bar.update)
+            firmware.update(client, firmware_data, bar.update, chunk_digests)
     except exceptions.Cancelled:
         click.echo("Update aborted on device.")
     except exceptions.TrezorException as e:
@@ -419,6 +458,7 @@ def cli() -> None:
 @click.argument("filename", type=click.File("rb"))
 @click.option("-c", "--check-device", is_flag=True, help="Validate device compatibility")
 @click.option("--fingerprint", help="Expected firmware fingerprint in hex")
+@click.option("--stream", is_flag=True, help="Map the file into memory instead of reading it")
 @click.pass_obj
 # fmt: on
 def verify(
@@ -426,6 +466,7 @@ def verify(
     filename: BinaryIO,
     check_device: bool,
     fingerprint: Optional[str],
+    stream: bool,
 ) -> None:
     """Verify the integrity of the firmware data stored in a file.
 
@@ -433,6 +474,9 @@ def verify(
     Its validation must be specified.
 
     In case of validation failure exits with the appropriate exit code.
+
+    With --stream, the file is mapped into memory and only the headers are parsed,
+    so the image is never copied. Useful for large images.
     """
     # Deciding if to take the device into account
     bootloader_onev2: Optional[bool]
@@ -445,12 +489,13 @@ def verify(
         bootloader_onev2 = None
         trezor_major_version = None
 
-    firmware_data = filename.read()
+    firmware_data = read_firmware_file(filename, stream)
     validate_firmware(
         firmware_data=firmware_data,
         fingerprint=fingerprint,
         bootloader_onev2=bootloader_onev2,
         trezor_major_version=trezor_major_version,
+        chunk_digests={} if stream else None,
     )
 
 
@@ -525,6 +570,7 @@ def download(
 @click.option("--bitcoin-only", is_flag=True, help="Use bitcoin-only firmware (if possible)")
 @click.option("--raw", is_flag=True, help="Push raw firmware data to Trezor")
 @click.option("--fingerprint", help="Expected firmware fingerprint in hex")
+@click.option("--stream", is_flag=True, help="Map the file into memory and hash every chunk once")
 # fmt: on
 @with_client
 def update(
@@ -538,6 +584,7 @@ def update(
     dry_run: bool,
     beta: bool,
     bitcoin_only: bool,
+    stream: bool,
 ) -> None:
     """Upload new firmware to device.
 
@@ -551,6 +598,10 @@ def update(
     If you provide a fingerprint via the --fingerprint option, it will be checked
     against downloaded firmware fingerprint. Otherwise fingerprint is checked
     against data.trezor.io information, if available.
+
+    With --stream, a firmware file is mapped into memory instead of being read, and
+    the digests of the code chunks computed during the validation are reused for
+    the upload.
     """
     if sum(bool(x) for x in (filename, url, version)) > 1:
         click.echo("You can use only one of: filename, url, version.")
@@ -560,8 +611,10 @@ def update(
         click.echo("Please switch your device to bootloader mode.")
         sys.exit(1)
 
+    chunk_digests: Optional[firmware.ChunkDigests] = {} if stream else None
+    firmware_data: FirmwareData
     if filename:
-        firmware_data = filename.read()
+        firmware_data = read_firmware_file(filename, stream)
     else:
         if not url:
             url, fp = find_best_firmware_version(
@@ -578,6 +631,7 @@ def update(
             fingerprint=fingerprint,
             bootloader_onev2=_is_bootloader_onev2(client),
             trezor_major_version=client.features.major_version,
+            chunk_digests=chunk_digests,
         )
 
     if not raw:
@@ -589,7 +643,9 @@ def update(
     if dry_run:
         click.echo("Dry run. Not uploading firmware to device.")
     else:
-        upload_firmware_into_device(client=client, firmware_data=firmware_data)
+        upload_firmware_into_device(
+            client=client, firmware_data=firmware_data, chunk_digests=chunk_digests
+        )
 
 
 @cli.command()
@@ -17,7 +17,7 @@
 import logging
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from mnemonic import Mnemonic
 
@@ -139,18 +139,29 @@ class TrezorClient:
     def cancel(self) -> None:
         self._raw_write(messages.Cancel())
 
-    def call_raw(self, msg: "MessageType") -> "MessageType":
+    def call_raw(
+        self, msg: "MessageType", encoded: Optional[Tuple[int, bytes]] = None
+    ) -> "MessageType":
         __tracebackhide__ = True  # for pytest # pylint: disable=W0612
-        self._raw_write(msg)
+        self._raw_write(msg, encoded)
         return self._raw_read()
 
-    def _raw_write(self, msg: "MessageType") -> None:
+    def _raw_write(
+        self, msg: "MessageType", encoded: Optional[Tuple[int, bytes]] = None
+    ) -> None:
+        """Send `msg` to the device.
+
+        `encoded` may carry the result of `self.mapping.encode(msg)` computed
+        ahead of time, in which case the message is not encoded again.
+        """
         __tracebackhide__ = True  # for pytest # pylint: disable=W0612
         LOG.debug(
             f"sending message: {msg.__class__.__name__}",
             extra={"protobuf": msg},
         )
-        msg_type, msg_bytes = self.mapping.encode(msg)
+        if encoded is None:
+            encoded = self.mapping.encode(msg)
+        msg_type, msg_bytes = encoded
         LOG.log(
             DUMP_BYTES,
             f"encoded as type {msg_type} ({len(msg_bytes)} bytes): {msg_bytes.hex()}",
@@ -242,9 +253,11 @@ class TrezorClient:
         return self._raw_read()
 
     @session
-    def call(self, msg: "MessageType") -> "MessageType":
+    def call(
+        self, msg: "MessageType", encoded: Optional[Tuple[int, bytes]] = None
+    ) -> "MessageType":
         self.check_firmware_version()
-        resp = self.call_raw(msg)
+        resp = self.call_raw(msg, encoded)
         while True:
             if isinstance(resp, messages.PinMatrixRequest):
                 resp = self._callback_pin(resp)
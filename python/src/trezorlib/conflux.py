@@ -16,7 +16,7 @@
 
 from typing import TYPE_CHECKING, AnyStr, Optional, Tuple
 
-from . import messages
+from . import chunks, messages
 from .tools import expect, prepare_message_bytes, session
 
 if TYPE_CHECKING:
@@ -60,9 +60,7 @@ def sign_tx(
     if "data" in tx_msg.keys():
         data = decode_hex(tx_msg["data"])
 
-    data_length = len(data)
-    data, chunk = data[1024:], data[:1024]
-
+    reader = chunks.as_reader(data)
     msg = messages.ConfluxSignTx(
         address_n=address_n,
         to=tx_msg["to"],
@@ -73,18 +71,17 @@ def sign_tx(
         storage_limit=int_to_big_endian(tx_msg["storage_limit"]),
         epoch_height=int_to_big_endian(tx_msg["epoch_height"]),
         chain_id=tx_msg["chain_id"],
-        data_length=data_length,
-        data_initial_chunk=chunk,
+        data_length=reader.length,
+        data_initial_chunk=reader.read(1024),
     )
 
-    response = client.call(msg)
-    assert isinstance(response, messages.ConfluxTxRequest)
-
-    while response.data_length is not None:
-        data_length = response.data_length
-        data, chunk = data[data_length:], data[:data_length]
-        response = client.call(messages.ConfluxTxAck(data_chunk=chunk))
-        assert isinstance(response, messages.ConfluxTxRequest)
+    response = chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.ConfluxTxRequest,
+        lambda chunk: messages.ConfluxTxAck(data_chunk=chunk),
+    )
 
     assert response.signature_v is not None
     assert response.signature_r is not None
@@ -16,9 +16,9 @@
 
 import warnings
 from functools import reduce
-from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Sequence, Tuple
 
-from . import _ed25519, messages
+from . import _ed25519, _ed25519_fast, messages
 from .tools import expect
 
 if TYPE_CHECKING:
@@ -32,12 +32,96 @@ Ed25519PrivateKey = bytes
 Ed25519PublicPoint = bytes
 Ed25519Signature = bytes
 
+"""Ed25519 implementations for signature verification.
+
+`python` is the pure-Python `_ed25519_fast` and the default. It accepts the same
+signatures as the textbook `reference` implementation `_ed25519`, and raises the
+same exceptions: `_ed25519.SignatureMismatch` for a signature that does not match,
+`ValueError` for one that cannot be decoded. `cryptography` and `nacl` are much
+faster and can be selected when the respective package is installed. They raise
+`_ed25519.SignatureMismatch` for every invalid signature, and also reject some
+signatures that `reference` accepts, e.g. with S >= l.
+"""
+ED25519_BACKENDS = ("python", "reference", "cryptography", "nacl")
+DEFAULT_ED25519_BACKEND = "python"
+
+_CheckValid = Callable[[Ed25519Signature, bytes, Ed25519PublicPoint], None]
+_backend: Optional[Tuple[str, _CheckValid]] = None
+
+
+def _load_backend(name: str) -> _CheckValid:
+    if name == "cryptography":
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PublicKey,
+        )
+
+        def checkvalid_cryptography(
+            signature: Ed25519Signature, digest: bytes, pub_key: Ed25519PublicPoint
+        ) -> None:
+            try:
+                Ed25519PublicKey.from_public_bytes(pub_key).verify(signature, digest)
+            except InvalidSignature as e:
+                raise _ed25519.SignatureMismatch(
+                    "signature does not pass verification"
+                ) from e
+
+        return checkvalid_cryptography
+
+    elif name == "nacl":
+        from nacl.exceptions import BadSignatureError
+        from nacl.signing import VerifyKey
+
+        def checkvalid_nacl(
+            signature: Ed25519Signature, digest: bytes, pub_key: Ed25519PublicPoint
+        ) -> None:
+            try:
+                VerifyKey(pub_key).verify(digest, signature)
+            except BadSignatureError as e:
+                raise _ed25519.SignatureMismatch(
+                    "signature does not pass verification"
+                ) from e
+
+        return checkvalid_nacl
+
+    elif name == "python":
+        return _ed25519_fast.checkvalid
+    elif name == "reference":
+        return _ed25519.checkvalid
+    else:
+        raise ValueError(f"Unknown Ed25519 backend: {name}")
+
+
+def set_backend(name: str = DEFAULT_ED25519_BACKEND) -> str:
+    """Select the Ed25519 implementation used to verify signatures.
+
+    `name` is one of `ED25519_BACKENDS`. Raise `ImportError` if the implementation
+    is not installed. Returns the name of the selected backend.
+    """
+    global _backend
+    _backend = name, _load_backend(name)
+    return name
+
+
+def get_backend() -> str:
+    """Return the name of the Ed25519 implementation used to verify signatures."""
+    if _backend is None:
+        return set_backend()
+    return _backend[0]
+
+
+def _checkvalid() -> _CheckValid:
+    if _backend is None:
+        set_backend()
+    assert _backend is not None
+    return _backend[1]
+
 
 def combine_keys(pks: Iterable[Ed25519PublicPoint]) -> Ed25519PublicPoint:
     """Combine a list of Ed25519 points into a "global" CoSi key."""
-    P = [_ed25519.decodepoint(pk) for pk in pks]
-    combine = reduce(_ed25519.edwards_add, P)
-    return Ed25519PublicPoint(_ed25519.encodepoint(combine))
+    P = [_ed25519_fast.decodepoint(pk) for pk in pks]
+    combine = reduce(_ed25519_fast.edwards_add, P)
+    return Ed25519PublicPoint(_ed25519_fast.encodepoint(combine))
 
 
 def combine_sig(
@@ -69,8 +153,8 @@ def get_nonce(
     bytesize = _ed25519.b // 8
     assert len(h) == bytesize * 2
     r = _ed25519.Hint(h[bytesize:] + data + ctr.to_bytes(4, "big"))
-    R = _ed25519.scalarmult(_ed25519.B, r)
-    return r, Ed25519PublicPoint(_ed25519.encodepoint(R))
+    R = _ed25519_fast.scalarmult_B(r)
+    return r, Ed25519PublicPoint(_ed25519_fast.encodepoint(R))
 
 
 def verify_combined(
@@ -83,7 +167,40 @@ def verify_combined(
     combined public key and performs simple Ed25519 verification.
     """
     # XXX this *might* change to bool function
-    _ed25519.checkvalid(signature, digest, pub_key)
+    _checkvalid()(signature, digest, pub_key)
+
+
+def verify_combined_batch(
+    items: Iterable[Tuple[Ed25519Signature, bytes, Ed25519PublicPoint]]
+) -> None:
+    """Verify many `(signature, digest, pub_key)` Ed25519 signatures at once.
+
+    Raise exception naming the first invalid signature. Every signature is checked
+    on its own, so exactly the signatures accepted by :func:`verify_combined` pass.
+    """
+    checkvalid = _checkvalid()
+    for i, (signature, digest, pub_key) in enumerate(items):
+        try:
+            checkvalid(signature, digest, pub_key)
+        except _ed25519.SignatureMismatch as e:
+            raise _ed25519.SignatureMismatch(
+                f"signature {i} does not pass verification"
+            ) from e
+        except ValueError as e:
+            raise ValueError(f"signature {i}: {e}") from e
+
+
+def _selected_key(
+    sigs_required: int, keys: Sequence[Ed25519PublicPoint], mask: int
+) -> Ed25519PublicPoint:
+    if sigs_required < 1:
+        raise ValueError("At least one signer must be specified.")
+    if mask.bit_length() > len(keys):
+        raise ValueError("Sigmask specifies more public keys than provided.")
+    selected_keys = [key for i, key in enumerate(keys) if mask & (1 << i)]
+    if len(selected_keys) < sigs_required:
+        raise _ed25519.SignatureMismatch("Insufficient number of signatures.")
+    return combine_keys(selected_keys)
 
 
 def verify(
@@ -103,17 +220,26 @@ def verify(
     The verification checks that the mask specifies at least M cosigners, then combines
     the selected public keys and verifies the signature against the combined key.
     """
-    if sigs_required < 1:
-        raise ValueError("At least one signer must be specified.")
-    if mask.bit_length() > len(keys):
-        raise ValueError("Sigmask specifies more public keys than provided.")
-    selected_keys = [key for i, key in enumerate(keys) if mask & (1 << i)]
-    if len(selected_keys) < sigs_required:
-        raise _ed25519.SignatureMismatch("Insufficient number of signatures.")
-    global_pk = combine_keys(selected_keys)
+    global_pk = _selected_key(sigs_required, keys, mask)
     return verify_combined(signature, digest, global_pk)
 
 
+def verify_batch(
+    checks: Iterable[
+        Tuple[Ed25519Signature, bytes, int, List[Ed25519PublicPoint], int]
+    ]
+) -> None:
+    """Verify many CoSi multi-signatures at once.
+
+    Each check is a tuple of the arguments of :func:`verify`. This is useful to
+    check many images, or signatures by many different sets of cosigners.
+    """
+    verify_combined_batch(
+        (signature, digest, _selected_key(sigs_required, keys, mask))
+        for signature, digest, sigs_required, keys, mask in checks
+    )
+
+
 def pubkey_from_privkey(privkey: Ed25519PrivateKey) -> Ed25519PublicPoint:
     """Interpret 32 bytes of data as an Ed25519 private key.
     Calculate and return the corresponding public key.
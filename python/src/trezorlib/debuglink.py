@@ -14,6 +14,7 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import hashlib
 import logging
 import textwrap
 from collections import namedtuple
@@ -78,6 +79,8 @@ class DebugLink:
         self.t1_take_screenshots = False
         self.t1_screenshot_directory: Optional[Path] = None
         self.t1_screenshot_counter = 0
+        # Hash of the pixels of the recorded screenshots, see screenshots_hash()
+        self.t1_screenshot_hasher = hashlib.sha256()
 
     def open(self) -> None:
         self.transport.begin_session()
@@ -220,6 +223,7 @@ class DebugLink:
         else:
             self.t1_screenshot_directory = Path(directory)
             self.t1_screenshot_counter = 0
+            self.t1_screenshot_hasher = hashlib.sha256()
             self.t1_take_screenshots = True
 
     def stop_recording(self) -> None:
@@ -229,6 +233,16 @@ class DebugLink:
         else:
             self.t1_take_screenshots = False
 
+    def screenshots_hash(self) -> Optional[str]:
+        """SHA-256 of the pixels of the screenshots taken during the last recording.
+
+        It is the hash of the decoded screenshot files, in order, but computed as the
+        screenshots are taken. Only available on T1, TT saves the screenshots itself.
+        """
+        if self.model == "T":
+            return None
+        return self.t1_screenshot_hasher.hexdigest()
+
     @expect(messages.DebugLinkMemory, field="memory", ret_type=bytes)
     def memory_read(self, address: int, length: int) -> protobuf.MessageType:
         return self._call(messages.DebugLinkMemoryRead(address=address, length=length))
@@ -270,6 +284,7 @@ class DebugLink:
 
         im = Image.new("1", (128, 64))
         im.putdata(pixels[::-1])
+        self.t1_screenshot_hasher.update(im.tobytes())
 
         assert self.t1_screenshot_directory is not None
         img_location = (
@@ -661,8 +676,14 @@ class TrezorClientDebugLink(TrezorClient):
             self.actual_responses.append(resp)
         return resp
 
-    def _raw_write(self, msg: protobuf.MessageType) -> None:
-        return super()._raw_write(self._filter_message(msg))
+    def _raw_write(
+        self, msg: protobuf.MessageType, encoded: Optional[Tuple[int, bytes]] = None
+    ) -> None:
+        filtered = self._filter_message(msg)
+        if filtered is not msg:
+            # pre-encoded bytes do not reflect the filter's changes
+            encoded = None
+        return super()._raw_write(filtered, encoded)
 
     @staticmethod
     def _expectation_lines(expected: List[MessageFilter], current: int) -> List[str]:
@@ -14,10 +14,20 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import functools
 import re
-from typing import TYPE_CHECKING, Any, AnyStr, Dict, List, Optional, Tuple
-
-from . import definitions, exceptions, messages
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from . import chunks, definitions, exceptions, messages
 from .tools import expect, prepare_message_bytes, session, unharden
 
 if TYPE_CHECKING:
@@ -141,6 +151,88 @@ def encode_data(value: Any, type_name: str) -> bytes:
     raise ValueError(f"Unsupported data type for direct field encoding: {type_name}")
 
 
+class TypedDataIndex:
+    """EIP-712 document prepared for answering the device's requests.
+
+    Field types of the structs are resolved once per type name. On the first value
+    request for the domain or the message, it is flattened into encoded values keyed
+    by their member path, so that every request is a single lookup. Like the device,
+    the paths start with 0 for the domain and with 1 for the message.
+    """
+
+    def __init__(self, data: dict) -> None:
+        self.data = data
+        self.types = data["types"]
+        self._field_types: Dict[str, messages.EthereumFieldType] = {}
+        self._encoders: Dict[str, Callable[[Any], bytes]] = {}
+        self._entry_types: Dict[str, str] = {}
+        self._values: Dict[Tuple[int, ...], bytes] = {}
+        self._flattened = [False, False]
+
+    def field_type(self, type_name: str) -> messages.EthereumFieldType:
+        field_type = self._field_types.get(type_name)
+        if field_type is None:
+            field_type = get_field_type(type_name, self.types)
+            self._field_types[type_name] = field_type
+        return field_type
+
+    def struct_members(self, struct_name: str) -> List[messages.EthereumStructMember]:
+        return [
+            messages.EthereumStructMember(
+                type=self.field_type(field["type"]), name=field["name"]
+            )
+            for field in self.types[struct_name]
+        ]
+
+    def value(self, member_path: List[int]) -> bytes:
+        root_index = member_path[0]
+        if not self._flattened[root_index]:
+            if root_index == 0:
+                self._flatten((0,), self.data["domain"], "EIP712Domain")
+            else:
+                self._flatten((1,), self.data["message"], self.data["primaryType"])
+            self._flattened[root_index] = True
+        try:
+            return self._values[tuple(member_path)]
+        except KeyError:
+            raise ValueError(f"No value at member path {member_path}") from None
+
+    def _encoder(self, type_name: str) -> Callable[[Any], bytes]:
+        encoder = self._encoders.get(type_name)
+        if encoder is None:
+            if type_name.startswith(("int", "uint")):
+                size = get_byte_size_for_int_type(type_name)
+                signed = type_name.startswith("int")
+
+                def encode_int(value: Any) -> bytes:
+                    return int(value).to_bytes(size, "big", signed=signed)
+
+                encoder = encode_int
+            else:
+                encoder = functools.partial(encode_data, type_name=type_name)
+            self._encoders[type_name] = encoder
+        return encoder
+
+    def _flatten(self, path: Tuple[int, ...], value: Any, type_name: str) -> None:
+        if isinstance(value, dict):
+            for index, member_def in enumerate(self.types[type_name]):
+                # a missing member is only an error if the device asks for it
+                if member_def["name"] in value:
+                    self._flatten(
+                        path + (index,), value[member_def["name"]], member_def["type"]
+                    )
+        elif isinstance(value, list):
+            # the length as uint16, the device then asks for the individual elements
+            self._values[path] = len(value).to_bytes(2, "big")
+            entry_type = self._entry_types.get(type_name)
+            if entry_type is None:
+                entry_type = self._entry_types[type_name] = typeof_array(type_name)
+            for index, item in enumerate(value):
+                self._flatten(path + (index,), item, entry_type)
+        else:
+            self._values[path] = self._encoder(type_name)(value)
+
+
 def network_from_address_n(
     address_n: "Address",
     source: definitions.Source,
@@ -195,7 +287,7 @@ def sign_tx(
     gas_limit: int,
     to: str,
     value: int,
-    data: Optional[bytes] = None,
+    data: Optional["chunks.Payload"] = None,
     chain_id: Optional[int] = None,
     tx_type: Optional[int] = None,
     definitions: Optional[messages.EthereumDefinitions] = None,
@@ -215,21 +307,17 @@ def sign_tx(
         definitions=definitions,
     )
 
-    if data is None:
-        data = b""
-
-    msg.data_length = len(data)
-    data, chunk = data[1024:], data[:1024]
-    msg.data_initial_chunk = chunk
-
-    response = client.call(msg)
-    assert isinstance(response, messages.EthereumTxRequest)
+    reader = chunks.as_reader(data if data is not None else b"")
+    msg.data_length = reader.length
+    msg.data_initial_chunk = reader.read(1024)
 
-    while response.data_length is not None:
-        data_length = response.data_length
-        data, chunk = data[data_length:], data[:data_length]
-        response = client.call(messages.EthereumTxAck(data_chunk=chunk))
-        assert isinstance(response, messages.EthereumTxRequest)
+    response = chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.EthereumTxRequest,
+        lambda chunk: messages.EthereumTxAck(data_chunk=chunk),
+    )
 
     assert response.signature_v is not None
     assert response.signature_r is not None
@@ -252,15 +340,14 @@ def sign_tx_eip1559(
     gas_limit: int,
     to: str,
     value: int,
-    data: bytes = b"",
+    data: "chunks.Payload" = b"",
     chain_id: int,
     max_gas_fee: int,
     max_priority_fee: int,
     access_list: Optional[List[messages.EthereumAccessList]] = None,
     definitions: Optional[messages.EthereumDefinitions] = None,
 ) -> Tuple[int, bytes, bytes]:
-    length = len(data)
-    data, chunk = data[1024:], data[:1024]
+    reader = chunks.as_reader(data)
     msg = messages.EthereumSignTxEIP1559(
         address_n=n,
         nonce=int_to_big_endian(nonce),
@@ -271,19 +358,18 @@ def sign_tx_eip1559(
         max_gas_fee=int_to_big_endian(max_gas_fee),
         max_priority_fee=int_to_big_endian(max_priority_fee),
         access_list=access_list,
-        data_length=length,
-        data_initial_chunk=chunk,
+        data_length=reader.length,
+        data_initial_chunk=reader.read(1024),
         definitions=definitions,
     )
 
-    response = client.call(msg)
-    assert isinstance(response, messages.EthereumTxRequest)
-
-    while response.data_length is not None:
-        data_length = response.data_length
-        data, chunk = data[data_length:], data[:data_length]
-        response = client.call(messages.EthereumTxAck(data_chunk=chunk))
-        assert isinstance(response, messages.EthereumTxRequest)
+    response = chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.EthereumTxRequest,
+        lambda chunk: messages.EthereumTxAck(data_chunk=chunk),
+    )
 
     assert response.signature_v is not None
     assert response.signature_r is not None
@@ -317,7 +403,7 @@ def sign_typed_data(
     definitions: Optional[messages.EthereumDefinitions] = None,
 ) -> "MessageType":
     data = sanitize_typed_data(data)
-    types = data["types"]
+    index = TypedDataIndex(data)
 
     request = messages.EthereumSignTypedData(
         address_n=n,
@@ -345,54 +431,23 @@ def sign_typed_data(
         )
     # Sending all the types
     while isinstance(response, messages.EthereumTypedDataStructRequest):
-        struct_name = response.name
-
-        members: List["messages.EthereumStructMember"] = []
-        for field in types[struct_name]:
-            field_type = get_field_type(field["type"], types)
-            struct_member = messages.EthereumStructMember(
-                type=field_type,
-                name=field["name"],
-            )
-            members.append(struct_member)
-
-        request = messages.EthereumTypedDataStructAck(members=members)
+        request = messages.EthereumTypedDataStructAck(
+            members=index.struct_members(response.name)
+        )
         response = client.call(request)
 
     # Sending the whole message that should be signed
     while isinstance(response, messages.EthereumTypedDataValueRequest):
-        root_index = response.member_path[0]
         # Index 0 is for the domain data, 1 is for the actual message
-        if root_index == 0:
-            member_typename = "EIP712Domain"
-            member_data = data["domain"]
-        elif root_index == 1:
-            member_typename = data["primaryType"]
-            member_data = data["message"]
-        else:
+        if response.member_path[0] not in (0, 1):
             client.cancel()
             raise exceptions.TrezorException("Root index can only be 0 or 1")
 
         # It can be asking for a nested structure (the member path being [X, Y, Z, ...])
-        # TODO: what to do when the value is missing (for example in recursive types)?
-        for index in response.member_path[1:]:
-            if isinstance(member_data, dict):
-                member_def = types[member_typename][index]
-                member_typename = member_def["type"]
-                member_data = member_data[member_def["name"]]
-            elif isinstance(member_data, list):
-                member_typename = typeof_array(member_typename)
-                member_data = member_data[index]
-
-        # If we were asked for a list, first sending its length and we will be receiving
-        # requests for individual elements later
-        if isinstance(member_data, list):
-            # Sending the length as uint16
-            encoded_data = len(member_data).to_bytes(2, "big")
-        else:
-            encoded_data = encode_data(member_data, member_typename)
-
-        request = messages.EthereumTypedDataValueAck(value=encoded_data)
+        # or for the length of a list, whose elements are then requested one by one
+        request = messages.EthereumTypedDataValueAck(
+            value=index.value(response.member_path)
+        )
         response = client.call(request)
 
     return response
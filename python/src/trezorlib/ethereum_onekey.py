@@ -17,7 +17,7 @@
 import re
 from typing import TYPE_CHECKING, Any, AnyStr, Dict, List, Optional, Tuple
 
-from . import exceptions, messages
+from . import chunks, exceptions, messages
 from .tools import expect, prepare_message_bytes, session
 
 if TYPE_CHECKING:
@@ -171,7 +171,7 @@ def sign_tx(
     gas_limit: int,
     to: str,
     value: int,
-    data: Optional[bytes] = None,
+    data: Optional["chunks.Payload"] = None,
     chain_id: Optional[int] = None,
     tx_type: Optional[int] = None,
 ) -> Tuple[int, bytes, bytes]:
@@ -188,21 +188,17 @@ def sign_tx(
         tx_type=tx_type,
     )
 
-    if data is None:
-        data = b""
+    reader = chunks.as_reader(data if data is not None else b"")
+    msg.data_length = reader.length
+    msg.data_initial_chunk = reader.read(1024)
 
-    msg.data_length = len(data)
-    data, chunk = data[1024:], data[:1024]
-    msg.data_initial_chunk = chunk
-
-    response = client.call(msg)
-    assert isinstance(response, messages.EthereumTxRequestOneKey)
-
-    while response.data_length is not None:
-        data_length = response.data_length
-        data, chunk = data[data_length:], data[:data_length]
-        response = client.call(messages.EthereumTxAckOneKey(data_chunk=chunk))
-        assert isinstance(response, messages.EthereumTxRequestOneKey)
+    response = chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.EthereumTxRequestOneKey,
+        lambda chunk: messages.EthereumTxAckOneKey(data_chunk=chunk),
+    )
 
     assert response.signature_v is not None
     assert response.signature_r is not None
@@ -225,15 +221,14 @@ def sign_tx_eip1559(
     gas_limit: int,
     to: str,
     value: int,
-    data: bytes = b"",
+    data: "chunks.Payload" = b"",
     chain_id: int,
     max_gas_fee: int,
     max_priority_fee: int,
     access_list: Optional[List[messages.EthereumAccessListOneKey]] = None,
 ) -> Tuple[int, bytes, bytes]:
 
-    length = len(data)
-    data, chunk = data[1024:], data[:1024]
+    reader = chunks.as_reader(data)
     msg = messages.EthereumSignTxEIP1559OneKey(
         address_n=n,
         nonce=int_to_big_endian(nonce),
@@ -244,18 +239,17 @@ def sign_tx_eip1559(
         max_gas_fee=int_to_big_endian(max_gas_fee),
         max_priority_fee=int_to_big_endian(max_priority_fee),
         access_list=access_list,
-        data_length=length,
-        data_initial_chunk=chunk,
+        data_length=reader.length,
+        data_initial_chunk=reader.read(1024),
     )
 
-    response = client.call(msg)
-    assert isinstance(response, messages.EthereumTxRequestOneKey)
-
-    while response.data_length is not None:
-        data_length = response.data_length
-        data, chunk = data[data_length:], data[:data_length]
-        response = client.call(messages.EthereumTxAckOneKey(data_chunk=chunk))
-        assert isinstance(response, messages.EthereumTxRequestOneKey)
+    response = chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.EthereumTxRequestOneKey,
+        lambda chunk: messages.EthereumTxAckOneKey(data_chunk=chunk),
+    )
 
     assert response.signature_v is not None
     assert response.signature_r is not None
@@ -15,9 +15,10 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from hashlib import blake2s
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import construct as c
 import ecdsa
@@ -247,7 +248,7 @@ This is the expected format of firmware binaries for Trezor One pre-1.8.0.
 The code block can optionally be interpreted as a new-style firmware image. That is the
 expected format of firmware binary for Trezor One version 1.8.0, which can be installed
 by both the older and the newer bootloader."""
-LegacyFirmware = c.Struct(
+LegacyFirmwareHeader = c.Struct(
     "magic" / c.Const(b"TRZR"),
     "code_length" / c.Rebuild(c.Int32ul, c.len_(c.this.code)),
     "key_indexes" / c.Int8ul[V1_SIGNATURE_SLOTS],  # pylint: disable=E1136
@@ -257,6 +258,11 @@ LegacyFirmware = c.Struct(
     ),
     "_reserved" / c.Padding(52),
     "signatures" / c.Bytes(64)[V1_SIGNATURE_SLOTS],
+)
+
+
+LegacyFirmware = c.Struct(
+    *LegacyFirmwareHeader.subcons,
     "code" / c.Bytes(c.this.code_length),
     c.Terminated,
 
@@ -274,6 +280,9 @@ class FirmwareFormat(Enum):
 
 ParsedFirmware = Tuple[FirmwareFormat, c.Container]
 
+"""blake2s digests of image chunks, keyed by (offset, length) within the image."""
+ChunkDigests = Dict[Tuple[int, int], bytes]
+
 
 def parse(data: bytes) -> ParsedFirmware:
     if data[:4] == b"TRZR":
@@ -295,6 +304,93 @@ def parse(data: bytes) -> ParsedFirmware:
     return version, fw
 
 
+class _BufferReader:
+    """Read-only stream over a buffer, for parsing headers without copying it."""
+
+    def __init__(self, view: memoryview) -> None:
+        self.view = view
+        self.pos = 0
+
+    def read(self, length: int = -1) -> bytes:
+        end = len(self.view) if length < 0 else self.pos + length
+        data = bytes(self.view[self.pos : end])
+        self.pos += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 1:
+            offset += self.pos
+        elif whence == 2:
+            offset += len(self.view)
+        self.pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self.pos
+
+
+def _parse_header(struct: c.Construct, view: memoryview) -> Tuple[c.Container, int]:
+    """Parse `struct` at the start of `view`, return the result and its size."""
+    reader = _BufferReader(view)
+    try:
+        return struct.parse_stream(reader), reader.pos
+    finally:
+        # The result references the reader in reference cycles. Drop the view,
+        # so that the buffer (e.g., an mmap) can be closed once the result is
+        # no longer used, without waiting for the garbage collector.
+        reader.view = memoryview(b"")
+
+
+def _parse_image_headers(view: memoryview) -> c.Container:
+    header, code_offset = _parse_header(FirmwareHeader, view)
+    if code_offset + header.code_length != len(view):
+        raise ValueError("Code length does not match the image size")
+    return c.Container(
+        header=header,
+        _code_offset=code_offset,
+        code=view[code_offset:],
+    )
+
+
+def parse_headers(data: Any) -> ParsedFirmware:
+    """Parse the headers of a firmware image without copying its code.
+
+    `data` can be any buffer, e.g., `bytes` or an `mmap` of a firmware file. The
+    result has the same structure as the result of `parse()`, except that the
+    `code` fields are `memoryview`s into `data`, so the image is only read when
+    it is hashed.
+    """
+    view = memoryview(data)
+    try:
+        if view[:4] == b"TRZR":
+            fw, code_offset = _parse_header(LegacyFirmwareHeader, view)
+            if code_offset + fw.code_length != len(view):
+                raise ValueError("Code length does not match the image size")
+            fw.code = view[code_offset:]
+            try:
+                fw.embedded_onev2 = _parse_image_headers(fw.code)
+            except Exception:
+                fw.embedded_onev2 = None
+            return FirmwareFormat.TREZOR_ONE, fw
+
+        elif view[:4] == b"OKTV":
+            vendor_header, image_offset = _parse_header(VendorHeader, view)
+            image = _parse_image_headers(view[image_offset:])
+            # make the code offset relative to the start of `data`, like `parse()`
+            image._code_offset += image_offset
+            return FirmwareFormat.TREZOR_T, c.Container(
+                vendor_header=vendor_header, image=image
+            )
+
+        elif view[:4] == b"OKTF":
+            return FirmwareFormat.TREZOR_ONE_V2, _parse_image_headers(view)
+
+    except Exception as e:
+        raise FirmwareIntegrityError("Invalid firmware image") from e
+
+    raise ValueError("Unrecognized firmware image type")
+
+
 def digest_onev1(fw: c.Container) -> bytes:
     return hashlib.sha256(fw.code).digest()
 
@@ -355,31 +451,47 @@ def calculate_code_hashes(
     hash_function: Callable = blake2s,
     chunk_size: int = V2_CHUNK_SIZE,
     padding_byte: Optional[bytes] = None,
+    chunk_digests: Optional[ChunkDigests] = None,
 ) -> Tuple[List[bytes], int]:
+    """Hash the code in chunks of the image.
+
+    The chunks are hashed through a `memoryview`, so `code` is never copied. If
+    `chunk_digests` is given, the digest of every chunk that needs no padding is
+    stored in it under the chunk's `(offset, length)` within the image.
+    """
 
     chunk_size = V2_CHUNK_SIZE if len(code) <= FIREMWARE_SIZE_LIMIT else V2_CHUNK_SIZE*2
+    view = memoryview(code)
     hashes = []
     # End offset for each chunk. Normally this would be (i+1)*chunk_size for i-th chunk,
     # but the first chunk is shorter by code_offset, so all end offsets are shifted.
     ends = [(i + 1) * chunk_size - code_offset for i in range(16)]
     start = 0
     for end in ends:
-        chunk = code[start:end]
-        # padding for last non-empty chunk
-        if padding_byte is not None and start < len(code) and end > len(code):
-            chunk += padding_byte[0:1] * (end - start - len(chunk))
-
+        chunk = view[start:end]
         if not chunk:
             hashes.append(b"\0" * 32)
-        else:
-            hashes.append(hash_function(chunk).digest())
+            start = end
+            continue
+
+        h = hash_function(chunk)
+        # padding for last non-empty chunk
+        if padding_byte is not None and end > len(view):
+            h.update(padding_byte[0:1] * (end - start - len(chunk)))
+        elif chunk_digests is not None:
+            chunk_digests[code_offset + start, len(chunk)] = h.digest()
+        hashes.append(h.digest())
 
         start = end
 
     return hashes, 0 if chunk_size == V2_CHUNK_SIZE else chunk_size
 
 
-def validate_code_hashes(fw: c.Container, version: FirmwareFormat) -> None:
+def validate_code_hashes(
+    fw: c.Container,
+    version: FirmwareFormat,
+    chunk_digests: Optional[ChunkDigests] = None,
+) -> None:
     hash_function: Callable
     padding_byte: Optional[bytes]
     if version == FirmwareFormat.TREZOR_ONE_V2:
@@ -387,6 +499,8 @@ def validate_code_hashes(fw: c.Container, version: FirmwareFormat) -> None:
         hash_function = hashlib.sha256
         chunk_size = ONEV2_CHUNK_SIZE
         padding_byte = b"\xff"
+        # the upload uses blake2s, these digests would be of no use
+        chunk_digests = None
     else:
         image = fw.image
         hash_function = blake2s
@@ -394,7 +508,12 @@ def validate_code_hashes(fw: c.Container, version: FirmwareFormat) -> None:
         padding_byte = None
 
     expected_hashes, chunk_size = calculate_code_hashes(
-        image.code, image._code_offset, hash_function, chunk_size, padding_byte
+        image.code,
+        image._code_offset,
+        hash_function,
+        chunk_size,
+        padding_byte,
+        chunk_digests,
     )
     if expected_hashes != image.header.hashes:
         raise FirmwareIntegrityError("Invalid firmware data.")
@@ -424,7 +543,11 @@ def validate_onev1(fw: c.Container, allow_unsigned: bool = False) -> None:
         validate_onev2(fw.embedded_onev2, allow_unsigned)
 
 
-def validate_v2(fw: c.Container, skip_vendor_header: bool = False) -> None:
+def validate_v2(
+    fw: c.Container,
+    skip_vendor_header: bool = False,
+    chunk_digests: Optional[ChunkDigests] = None,
+) -> None:
     vendor_fingerprint = header_digest(fw.vendor_header)
     fingerprint = digest_v2(fw)
 
@@ -461,7 +584,7 @@ def validate_v2(fw: c.Container, skip_vendor_header: bool = False) -> None:
     # XXX expiry is not used now
     # if time.gmtime(fw.image.header.expiry) < now:
     #     raise ValueError("Firmware header expired.")
-    validate_code_hashes(fw, FirmwareFormat.TREZOR_T)
+    validate_code_hashes(fw, FirmwareFormat.TREZOR_T, chunk_digests)
 
 
 def digest(version: FirmwareFormat, fw: c.Container) -> bytes:
@@ -476,14 +599,22 @@ def digest(version: FirmwareFormat, fw: c.Container) -> bytes:
 
 
 def validate(
-    version: FirmwareFormat, fw: c.Container, allow_unsigned: bool = False
+    version: FirmwareFormat,
+    fw: c.Container,
+    allow_unsigned: bool = False,
+    chunk_digests: Optional[ChunkDigests] = None,
 ) -> None:
+    """Validate signatures and code hashes of a parsed firmware.
+
+    For a `TREZOR_T` image, pass a dict as `chunk_digests` to collect the digests
+    of the code chunks, which `update()` can then send without hashing again.
+    """
     if version == FirmwareFormat.TREZOR_ONE:
         return validate_onev1(fw, allow_unsigned)
     elif version == FirmwareFormat.TREZOR_ONE_V2:
         return validate_onev2(fw, allow_unsigned)
     elif version == FirmwareFormat.TREZOR_T:
-        return validate_v2(fw)
+        return validate_v2(fw, chunk_digests=chunk_digests)
     else:
         raise ValueError("Unrecognized firmware version")
 
@@ -491,12 +622,36 @@ def validate(
 # ====== Client functions ====== #
 
 
+def _prepare_upload(
+    client: "TrezorClient",
+    view: memoryview,
+    offset: int,
+    length: int,
+    chunk_digests: Optional[ChunkDigests],
+) -> Tuple[messages.FirmwareUpload, Tuple[int, bytes]]:
+    chunk = view[offset : offset + length]
+    digest = chunk_digests.get((offset, length)) if chunk_digests else None
+    if digest is None:
+        digest = blake2s(chunk).digest()
+    msg = messages.FirmwareUpload(payload=bytes(chunk), hash=digest)
+    return msg, client.mapping.encode(msg)
+
+
 @session
 def update(
     client: "TrezorClient",
-    data: bytes,
+    data: Any,
     progress_update: Callable[[int], Any] = lambda _: None,
+    chunk_digests: Optional[ChunkDigests] = None,
 ):
+    """Upload firmware `data` to a device in bootloader mode.
+
+    `data` can be any buffer, e.g., an `mmap` of the firmware file, and only the
+    requested chunks are copied out of it. `chunk_digests` filled in by
+    `validate()` are reused instead of hashing those chunks again. The chunk
+    after the requested one is hashed and encoded in the background while the
+    current chunk is being uploaded.
+    """
     if client.features.bootloader_mode is False:
         raise RuntimeError("Device must be in bootloader mode")
 
@@ -504,7 +659,7 @@ def update(
 
     # TREZORv1 method
     if isinstance(resp, messages.Success):
-        resp = client.call(messages.FirmwareUpload(payload=data))
+        resp = client.call(messages.FirmwareUpload(payload=bytes(data)))
         progress_update(len(data))
         if isinstance(resp, messages.Success):
             return
@@ -512,14 +667,42 @@ def update(
             raise RuntimeError(f"Unexpected result {resp}")
 
     # TREZORv2 method
-    while isinstance(resp, messages.FirmwareRequest):
-        assert resp.offset is not None
-        assert resp.length is not None
-        length = resp.length
-        payload = data[resp.offset : resp.offset + length]
-        digest = blake2s(payload).digest()
-        resp = client.call(messages.FirmwareUpload(payload=payload, hash=digest))
-        progress_update(length)
+    view = memoryview(data)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # (offset, length) of the prepared chunk, and the preparation
+        prepared: Optional[Tuple[Tuple[int, int], Future]] = None
+        while isinstance(resp, messages.FirmwareRequest):
+            assert resp.offset is not None
+            assert resp.length is not None
+            offset = resp.offset
+            length = resp.length
+            if prepared is not None and prepared[0] == (offset, length):
+                msg, encoded = prepared[1].result()
+            else:
+                msg, encoded = _prepare_upload(
+                    client, view, offset, length, chunk_digests
+                )
+
+            # the device usually asks for the chunk that follows
+            next_offset = offset + length
+            next_length = min(length, len(view) - next_offset)
+            if next_length > 0:
+                prepared = (
+                    (next_offset, next_length),
+                    executor.submit(
+                        _prepare_upload,
+                        client,
+                        view,
+                        next_offset,
+                        next_length,
+                        chunk_digests,
+                    ),
+                )
+            else:
+                prepared = None
+
+            resp = client.call(msg, encoded)
+            progress_update(length)
 
     if isinstance(resp, messages.Success):
         return
@@ -106,6 +106,8 @@ class MessageType(IntEnum):
     AuthorizeCoinJoin = 51
     SignPsbt = 10052
     SignedPsbt = 10053
+    PsbtRequest = 10054
+    PsbtAck = 10055
     CipherKeyValue = 23
     CipheredKeyValue = 48
     SignIdentity = 53
@@ -552,6 +554,14 @@ class RequestType(IntEnum):
     TXPAYMENTREQ = 7
 
 
+class PsbtRequestType(IntEnum):
+    PSBT_GLOBAL = 0
+    PSBT_INPUT = 1
+    PSBT_OUTPUT = 2
+    PSBT_SIGNATURE = 3
+    PSBT_FINISHED = 4
+
+
 class RebootType(IntEnum):
     Normal = 0
     Boardloader = 1
@@ -2446,14 +2456,14 @@ class AuthorizeCoinJoin(protobuf.MessageType):
 class SignPsbt(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 10052
     FIELDS = {
-        1: protobuf.Field("psbt", "bytes", repeated=False, required=True),
+        1: protobuf.Field("psbt", "bytes", repeated=False, required=False),
         2: protobuf.Field("coin_name", "string", repeated=False, required=False),
     }
 
     def __init__(
         self,
         *,
-        psbt: "bytes",
+        psbt: Optional["bytes"] = None,
         coin_name: Optional["str"] = 'Bitcoin',
     ) -> None:
         self.psbt = psbt
@@ -2474,6 +2484,40 @@ class SignedPsbt(protobuf.MessageType):
         self.psbt = psbt
 
 
+class PsbtRequest(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 10054
+    FIELDS = {
+        1: protobuf.Field("request_type", "PsbtRequestType", repeated=False, required=True),
+        2: protobuf.Field("request_index", "uint32", repeated=False, required=False),
+        3: protobuf.Field("record", "PsbtRecord", repeated=False, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        request_type: "PsbtRequestType",
+        request_index: Optional["int"] = None,
+        record: Optional["PsbtRecord"] = None,
+    ) -> None:
+        self.request_type = request_type
+        self.request_index = request_index
+        self.record = record
+
+
+class PsbtAck(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = 10055
+    FIELDS = {
+        1: protobuf.Field("map", "bytes", repeated=False, required=False),
+    }
+
+    def __init__(
+        self,
+        *,
+        map: Optional["bytes"] = None,
+    ) -> None:
+        self.map = map
+
+
 class HDNodePathType(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = None
     FIELDS = {
@@ -2877,6 +2921,23 @@ class TxAckPrevExtraDataWrapper(protobuf.MessageType):
         self.extra_data_chunk = extra_data_chunk
 
 
+class PsbtRecord(protobuf.MessageType):
+    MESSAGE_WIRE_TYPE = None
+    FIELDS = {
+        1: protobuf.Field("key", "bytes", repeated=False, required=True),
+        2: protobuf.Field("value", "bytes", repeated=False, required=True),
+    }
+
+    def __init__(
+        self,
+        *,
+        key: "bytes",
+        value: "bytes",
+    ) -> None:
+        self.key = key
+        self.value = value
+
+
 class FirmwareErase(protobuf.MessageType):
     MESSAGE_WIRE_TYPE = 6
     FIELDS = {
@@ -5714,6 +5775,9 @@ class DebugLinkState(protobuf.MessageType):
         11: protobuf.Field("reset_word_pos", "uint32", repeated=False, required=False),
         12: protobuf.Field("mnemonic_type", "BackupType", repeated=False, required=False),
         13: protobuf.Field("layout_lines", "string", repeated=True, required=False),
+        14: protobuf.Field("keychain_cache_hits", "uint32", repeated=False, required=False),
+        15: protobuf.Field("keychain_cache_misses", "uint32", repeated=False, required=False),
+        16: protobuf.Field("keychain_cache_evictions", "uint32", repeated=False, required=False),
     }
 
     def __init__(
@@ -5732,6 +5796,9 @@ class DebugLinkState(protobuf.MessageType):
         recovery_word_pos: Optional["int"] = None,
         reset_word_pos: Optional["int"] = None,
         mnemonic_type: Optional["BackupType"] = None,
+        keychain_cache_hits: Optional["int"] = None,
+        keychain_cache_misses: Optional["int"] = None,
+        keychain_cache_evictions: Optional["int"] = None,
     ) -> None:
         self.layout_lines: Sequence["str"] = layout_lines if layout_lines is not None else []
         self.layout = layout
@@ -5746,6 +5813,9 @@ class DebugLinkState(protobuf.MessageType):
         self.recovery_word_pos = recovery_word_pos
         self.reset_word_pos = reset_word_pos
         self.mnemonic_type = mnemonic_type
+        self.keychain_cache_hits = keychain_cache_hits
+        self.keychain_cache_misses = keychain_cache_misses
+        self.keychain_cache_evictions = keychain_cache_evictions
 
 
 class DebugLinkStop(protobuf.MessageType):
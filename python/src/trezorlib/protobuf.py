@@ -20,15 +20,28 @@ Supports uint32, bytes, string, embedded message and repeated fields.
 
 For de-serializing (loading) protobuf types, object with `Reader` interface is required.
 For serializing (dumping) protobuf types, object with `Writer` interface is required.
+
+`encode_message` and `decode_message` work on whole in-memory buffers instead, using
+a codec that is compiled once per message class (see `get_codec`).
 """
 
 import logging
 import warnings
 from dataclasses import dataclass
 from enum import IntEnum
-from io import BytesIO
 from itertools import zip_longest
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Protocol, TypeGuard
 
@@ -182,11 +195,16 @@ class Field:
 class _MessageTypeMeta(type):
     def __init__(cls, name: str, bases: tuple, d: dict) -> None:
         super().__init__(name, bases, d)  # type: ignore [Expected 1 positional argument]
-        if name != "MessageType":
+        # compact variants bring their own generated constructor
+        if name != "MessageType" and "_FULL_TYPE" not in d:
             cls.__init__ = MessageType.__init__  # type: ignore ["__init__" is obscured by a declaration of the same name;;Cannot assign member "__init__" for type "_MessageTypeMeta"]
 
 
 class MessageType(metaclass=_MessageTypeMeta):
+    # Regular subclasses are __dict__-backed. The empty slots only allow
+    # `compact_type()` to generate fully slotted variants.
+    __slots__ = ()
+
     MESSAGE_WIRE_TYPE: Optional[int] = None
 
     FIELDS: Dict[int, Field] = {}
@@ -233,20 +251,20 @@ class MessageType(metaclass=_MessageTypeMeta):
                 setattr(self, field.name, default)
 
     def __eq__(self, rhs: Any) -> bool:
-        return self.__class__ is rhs.__class__ and self.__dict__ == rhs.__dict__
+        return _full_type(self.__class__) is _full_type(
+            rhs.__class__
+        ) and _field_values(self) == _field_values(rhs)
 
     def __repr__(self) -> str:
         d = {}
-        for key, value in self.__dict__.items():
+        for key, value in _field_values(self).items():
             if value is None or value == []:
                 continue
             d[key] = value
         return f"<{self.__class__.__name__}: {d}>"
 
     def ByteSize(self) -> int:
-        data = BytesIO()
-        dump_message(data, self)
-        return len(data.getvalue())
+        return get_codec(self.__class__).byte_size(self)
 
 
 class LimitedReader:
@@ -416,76 +434,561 @@ def load_message(reader: Reader, msg_type: Type[MT]) -> MT:
 
 
 def dump_message(writer: Writer, msg: "MessageType") -> None:
-    repvalue = [0]
-    mtype = msg.__class__
+    writer.write(get_codec(msg.__class__).encode(msg))
 
-    for ftag, field in mtype.FIELDS.items():
-        fvalue = getattr(msg, field.name, None)
 
-        if fvalue is REQUIRED_FIELD_PLACEHOLDER:
-            raise ValueError(f"Required value of field {field.name} was not provided")
+# Compiled codec
+#
+# `load_message` interprets `FIELDS` and resolves field types on every call.
+# `MessageCodec` resolves a message class once, on first use, into per-field
+# encoder and decoder functions that operate on a whole buffer.
+#
+# Encoding runs in two passes. The size pass computes the size of every embedded
+# message bottom-up and remembers it in a memo keyed by object id. The write pass
+# then fills a preallocated buffer, so every submessage is serialized exactly once.
 
-        if fvalue is None:
-            # not sending empty values
-            continue
+_DecodeFn = Callable[[Any, int, int], Tuple[Any, int]]
+_SizeMemo = Dict[int, Any]
+_SizeFn = Callable[[Any, _SizeMemo], int]
+_WriteFn = Callable[[bytearray, int, Any, _SizeMemo], int]
 
-        fkey = (ftag << 3) | field.wire_type
+# how a decoded value is stored into the message dict
+_STORE_SINGLE = 0
+_STORE_APPEND = 1
+_STORE_EXTEND = 2
 
-        if not field.repeated:
-            repvalue[0] = fvalue
-            fvalue = repvalue
 
-        for svalue in fvalue:
-            dump_uvarint(writer, fkey)
+def _uvarint_at(buf: Any, pos: int, end: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if pos >= end:
+            raise IOError("Interrupted UVarint")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
 
-            field_type_object = get_field_type_object(field)
-            if safe_issubclass(field_type_object, MessageType):
-                if not isinstance(svalue, field_type_object):
-                    raise ValueError(
-                        f"Value {svalue} in field {field.name} is not {field_type_object.__name__}"
-                    )
-                counter = CountingWriter()
-                dump_message(counter, svalue)
-                dump_uvarint(writer, counter.size)
-                dump_message(writer, svalue)
-
-            elif safe_issubclass(field_type_object, IntEnum):
-                if svalue not in field_type_object.__members__.values():
-                    raise ValueError(
-                        f"Value {svalue} in field {field.name} unknown for {field.type}"
-                    )
-                dump_uvarint(writer, svalue)
+def _uvarint_size(n: int) -> int:
+    if n < 0x80:
+        if n < 0:
+            raise ValueError("Cannot dump signed value, convert it to unsigned first.")
+        return 1
+    return (n.bit_length() + 6) // 7
 
-            elif field.type.startswith("uint"):
-                if not field.value_fits(svalue):
-                    raise ValueError(
-                        f"Value {svalue} in field {field.name} does not fit into {field.type}"
-                    )
-                dump_uvarint(writer, svalue)
 
-            elif field.type.startswith("sint"):
-                if not field.value_fits(svalue):
-                    raise ValueError(
-                        f"Value {svalue} in field {field.name} does not fit into {field.type}"
-                    )
-                dump_uvarint(writer, sint_to_uint(svalue))
+def _write_uvarint(buf: bytearray, pos: int, n: int) -> int:
+    while n > 0x7F:
+        buf[pos] = (n & 0x7F) | 0x80
+        n >>= 7
+        pos += 1
+    buf[pos] = n
+    return pos + 1
+
+
+def _write_length_delimited(buf: bytearray, pos: int, data: bytes) -> int:
+    pos = _write_uvarint(buf, pos, len(data))
+    end = pos + len(data)
+    buf[pos:end] = data
+    return end
+
+
+def _length_at(buf: Any, pos: int, end: int) -> Tuple[int, int]:
+    length, pos = _uvarint_at(buf, pos, end)
+    if pos + length > end:
+        raise IOError("Interrupted length-delimited field")
+    return pos, pos + length
+
+
+_VALUE_BOUNDS = {
+    "uint32": (0, 2**32),
+    "uint64": (0, 2**64),
+    "sint32": (-(2**31), 2**31),
+    "sint64": (-(2**63), 2**63),
+}
+
+
+def _compile_decoder(field: Field, field_type_object: Any) -> Optional[_DecodeFn]:
+    name = field.name
+
+    if safe_issubclass(field_type_object, MessageType):
+        msg_type = field_type_object
+
+        def decode_message_field(buf: Any, pos: int, end: int) -> Tuple[Any, int]:
+            start, pos = _length_at(buf, pos, end)
+            return get_codec(msg_type).decode(buf, start, pos), pos
+
+        return decode_message_field
+
+    if field.type == "bytes":
+
+        def decode_bytes(buf: Any, pos: int, end: int) -> Tuple[Any, int]:
+            start, pos = _length_at(buf, pos, end)
+            return bytes(buf[start:pos]), pos
+
+        return decode_bytes
+
+    if field.type == "string":
+
+        def decode_string(buf: Any, pos: int, end: int) -> Tuple[Any, int]:
+            start, pos = _length_at(buf, pos, end)
+            return str(buf[start:pos], "utf-8"), pos
+
+        return decode_string
+
+    if safe_issubclass(field_type_object, IntEnum):
+        members = {m.value: m for m in field_type_object}
+        enum_name = field_type_object.__name__
+
+        def decode_enum(buf: Any, pos: int, end: int) -> Tuple[Any, int]:
+            value, pos = _uvarint_at(buf, pos, end)
+            member = members.get(value)
+            if member is None:
+                # treat enum errors as warnings
+                LOG.info(f"On field {name}: {value} is not a valid {enum_name}")
+                return value, pos
+            return member, pos
+
+        return decode_enum
+
+    if field.type == "bool":
+
+        def decode_bool(buf: Any, pos: int, end: int) -> Tuple[Any, int]:
+            value, pos = _uvarint_at(buf, pos, end)
+            return bool(value), pos
+
+        return decode_bool
+
+    if field.type in _VALUE_BOUNDS:
+        low, high = _VALUE_BOUNDS[field.type]
+        signed = field.type.startswith("sint")
+        ftype = field.type
+
+        def decode_int(buf: Any, pos: int, end: int) -> Tuple[Any, int]:
+            value, pos = _uvarint_at(buf, pos, end)
+            if signed:
+                value = uint_to_sint(value)
+            if not low <= value < high:
+                LOG.info(f"On field {name}: value {value} out of range for {ftype}")
+            return value, pos
+
+        return decode_int
+
+    return None
+
+
+def _compile_packed_decoder(decode_item: _DecodeFn) -> _DecodeFn:
+    def decode_packed(buf: Any, pos: int, end: int) -> Tuple[Any, int]:
+        pos, packed_end = _length_at(buf, pos, end)
+        values = []
+        while pos < packed_end:
+            value, pos = decode_item(buf, pos, packed_end)
+            values.append(value)
+        return values, pos
+
+    return decode_packed
+
+
+def _compile_value_encoder(
+    field: Field, field_type_object: Any
+) -> Optional[Tuple[_SizeFn, _WriteFn]]:
+    # The size pass runs first and performs all validation, so the write pass can
+    # assume that every value is valid.
+    name = field.name
+
+    if safe_issubclass(field_type_object, MessageType):
+        msg_type = field_type_object
+
+        def size_message(value: Any, memo: _SizeMemo) -> int:
+            if (
+                not isinstance(value, msg_type)
+                and _full_type(value.__class__) is not msg_type
+            ):
+                raise ValueError(
+                    f"Value {value} in field {name} is not {msg_type.__name__}"
+                )
+            size = memo[id(value)] = get_codec(msg_type).size(value, memo)
+            return _uvarint_size(size) + size
+
+        def write_message(buf: bytearray, pos: int, value: Any, memo: _SizeMemo) -> int:
+            pos = _write_uvarint(buf, pos, memo[id(value)])
+            return get_codec(msg_type).write(buf, pos, value, memo)
+
+        return size_message, write_message
+
+    if safe_issubclass(field_type_object, IntEnum):
+        values = frozenset(m.value for m in field_type_object)
+        ftype = field.type
+
+        def size_enum(value: Any, memo: _SizeMemo) -> int:
+            if value not in values:
+                raise ValueError(f"Value {value} in field {name} unknown for {ftype}")
+            return _uvarint_size(value)
+
+        def write_enum(buf: bytearray, pos: int, value: Any, memo: _SizeMemo) -> int:
+            return _write_uvarint(buf, pos, value)
+
+        return size_enum, write_enum
+
+    if field.type in _VALUE_BOUNDS:
+        low, high = _VALUE_BOUNDS[field.type]
+        signed = field.type.startswith("sint")
+        ftype = field.type
+
+        def size_int(value: Any, memo: _SizeMemo) -> int:
+            if not low <= value < high:
+                raise ValueError(
+                    f"Value {value} in field {name} does not fit into {ftype}"
+                )
+            return _uvarint_size(sint_to_uint(value) if signed else value)
+
+        def write_int(buf: bytearray, pos: int, value: Any, memo: _SizeMemo) -> int:
+            return _write_uvarint(buf, pos, sint_to_uint(value) if signed else value)
+
+        return size_int, write_int
+
+    if field.type == "bool":
+
+        def size_bool(value: Any, memo: _SizeMemo) -> int:
+            return _uvarint_size(int(value))
+
+        def write_bool(buf: bytearray, pos: int, value: Any, memo: _SizeMemo) -> int:
+            return _write_uvarint(buf, pos, int(value))
 
-            elif field.type == "bool":
-                dump_uvarint(writer, int(svalue))
+        return size_bool, write_bool
 
-            elif field.type == "bytes":
-                assert isinstance(svalue, (bytes, bytearray))
-                dump_uvarint(writer, len(svalue))
-                writer.write(svalue)
+    if field.type == "bytes":
+
+        def size_bytes(value: Any, memo: _SizeMemo) -> int:
+            # a memoryview lets a large payload be sent in chunks without copying
+            assert isinstance(value, (bytes, bytearray, memoryview))
+            return _uvarint_size(len(value)) + len(value)
+
+        def write_bytes(buf: bytearray, pos: int, value: Any, memo: _SizeMemo) -> int:
+            return _write_length_delimited(buf, pos, value)
+
+        return size_bytes, write_bytes
+
+    if field.type == "string":
+
+        def size_string(value: Any, memo: _SizeMemo) -> int:
+            assert isinstance(value, str)
+            # keep the UTF-8 form around for the write pass
+            value_bytes = memo[id(value)] = value.encode()
+            return _uvarint_size(len(value_bytes)) + len(value_bytes)
+
+        def write_string(buf: bytearray, pos: int, value: Any, memo: _SizeMemo) -> int:
+            return _write_length_delimited(buf, pos, memo[id(value)])
+
+        return size_string, write_string
+
+    return None
+
+
+def _compile_field_encoder(
+    field: Field, fkey: int, size_value: _SizeFn, write_value: _WriteFn
+) -> Tuple[_SizeFn, _WriteFn]:
+    key_size = _uvarint_size(fkey)
+    key = bytearray(key_size)
+    _write_uvarint(key, 0, fkey)
+    key_bytes = bytes(key)
+
+    if field.repeated:
+
+        def size_repeated(values: Any, memo: _SizeMemo) -> int:
+            if not isinstance(values, (list, tuple)):
+                # an iterator would be used up by the size pass, keep its items
+                items = memo[id(values)] = tuple(values)
+                values = items
+            return sum(key_size + size_value(value, memo) for value in values)
+
+        def write_repeated(
+            buf: bytearray, pos: int, values: Any, memo: _SizeMemo
+        ) -> int:
+            if not isinstance(values, (list, tuple)):
+                values = memo[id(values)]
+            for value in values:
+                buf[pos : pos + key_size] = key_bytes
+                pos = write_value(buf, pos + key_size, value, memo)
+            return pos
+
+        return size_repeated, write_repeated
+
+    def size_single(value: Any, memo: _SizeMemo) -> int:
+        return key_size + size_value(value, memo)
+
+    def write_single(buf: bytearray, pos: int, value: Any, memo: _SizeMemo) -> int:
+        buf[pos : pos + key_size] = key_bytes
+        return write_value(buf, pos + key_size, value, memo)
 
-            elif field.type == "string":
-                assert isinstance(svalue, str)
-                svalue_bytes = svalue.encode()
-                dump_uvarint(writer, len(svalue_bytes))
-                writer.write(svalue_bytes)
+    return size_single, write_single
 
+
+def _unrecognized_field_encoder(field: Field) -> Tuple[_SizeFn, _WriteFn]:
+    def size_unrecognized(value: Any, memo: _SizeMemo) -> int:
+        raise ValueError(f"Unrecognized type for field {field.name}")
+
+    def write_unrecognized(
+        buf: bytearray, pos: int, value: Any, memo: _SizeMemo
+    ) -> int:
+        raise ValueError(f"Unrecognized type for field {field.name}")
+
+    return size_unrecognized, write_unrecognized
+
+
+class MessageCodec:
+    """Encoder and decoder specialized for a single `MessageType` subclass.
+
+    Field types are resolved once, when the codec is built. Use `get_codec()` to
+    obtain a cached instance instead of constructing one directly.
+    """
+
+    def __init__(self, msg_type: Type[MessageType]) -> None:
+        self.msg_type = msg_type
+        self.compact = _full_type(msg_type) is not msg_type
+        self.defaults: Dict[str, Any] = {}
+        self.repeated: List[str] = []
+        self.required: List[str] = []
+        self.unrecognized: Set[int] = set()
+        self.encoders: List[Tuple[str, _SizeFn, _WriteFn]] = []
+        self.decoders: Dict[int, Tuple[str, int, _DecodeFn]] = {}
+
+        for ftag, field in msg_type.FIELDS.items():
+            if field.repeated:
+                self.repeated.append(field.name)
+            elif field.required:
+                self.required.append(field.name)
             else:
-                raise TypeError
+                self.defaults[field.name] = field.default
+            self._compile_field(ftag, field)
+
+    def _compile_field(self, ftag: int, field: Field) -> None:
+        field_type_object = get_field_type_object(field)
+        decode_type_object = field_type_object
+        if self.compact and safe_issubclass(field_type_object, MessageType):
+            # compact messages decode into compact submessages
+            decode_type_object = compact_type(field_type_object)
+        decode = _compile_decoder(field, decode_type_object)
+        value_encoder = _compile_value_encoder(field, field_type_object)
+        if decode is None or value_encoder is None:
+            self.unrecognized.add(ftag)
+            self.encoders.append((field.name, *_unrecognized_field_encoder(field)))
+            return
+
+        if safe_issubclass(field_type_object, MessageType) or field.type in (
+            "bytes",
+            "string",
+        ):
+            wire_type = WIRE_TYPE_LENGTH
+        else:
+            wire_type = WIRE_TYPE_INT
+
+        fkey = (ftag << 3) | wire_type
+        self.encoders.append(
+            (field.name, *_compile_field_encoder(field, fkey, *value_encoder))
+        )
+        store = _STORE_APPEND if field.repeated else _STORE_SINGLE
+        self.decoders[fkey] = (field.name, store, decode)
+        if field.repeated and wire_type == WIRE_TYPE_INT:
+            packed_key = (ftag << 3) | WIRE_TYPE_LENGTH
+            packed = _compile_packed_decoder(decode)
+            self.decoders[packed_key] = (field.name, _STORE_EXTEND, packed)
+
+    def _skip_field(self, fkey: int, buf: Any, pos: int, end: int) -> int:
+        ftag = fkey >> 3
+        wtype = fkey & 7
+        field = self.msg_type.FIELDS.get(ftag)
+        if field is not None:
+            if ftag in self.unrecognized:
+                raise ValueError(f"Unrecognized type for field {field.name}")
+            raise ValueError(f"Field {field.name} received value does not match schema")
+
+        # unknown field, skip it
+        if wtype == WIRE_TYPE_INT:
+            _, pos = _uvarint_at(buf, pos, end)
+            return pos
+        if wtype == WIRE_TYPE_LENGTH:
+            _, pos = _length_at(buf, pos, end)
+            return pos
+        raise ValueError
+
+    def decode(self, buf: Any, pos: int = 0, end: Optional[int] = None) -> Any:
+        """Decode a message from `buf[pos:end]` without copying the buffer."""
+        if end is None:
+            end = len(buf)
+        msg_dict = self.defaults.copy()
+        for name in self.repeated:
+            msg_dict[name] = []
+
+        decoders = self.decoders
+        while pos < end:
+            fkey, pos = _uvarint_at(buf, pos, end)
+            entry = decoders.get(fkey)
+            if entry is None:
+                pos = self._skip_field(fkey, buf, pos, end)
+                continue
+
+            name, store, decode = entry
+            value, pos = decode(buf, pos, end)
+            if store == _STORE_SINGLE:
+                msg_dict[name] = value
+            elif store == _STORE_APPEND:
+                msg_dict[name].append(value)
+            else:
+                msg_dict[name].extend(value)
+
+        for name in self.required:
+            if name not in msg_dict:
+                raise ValueError(f"Did not receive value for field {name}")
+        return self.msg_type(**msg_dict)
+
+    def size(self, msg: MessageType, memo: _SizeMemo) -> int:
+        """Compute the serialized size of `msg`, recording submessage sizes in `memo`."""
+        total = 0
+        for name, size, _ in self.encoders:
+            value = getattr(msg, name, None)
+            if value is REQUIRED_FIELD_PLACEHOLDER:
+                raise ValueError(f"Required value of field {name} was not provided")
+            if value is None:
+                # not sending empty values
+                continue
+            total += size(value, memo)
+        return total
+
+    def write(self, buf: bytearray, pos: int, msg: MessageType, memo: _SizeMemo) -> int:
+        """Serialize `msg` into `buf` at `pos`, using sizes recorded by `size()`."""
+        for name, _, write in self.encoders:
+            value = getattr(msg, name, None)
+            if value is not None:
+                pos = write(buf, pos, value, memo)
+        return pos
+
+    def byte_size(self, msg: MessageType) -> int:
+        return self.size(msg, {})
+
+    def encode(self, msg: MessageType) -> bytearray:
+        memo: _SizeMemo = {}
+        buf = bytearray(self.size(msg, memo))
+        if self.write(buf, 0, msg, memo) != len(buf):
+            raise ValueError("Message changed while it was being encoded")
+        return buf
+
+
+_CODECS: Dict[type, MessageCodec] = {}
+
+
+def get_codec(msg_type: Type[MessageType]) -> MessageCodec:
+    """Return the compiled codec for `msg_type`, building it on first use."""
+    codec = _CODECS.get(msg_type)
+    if codec is None:
+        codec = _CODECS[msg_type] = MessageCodec(msg_type)
+    return codec
+
+
+def clear_codec_cache() -> None:
+    """Drop all compiled codecs, e.g. after message types were redefined."""
+    _CODECS.clear()
+
+
+def encode_message(msg: MessageType) -> bytes:
+    return bytes(get_codec(msg.__class__).encode(msg))
+
+
+def decode_message(data: Union[bytes, bytearray, memoryview], msg_type: Type[MT]) -> MT:
+    return get_codec(msg_type).decode(data)
+
+
+# Compact messages
+#
+# Regular message instances keep their fields in a per-instance `__dict__` and
+# are built by the generic `MessageType.__init__`. For workloads that hold many
+# messages at once (e.g. large sets of previous transactions), `compact_type()`
+# generates a variant of a message class with `__slots__` and a specialized
+# keyword-only constructor. Compact instances compare equal to regular instances
+# with the same content and are accepted wherever the regular type is expected by
+# the codec. Decoding a compact message, or building one with `dict_to_proto`,
+# produces compact submessages.
+
+_MISSING = object()
+
+_COMPACT_TYPES: Dict[type, type] = {}
+
+
+def _full_type(cls: type) -> type:
+    return getattr(cls, "_FULL_TYPE", None) or cls
+
+
+def _field_values(msg: MessageType) -> Dict[str, Any]:
+    values = getattr(msg, "__dict__", None)
+    if values is None:
+        values = {name: getattr(msg, name) for name in msg.__slots__}
+    return values
+
+
+def _missing_required(name: str) -> object:
+    warnings.warn(
+        f"Value of required field '{name}' must be provided in constructor",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return REQUIRED_FIELD_PLACEHOLDER
+
+
+def _compile_compact_init(msg_type: Type[MessageType]) -> Callable[..., None]:
+    namespace: Dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_missing_required": _missing_required,
+    }
+    params = []
+    body = []
+    for field in msg_type.FIELDS.values():
+        name = field.name
+        if field.repeated:
+            params.append(f"{name}=_MISSING")
+            body.append(f"self.{name} = [] if {name} is _MISSING else {name}")
+        elif field.required:
+            params.append(f"{name}=_MISSING")
+            body.append(
+                f"self.{name} = _missing_required({name!r}) "
+                f"if {name} is _MISSING else {name}"
+            )
+        else:
+            namespace[f"_default_{name}"] = field.default
+            params.append(f"{name}=_default_{name}")
+            body.append(f"self.{name} = {name}")
+
+    if params:
+        signature = "self, *, " + ", ".join(params)
+    else:
+        signature = "self"
+        body.append("pass")
+    source = f"def __init__({signature}):\n    " + "\n    ".join(body)
+    exec(source, namespace)
+    return namespace["__init__"]
+
+
+def compact_type(msg_type: Type[MT]) -> Type[MT]:
+    """Return the slotted variant of `msg_type`, generating it on first use."""
+    if _full_type(msg_type) is not msg_type:
+        # already compact
+        return msg_type
+    compact = _COMPACT_TYPES.get(msg_type)
+    if compact is None:
+        namespace = {
+            "__slots__": tuple(field.name for field in msg_type.FIELDS.values()),
+            "__module__": msg_type.__module__,
+            "__qualname__": msg_type.__qualname__,
+            "__init__": _compile_compact_init(msg_type),
+            "MESSAGE_WIRE_TYPE": msg_type.MESSAGE_WIRE_TYPE,
+            "FIELDS": msg_type.FIELDS,
+            "_FULL_TYPE": msg_type,
+        }
+        compact = type(msg_type.__name__, (MessageType,), namespace)
+        _COMPACT_TYPES[msg_type] = compact
+    return compact  # type: ignore [Expression of type "type" cannot be assigned to return type "Type[MT@compact_type]"]
 
 
 def format_message(
@@ -527,12 +1030,14 @@ def format_message(
             lines.append(level + "}")
             return "\n".join(lines)
 
-        if isinstance(value, (bytes, bytearray)):
+        if isinstance(value, (bytes, bytearray, memoryview)):
             length = len(value)
             suffix = ""
             if truncate_after and length > truncate_after:
                 suffix = "..."
                 value = value[: truncate_to or 0]
+            if isinstance(value, memoryview):
+                value = bytes(value)
             if mostly_printable(value):
                 output = repr(value)
             else:
@@ -556,7 +1061,7 @@ def format_message(
     return "{name} ({size}) {content}".format(
         name=pb.__class__.__name__,
         size=byte_size,
-        content=pformat("", pb.__dict__, indent),
+        content=pformat("", _field_values(pb), indent),
     )
 
 
@@ -605,6 +1110,8 @@ def dict_to_proto(message_type: Type[MT], d: Dict[str, Any]) -> MT:
 
         field_type_object = get_field_type_object(field)
         if safe_issubclass(field_type_object, MessageType):
+            if _full_type(message_type) is not message_type:
+                field_type_object = compact_type(field_type_object)
             newvalue = [dict_to_proto(field_type_object, v) for v in value]
         else:
             newvalue = [value_to_proto(field, v) for v in value]
@@ -630,7 +1137,7 @@ def to_dict(msg: "MessageType", hexlify_bytes: bool = True) -> Dict[str, Any]:
             return value
 
     res = {}
-    for key, value in msg.__dict__.items():
+    for key, value in _field_values(msg).items():
         if value is None or value == []:
             continue
         res[key] = convert_value(value)
@@ -16,7 +16,7 @@
 
 from typing import TYPE_CHECKING, AnyStr, Optional, Tuple
 
-from . import messages
+from . import chunks, messages
 from .tools import expect, prepare_message_bytes, session
 
 if TYPE_CHECKING:
@@ -74,18 +74,17 @@ def sign_tx(
         tx_type=tx_type,
     )
 
-    msg.data_length = len(data)
-    data, chunk = data[1024:], data[:1024]
-    msg.data_initial_chunk = chunk
+    reader = chunks.as_reader(data)
+    msg.data_length = reader.length
+    msg.data_initial_chunk = reader.read(1024)
 
-    response = client.call(msg)
-    assert isinstance(response, messages.ScdoSignedTx)
-
-    while response.data_length is not None:
-        data_length = response.data_length
-        data, chunk = data[data_length:], data[:data_length]
-        response = client.call(messages.ScdoTxAck(data_chunk=chunk))
-        assert isinstance(response, messages.ScdoSignedTx)
+    response = chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.ScdoSignedTx,
+        lambda chunk: messages.ScdoTxAck(data_chunk=chunk),
+    )
 
     assert response.signature is not None
 
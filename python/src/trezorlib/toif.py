@@ -14,10 +14,12 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
-import struct
+import os
+import sys
 import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -32,82 +34,160 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Pixel conversions work on whole buffers. With NumPy, as array operations.
+# Without it, channels are split and merged with extended slices, mapped with
+# `bytes.translate`, and combined with a bitwise OR over the whole buffer
+# interpreted as one big integer, so no Python code runs per pixel either.
+USE_NUMPY = NUMPY_AVAILABLE
 
 RGBPixel = Tuple[int, int, int]
 
+# TOIF data is a raw deflate stream. The device inflates it with a window of
+# 2**10 bytes, so it cannot decode data compressed with a larger window.
+DEFAULT_COMPRESS_LEVEL = 9
+DEFAULT_WINDOW_BITS = 10
 
-def _compress(data: bytes) -> bytes:
-    z = zlib.compressobj(level=9, wbits=-10)
+
+def _compress(
+    data: bytes,
+    level: int = DEFAULT_COMPRESS_LEVEL,
+    window_bits: int = DEFAULT_WINDOW_BITS,
+) -> bytes:
+    z = zlib.compressobj(level=level, wbits=-window_bits)
     return z.compress(data) + z.flush()
 
 
 def _decompress(data: bytes) -> bytes:
-    return zlib.decompress(data, wbits=-10)
-
-
-def _from_pil_rgb(pixels: Sequence[RGBPixel], little_endian: bool) -> bytes:
-    data = bytearray()
-    for r, g, b in pixels:
-        c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
-        if little_endian:
-            data += struct.pack("<H", c)
-        else:
-            data += struct.pack(">H", c)
-    return bytes(data)
+    # the largest window decodes data compressed with any window size
+    return zlib.decompress(data, wbits=-15)
+
+
+def _table(fn: Any) -> bytes:
+    return bytes(fn(i) & 0xFF for i in range(256))
+
+
+def _or(a: bytes, b: bytes) -> bytes:
+    return (int.from_bytes(a, "little") | int.from_bytes(b, "little")).to_bytes(
+        len(a), "little"
+    )
+
+
+_RGB_R_HI = _table(lambda r: r & 0xF8)
+_RGB_G_HI = _table(lambda g: g >> 5)
+_RGB_G_LO = _table(lambda g: (g & 0x1C) << 3)
+_RGB_B_LO = _table(lambda b: b >> 3)
+_HI_R = _RGB_R_HI
+_HI_G = _table(lambda hi: (hi & 0x07) << 5)
+_LO_G = _table(lambda lo: (lo & 0xE0) >> 3)
+_LO_B = _table(lambda lo: (lo & 0x1F) << 3)
+_GRAY_HI = _table(lambda v: v & 0xF0)
+_GRAY_LO = _table(lambda v: v >> 4)
+_NIBBLE_LO = _table(lambda p: (p & 0x0F) << 4)
+# premultiplied gray value of a gray-alpha pixel read as a native uint16
+_GRAY_ALPHA: List[int] = []
+
+
+def _from_pil_rgb(data: bytes, little_endian: bool) -> bytes:
+    """Convert raw RGB888 data to RGB565."""
+    if USE_NUMPY:
+        rgb = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.uint16)
+        c = ((rgb[:, 0] & 0xF8) << 8) | ((rgb[:, 1] & 0xFC) << 3) | (rgb[:, 2] >> 3)
+        return c.astype("<u2" if little_endian else ">u2").tobytes()
+
+    r, g, b = data[0::3], data[1::3], data[2::3]
+    hi = _or(r.translate(_RGB_R_HI), g.translate(_RGB_G_HI))
+    lo = _or(g.translate(_RGB_G_LO), b.translate(_RGB_B_LO))
+    res = bytearray(2 * len(hi))
+    if little_endian:
+        res[0::2], res[1::2] = lo, hi
+    else:
+        res[0::2], res[1::2] = hi, lo
+    return bytes(res)
 
 
 def _to_rgb(data: bytes, little_endian: bool) -> bytes:
-    res = bytearray()
-    for i in range(0, len(data), 2):
-        if little_endian:
-            (c,) = struct.unpack("<H", data[i : i + 2])
-        else:
-            (c,) = struct.unpack(">H", data[i : i + 2])
-        r = (c & 0xF800) >> 8
-        g = (c & 0x07E0) >> 3
-        b = (c & 0x001F) << 3
-        res += bytes((r, g, b))
+    """Convert RGB565 data to raw RGB888."""
+    if USE_NUMPY:
+        c = np.frombuffer(data, dtype="<u2" if little_endian else ">u2")
+        rgb = np.empty((len(c), 3), dtype=np.uint8)
+        rgb[:, 0] = (c & 0xF800) >> 8
+        rgb[:, 1] = (c & 0x07E0) >> 3
+        rgb[:, 2] = (c & 0x001F) << 3
+        return rgb.tobytes()
+
+    if little_endian:
+        lo, hi = data[0::2], data[1::2]
+    else:
+        hi, lo = data[0::2], data[1::2]
+    res = bytearray(3 * len(hi))
+    res[0::3] = hi.translate(_HI_R)
+    res[1::3] = _or(hi.translate(_HI_G), lo.translate(_LO_G))
+    res[2::3] = lo.translate(_LO_B)
     return bytes(res)
 
 
-def _from_pil_grayscale(pixels: Sequence[int], right_hi: bool) -> bytes:
-    data = bytearray()
-    for i in range(0, len(pixels), 2):
-        left, right = pixels[i], pixels[i + 1]
+def _from_pil_grayscale(data: bytes, right_hi: bool) -> bytes:
+    """Pack raw 8-bit grayscale data to 4 bits per pixel."""
+    if USE_NUMPY:
+        pixels = np.frombuffer(data, dtype=np.uint8)
+        left, right = pixels[0::2], pixels[1::2]
         if right_hi:
-            c = (right & 0xF0) | ((left & 0xF0) >> 4)
+            c = (right & 0xF0) | (left >> 4)
         else:
-            c = (left & 0xF0) | ((right & 0xF0) >> 4)
-        data += struct.pack(">B", c)
-    return bytes(data)
+            c = (left & 0xF0) | (right >> 4)
+        return c.tobytes()
 
+    left, right = data[0::2], data[1::2]
+    if right_hi:
+        return _or(right.translate(_GRAY_HI), left.translate(_GRAY_LO))
+    else:
+        return _or(left.translate(_GRAY_HI), right.translate(_GRAY_LO))
 
-def _from_pil_grayscale_alpha(
-    pixels: Sequence[Tuple[int, int]], right_hi: bool
-) -> bytes:
-    data = bytearray()
-    for i in range(0, len(pixels), 2):
-        left_w_alpha, right_w_alpha = pixels[i], pixels[i + 1]
-        left = int((left_w_alpha[0] * left_w_alpha[1]) / 255)
-        right = int((right_w_alpha[0] * right_w_alpha[1]) / 255)
-        if right_hi:
-            c = (right & 0xF0) | ((left & 0xF0) >> 4)
+
+def _premultiply_alpha(data: bytes) -> bytes:
+    """Convert raw gray-alpha data to 8-bit grayscale on black."""
+    if USE_NUMPY:
+        la = np.frombuffer(data, dtype=np.uint8).reshape(-1, 2).astype(np.uint16)
+        return ((la[:, 0] * la[:, 1]) // 255).astype(np.uint8).tobytes()
+
+    if not _GRAY_ALPHA:
+        if sys.byteorder == "little":
+            _GRAY_ALPHA.extend((i & 0xFF) * (i >> 8) // 255 for i in range(0x10000))
         else:
-            c = (left & 0xF0) | ((right & 0xF0) >> 4)
-        data += struct.pack(">B", c)
-    return bytes(data)
+            _GRAY_ALPHA.extend((i >> 8) * (i & 0xFF) // 255 for i in range(0x10000))
+    return bytes(map(_GRAY_ALPHA.__getitem__, memoryview(data).cast("H")))
+
+
+def _from_pil_grayscale_alpha(data: bytes, right_hi: bool) -> bytes:
+    """Pack raw gray-alpha data to 4 bits per pixel, on black."""
+    return _from_pil_grayscale(_premultiply_alpha(data), right_hi)
 
 
 def _to_grayscale(data: bytes, right_hi: bool) -> bytes:
-    res = bytearray()
-    for pixel in data:
+    """Unpack 4-bit grayscale data to raw 8-bit grayscale."""
+    if USE_NUMPY:
+        pixels = np.frombuffer(data, dtype=np.uint8)
+        res = np.empty(2 * len(pixels), dtype=np.uint8)
+        hi, lo = pixels & 0xF0, (pixels & 0x0F) << 4
         if right_hi:
-            right = pixel & 0xF0
-            left = (pixel & 0x0F) << 4
+            res[0::2], res[1::2] = lo, hi
         else:
-            left = pixel & 0xF0
-            right = (pixel & 0x0F) << 4
-        res += bytes((left, right))
+            res[0::2], res[1::2] = hi, lo
+        return res.tobytes()
+
+    hi, lo = data.translate(_GRAY_HI), data.translate(_NIBBLE_LO)
+    res = bytearray(2 * len(data))
+    if right_hi:
+        res[0::2], res[1::2] = lo, hi
+    else:
+        res[0::2], res[1::2] = hi, lo
     return bytes(res)
 
 
@@ -182,7 +262,14 @@ def from_image(
     image: "Image.Image",
     background: Tuple[int, int, int, int] = (0, 0, 0, 255),
     legacy_format: bool = False,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    window_bits: int = DEFAULT_WINDOW_BITS,
 ) -> Toif:
+    """Convert a PIL image to TOIF.
+
+    `compress_level` and `window_bits` are passed to zlib. Keep `window_bits` at
+    most 10 for images that a device should display.
+    """
     if not PIL_AVAILABLE:
         raise RuntimeError(
             "PIL is not available. Please install via 'pip install Pillow'"
@@ -201,29 +288,91 @@ def from_image(
             raise ValueError("Only even-width grayscale images are supported")
         if not legacy_format:
             toif_mode = firmware.ToifMode.grayscale_eh
-            toif_data = _from_pil_grayscale(image.getdata(), right_hi=True)
+            toif_data = _from_pil_grayscale(image.tobytes(), right_hi=True)
         else:
             toif_mode = firmware.ToifMode.grayscale
-            toif_data = _from_pil_grayscale(image.getdata(), right_hi=False)
+            toif_data = _from_pil_grayscale(image.tobytes(), right_hi=False)
     elif image.mode == "LA":
         toif_mode = firmware.ToifMode.grayscale
         if image.size[0] % 2 != 0:
             raise ValueError("Only even-width grayscale images are supported")
         if not legacy_format:
             toif_mode = firmware.ToifMode.grayscale_eh
-            toif_data = _from_pil_grayscale_alpha(image.getdata(), right_hi=True)
+            toif_data = _from_pil_grayscale_alpha(image.tobytes(), right_hi=True)
         else:
             toif_mode = firmware.ToifMode.grayscale
-            toif_data = _from_pil_grayscale_alpha(image.getdata(), right_hi=False)
+            toif_data = _from_pil_grayscale_alpha(image.tobytes(), right_hi=False)
     elif image.mode == "RGB":
         if not legacy_format:
             toif_mode = firmware.ToifMode.full_color_le
-            toif_data = _from_pil_rgb(image.getdata(), little_endian=True)
+            toif_data = _from_pil_rgb(image.tobytes(), little_endian=True)
         else:
             toif_mode = firmware.ToifMode.full_color
-            toif_data = _from_pil_rgb(image.getdata(), little_endian=False)
+            toif_data = _from_pil_rgb(image.tobytes(), little_endian=False)
     else:
         raise ValueError(f"Unsupported image mode: {image.mode}")
 
-    data = _compress(toif_data)
+    data = _compress(toif_data, compress_level, window_bits)
     return Toif(toif_mode, image.size, data)
+
+
+def _from_file(
+    filename: str, resize: Optional[Tuple[int, int]], kwargs: Dict[str, Any]
+) -> Toif:
+    image = Image.open(filename)
+    if resize is not None:
+        image = image.resize(resize, Image.BOX)
+    return from_image(image, **kwargs)
+
+
+def from_files(
+    filenames: Sequence[Union[str, "os.PathLike[str]"]],
+    resize: Optional[Tuple[int, int]] = None,
+    processes: Optional[int] = None,
+    **kwargs: Any,
+) -> List[Toif]:
+    """Convert image files to TOIF, in parallel worker processes.
+
+    Images are resized to `resize` first, if given. `kwargs` are passed to
+    `from_image()`. `processes` defaults to the number of CPUs. With a single
+    process, the files are converted in the calling process.
+    """
+    if not PIL_AVAILABLE:
+        raise RuntimeError(
+            "PIL is not available. Please install via 'pip install Pillow'"
+        )
+
+    names = [os.fspath(f) for f in filenames]
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(names))
+    if processes <= 1:
+        return [_from_file(name, resize, kwargs) for name in names]
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_from_file, name, resize, kwargs) for name in names]
+        return [future.result() for future in futures]
+
+
+def convert_directory(
+    source: Union[str, "os.PathLike[str]"],
+    destination: Union[str, "os.PathLike[str]"],
+    pattern: str = "*.png",
+    **kwargs: Any,
+) -> List[str]:
+    """Convert all images in `source` matching `pattern` to TOIF files.
+
+    Each file is saved under `destination` with the same name and the `.toif`
+    suffix. `kwargs` are passed to `from_files()`. Returns the written paths.
+    """
+    from pathlib import Path
+
+    sources = sorted(Path(source).glob(pattern))
+    toifs = from_files(sources, **kwargs)
+    os.makedirs(destination, exist_ok=True)
+    written = []
+    for path, toi in zip(sources, toifs):
+        out = os.path.join(destination, path.stem + ".toif")
+        toi.save(out)
+        written.append(out)
+    return written
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from . import messages
+from . import chunks, messages
 from .tools import expect
 
 if TYPE_CHECKING:
@@ -87,21 +87,18 @@ def sign_message(client: "TrezorClient",
             ext_payload=ext_payload,
             signing_message_repr=signing_message_repr
         )
+    reader = chunks.as_reader(init_data_bytes or b"")
+    msg.init_data_length = reader.length
     if init_data_bytes is not None:
-        msg.init_data_length = len(init_data_bytes)
-        init_data_bytes, chunk = init_data_bytes[1024:], init_data_bytes[:1024]
-        msg.init_data_initial_chunk = chunk
-    else:
-        msg.init_data_length = 0
-    response = client.call(msg)
-    assert isinstance(response, messages.TonSignedMessage)
-
-    while response.init_data_length is not None:
-        init_data_length = response.init_data_length
-        init_data_bytes, chunk = init_data_bytes[init_data_length:], init_data_bytes[:init_data_length]
-        response = client.call(messages.TonTxAck(init_data_chunk=chunk))
-        assert isinstance(response, messages.TonSignedMessage)
-    return response
+        msg.init_data_initial_chunk = reader.read(1024)
+    return chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.TonSignedMessage,
+        lambda chunk: messages.TonTxAck(init_data_chunk=chunk),
+        length_field="init_data_length",
+    )
 
 @expect(messages.TonSignedProof)
 def sign_proof(client: "TrezorClient",
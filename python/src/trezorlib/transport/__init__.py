@@ -15,8 +15,12 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import logging
+import threading
+import time
 from typing import (
     TYPE_CHECKING,
+    Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
@@ -35,6 +39,9 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger(__name__)
 
+# Results of `enumerate_devices` are reused for this many seconds
+ENUMERATE_CACHE_TTL = 2.0
+
 UDEV_RULES_STR = """
 Do you have udev rules installed?
 https://github.com/trezor/trezor-common/blob/master/udev/51-trezor.rules
@@ -71,6 +78,8 @@ class Transport:
 
     PATH_PREFIX: str
     ENABLED = False
+    # Seconds that `enumerate_devices` waits for this transport to enumerate
+    ENUMERATE_TIMEOUT = 5.0
 
     def __str__(self) -> str:
         return self.get_path()
@@ -93,6 +102,11 @@ class Transport:
     def find_debug(self: "T") -> "T":
         raise NotImplementedError
 
+    def clone(self: "T") -> "T":
+        """Return a new transport to the same device, without any open handle or
+        session of this one."""
+        raise NotImplementedError
+
     @classmethod
     def enumerate(
         cls: Type["T"], models: Optional[Iterable["TrezorModel"]] = None
@@ -127,22 +141,103 @@ def all_transports() -> Iterable[Type["Transport"]]:
     return set(t for t in transports if t.ENABLED)
 
 
+_EnumerateResult = Tuple[float, Sequence["Transport"]]
+_ENUMERATE_CACHE: Dict[Optional[FrozenSet[str]], _EnumerateResult] = {}
+_ENUMERATE_LOCK = threading.Lock()
+
+
+def invalidate_enumeration_cache() -> None:
+    """Drop cached `enumerate_devices` results, e.g. after (re)connecting a device."""
+    with _ENUMERATE_LOCK:
+        _ENUMERATE_CACHE.clear()
+
+
+def _clone_all(devices: Sequence["Transport"]) -> Optional[List["Transport"]]:
+    try:
+        return [device.clone() for device in devices]
+    except NotImplementedError:
+        return None
+
+
+def _enumerate_transport(
+    transport: Type["Transport"],
+    models: Optional[Iterable["TrezorModel"]],
+    results: Dict[Type["Transport"], List["Transport"]],
+) -> None:
+    name = transport.__name__
+    try:
+        found = list(transport.enumerate(models))
+        LOG.info(f"Enumerating {name}: found {len(found)} devices")
+        results[transport] = found
+    except NotImplementedError:
+        LOG.error(f"{name} does not implement device enumeration")
+    except Exception as e:
+        excname = e.__class__.__name__
+        LOG.error(f"Failed to enumerate {name}. {excname}: {e}")
+
+
 def enumerate_devices(
     models: Optional[Iterable["TrezorModel"]] = None,
+    use_cache: bool = True,
 ) -> Sequence["Transport"]:
+    """Enumerate devices on all enabled transports.
+
+    Transports are probed concurrently, each in its own thread. A transport that
+    does not finish within its `ENUMERATE_TIMEOUT` is skipped and logged.
+
+    Results are cached for `ENUMERATE_CACHE_TTL` seconds. The cache keeps the
+    enumerated devices and every call returns new transport instances for them, so
+    callers never share open handles or sessions. Pass `use_cache=False` or call
+    `invalidate_enumeration_cache()` to force a fresh enumeration.
+    """
+    if models is not None:
+        models = list(models)
+        key: Optional[FrozenSet[str]] = frozenset(model.name for model in models)
+    else:
+        key = None
+
+    if use_cache:
+        with _ENUMERATE_LOCK:
+            cached = _ENUMERATE_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ENUMERATE_CACHE_TTL:
+            fresh = _clone_all(cached[1])
+            assert fresh is not None
+            return fresh
+
+    transports = sorted(all_transports(), key=lambda t: t.__name__)
+    results: Dict[Type["Transport"], List["Transport"]] = {}
+    # daemon threads, so that a hung probe does not block interpreter exit
+    threads = [
+        threading.Thread(
+            target=_enumerate_transport,
+            args=(transport, models, results),
+            name=f"enumerate-{transport.__name__}",
+            daemon=True,
+        )
+        for transport in transports
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+
     devices: List["Transport"] = []
-    for transport in all_transports():
-        name = transport.__name__
-        try:
-            found = list(transport.enumerate(models))
-            LOG.info(f"Enumerating {name}: found {len(found)} devices")
-            devices.extend(found)
-        except NotImplementedError:
-            LOG.error(f"{name} does not implement device enumeration")
-        except Exception as e:
-            excname = e.__class__.__name__
-            LOG.error(f"Failed to enumerate {name}. {excname}: {e}")
-    return devices
+    for transport, thread in zip(transports, threads):
+        thread.join(max(start + transport.ENUMERATE_TIMEOUT - time.monotonic(), 0))
+        if thread.is_alive():
+            LOG.error(
+                f"Enumerating {transport.__name__} timed out "
+                f"after {transport.ENUMERATE_TIMEOUT} seconds"
+            )
+            continue
+        devices.extend(results.get(transport, ()))
+
+    fresh = _clone_all(devices)
+    if fresh is None:
+        # a transport without clone() cannot be handed out twice
+        return devices
+    with _ENUMERATE_LOCK:
+        _ENUMERATE_CACHE[key] = (time.monotonic(), devices)
+    return fresh
 
 
 def get_transport(
@@ -0,0 +1,469 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""asyncio transports.
+
+Counterparts of `UdpTransport` and `BridgeTransport` whose I/O methods are
+coroutines. Nothing here blocks the event loop, so any number of devices and
+emulators can be driven from a single thread, e.g. with `asyncio.gather`.
+
+The wire format is shared with the blocking transports: UDP uses the report
+layout of `ProtocolV1`, Bridge the same HTTP API as `BridgeTransport`.
+"""
+
+import asyncio
+import json
+import logging
+import struct
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+
+from ..log import DUMP_PACKETS
+from . import DeviceIsBusy, MessagePayload, TransportException
+from .bridge import (
+    TREZORD_HOST,
+    TREZORD_ORIGIN_HEADER,
+    TREZORD_VERSION_MODERN,
+    BridgeException,
+)
+from .protocol import REPLEN, ProtocolV1
+from .udp import UdpTransport
+
+if TYPE_CHECKING:
+    from ..models import TrezorModel
+
+    T = TypeVar("T", bound="AsyncTransport")
+
+LOG = logging.getLogger(__name__)
+
+PING_TIMEOUT = 1
+
+
+class AsyncTransport:
+    """Raw asynchronous connection to a Trezor device.
+
+    Same interface as `Transport`, except that `begin_session`, `end_session`,
+    `read`, `write` and `enumerate` are coroutines.
+    """
+
+    PATH_PREFIX: str
+
+    def __str__(self) -> str:
+        return self.get_path()
+
+    def get_path(self) -> str:
+        raise NotImplementedError
+
+    async def begin_session(self) -> None:
+        raise NotImplementedError
+
+    async def end_session(self) -> None:
+        raise NotImplementedError
+
+    async def read(self) -> MessagePayload:
+        raise NotImplementedError
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        raise NotImplementedError
+
+    def find_debug(self: "T") -> "T":
+        raise NotImplementedError
+
+    @classmethod
+    async def enumerate(
+        cls: Type["T"], models: Optional[Iterable["TrezorModel"]] = None
+    ) -> Sequence["T"]:
+        raise NotImplementedError
+
+
+# ===== UDP =====
+
+
+class _DatagramQueue(asyncio.DatagramProtocol):
+    """Queues incoming datagrams for `AsyncUdpTransport`."""
+
+    def __init__(self) -> None:
+        self.queue: "asyncio.Queue[bytes]" = asyncio.Queue()
+        self.error: Optional[Exception] = None
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        self.queue.put_nowait(data)
+
+    def error_received(self, exc: Exception) -> None:
+        # e.g. ICMP port unreachable, when nothing listens on the port
+        self.error = exc
+        self.queue.put_nowait(b"")
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.error = exc or TransportException("Connection closed")
+        self.queue.put_nowait(b"")
+
+
+class AsyncUdpTransport(AsyncTransport):
+    """asyncio counterpart of `UdpTransport`, for emulators.
+
+    Each instance owns one datagram endpoint. Incoming reports are queued by the
+    event loop, so `read` waits without polling; wrap calls in `asyncio.wait_for`
+    to limit the waiting time.
+    """
+
+    DEFAULT_HOST = UdpTransport.DEFAULT_HOST
+    DEFAULT_PORT = UdpTransport.DEFAULT_PORT
+    PATH_PREFIX = UdpTransport.PATH_PREFIX
+
+    def __init__(self, device: Optional[str] = None) -> None:
+        if not device:
+            host = self.DEFAULT_HOST
+            port = self.DEFAULT_PORT
+        else:
+            devparts = device.split(":")
+            host = devparts[0]
+            port = int(devparts[1]) if len(devparts) > 1 else self.DEFAULT_PORT
+        self.device = (host, port)
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.protocol: Optional[_DatagramQueue] = None
+        self.session_counter = 0
+
+    def get_path(self) -> str:
+        return "{}:{}:{}".format(self.PATH_PREFIX, *self.device)
+
+    def find_debug(self) -> "AsyncUdpTransport":
+        host, port = self.device
+        return AsyncUdpTransport(f"{host}:{port + 1}")
+
+    @classmethod
+    async def _try_path(cls, path: str) -> "AsyncUdpTransport":
+        d = cls(path)
+        try:
+            await d.open()
+            if await d._ping():
+                return d
+            else:
+                raise TransportException(
+                    f"No Trezor device found at address {d.get_path()}"
+                )
+        finally:
+            d.close()
+
+    @classmethod
+    async def enumerate(
+        cls, _models: Optional[Iterable["TrezorModel"]] = None
+    ) -> Sequence["AsyncUdpTransport"]:
+        default_path = f"{cls.DEFAULT_HOST}:{cls.DEFAULT_PORT}"
+        try:
+            return [await cls._try_path(default_path)]
+        except TransportException:
+            return []
+
+    @classmethod
+    async def find_by_path(cls, path: str) -> "AsyncUdpTransport":
+        path = path.replace(f"{cls.PATH_PREFIX}:", "")
+        return await cls._try_path(path)
+
+    async def wait_until_ready(self, timeout: float = 10) -> None:
+        loop = asyncio.get_event_loop()
+        try:
+            await self.open()
+            deadline = loop.time() + timeout
+            while not await self._ping():
+                if loop.time() >= deadline:
+                    raise TransportException("Timed out waiting for connection.")
+                await asyncio.sleep(0.05)
+        finally:
+            self.close()
+
+    async def open(self) -> None:
+        loop = asyncio.get_event_loop()
+        self.transport, self.protocol = await loop.create_datagram_endpoint(
+            _DatagramQueue, remote_addr=self.device
+        )
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+        self.transport = None
+        self.protocol = None
+
+    async def begin_session(self) -> None:
+        if self.session_counter == 0:
+            await self.open()
+        self.session_counter += 1
+
+    async def end_session(self) -> None:
+        self.session_counter = max(self.session_counter - 1, 0)
+        if self.session_counter == 0:
+            self.close()
+
+    async def _ping(self) -> bool:
+        """Test if the device is listening."""
+        assert self.transport is not None and self.protocol is not None
+        self.transport.sendto(b"PINGPING")
+        try:
+            resp = await asyncio.wait_for(self.protocol.queue.get(), PING_TIMEOUT)
+        except asyncio.TimeoutError:
+            return False
+        return resp == b"PONGPONG"
+
+    def write_chunk(self, chunk: bytes) -> None:
+        assert self.transport is not None
+        if len(chunk) != REPLEN:
+            raise TransportException("Unexpected data length")
+        LOG.log(DUMP_PACKETS, f"sending packet: {chunk.hex()}")
+        self.transport.sendto(chunk)
+
+    async def read_chunk(self) -> bytes:
+        assert self.protocol is not None
+        protocol = self.protocol
+        chunk = await protocol.queue.get()
+        if not chunk and protocol.error is not None:
+            raise TransportException(f"UDP connection failed: {protocol.error}")
+        LOG.log(DUMP_PACKETS, f"received packet: {chunk.hex()}")
+        if len(chunk) != REPLEN:
+            raise TransportException(f"Unexpected chunk size: {len(chunk)}")
+        return chunk
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        # datagrams are queued by the event loop, no need to wait for each report
+        buffer = ProtocolV1.pack_reports(message_type, message_data)
+        view = memoryview(buffer)
+        for offset in range(0, len(buffer), REPLEN):
+            self.write_chunk(view[offset : offset + REPLEN])
+
+    async def read(self) -> MessagePayload:
+        msg_type, datalen, first_chunk = ProtocolV1.parse_first(await self.read_chunk())
+        buffer = bytearray(first_chunk)
+        while len(buffer) < datalen:
+            buffer += ProtocolV1.parse_next(await self.read_chunk())
+        del buffer[datalen:]
+        return msg_type, buffer
+
+
+# ===== Bridge =====
+
+
+def _dechunk(body: bytes) -> bytes:
+    """Decode a body with `Transfer-Encoding: chunked`."""
+    result = bytearray()
+    pos = 0
+    while True:
+        eol = body.index(b"\r\n", pos)
+        size = int(body[pos:eol].split(b";")[0], 16)
+        if size == 0:
+            return bytes(result)
+        result += body[eol + 2 : eol + 2 + size]
+        pos = eol + 2 + size + 2
+
+
+async def call_bridge(
+    path: str, data: Optional[str] = None, host: str = TREZORD_HOST
+) -> bytes:
+    """POST to trezord and return the response body.
+
+    A minimal HTTP/1.1 client over asyncio streams, one connection per request.
+    Raises `BridgeException` on a non-200 response, same as `bridge.call_bridge`.
+    """
+    url = urlsplit(host)
+    body = (data or "").encode()
+    headers = [
+        f"POST /{path} HTTP/1.1",
+        f"Host: {url.netloc}",
+        *(f"{key}: {value}" for key, value in TREZORD_ORIGIN_HEADER.items()),
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+    ]
+    request = ("\r\n".join(headers) + "\r\n\r\n").encode() + body
+
+    reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+    try:
+        writer.write(request)
+        response = await reader.read()
+    finally:
+        writer.close()
+
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    status = int(status_line.split()[1])
+    response_headers = {}
+    for line in header_lines:
+        key, _, value = line.partition(":")
+        response_headers[key.strip().lower()] = value.strip()
+    if response_headers.get("transfer-encoding", "").lower() == "chunked":
+        payload = _dechunk(payload)
+    elif "content-length" in response_headers:
+        payload = payload[: int(response_headers["content-length"])]
+
+    if status != 200:
+        raise BridgeException(path, status, json.loads(payload)["error"])
+    return payload
+
+
+async def is_legacy_bridge(host: str = TREZORD_HOST) -> bool:
+    config = json.loads(await call_bridge("configure", host=host))
+    version_tuple = tuple(map(int, config["version"].split(".")))
+    return version_tuple < TREZORD_VERSION_MODERN
+
+
+class AsyncBridgeTransport(AsyncTransport):
+    """asyncio counterpart of `BridgeTransport`.
+
+    Legacy Bridge can only perform a write immediately followed by a read, so the
+    written message is kept until `read` is awaited, same as `BridgeHandleLegacy`.
+    """
+
+    PATH_PREFIX = "bridge"
+
+    def __init__(
+        self,
+        device: Dict[str, Any],
+        legacy: bool,
+        debug: bool = False,
+        host: str = TREZORD_HOST,
+    ) -> None:
+        if legacy and debug:
+            raise TransportException("Debugging not supported on legacy Bridge")
+
+        self.device = device
+        self.session: Optional[str] = None
+        self.debug = debug
+        self.legacy = legacy
+        self.host = host
+        self.request: Optional[str] = None
+
+    def get_path(self) -> str:
+        return f"{self.PATH_PREFIX}:{self.device['path']}"
+
+    def find_debug(self) -> "AsyncBridgeTransport":
+        if not self.device.get("debug"):
+            raise TransportException("Debug device not available")
+        return AsyncBridgeTransport(self.device, self.legacy, True, self.host)
+
+    async def _call(self, action: str, data: Optional[str] = None) -> bytes:
+        session = self.session or "null"
+        uri = action + "/" + str(session)
+        if self.debug:
+            uri = "debug/" + uri
+        return await call_bridge(uri, data=data, host=self.host)
+
+    @classmethod
+    async def enumerate(
+        cls,
+        _models: Optional[Iterable["TrezorModel"]] = None,
+        host: str = TREZORD_HOST,
+    ) -> Sequence["AsyncBridgeTransport"]:
+        try:
+            legacy = await is_legacy_bridge(host)
+            devices = json.loads(await call_bridge("enumerate", host=host))
+            return [cls(dev, legacy, host=host) for dev in devices]
+        except Exception:
+            return []
+
+    async def begin_session(self) -> None:
+        try:
+            data = await self._call("acquire/" + self.device["path"])
+        except BridgeException as e:
+            if e.message == "wrong previous session":
+                raise DeviceIsBusy(self.device["path"]) from e
+            raise
+        self.session = json.loads(data)["session"]
+
+    async def end_session(self) -> None:
+        if not self.session:
+            return
+        await self._call("release")
+        self.session = None
+
+    async def write(self, message_type: int, message_data: bytes) -> None:
+        header = struct.pack(">HL", message_type, len(message_data))
+        buf = (header + message_data).hex()
+        if not self.legacy:
+            LOG.log(DUMP_PACKETS, f"sending message: {buf}")
+            await self._call("post", data=buf)
+        elif self.request is not None:
+            raise TransportException("Can't write twice on legacy Bridge")
+        else:
+            self.request = buf
+
+    async def read(self) -> MessagePayload:
+        if not self.legacy:
+            data = await self._call("read")
+        elif self.request is None:
+            raise TransportException("Can't read without write on legacy Bridge")
+        else:
+            try:
+                LOG.log(DUMP_PACKETS, f"calling with message: {self.request}")
+                data = await self._call("call", data=self.request)
+            finally:
+                self.request = None
+        LOG.log(DUMP_PACKETS, f"received message: {data.decode()}")
+
+        buf = bytes.fromhex(data.decode())
+        headerlen = struct.calcsize(">HL")
+        msg_type, datalen = struct.unpack(">HL", buf[:headerlen])
+        return msg_type, buf[headerlen : headerlen + datalen]
+
+
+def all_transports() -> Iterable[Type[AsyncTransport]]:
+    return (AsyncBridgeTransport, AsyncUdpTransport)
+
+
+async def enumerate_devices(
+    models: Optional[Iterable["TrezorModel"]] = None,
+) -> Sequence[AsyncTransport]:
+    """Enumerate all asyncio transports concurrently."""
+    transports = list(all_transports())
+    results = await asyncio.gather(
+        *(transport.enumerate(models) for transport in transports),
+        return_exceptions=True,
+    )
+    devices: List[AsyncTransport] = []
+    for transport, found in zip(transports, results):
+        name = transport.__name__
+        if isinstance(found, BaseException):
+            excname = found.__class__.__name__
+            LOG.error(f"Failed to enumerate {name}. {excname}: {found}")
+            continue
+        LOG.info(f"Enumerating {name}: found {len(found)} devices")
+        devices.extend(found)
+    return devices
+
+
+async def get_transport(path: Optional[str] = None) -> AsyncTransport:
+    """Find a device by full path, or the first available device."""
+    if path is None:
+        devices = await enumerate_devices()
+        if not devices:
+            raise TransportException("No Trezor device found")
+        return devices[0]
+
+    if path.startswith(AsyncUdpTransport.PATH_PREFIX):
+        return await AsyncUdpTransport.find_by_path(path)
+    if path.startswith(AsyncBridgeTransport.PATH_PREFIX):
+        for device in await AsyncBridgeTransport.enumerate():
+            if device.get_path() == path:
+                return device
+        raise TransportException(f"bridge device not found: {path}")
+
+    raise TransportException(f"Could not find device by path: {path}")
@@ -130,6 +130,9 @@ class BridgeTransport(Transport):
     def get_path(self) -> str:
         return f"{self.PATH_PREFIX}:{self.device['path']}"
 
+    def clone(self) -> "BridgeTransport":
+        return BridgeTransport(self.device, self.legacy, debug=self.debug)
+
     def find_debug(self) -> "BridgeTransport":
         if not self.device.get("debug"):
             raise TransportException("Debug device not available")
@@ -132,6 +132,9 @@ class HidTransport(ProtocolBasedTransport):
     def get_path(self) -> str:
         return f"{self.PATH_PREFIX}:{self.device['path'].decode()}"
 
+    def clone(self) -> "HidTransport":
+        return HidTransport(self.device)
+
     @classmethod
     def enumerate(
         cls, models: Optional[Iterable["TrezorModel"]] = None, debug: bool = False
@@ -16,7 +16,7 @@
 
 import logging
 import struct
-from typing import Tuple
+from typing import Iterable, List, Tuple
 
 from typing_extensions import Protocol as StructuralType
 
@@ -57,6 +57,21 @@ class Handle(StructuralType):
         ...
 
 
+class BatchHandle(Handle, StructuralType):
+    """Handle that can additionally transfer several chunks in one call.
+
+    `ProtocolV1` uses these methods when the handle provides them. Chunks passed to
+    `write_chunks` may be `memoryview`s into a shared buffer, which are only valid
+    for the duration of the call.
+    """
+
+    def write_chunks(self, chunks: Iterable[bytes]) -> None:
+        ...
+
+    def read_chunks(self, count: int) -> List[bytes]:
+        ...
+
+
 class Protocol:
     """Wire protocol that can communicate with a Trezor device, given a Handle.
 
@@ -127,43 +142,82 @@ class ProtocolV1(Protocol):
 
     HEADER_LEN = struct.calcsize(">HL")
 
-    def write(self, message_type: int, message_data: bytes) -> None:
-        header = struct.pack(">HL", message_type, len(message_data))
-        buffer = bytearray(b"##" + header + message_data)
+    @classmethod
+    def pack_reports(cls, message_type: int, message_data: bytes) -> bytearray:
+        """Lay out all reports of a message in a single buffer.
+
+        The message data is copied exactly once and the padding of the last report is
+        zeroed. Report `i` is `buffer[i * REPLEN : (i + 1) * REPLEN]`.
+        """
+        header_len = 3 + cls.HEADER_LEN
+        datalen = len(message_data)
+        chunk_count = -(-(header_len - 1 + datalen) // (REPLEN - 1))
+        buffer = bytearray(chunk_count * REPLEN)
+        struct.pack_into(">3sHL", buffer, 0, b"?##", message_type, datalen)
+
+        data = memoryview(message_data)
+        start = 0
+        for offset in range(0, len(buffer), REPLEN):
+            # Report ID, followed by the header in the first report
+            skip = header_len if offset == 0 else 1
+            buffer[offset] = 0x3F  # "?"
+            part = data[start : start + REPLEN - skip]
+            buffer[offset + skip : offset + skip + len(part)] = part
+            start += len(part)
+        return buffer
+
+    @classmethod
+    def parse_first(cls, chunk: bytes) -> Tuple[int, int, bytes]:
+        """Parse the first report of a message into type, length and data."""
+        if chunk[:3] != b"?##":
+            raise RuntimeError("Unexpected magic characters")
+        try:
+            msg_type, datalen = struct.unpack(">HL", chunk[3 : 3 + cls.HEADER_LEN])
+        except Exception:
+            raise RuntimeError("Cannot parse header")
+
+        return msg_type, datalen, chunk[3 + cls.HEADER_LEN :]
 
-        while buffer:
-            # Report ID, data padded to 63 bytes
-            chunk = b"?" + buffer[: REPLEN - 1]
-            chunk = chunk.ljust(REPLEN, b"\x00")
-            self.handle.write_chunk(chunk)
-            buffer = buffer[63:]
+    @staticmethod
+    def parse_next(chunk: bytes) -> bytes:
+        """Return the data of a continuation report."""
+        if chunk[:1] != b"?":
+            raise RuntimeError("Unexpected magic characters")
+        return chunk[1:]
+
+    def write(self, message_type: int, message_data: bytes) -> None:
+        buffer = self.pack_reports(message_type, message_data)
+        view = memoryview(buffer)
+        chunks = (view[i : i + REPLEN] for i in range(0, len(buffer), REPLEN))
+        write_chunks = getattr(self.handle, "write_chunks", None)
+        if write_chunks is not None:
+            write_chunks(chunks)
+        else:
+            for chunk in chunks:
+                self.handle.write_chunk(bytes(chunk))
 
     def read(self) -> MessagePayload:
-        buffer = bytearray()
         # Read header with first part of message data
         msg_type, datalen, first_chunk = self.read_first()
-        buffer.extend(first_chunk)
+        buffer = bytearray(first_chunk)
 
         # Read the rest of the message
+        read_chunks = getattr(self.handle, "read_chunks", None)
         while len(buffer) < datalen:
-            buffer.extend(self.read_next())
-
-        return msg_type, buffer[:datalen]
+            if read_chunks is not None:
+                remaining = datalen - len(buffer)
+                chunks = read_chunks(-(-remaining // (REPLEN - 1)))
+            else:
+                chunks = [self.handle.read_chunk()]
+            for chunk in chunks:
+                buffer += self.parse_next(chunk)
+
+        # Drop the report padding in place instead of copying the message
+        del buffer[datalen:]
+        return msg_type, buffer
 
     def read_first(self) -> Tuple[int, int, bytes]:
-        chunk = self.handle.read_chunk()
-        if chunk[:3] != b"?##":
-            raise RuntimeError("Unexpected magic characters")
-        try:
-            msg_type, datalen = struct.unpack(">HL", chunk[3 : 3 + self.HEADER_LEN])
-        except Exception:
-            raise RuntimeError("Cannot parse header")
-
-        data = chunk[3 + self.HEADER_LEN :]
-        return msg_type, datalen, data
+        return self.parse_first(self.handle.read_chunk())
 
     def read_next(self) -> bytes:
-        chunk = self.handle.read_chunk()
-        if chunk[:1] != b"?":
-            raise RuntimeError("Unexpected magic characters")
-        return chunk[1:]
+        return self.parse_next(self.handle.read_chunk())
@@ -15,9 +15,11 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import logging
+import os
+import selectors
 import socket
 import time
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from ..log import DUMP_PACKETS
 from . import TransportException
@@ -27,6 +29,8 @@ if TYPE_CHECKING:
     from ..models import TrezorModel
 
 SOCKET_TIMEOUT = 10
+# Seconds to wait for PONGPONG replies when scanning for emulators
+SCAN_TIMEOUT = 0.5
 
 LOG = logging.getLogger(__name__)
 
@@ -37,6 +41,7 @@ class UdpTransport(ProtocolBasedTransport):
     DEFAULT_PORT = 54935
     PATH_PREFIX = "udp"
     ENABLED = True
+    ENUMERATE_TIMEOUT = 2 * SCAN_TIMEOUT
 
     def __init__(self, device: Optional[str] = None) -> None:
         if not device:
@@ -54,6 +59,9 @@ class UdpTransport(ProtocolBasedTransport):
     def get_path(self) -> str:
         return "{}:{}:{}".format(self.PATH_PREFIX, *self.device)
 
+    def clone(self) -> "UdpTransport":
+        return UdpTransport("{}:{}".format(*self.device))
+
     def find_debug(self) -> "UdpTransport":
         host, port = self.device
         return UdpTransport(f"{host}:{port + 1}")
@@ -72,15 +80,90 @@ class UdpTransport(ProtocolBasedTransport):
         finally:
             d.close()
 
+    @classmethod
+    def scan(
+        cls,
+        ports: Iterable[int],
+        host: str = DEFAULT_HOST,
+        timeout: float = SCAN_TIMEOUT,
+        skip_debug: bool = True,
+    ) -> List["UdpTransport"]:
+        """Find emulators listening on any of `ports` on `host`.
+
+        All ports are pinged at once and replies are collected until every port has
+        answered or refused, or `timeout` seconds elapse.
+
+        Every emulator interface answers pings, including the debug link on
+        `port + 1`. With `skip_debug`, a port is not reported when the port right
+        below it is.
+        """
+        ports = sorted(set(ports))
+        found = set()
+        selector = selectors.DefaultSelector()
+        sockets = []
+        try:
+            for port in ports:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sockets.append(sock)
+                sock.setblocking(False)
+                try:
+                    # connected, so that a closed port is reported as refused
+                    sock.connect((host, port))
+                    sock.send(b"PINGPING")
+                except OSError:
+                    continue
+                selector.register(sock, selectors.EVENT_READ, port)
+
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    selector.unregister(key.fileobj)
+                    try:
+                        resp = key.fileobj.recv(8)  # type: ignore [union-attr]
+                    except OSError:
+                        continue
+                    if resp == b"PONGPONG":
+                        found.add(key.data)
+        finally:
+            selector.close()
+            for sock in sockets:
+                sock.close()
+
+        result = []
+        for port in ports:
+            if port not in found:
+                continue
+            if skip_debug and port - 1 in found:
+                # debug link of the emulator on `port - 1`, don't report it
+                found.discard(port)
+                continue
+            result.append(cls(f"{host}:{port}"))
+        return result
+
+    @staticmethod
+    def scan_ports() -> List[int]:
+        """Ports to enumerate, from `TREZOR_UDP_PORTS` or the default port.
+
+        The variable holds comma-separated ports and inclusive ranges, e.g.
+        `21324,21330-21350`.
+        """
+        spec = os.getenv("TREZOR_UDP_PORTS")
+        if not spec:
+            return [UdpTransport.DEFAULT_PORT]
+        ports = []
+        for part in spec.split(","):
+            first, _, last = part.strip().partition("-")
+            ports.extend(range(int(first), int(last or first) + 1))
+        return ports
+
     @classmethod
     def enumerate(
         cls, _models: Optional[Iterable["TrezorModel"]] = None
     ) -> Iterable["UdpTransport"]:
-        default_path = f"{cls.DEFAULT_HOST}:{cls.DEFAULT_PORT}"
-        try:
-            return [cls._try_path(default_path)]
-        except TransportException:
-            return []
+        return cls.scan(cls.scan_ports())
 
     @classmethod
     def find_by_path(cls, path: str, prefix_search: bool = False) -> "UdpTransport":
@@ -133,6 +216,11 @@ class UdpTransport(ProtocolBasedTransport):
         LOG.log(DUMP_PACKETS, f"sending packet: {chunk.hex()}")
         self.socket.sendall(chunk)
 
+    def write_chunks(self, chunks: Iterable[bytes]) -> None:
+        # sockets accept memoryviews, so the chunks are sent without copying
+        for chunk in chunks:
+            self.write_chunk(chunk)
+
     def read_chunk(self) -> bytes:
         assert self.socket is not None
         while True:
@@ -153,6 +153,9 @@ class WebUsbTransport(ProtocolBasedTransport):
                     handle.close()
         return devices
 
+    def clone(self) -> "WebUsbTransport":
+        return WebUsbTransport(self.device, debug=self.debug)
+
     def find_debug(self) -> "WebUsbTransport":
         # For v1 protocol, find debug USB interface for the same serial number
         return WebUsbTransport(self.device, debug=True)
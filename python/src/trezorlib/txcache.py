@@ -0,0 +1,168 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Persistent cache of previous transactions for `btc.sign_tx`.
+
+Transactions are stored in a single SQLite file, indexed by coin and transaction
+hash, as already serialized `TransactionType` protobuf messages. Lookups are a
+single primary-key query followed by a protobuf decode, with no JSON parsing.
+Recently used transactions are additionally kept decoded in memory.
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Type, Union
+
+from . import messages, protobuf
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS txes (
+    coin TEXT NOT NULL,
+    txhash BLOB NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (coin, txhash)
+) WITHOUT ROWID
+"""
+
+
+def _coin_slug(coin_name: str) -> str:
+    return coin_name.lower().replace(" ", "_")
+
+
+class TxCache:
+    """Previous transactions of a single coin, backed by a SQLite file.
+
+    Implements the `btc.TxCacheType` protocol, so an instance can be passed as
+    `prev_txes` to `btc.sign_tx` or `btc.SignTxDriver`.
+
+    Decoded transactions are kept in an LRU of `lru_size` entries and the same
+    object is returned for repeated lookups, so callers must not modify it. With
+    `compact=True`, transactions are decoded into compact message types (see
+    `protobuf.compact_type`).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        coin_name: str,
+        lru_size: int = 1024,
+        compact: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.slug = _coin_slug(coin_name)
+        self.lru_size = lru_size
+        self.tx_type: Type[messages.TransactionType] = messages.TransactionType
+        if compact:
+            self.tx_type = protobuf.compact_type(messages.TransactionType)
+        self._lru: "OrderedDict[bytes, messages.TransactionType]" = OrderedDict()
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute(SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "TxCache":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _load(self, key: bytes) -> Optional[bytes]:
+        row = self._db.execute(
+            "SELECT data FROM txes WHERE coin = ? AND txhash = ?", (self.slug, key)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def get_tx(self, key: bytes) -> Optional[messages.TransactionType]:
+        tx = self._lru.get(key)
+        if tx is not None:
+            self._lru.move_to_end(key)
+            return tx
+
+        data = self._load(key)
+        if data is None:
+            return None
+        tx = protobuf.decode_message(data, self.tx_type)
+        self._lru[key] = tx
+        if len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+        return tx
+
+    def __getitem__(self, key: bytes) -> messages.TransactionType:
+        tx = self.get_tx(key)
+        if tx is None:
+            raise KeyError(f"cache miss for {self.slug} tx {key.hex()}")
+        return tx
+
+    def __contains__(self, key: bytes) -> bool:
+        if key in self._lru:
+            return True
+        row = self._db.execute(
+            "SELECT 1 FROM txes WHERE coin = ? AND txhash = ?", (self.slug, key)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        (count,) = self._db.execute(
+            "SELECT COUNT(*) FROM txes WHERE coin = ?", (self.slug,)
+        ).fetchone()
+        return count
+
+    def add_many(self, txes: Iterable[Tuple[bytes, messages.TransactionType]]) -> int:
+        """Store transactions in a single database transaction.
+
+        Returns the number of stored transactions.
+        """
+        rows = ((self.slug, txhash, protobuf.encode_message(tx)) for txhash, tx in txes)
+        with self._db:
+            cursor = self._db.executemany(
+                "INSERT OR REPLACE INTO txes (coin, txhash, data) VALUES (?, ?, ?)",
+                rows,
+            )
+        self._lru.clear()
+        return cursor.rowcount
+
+    def add(self, txhash: bytes, tx: messages.TransactionType) -> None:
+        self.add_many([(txhash, tx)])
+
+    def import_json(self, directory: Union[str, Path]) -> int:
+        """Import a directory of `<txhash>.json` files in the `tests/txcache` format.
+
+        Returns the number of imported transactions.
+        """
+
+        def load_all() -> Iterable[Tuple[bytes, messages.TransactionType]]:
+            for json_file in sorted(Path(directory).glob("*.json")):
+                txdict = json.loads(json_file.read_text())
+                tx = protobuf.dict_to_proto(messages.TransactionType, txdict)
+                yield bytes.fromhex(json_file.stem), tx
+
+        return self.add_many(load_all())
+
+
+def import_json_tree(path: Union[str, Path], root: Union[str, Path]) -> int:
+    """Import a `tests/txcache`-style tree with one subdirectory per coin.
+
+    Returns the total number of imported transactions.
+    """
+    total = 0
+    for coin_dir in sorted(Path(root).iterdir()):
+        if coin_dir.is_dir():
+            with TxCache(path, coin_dir.name) as cache:
+                total += cache.import_json(coin_dir)
+    return total
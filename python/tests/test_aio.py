@@ -0,0 +1,319 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import asyncio
+import json
+import struct
+
+import pytest
+
+from trezorlib import exceptions, mapping, messages
+from trezorlib.aio_client import AsyncTrezorClient
+from trezorlib.transport import TransportException
+from trezorlib.transport.aio import (
+    AsyncBridgeTransport,
+    AsyncUdpTransport,
+    call_bridge,
+)
+from trezorlib.transport.protocol import REPLEN, ProtocolV1
+
+FEATURES = messages.Features(
+    vendor="trezor.io",
+    model="T",
+    major_version=2,
+    minor_version=5,
+    patch_version=3,
+    device_id="FAKE",
+    capabilities=[messages.Capability.PassphraseEntry],
+)
+
+
+class FakeDevice:
+    """Message-level model of a device, enough for the client callback flow."""
+
+    def __init__(self, name: str, pin: str = "1234") -> None:
+        self.name = name
+        self.pin = pin
+        self.pending = None
+
+    def handle(self, msg):
+        if isinstance(msg, (messages.Initialize, messages.GetFeatures)):
+            features = FEATURES.__class__(**FEATURES.__dict__)
+            features.device_id = self.name
+            return features
+        if isinstance(msg, messages.Ping):
+            if msg.message == "pin":
+                self.pending = msg
+                return messages.PinMatrixRequest(
+                    type=messages.PinMatrixRequestType.Current
+                )
+            if msg.message == "passphrase":
+                self.pending = msg
+                return messages.PassphraseRequest()
+            if msg.button_protection:
+                self.pending = msg
+                return messages.ButtonRequest(
+                    code=messages.ButtonRequestType.ProtectCall
+                )
+            return messages.Success(message=f"{self.name}: {msg.message}")
+        if isinstance(msg, messages.PinMatrixAck):
+            if msg.pin != self.pin:
+                return messages.Failure(code=messages.FailureType.PinInvalid)
+            return messages.Success(message=f"{self.name}: {self.pending.message}")
+        if isinstance(msg, messages.PassphraseAck):
+            return messages.Success(message=f"{self.name}: {msg.passphrase}")
+        if isinstance(msg, messages.ButtonAck):
+            return messages.Success(message=f"{self.name}: {self.pending.message}")
+        if isinstance(msg, messages.Cancel):
+            return messages.Failure(code=messages.FailureType.ActionCancelled)
+        return messages.Failure(code=messages.FailureType.UnexpectedMessage)
+
+    def handle_raw(self, msg_type: int, data: bytes):
+        msg = mapping.DEFAULT_MAPPING.decode(msg_type, data)
+        return mapping.DEFAULT_MAPPING.encode(self.handle(msg))
+
+
+class FakeUdpEmulator(asyncio.DatagramProtocol):
+    def __init__(self, device: FakeDevice) -> None:
+        self.device = device
+        self.buffer = bytearray()
+        self.header = None
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if data == b"PINGPING":
+            self.transport.sendto(b"PONGPONG", addr)
+            return
+        if self.header is None:
+            msg_type, datalen, chunk = ProtocolV1.parse_first(data)
+            self.header = msg_type, datalen
+        else:
+            chunk = ProtocolV1.parse_next(data)
+        self.buffer += chunk
+        msg_type, datalen = self.header
+        if len(self.buffer) < datalen:
+            return
+
+        resp_type, resp_data = self.device.handle_raw(
+            msg_type, bytes(self.buffer[:datalen])
+        )
+        self.buffer.clear()
+        self.header = None
+        reports = ProtocolV1.pack_reports(resp_type, resp_data)
+        for offset in range(0, len(reports), REPLEN):
+            self.transport.sendto(bytes(reports[offset : offset + REPLEN]), addr)
+
+
+async def start_udp_emulator(name: str):
+    loop = asyncio.get_event_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: FakeUdpEmulator(FakeDevice(name)), local_addr=("127.0.0.1", 0)
+    )
+    host, port = transport.get_extra_info("sockname")
+    return transport, f"{host}:{port}"
+
+
+class RecordingUI:
+    def __init__(self, pin: str = "1234", passphrase: str = "secret") -> None:
+        self.pin = pin
+        self.passphrase = passphrase
+        self.buttons = []
+
+    async def button_request(self, br: messages.ButtonRequest) -> None:
+        await asyncio.sleep(0)
+        self.buttons.append(br.code)
+
+    async def get_pin(self, code=None) -> str:
+        return self.pin
+
+    def get_passphrase(self, available_on_device: bool) -> str:
+        # a plain (blocking) callback works too
+        return self.passphrase
+
+
+def test_udp_roundtrip_large_message():
+    async def run():
+        server, path = await start_udp_emulator("large")
+        try:
+            transport = AsyncUdpTransport(path)
+            await transport.begin_session()
+            # spans many reports in both directions
+            ping = messages.Ping(message="x" * 10000)
+            await transport.write(*mapping.DEFAULT_MAPPING.encode(ping))
+            msg_type, resp = await asyncio.wait_for(transport.read(), 5)
+            await transport.end_session()
+        finally:
+            server.close()
+        return mapping.DEFAULT_MAPPING.decode(msg_type, resp)
+
+    resp = asyncio.run(run())
+    assert resp.message == "large: " + "x" * 10000
+
+
+def test_udp_find_by_path():
+    async def run():
+        server, path = await start_udp_emulator("found")
+        try:
+            found = await AsyncUdpTransport.find_by_path(f"udp:{path}")
+            assert found.get_path() == f"udp:{path}"
+        finally:
+            server.close()
+
+        # nothing listens there anymore
+        with pytest.raises(TransportException):
+            await AsyncUdpTransport.find_by_path(path)
+
+    asyncio.run(run())
+
+
+def test_client_callbacks():
+    async def run():
+        server, path = await start_udp_emulator("dev")
+        ui = RecordingUI()
+        try:
+            client = await AsyncTrezorClient.connect(AsyncUdpTransport(path), ui)
+            assert client.features.device_id == "dev"
+            assert client.get_device_id() == "dev"
+            assert await client.ping("hello") == "dev: hello"
+            assert await client.ping("button", button_protection=True) == (
+                "dev: button"
+            )
+            assert ui.buttons == [messages.ButtonRequestType.ProtectCall]
+            resp = await client.call(messages.Ping(message="pin"))
+            assert resp.message == "dev: pin"
+            resp = await client.call(messages.Ping(message="passphrase"))
+            assert resp.message == "dev: secret"
+
+            ui.pin = "0000"
+            with pytest.raises(exceptions.PinException):
+                await client.call(messages.Ping(message="pin"))
+            with pytest.raises(exceptions.Cancelled):
+                await client.call(messages.Cancel())
+            assert client.session_counter == 0
+        finally:
+            server.close()
+
+    asyncio.run(run())
+
+
+def test_multiple_devices_one_loop():
+    async def run():
+        servers = [await start_udp_emulator(f"dev{i}") for i in range(8)]
+        try:
+            clients = await asyncio.gather(
+                *(
+                    AsyncTrezorClient.connect(AsyncUdpTransport(path), RecordingUI())
+                    for _, path in servers
+                )
+            )
+            # many concurrent calls, several per device
+            results = await asyncio.gather(
+                *(
+                    client.ping(f"msg{n}", button_protection=True)
+                    for client in clients
+                    for n in range(5)
+                )
+            )
+        finally:
+            for server, _ in servers:
+                server.close()
+        return results
+
+    results = asyncio.run(run())
+    assert results == [f"dev{i}: msg{n}" for i in range(8) for n in range(5)]
+
+
+class FakeBridge:
+    """trezord HTTP API for one fake device, responses chunk-encoded."""
+
+    def __init__(self, device: FakeDevice) -> None:
+        self.device = device
+        self.session = None
+        self.pending = []
+
+    def respond(self, path: str, body: bytes):
+        parts = path.strip("/").split("/")
+        if parts[0] == "configure":
+            return 200, {"version": "2.0.27"}
+        if parts[0] == "enumerate":
+            return 200, [{"path": "1", "session": self.session}]
+        if parts[0] == "acquire":
+            if parts[2] != (self.session or "null"):
+                return 400, {"error": "wrong previous session"}
+            self.session = "42"
+            return 200, {"session": self.session}
+        if parts[-1] != self.session:
+            return 400, {"error": "session not found"}
+        if parts[0] == "release":
+            self.session = None
+            return 200, {}
+        if parts[0] == "post":
+            data = bytes.fromhex(body.decode())
+            msg_type, datalen = struct.unpack(">HL", data[:6])
+            self.pending.append(self.device.handle_raw(msg_type, data[6:]))
+            return 200, ""
+        if parts[0] == "read":
+            msg_type, data = self.pending.pop(0)
+            return 200, (struct.pack(">HL", msg_type, len(data)) + data).hex()
+        return 404, {"error": "not found"}
+
+    async def serve(self, reader, writer) -> None:
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode().split("\r\n")
+        path = lines[0].split()[1]
+        length = 0
+        for line in lines[1:]:
+            if line.lower().startswith("content-length:"):
+                length = int(line.split(":")[1])
+        body = await reader.readexactly(length)
+        status, payload = self.respond(path, body)
+        if not isinstance(payload, str):
+            payload = json.dumps(payload)
+        payload = payload.encode()
+        chunks = b"".join(
+            b"%x\r\n%s\r\n" % (len(payload[i : i + 100]), payload[i : i + 100])
+            for i in range(0, len(payload), 100)
+        )
+        writer.write(
+            b"HTTP/1.1 %d X\r\nTransfer-Encoding: chunked\r\n\r\n%s0\r\n\r\n"
+            % (status, chunks)
+        )
+        await writer.drain()
+        writer.close()
+
+
+def test_bridge_client():
+    async def run():
+        bridge = FakeBridge(FakeDevice("bridged"))
+        server = await asyncio.start_server(bridge.serve, "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        url = f"http://{host}:{port}"
+        try:
+            (transport,) = await AsyncBridgeTransport.enumerate(host=url)
+            assert transport.get_path() == "bridge:1"
+            client = await AsyncTrezorClient.connect(transport, RecordingUI())
+            assert await client.ping("x" * 500) == "bridged: " + "x" * 500
+            assert bridge.session is None
+
+            with pytest.raises(exceptions.TrezorException) as e:
+                await call_bridge("read/7", host=url)
+            assert e.value.message == "session not found"
+        finally:
+            server.close()
+
+    asyncio.run(run())
@@ -14,10 +14,14 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import io
 import json
 from decimal import Decimal
 
-from trezorlib import btc
+import pytest
+
+from trezorlib import btc, exceptions, messages
+from trezorlib.mapping import DEFAULT_MAPPING
 
 
 # https://btc1.trezor.io/api/tx-specific/f5e735549daeb480d4348f2574b8967a4f149715edb220a742d8bb654d668348
@@ -235,3 +239,180 @@ def test_coinbase_from_json():
     assert coinbase.prev_hash == b"\x00" * 32
     assert coinbase.prev_index == 2 ** 32 - 1
     assert coinbase.script_sig.hex() == tx_dict["vin"][0]["coinbase"]
+
+
+PREV_HASH = bytes.fromhex(
+    "f5e735549daeb480d4348f2574b8967a4f149715edb220a742d8bb654d668348"
+)
+R = messages.RequestType
+
+
+class CountingTxCache(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loads = 0
+
+    def __getitem__(self, key):
+        self.loads += 1
+        return super().__getitem__(key)
+
+
+class FakeSigningClient:
+    """Replays a fixed sequence of TxRequests and records the replies."""
+
+    mapping = DEFAULT_MAPPING
+
+    def __init__(self, requests):
+        self.requests = iter(requests)
+        self.replies = []
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def call(self, msg, encoded=None):
+        if encoded is not None:
+            assert encoded == self.mapping.encode(msg)
+        self.replies.append(msg)
+        return next(self.requests)
+
+
+def tx_request(request_type, index=None, tx_hash=None, signature=None):
+    serialized = None
+    if signature is not None:
+        serialized = messages.TxRequestSerializedType(
+            signature_index=0, signature=signature, serialized_tx=b"\x01\x02"
+        )
+    return messages.TxRequest(
+        request_type=request_type,
+        details=messages.TxRequestDetailsType(request_index=index, tx_hash=tx_hash),
+        serialized=serialized,
+    )
+
+
+def signing_requests():
+    return [
+        tx_request(R.TXINPUT, 0),
+        tx_request(R.TXMETA, tx_hash=PREV_HASH),
+        tx_request(R.TXINPUT, 1, tx_hash=PREV_HASH),
+        tx_request(R.TXOUTPUT, 0, tx_hash=PREV_HASH),
+        tx_request(R.TXINPUT, 0),
+        tx_request(R.TXOUTPUT, 0),
+        tx_request(R.TXFINISHED, signature=b"\x30" * 70),
+    ]
+
+
+def test_sign_tx_driver():
+    prev_tx = btc.from_json(json.loads(TX_JSON_BIG, parse_float=Decimal))
+    prev_txes = CountingTxCache({PREV_HASH: prev_tx})
+    inputs = [
+        messages.TxInputType(
+            address_n=[0x8000002C, 0x80000000, 0x80000000, 0, 0],
+            prev_hash=PREV_HASH,
+            prev_index=0,
+            amount=1000,
+        )
+    ]
+    outputs = [
+        messages.TxOutputType(
+            address_n=[0x8000002C, 0x80000000, 0x80000000, 1, 0], amount=900
+        )
+    ]
+
+    driver = btc.SignTxDriver(prev_txes)
+    for _ in range(2):
+        client = FakeSigningClient(signing_requests())
+        signatures, serialized = driver.sign_tx(client, "Bitcoin", inputs, outputs)
+        assert signatures == [b"\x30" * 70]
+        assert serialized == b"\x01\x02"
+
+        signtx, *acks = client.replies
+        assert signtx.inputs_count == 1 and signtx.outputs_count == 1
+        assert acks[0].tx.inputs == inputs
+        assert acks[1].tx.inputs_cnt == len(prev_tx.inputs)
+        assert acks[1].tx.outputs_cnt == len(prev_tx.bin_outputs)
+        assert acks[1].tx.inputs == [] and acks[1].tx.bin_outputs == []
+        assert acks[2].tx.inputs == [prev_tx.inputs[1]]
+        assert acks[3].tx.bin_outputs == [prev_tx.bin_outputs[0]]
+        assert acks[4].tx.inputs == inputs
+        assert acks[5].tx.outputs == outputs
+
+        assert set(driver.timings) == {"prepare", "prev_txes", "device", "total"}
+
+    # the previous transaction was loaded once for both calls
+    assert prev_txes.loads == 1
+
+
+P = messages.PsbtRequestType
+
+PSBT_GLOBAL_MAP = bytes.fromhex("0100" "0a" + "02" * 10 + "00")
+PSBT_INPUT_MAPS = [
+    bytes.fromhex("0101" "04" "01020304" "00"),
+    bytes.fromhex("0101" "04" "05060708" "0113" "02" "eeee" "00"),
+]
+PSBT_OUTPUT_MAP = bytes.fromhex("00")
+
+
+def test_sign_taproot_streamed():
+    psbt = b"psbt\xff" + PSBT_GLOBAL_MAP + b"".join(PSBT_INPUT_MAPS) + PSBT_OUTPUT_MAP
+    script_sig_key = b"\x14" + b"\x11" * 64
+    requests = [
+        messages.PsbtRequest(request_type=P.PSBT_GLOBAL),
+        messages.PsbtRequest(request_type=P.PSBT_INPUT, request_index=0),
+        messages.PsbtRequest(request_type=P.PSBT_INPUT, request_index=1),
+        messages.PsbtRequest(request_type=P.PSBT_OUTPUT, request_index=0),
+        messages.PsbtRequest(
+            request_type=P.PSBT_SIGNATURE,
+            request_index=0,
+            record=messages.PsbtRecord(key=script_sig_key, value=b"\x01" * 64),
+        ),
+        messages.PsbtRequest(
+            request_type=P.PSBT_SIGNATURE,
+            request_index=1,
+            record=messages.PsbtRecord(key=b"\x13", value=b"\x02" * 64),
+        ),
+        messages.PsbtRequest(request_type=P.PSBT_FINISHED),
+    ]
+    client = FakeSigningClient(requests)
+    f = io.BytesIO(b"prefix" + psbt)
+    f.seek(6)
+    signed = btc.sign_taproot(client, "Bitcoin", f)
+
+    sign, *acks = client.replies
+    assert sign.psbt is None
+    assert [ack.map for ack in acks] == [
+        b"psbt\xff" + PSBT_GLOBAL_MAP,
+        *PSBT_INPUT_MAPS,
+        PSBT_OUTPUT_MAP,
+        None,
+        None,
+    ]
+    # the signatures are added to the input maps, replacing the old ones
+    assert signed == (
+        b"psbt\xff"
+        + PSBT_GLOBAL_MAP
+        + PSBT_INPUT_MAPS[0][:-1]
+        + b"\x41"
+        + script_sig_key
+        + b"\x40"
+        + b"\x01" * 64
+        + b"\x00"
+        + PSBT_INPUT_MAPS[1][:7]
+        + b"\x01\x13\x40"
+        + b"\x02" * 64
+        + b"\x00"
+        + PSBT_OUTPUT_MAP
+    )
+
+
+def test_sign_taproot_streamed_order():
+    psbt = b"psbt\xff" + PSBT_GLOBAL_MAP + b"".join(PSBT_INPUT_MAPS) + PSBT_OUTPUT_MAP
+    requests = [
+        messages.PsbtRequest(request_type=P.PSBT_GLOBAL),
+        messages.PsbtRequest(request_type=P.PSBT_INPUT, request_index=1),
+    ]
+    client = FakeSigningClient(requests)
+    with pytest.raises(exceptions.TrezorException):
+        btc.sign_taproot(client, "Bitcoin", io.BytesIO(psbt))
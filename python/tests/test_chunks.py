@@ -0,0 +1,189 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import io
+
+import pytest
+
+from trezorlib import chunks, ethereum_onekey, exceptions, messages
+from trezorlib.debuglink import TrezorClientDebugLink
+from trezorlib.mapping import DEFAULT_MAPPING
+
+PAYLOAD = bytes(range(256)) * 20
+
+
+def pieces(data, size):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+class FakeChunkClient:
+    """Asks for the payload in chunks of the given lengths and records the acks."""
+
+    mapping = DEFAULT_MAPPING
+
+    def __init__(self, lengths, last, request_type=messages.EthereumTxRequest):
+        self.responses = iter([request_type(data_length=n) for n in lengths] + [last])
+        self.calls = []
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def call(self, msg, encoded=None):
+        if encoded is not None:
+            assert encoded == self.mapping.encode(msg)
+        self.calls.append(msg)
+        return next(self.responses)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    (
+        lambda: PAYLOAD,
+        lambda: bytearray(PAYLOAD),
+        lambda: io.BytesIO(PAYLOAD),
+        lambda: chunks.ChunkReader(pieces(PAYLOAD, 100), len(PAYLOAD)),
+    ),
+)
+def test_iter_chunks(payload):
+    result = [bytes(c) for c in chunks.iter_chunks(payload(), 1024)]
+    assert [len(c) for c in result] == [1024] * 5
+    assert b"".join(result) == PAYLOAD
+
+
+def test_reader_file_from_position():
+    f = io.BytesIO(PAYLOAD)
+    f.seek(1000)
+    reader = chunks.ChunkReader(f)
+    assert reader.length == len(PAYLOAD) - 1000
+    assert reader.read(10) == PAYLOAD[1000:1010]
+
+
+def test_reader_errors():
+    with pytest.raises(ValueError):
+        chunks.ChunkReader(pieces(PAYLOAD, 100))
+    reader = chunks.ChunkReader(pieces(PAYLOAD, 100), len(PAYLOAD) + 1)
+    with pytest.raises(ValueError):
+        reader.read(len(PAYLOAD) + 1)
+
+
+def test_send_chunks():
+    last = messages.EthereumTxRequest(signature_v=1)
+    lengths = [1024, 1024, 500, 1024, 1024, 1024]
+    client = FakeChunkClient(lengths, last)
+    reader = chunks.ChunkReader(io.BytesIO(PAYLOAD))
+    msg = messages.EthereumSignTx(gas_price=b"", gas_limit=b"", chain_id=1)
+    resp = chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.EthereumTxRequest,
+        lambda chunk: messages.EthereumTxAck(data_chunk=chunk),
+    )
+    assert resp is last
+    assert client.calls[0] is msg
+    acks = [bytes(ack.data_chunk) for ack in client.calls[1:]]
+    assert [len(a) for a in acks] == [1024, 1024, 500, 1024, 1024, 524]
+    assert b"".join(acks) == PAYLOAD
+
+
+def test_send_chunks_unexpected():
+    client = FakeChunkClient([1024], messages.Success())
+    with pytest.raises(exceptions.TrezorException):
+        chunks.send_chunks(
+            client,
+            messages.EthereumSignTx(gas_price=b"", gas_limit=b"", chain_id=1),
+            chunks.ChunkReader(PAYLOAD),
+            messages.EthereumTxRequest,
+            lambda chunk: messages.EthereumTxAck(data_chunk=chunk),
+        )
+
+
+def test_ethereum_sign_tx_file():
+    last = messages.EthereumTxRequestOneKey(
+        signature_v=37, signature_r=b"\x01" * 32, signature_s=b"\x02" * 32
+    )
+    client = FakeChunkClient([1024] * 4, last, messages.EthereumTxRequestOneKey)
+    sig = ethereum_onekey.sign_tx(
+        client,
+        n=[0x8000002C, 0x8000003C, 0x80000000, 0, 0],
+        nonce=0,
+        gas_price=20,
+        gas_limit=21000,
+        to="0x1d1c328764a41bda0492b66baa30c4a339ff85ef",
+        value=0,
+        data=io.BytesIO(PAYLOAD),
+        chain_id=1,
+    )
+    assert sig == (37, b"\x01" * 32, b"\x02" * 32)
+    sent = client.calls[0].data_initial_chunk + b"".join(
+        ack.data_chunk for ack in client.calls[1:]
+    )
+    assert client.calls[0].data_length == len(PAYLOAD)
+    assert sent == PAYLOAD
+
+
+class FilteringChunkClient(FakeChunkClient):
+    """Applies message filters to the sent messages, like TrezorClientDebugLink."""
+
+    def __init__(self, filters, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.filters = filters
+
+    def call(self, msg, encoded=None):
+        filtered = TrezorClientDebugLink._filter_message(self, msg)
+        return super().call(filtered, None if filtered is not msg else encoded)
+
+
+def test_filter_chunked_ack():
+    def flip_first_byte(msg):
+        msg.data_chunk = bytes([msg.data_chunk[0] ^ 0xFF]) + msg.data_chunk[1:]
+        return msg
+
+    def shorten_initial_chunk(msg):
+        msg.data_initial_chunk = msg.data_initial_chunk[:-1]
+        return msg
+
+    last = messages.EthereumTxRequestOneKey(
+        signature_v=37, signature_r=b"\x01" * 32, signature_s=b"\x02" * 32
+    )
+    client = FilteringChunkClient(
+        {
+            messages.EthereumTxAckOneKey: flip_first_byte,
+            messages.EthereumSignTxOneKey: shorten_initial_chunk,
+        },
+        [1024] * 4,
+        last,
+        messages.EthereumTxRequestOneKey,
+    )
+    ethereum_onekey.sign_tx(
+        client,
+        n=[0x8000002C, 0x8000003C, 0x80000000, 0, 0],
+        nonce=0,
+        gas_price=20,
+        gas_limit=21000,
+        to="0x1d1c328764a41bda0492b66baa30c4a339ff85ef",
+        value=0,
+        data=PAYLOAD,
+        chain_id=1,
+    )
+    assert client.calls[0].data_initial_chunk == PAYLOAD[: 1024 - 1]
+    for i, ack in enumerate(client.calls[1:], 1):
+        chunk = PAYLOAD[i * 1024 : (i + 1) * 1024]
+        assert ack.data_chunk == bytes([chunk[0] ^ 0xFF]) + chunk[1:]
@@ -15,10 +15,11 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import hashlib
+import random
 
 import pytest
 
-from trezorlib import _ed25519, cosi
+from trezorlib import _ed25519, _ed25519_fast, cosi
 
 RFC8032_VECTORS = (
     (  # test 1
@@ -199,3 +200,171 @@ def test_m_of_n():
         # wrong sigmask
         cosi.verify(global_sig, message, 3, pubkeys, 7)
     assert "signature does not pass verification" in e.value.args[0]
+
+
+def _outcome(fn, *args):
+    try:
+        fn(*args)
+    except Exception as e:
+        return type(e)
+    return None
+
+
+def test_fast_matches_reference():
+    rng = random.Random(25519)
+    for _ in range(4):
+        privkey = bytes(rng.getrandbits(8) for _ in range(32))
+        message = bytes(rng.getrandbits(8) for _ in range(rng.randrange(100)))
+        pubkey = _ed25519.publickey_unsafe(privkey)
+        signature = _ed25519.signature_unsafe(message, privkey, pubkey)
+
+        a = _ed25519.decodecoord(_ed25519.H(privkey))
+        assert _ed25519_fast.encodepoint(_ed25519_fast.scalarmult_B(a)) == pubkey
+        P = _ed25519.decodepoint(pubkey)
+        e = rng.getrandbits(512)
+        assert _ed25519_fast.encodepoint(
+            _ed25519_fast.scalarmult(P, e)
+        ) == _ed25519.encodepoint(_ed25519.scalarmult(P, e))
+
+        candidates = [
+            (signature, message, pubkey),
+            (signature, message + b"!", pubkey),
+            # S >= l is accepted by the textbook implementation
+            (
+                signature[:32]
+                + _ed25519.encodeint(_ed25519.decodeint(signature[32:]) + _ed25519.l),
+                message,
+                pubkey,
+            ),
+        ]
+        for _ in range(16):
+            mangled = bytearray(signature)
+            mangled[rng.randrange(64)] ^= 1 << rng.randrange(8)
+            candidates.append((bytes(mangled), message, pubkey))
+        for candidate in candidates:
+            assert _outcome(_ed25519_fast.checkvalid, *candidate) == _outcome(
+                _ed25519.checkvalid, *candidate
+            )
+
+
+def test_fast_small_order_points():
+    identity = _ed25519.encodepoint(_ed25519.ident)
+    # a point of order 2
+    order_2 = _ed25519.encodeint(_ed25519.q - 1)
+    for pubkey in (identity, order_2):
+        for R in (identity, order_2):
+            for S in (0, 1, _ed25519.l):
+                candidate = (R + _ed25519.encodeint(S), b"msg", pubkey)
+                assert _outcome(_ed25519_fast.checkvalid, *candidate) == _outcome(
+                    _ed25519.checkvalid, *candidate
+                )
+
+
+def test_verify_combined_batch():
+    items = [
+        (signature, message, pubkey)
+        for _, pubkey, message, signature in RFC8032_VECTORS
+    ]
+    cosi.verify_combined_batch(items)
+
+    signature, message, pubkey = items[2]
+    items[2] = (signature, message + b"!", pubkey)
+    with pytest.raises(_ed25519.SignatureMismatch) as e:
+        cosi.verify_combined_batch(items)
+    assert "signature 2 " in e.value.args[0]
+
+    items[2] = (signature[:32] + b"\xff" * 32, message, pubkey)
+    with pytest.raises(_ed25519.SignatureMismatch) as e:
+        cosi.verify_combined_batch(items)
+    assert "signature 2 " in e.value.args[0]
+
+    items[2] = (signature, message, b"\x02" + b"\x00" * 31)
+    with pytest.raises(ValueError) as e:
+        cosi.verify_combined_batch(items)
+    assert "signature 2: " in e.value.args[0]
+
+
+def test_verify_combined_batch_small_order():
+    # S * B == 8 * (R + h * A), but S * B != R + h * A
+    identity = _ed25519.encodepoint(_ed25519.ident)
+    order_2 = _ed25519.encodeint(_ed25519.q - 1)
+    item = (order_2 + _ed25519.encodeint(0), b"msg", identity)
+    with pytest.raises(_ed25519.SignatureMismatch):
+        cosi.verify_combined(*item)
+    with pytest.raises(_ed25519.SignatureMismatch):
+        cosi.verify_combined_batch([item])
+
+
+def test_verify_batch():
+    privkeys, pubkeys, _, _ = zip(*RFC8032_VECTORS)
+    checks = []
+    for signer_ids in ((0,), (1, 2), (0, 2, 3)):
+        message = hashlib.sha512(bytes(signer_ids)).digest()
+        signers = [privkeys[i] for i in signer_ids]
+        nonces, commits = zip(*(cosi.get_nonce(pk, message) for pk in signers))
+        global_pk = cosi.combine_keys([pubkeys[i] for i in signer_ids])
+        global_commit = cosi.combine_keys(commits)
+        signatures = [
+            cosi.sign_with_privkey(message, privkey, global_pk, nonce, global_commit)
+            for privkey, nonce in zip(signers, nonces)
+        ]
+        global_sig = cosi.combine_sig(global_commit, signatures)
+        sigmask = sum(1 << i for i in signer_ids)
+        checks.append((global_sig, message, len(signer_ids), pubkeys, sigmask))
+
+    cosi.verify_batch(checks)
+
+    with pytest.raises(_ed25519.SignatureMismatch) as e:
+        cosi.verify_batch(checks + [checks[0][:4] + (0b11,)])
+    assert "signature 3 " in e.value.args[0]
+
+    with pytest.raises(_ed25519.SignatureMismatch) as e:
+        cosi.verify_batch(checks + [checks[2][:2] + (4,) + checks[2][3:]])
+    assert "Insufficient number of signatures" in e.value.args[0]
+
+
+@pytest.fixture
+def backend():
+    original = cosi.get_backend()
+    yield
+    cosi.set_backend(original)
+
+
+@pytest.mark.parametrize("name", cosi.ED25519_BACKENDS)
+def test_backends(backend, name):
+    try:
+        assert cosi.set_backend(name) == name
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    assert cosi.get_backend() == name
+
+    for _, pubkey, message, signature in RFC8032_VECTORS:
+        cosi.verify_combined(signature, message, pubkey)
+        fake_signature = signature[:37] + b"\xf0" + signature[38:]
+        with pytest.raises(_ed25519.SignatureMismatch):
+            cosi.verify_combined(fake_signature, message, pubkey)
+
+    items = [
+        (signature, message, pubkey)
+        for _, pubkey, message, signature in RFC8032_VECTORS
+    ]
+    cosi.verify_combined_batch(items)
+    items.append((items[0][0], items[1][1], items[0][2]))
+    with pytest.raises(_ed25519.SignatureMismatch):
+        cosi.verify_combined_batch(items)
+
+
+def test_default_backend(backend):
+    assert cosi.set_backend() == "python"
+    _, pubkey, message, signature = RFC8032_VECTORS[0]
+    # the same exceptions as the reference implementation
+    for candidate in (
+        (signature, message + b"!", pubkey),
+        (signature[:31] + b"\x80" + signature[32:], message, pubkey),
+        (signature, message, pubkey[:31]),
+    ):
+        expected = _outcome(_ed25519.checkvalid, *candidate)
+        assert expected is not None
+        assert _outcome(cosi.verify_combined, *candidate) is expected
+    with pytest.raises(ValueError):
+        cosi.set_backend("openssh")
@@ -0,0 +1,106 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import os
+import socket
+import sys
+import time
+
+import pytest
+
+from trezorlib._internal import emulator
+
+# Answers pings on TREZOR_UDP_PORT like the emulator. FAKE_MODE selects whether it
+# reports readiness, stays silent like older builds, or exits right away.
+FAKE_EMULATOR = f"""#!{sys.executable}
+import os, socket, sys
+
+mode = os.environ["FAKE_MODE"]
+if mode == "die":
+    sys.exit(1)
+sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+sock.bind(("127.0.0.1", int(os.environ["TREZOR_UDP_PORT"])))
+if mode == "notify":
+    os.write(int(os.environ["TREZOR_NOTIFY_FD"]), b"READY\\n")
+while True:
+    data, addr = sock.recvfrom(64)
+    if data == b"PINGPING":
+        sock.sendto(b"PONGPONG", addr)
+"""
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def fake_emulator(tmp_path, monkeypatch):
+    executable = tmp_path / "fake-emu"
+    executable.write_text(FAKE_EMULATOR)
+    executable.chmod(0o755)
+
+    def make(mode: str) -> emulator.CoreEmulator:
+        monkeypatch.setenv("FAKE_MODE", mode)
+        return emulator.CoreEmulator(
+            executable, str(tmp_path / "profile"), port=free_port()
+        )
+
+    return make
+
+
+def launch(emu: emulator.Emulator) -> float:
+    emu.process = emu.launch_process()
+    start = time.monotonic()
+    try:
+        emu.wait_until_ready(timeout=10)
+    finally:
+        if emu.process.poll() is None:
+            emu.process.kill()
+        emu.process.wait()
+    return time.monotonic() - start
+
+
+def test_notification(fake_emulator):
+    emu = fake_emulator("notify")
+    assert launch(emu) < emulator.PING_INTERVAL
+    assert emu._notify_fd is None
+
+
+def test_no_notification(fake_emulator):
+    # older builds are still found by pinging
+    emu = fake_emulator("silent")
+    assert launch(emu) >= emulator.PING_INTERVAL
+
+
+def test_died(fake_emulator):
+    emu = fake_emulator("die")
+    start = time.monotonic()
+    with pytest.raises(RuntimeError):
+        launch(emu)
+    assert time.monotonic() - start < emulator.PING_INTERVAL * 2
+
+
+def test_notify_fd_not_leaked(fake_emulator):
+    fds = set(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else None
+    for mode in ("notify", "die"):
+        try:
+            launch(fake_emulator(mode))
+        except RuntimeError:
+            pass
+    if fds is not None:
+        assert set(os.listdir("/proc/self/fd")) == fds
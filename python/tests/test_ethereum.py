@@ -0,0 +1,146 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import pytest
+
+from trezorlib import messages
+from trezorlib.messages import EthereumDataType as DataType
+
+try:
+    from trezorlib import ethereum
+except ImportError:
+    # definitions, imported by ethereum, need construct_classes
+    pytest.skip("construct_classes not installed", allow_module_level=True)
+
+TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "Mail": [
+        {"name": "from", "type": "Person"},
+        {"name": "to", "type": "Person[]"},
+        {"name": "contents", "type": "string"},
+        {"name": "urgent", "type": "bool"},
+    ],
+    "Person": [
+        {"name": "name", "type": "string"},
+        {"name": "balance", "type": "int16"},
+    ],
+}
+
+DOMAIN = {
+    "name": "Ether Mail",
+    "chainId": 1,
+    "verifyingContract": "0x1e0Ae8205e9726E6F296ab8869160A6423E2337E",
+}
+
+MESSAGE = {
+    "from": {"name": "Cow", "balance": "-2"},
+    "to": [{"name": "Bob", "balance": 300}, {"name": "Alice", "balance": 0}],
+    "contents": "Hello, Bob!",
+    "urgent": True,
+}
+
+
+def typed_data(primary_type="Mail", message=MESSAGE):
+    return {
+        "types": TYPES,
+        "primaryType": primary_type,
+        "domain": DOMAIN,
+        "message": message,
+    }
+
+
+class FakeClient:
+    """Answers with the given responses, in order, and records the requests."""
+
+    def __init__(self, responses):
+        self.responses = iter(responses)
+        self.calls = []
+
+    def call(self, msg):
+        self.calls.append(msg)
+        return next(self.responses)
+
+
+def test_index_values():
+    index = ethereum.TypedDataIndex(typed_data())
+    assert index.value([0, 0]) == b"Ether Mail"
+    assert index.value([0, 1]) == (1).to_bytes(32, "big")
+    assert index.value([0, 2]) == bytes.fromhex(
+        "1e0ae8205e9726e6f296ab8869160a6423e2337e"
+    )
+    assert index.value([1, 0, 0]) == b"Cow"
+    assert index.value([1, 0, 1]) == b"\xff\xfe"
+    # the length of the array, then its elements
+    assert index.value([1, 1]) == b"\x00\x02"
+    assert index.value([1, 1, 0, 0]) == b"Bob"
+    assert index.value([1, 1, 0, 1]) == b"\x01\x2c"
+    assert index.value([1, 1, 1, 0]) == b"Alice"
+    assert index.value([1, 1, 1, 1]) == b"\x00\x00"
+    assert index.value([1, 2]) == b"Hello, Bob!"
+    assert index.value([1, 3]) == b"\x01"
+
+
+def test_index_struct_members():
+    index = ethereum.TypedDataIndex(typed_data())
+    members = index.struct_members("Mail")
+    assert [m.name for m in members] == ["from", "to", "contents", "urgent"]
+    assert members[0].type.data_type == DataType.STRUCT
+    assert members[0].type.struct_name == "Person"
+    assert members[1].type.data_type == DataType.ARRAY
+    assert members[1].type.entry_type.struct_name == "Person"
+    assert members[3].type.data_type == DataType.BOOL
+
+
+def test_index_missing_value():
+    message = dict(MESSAGE)
+    del message["contents"]
+    index = ethereum.TypedDataIndex(typed_data(message=message))
+    # the other members are still answered
+    assert index.value([1, 3]) == b"\x01"
+    with pytest.raises(ValueError, match=r"No value at member path \[1, 2\]"):
+        index.value([1, 2])
+    with pytest.raises(ValueError, match="No value at member path"):
+        index.value([1, 1, 2, 0])
+    with pytest.raises(ValueError, match="No value at member path"):
+        index.value([0, 3])
+
+
+def test_sign_domain_only():
+    # the message would not encode as an EIP712Domain, it must not be touched
+    data = typed_data("EIP712Domain", message={"chainId": "not a number"})
+    signature = messages.EthereumTypedDataSignature(
+        signature=b"\x00" * 65, address="0x" + "00" * 20
+    )
+    client = FakeClient(
+        [
+            messages.EthereumTypedDataStructRequest(name="EIP712Domain"),
+            messages.EthereumTypedDataValueRequest(member_path=[0, 0]),
+            messages.EthereumTypedDataValueRequest(member_path=[0, 1]),
+            messages.EthereumTypedDataValueRequest(member_path=[0, 2]),
+            signature,
+        ]
+    )
+    assert ethereum.sign_typed_data(client, [], data) is signature
+    values = [call.value for call in client.calls[2:]]
+    assert values == [
+        b"Ether Mail",
+        (1).to_bytes(32, "big"),
+        bytes.fromhex("1e0ae8205e9726e6f296ab8869160a6423e2337e"),
+    ]
@@ -0,0 +1,259 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import mmap
+from hashlib import blake2s
+
+import pytest
+from click.testing import CliRunner
+
+from trezorlib import cosi, firmware, mapping, messages
+from trezorlib.cli import firmware as firmware_cli
+
+PRIVKEY = bytes(range(32))
+
+
+def make_v2_image(code_length: int) -> bytes:
+    """Build a TREZOR_T image signed by PRIVKEY, with a vendor header."""
+    pubkey = cosi.pubkey_from_privkey(PRIVKEY)
+    vendor_header = firmware.VendorHeader.build(
+        dict(
+            header_len=1024,
+            expiry=0,
+            version=dict(major=1, minor=0),
+            sig_m=1,
+            trust=dict(
+                show_vendor_string=False,
+                require_user_click=False,
+                red_background=False,
+                delay=0,
+            ),
+            pubkeys=[pubkey],
+            text="test vendor",
+            image=dict(
+                format=firmware.ToifMode.full_color, width=1, height=1, data=b""
+            ),
+            sigmask=0,
+            signature=b"\0" * 64,
+        )
+    )
+    code = bytes(i * 7 % 251 for i in range(code_length))
+    header = dict(
+        magic=firmware.HeaderType.FIRMWARE,
+        header_len=0,
+        expiry=0,
+        code_length=code_length,
+        version=dict(major=2, minor=0, patch=0, build=0),
+        fix_version=dict(major=2, minor=0, patch=0, build=0),
+        onekey_version=dict(major=2, minor=0, patch=0, build=0),
+        hash_block=0,
+        hashes=[b"\0" * 32] * 16,
+        v1_signatures=[b"\0" * 64] * 3,
+        v1_key_indexes=[0] * 3,
+        build_id=b"\0" * 16,
+        sigmask=0,
+        signature=b"\0" * 64,
+    )
+    header_len = len(firmware.FirmwareHeader.build(header))
+    header["hashes"], _ = firmware.calculate_code_hashes(
+        code, len(vendor_header) + header_len
+    )
+
+    digest = firmware.header_digest(firmware.c.Container(header))
+    nonce, commit = cosi.get_nonce(PRIVKEY, digest)
+    signature = cosi.sign_with_privkey(digest, PRIVKEY, pubkey, nonce, commit)
+    header["signature"] = cosi.combine_sig(commit, [signature])
+    header["sigmask"] = 1
+
+    return vendor_header + firmware.FirmwareImage.build(dict(header=header, code=code))
+
+
+@pytest.fixture(scope="module")
+def image() -> bytes:
+    return make_v2_image(3 * firmware.V2_CHUNK_SIZE + 1234)
+
+
+def test_parse_headers(image):
+    version, fw = firmware.parse(image)
+    streamed_version, streamed = firmware.parse_headers(image)
+
+    assert streamed_version == version == firmware.FirmwareFormat.TREZOR_T
+    assert streamed.vendor_header == fw.vendor_header
+    assert streamed.image.header == fw.image.header
+    assert streamed.image._code_offset == fw.image._code_offset
+    assert isinstance(streamed.image.code, memoryview)
+    assert streamed.image.code == fw.image.code
+    assert firmware.digest(version, streamed) == firmware.digest(version, fw)
+
+    with pytest.raises(firmware.FirmwareIntegrityError):
+        firmware.parse_headers(image[:-1])
+    with pytest.raises(ValueError):
+        firmware.parse_headers(b"XXXX" + image[4:])
+
+
+def test_parse_headers_legacy():
+    embedded = firmware.FirmwareImage.build(
+        dict(
+            header=dict(
+                magic=firmware.HeaderType.FIRMWARE,
+                header_len=0,
+                expiry=0,
+                version=dict(major=1, minor=8, patch=0, build=0),
+                fix_version=dict(major=1, minor=8, patch=0, build=0),
+                onekey_version=dict(major=1, minor=8, patch=0, build=0),
+                hash_block=0,
+                hashes=[b"\0" * 32] * 16,
+                v1_signatures=[b"\0" * 64] * 3,
+                v1_key_indexes=[0] * 3,
+                build_id=b"\0" * 16,
+                sigmask=0,
+                signature=b"\0" * 64,
+            ),
+            code=b"\x42" * 1000,
+        )
+    )
+    data = firmware.LegacyFirmware.build(
+        dict(
+            key_indexes=[0] * 3,
+            flags=dict(restore_storage=False),
+            signatures=[b"\0" * 64] * 3,
+            code=embedded,
+        )
+    )
+
+    version, fw = firmware.parse(data)
+    streamed_version, streamed = firmware.parse_headers(data)
+    assert streamed_version == version == firmware.FirmwareFormat.TREZOR_ONE
+    assert streamed.code == fw.code
+    assert streamed.embedded_onev2.header == fw.embedded_onev2.header
+    assert streamed.embedded_onev2._code_offset == fw.embedded_onev2._code_offset
+    assert streamed.embedded_onev2.code == fw.embedded_onev2.code
+    for v, f in ((version, fw), (streamed_version, streamed)):
+        with pytest.raises(firmware.Unsigned):
+            firmware.validate(v, f)
+
+
+def test_validate_mmap_collects_chunk_digests(image, tmp_path):
+    path = tmp_path / "firmware.bin"
+    path.write_bytes(image)
+
+    chunk_digests: firmware.ChunkDigests = {}
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        version, fw = firmware.parse_headers(m)
+        firmware.validate_v2(fw, skip_vendor_header=True, chunk_digests=chunk_digests)
+        code_offset = fw.image._code_offset
+        # release the views into the mmap before it is closed
+        del fw
+
+    # the first chunk of code starts after the headers
+    size = firmware.V2_CHUNK_SIZE
+    assert sorted(chunk_digests) == [
+        (code_offset, size - code_offset),
+        (size, size),
+        (2 * size, size),
+        (3 * size, len(image) - 3 * size),
+    ]
+    for (offset, length), digest in chunk_digests.items():
+        assert digest == blake2s(image[offset : offset + length]).digest()
+
+    with pytest.raises(firmware.FirmwareIntegrityError):
+        tampered = bytearray(image)
+        tampered[-1] ^= 1
+        firmware.validate_code_hashes(
+            firmware.parse_headers(tampered)[1], firmware.FirmwareFormat.TREZOR_T
+        )
+
+
+class FakeBootloader:
+    """Client stand-in that answers FirmwareUpload like a bootloader."""
+
+    features = messages.Features(
+        vendor="onekey.so",
+        major_version=2,
+        minor_version=0,
+        patch_version=0,
+        bootloader_mode=True,
+    )
+    mapping = mapping.DEFAULT_MAPPING
+
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        self.data = data
+        self.chunk_size = chunk_size
+        self.offset = 0
+        self.uploaded = bytearray()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _request(self) -> messages.MessageType:
+        if self.offset >= len(self.data):
+            return messages.Success()
+        length = min(self.chunk_size, len(self.data) - self.offset)
+        return messages.FirmwareRequest(offset=self.offset, length=length)
+
+    def call(self, msg, encoded=None):
+        if isinstance(msg, messages.FirmwareErase):
+            assert msg.length == len(self.data)
+            return self._request()
+        assert isinstance(msg, messages.FirmwareUpload)
+        assert encoded == self.mapping.encode(msg)
+        assert msg.hash == blake2s(msg.payload).digest()
+        self.uploaded += msg.payload
+        self.offset += len(msg.payload)
+        return self._request()
+
+
+def test_update_pipelined(image):
+    chunk_digests: firmware.ChunkDigests = {}
+    version, fw = firmware.parse_headers(image)
+    firmware.validate_v2(fw, skip_vendor_header=True, chunk_digests=chunk_digests)
+
+    client = FakeBootloader(image, firmware.V2_CHUNK_SIZE)
+    progress = []
+    firmware.update(client, image, progress.append, chunk_digests)
+    assert client.uploaded == image
+    assert sum(progress) == len(image)
+
+    # odd chunk sizes miss both the prediction and the digests
+    client = FakeBootloader(image, 12345)
+    firmware.update(client, memoryview(image), chunk_digests=chunk_digests)
+    assert client.uploaded == image
+
+
+def test_cli_verify_stream(image, tmp_path, monkeypatch):
+    # sign the vendor header with PRIVKEY and trust it as the bootloader key
+    pubkey = cosi.pubkey_from_privkey(PRIVKEY)
+    monkeypatch.setattr(firmware, "V2_BOOTLOADER_KEYS", [pubkey])
+    monkeypatch.setattr(firmware, "V2_SIGS_REQUIRED", 1)
+    vendor_header = firmware.parse_headers(image)[1].vendor_header
+    digest = firmware.header_digest(vendor_header)
+    nonce, commit = cosi.get_nonce(PRIVKEY, digest)
+    signature = cosi.sign_with_privkey(digest, PRIVKEY, pubkey, nonce, commit)
+    vendor_header.signature = cosi.combine_sig(commit, [signature])
+    vendor_header.sigmask = 1
+    signed = firmware.VendorHeader.build(vendor_header)
+    path = tmp_path / "firmware.bin"
+    path.write_bytes(signed + image[len(signed) :])
+
+    runner = CliRunner()
+    read = runner.invoke(firmware_cli.cli, ["verify", str(path)])
+    streamed = runner.invoke(firmware_cli.cli, ["verify", "--stream", str(path)])
+    assert read.exit_code == streamed.exit_code == 0
+    assert "Signatures are valid." in streamed.output
+    assert streamed.output == read.output
@@ -330,3 +330,122 @@ def test_recursive():
     assert retr.recursivefield.uvarint == 2
     assert type(retr.recursivefield.recursivefield) == RecursiveMessage
     assert retr.recursivefield.recursivefield.uvarint == 3
+
+
+COMPILED_CODEC_MESSAGES = [
+    PrimitiveMessage(
+        uvarint=12345678910,
+        svarint=-12345678910,
+        bool=True,
+        bytes=b"\xDE\xAD\xCA\xFE",
+        unicode="Příliš žluťoučký kůň úpěl ďábelské ódy 😊",
+        enum=SomeEnum.Five,
+    ),
+    PrimitiveMessage(),
+    RepeatedFields(
+        uintlist=[1, 2, 3], enumlist=[0, 5, 0, 5], strlist=["hello", "world"]
+    ),
+    RequiredFields(uvarint=3, nested=PrimitiveMessage(bytes=b"\x00" * 300)),
+    DefaultFields(uvarint=0, bool=False),
+    RecursiveMessage(
+        uvarint=1,
+        recursivefield=RecursiveMessage(
+            uvarint=2, recursivefield=RecursiveMessage(uvarint=3)
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("msg", COMPILED_CODEC_MESSAGES)
+def test_compiled_codec_roundtrip(msg):
+    buf = protobuf.encode_message(msg)
+    assert buf == dump_message(msg)
+    assert protobuf.decode_message(buf, msg.__class__) == msg
+    assert protobuf.decode_message(buf, msg.__class__) == load_message(
+        buf, msg.__class__
+    )
+
+
+def test_compiled_codec_offsets():
+    msg = COMPILED_CODEC_MESSAGES[0]
+    buf = protobuf.encode_message(msg)
+    padded = memoryview(b"garbage" + buf + b"garbage")
+    codec = protobuf.get_codec(PrimitiveMessage)
+    assert codec is protobuf.get_codec(PrimitiveMessage)
+    assert codec.decode(padded, 7, 7 + len(buf)) == msg
+
+
+def test_compiled_codec_packed():
+    values = [4, 44, 444]
+    packed_values = b"".join(dump_uvarint(v) for v in values)
+    message_bytes = dump_uvarint(1 << 3 | 2) + dump_uvarint(len(packed_values))
+    message_bytes += packed_values + dump_uvarint(1 << 3 | 0) + dump_uvarint(5)
+
+    msg = protobuf.decode_message(message_bytes, RepeatedFields)
+    assert msg.uintlist == values + [5]
+
+
+def test_compiled_codec_unknown_fields():
+    msg = PrimitiveMessage(uvarint=1, bytes=b"hello")
+    unknown = dump_uvarint(20 << 3 | 0) + dump_uvarint(300)
+    unknown += dump_uvarint(21 << 3 | 2) + dump_uvarint(3) + b"abc"
+    buf = unknown + protobuf.encode_message(msg)
+    assert protobuf.decode_message(buf, PrimitiveMessage) == msg
+
+    with pytest.raises(ValueError):
+        protobuf.decode_message(dump_uvarint(22 << 3 | 5), PrimitiveMessage)
+
+
+def test_compiled_codec_errors(caplog):
+    caplog.set_level(logging.INFO)
+    buf = protobuf.encode_message(EnumMessageMoreValues(enum=WiderEnum.Three))
+    retr = protobuf.decode_message(buf, EnumMessageLessValues)
+    assert retr.enum == 3
+    assert caplog.records[0].getMessage() == (
+        "On field enum: 3 is not a valid NarrowerEnum"
+    )
+
+    with pytest.raises(ValueError, match="Value 19 in field enum unknown"):
+        protobuf.encode_message(EnumMessageMoreValues(enum=19))
+
+    with pytest.raises(ValueError, match="does not fit into uint64"):
+        protobuf.encode_message(PrimitiveMessage(uvarint=-1))
+
+    with pytest.raises(ValueError):
+        # wire type of `bytes` does not match
+        protobuf.decode_message(dump_uvarint(4 << 3 | 0) + b"\x01", PrimitiveMessage)
+
+    with pytest.raises(IOError):
+        buf = protobuf.encode_message(PrimitiveMessage(bytes=b"hello"))
+        protobuf.decode_message(buf[:-1], PrimitiveMessage)
+
+    with pytest.raises(ValueError):
+        protobuf.decode_message(b"", RequiredFields)
+
+    with pytest.deprecated_call():
+        msg = RequiredFields(uvarint=3)
+    with pytest.raises(ValueError):
+        protobuf.encode_message(msg)
+
+
+def test_nested_sizes():
+    shared = PrimitiveMessage(bytes=b"\x00" * 200, unicode="žluťoučký")
+    msg = RecursiveMessage(
+        uvarint=1,
+        recursivefield=RecursiveMessage(
+            recursivefield=RecursiveMessage(uvarint=2**60),
+        ),
+    )
+    assert msg.ByteSize() == len(dump_message(msg))
+    assert load_message(dump_message(msg), RecursiveMessage) == msg
+
+    # the same submessage object may occur more than once
+    msg = RequiredFields(uvarint=1, nested=shared)
+    buf = protobuf.encode_message(msg) + protobuf.encode_message(msg)
+    assert msg.ByteSize() * 2 == len(buf)
+    assert protobuf.get_codec(RequiredFields).encode(msg) == buf[: len(buf) // 2]
+
+
+def test_repeated_iterator():
+    msg = messages.GetAddress(address_n=(x for x in [1, 2, 3]), coin_name="Bitcoin")
+    assert protobuf.encode_message(msg) == b"\x08\x01\x08\x02\x08\x03\x12\x07Bitcoin"
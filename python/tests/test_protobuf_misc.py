@@ -14,6 +14,7 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import copy
 from enum import IntEnum
 
 import pytest
@@ -240,3 +241,71 @@ def test_constructor_deprecations():
     # colliding arg and kwarg
     with pytest.deprecated_call(), pytest.raises(TypeError):
         RequiredFields(0, scalar=0)
+
+
+def test_compact_type():
+    CompactNested = protobuf.compact_type(NestedMessage)
+    CompactSimple = protobuf.compact_type(SimpleMessage)
+    assert protobuf.compact_type(NestedMessage) is CompactNested
+    assert protobuf.compact_type(CompactNested) is CompactNested
+    assert CompactNested.__name__ == "NestedMessage"
+
+    compact = CompactNested(
+        scalar=9,
+        nested=CompactSimple(uvarint=4, enum=SimpleEnum.FOO),
+        repeated=[CompactSimple(), CompactSimple(bytes=b"\xca\xfe")],
+    )
+    assert not hasattr(compact, "__dict__")
+    with pytest.raises(AttributeError):
+        compact.not_a_field = 1
+
+    full = NestedMessage(
+        scalar=9,
+        nested=SimpleMessage(uvarint=4, enum=SimpleEnum.FOO),
+        repeated=[SimpleMessage(), SimpleMessage(bytes=b"\xca\xfe")],
+    )
+    assert compact == full
+    assert repr(compact) == repr(full)
+    assert protobuf.to_dict(compact) == protobuf.to_dict(full)
+    assert protobuf.format_message(compact) == protobuf.format_message(full)
+    assert compact.ByteSize() == full.ByteSize()
+    assert protobuf.encode_message(compact) == protobuf.encode_message(full)
+
+    # mixing compact and regular submessages
+    full.nested = compact.nested
+    assert protobuf.encode_message(full) == protobuf.encode_message(compact)
+
+
+def test_compact_copy_and_decode():
+    CompactNested = protobuf.compact_type(NestedMessage)
+    CompactSimple = protobuf.compact_type(SimpleMessage)
+    msg = CompactNested(nested=CompactSimple(rep_int=[1, 2]))
+
+    shallow = copy.copy(msg)
+    assert shallow == msg and shallow.nested is msg.nested
+    deep = copy.deepcopy(msg)
+    assert deep == msg and deep.nested is not msg.nested
+    assert deep.nested.rep_int == [1, 2]
+
+    decoded = protobuf.decode_message(protobuf.encode_message(msg), CompactNested)
+    assert decoded == msg
+    assert type(decoded.nested) is CompactSimple
+
+    recovered = protobuf.dict_to_proto(CompactNested, protobuf.to_dict(msg))
+    assert recovered == msg
+    assert type(recovered.nested) is CompactSimple
+
+
+def test_compact_constructor():
+    CompactRequired = protobuf.compact_type(RequiredFields)
+    CompactRequired(scalar=0)
+
+    with pytest.deprecated_call():
+        msg = CompactRequired()
+    with pytest.raises(ValueError):
+        protobuf.encode_message(msg)
+
+    with pytest.raises(TypeError):
+        CompactRequired(0)
+
+    assert protobuf.compact_type(SimpleMessage)().rep_int == []
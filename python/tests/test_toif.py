@@ -0,0 +1,156 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import struct
+
+import pytest
+
+from trezorlib import firmware, toif
+
+if not toif.PIL_AVAILABLE:
+    pytest.skip("PIL is not available", allow_module_level=True)
+
+from PIL import Image  # noqa: E402
+
+ENGINES = [False]
+if toif.NUMPY_AVAILABLE:
+    ENGINES.append(True)
+
+SIZE = (38, 17)
+
+
+@pytest.fixture(params=ENGINES, ids=lambda numpy: "numpy" if numpy else "python")
+def engine(request, monkeypatch):
+    monkeypatch.setattr(toif, "USE_NUMPY", request.param)
+
+
+def make_image(mode: str) -> "Image.Image":
+    bands = len(mode)
+    w, h = SIZE
+    data = bytes((i * 37 + (i // bands) * 11) % 256 for i in range(w * h * bands))
+    return Image.frombytes(mode, SIZE, data)
+
+
+def get_pixels(image: "Image.Image") -> list:
+    data = image.tobytes()
+    bands = len(image.mode)
+    if bands == 1:
+        return list(data)
+    return list(zip(*(data[i::bands] for i in range(bands))))
+
+
+# per-pixel conversions of the previous implementation
+
+
+def legacy_rgb(pixels, little_endian):
+    fmt = "<H" if little_endian else ">H"
+    return b"".join(
+        struct.pack(fmt, ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3))
+        for r, g, b in pixels
+    )
+
+
+def legacy_grayscale(pixels, right_hi):
+    data = bytearray()
+    for left, right in zip(pixels[0::2], pixels[1::2]):
+        if right_hi:
+            data.append((right & 0xF0) | ((left & 0xF0) >> 4))
+        else:
+            data.append((left & 0xF0) | ((right & 0xF0) >> 4))
+    return bytes(data)
+
+
+def legacy_grayscale_alpha(pixels, right_hi):
+    return legacy_grayscale([int(v * a / 255) for v, a in pixels], right_hi)
+
+
+@pytest.mark.parametrize("legacy_format", (False, True))
+@pytest.mark.parametrize("mode", ("RGB", "L", "LA"))
+def test_from_image(engine, mode, legacy_format):
+    image = make_image(mode)
+    pixels = get_pixels(image)
+    if mode == "RGB":
+        expected = legacy_rgb(pixels, little_endian=not legacy_format)
+    elif mode == "L":
+        expected = legacy_grayscale(pixels, right_hi=not legacy_format)
+    else:
+        expected = legacy_grayscale_alpha(pixels, right_hi=not legacy_format)
+
+    t = toif.from_image(image, legacy_format=legacy_format)
+    assert t.size == SIZE
+    assert toif._decompress(t.data) == expected
+    assert toif.from_bytes(t.to_bytes()) == t
+
+
+@pytest.mark.parametrize(
+    "mode, pil_mode",
+    (
+        (firmware.ToifMode.full_color, "RGB"),
+        (firmware.ToifMode.full_color_le, "RGB"),
+        (firmware.ToifMode.grayscale, "L"),
+        (firmware.ToifMode.grayscale_eh, "L"),
+    ),
+)
+def test_to_image(engine, mode, pil_mode):
+    if pil_mode == "RGB":
+        raw = bytes(range(256)) * 4
+        size = (32, 16)
+    else:
+        raw = bytes(range(256))
+        size = (32, 16)
+    t = toif.Toif(mode, size, toif._compress(raw))
+
+    image = t.to_image()
+    assert image.mode == pil_mode
+    pixels = get_pixels(image)
+    if pil_mode == "RGB":
+        little_endian = mode is firmware.ToifMode.full_color_le
+        assert legacy_rgb(pixels, little_endian) == raw
+    else:
+        right_hi = mode is firmware.ToifMode.grayscale_eh
+        assert legacy_grayscale(pixels, right_hi) == raw
+
+
+def test_compression_parameters():
+    image = make_image("RGB")
+    default = toif.from_image(image)
+    assert default == toif.from_image(image, compress_level=9, window_bits=10)
+
+    fast = toif.from_image(image, compress_level=1, window_bits=15)
+    assert fast.to_image().tobytes() == default.to_image().tobytes()
+    with pytest.raises(ValueError):
+        toif.from_image(image, window_bits=16)
+
+
+@pytest.mark.parametrize("processes", (1, 2))
+def test_convert_directory(tmp_path, processes):
+    source = tmp_path / "icons"
+    source.mkdir()
+    images = {}
+    for i, mode in enumerate(("RGB", "RGBA", "L", "LA")):
+        image = make_image(mode)
+        image.save(source / f"icon{i}.png")
+        images[f"icon{i}"] = image
+    (source / "readme.txt").write_text("not an icon")
+
+    written = toif.convert_directory(
+        source, tmp_path / "out", resize=(20, 10), processes=processes
+    )
+    assert [p.split("/")[-1] for p in written] == [f"icon{i}.toif" for i in range(4)]
+    for path in written:
+        name = path.split("/")[-1][: -len(".toif")]
+        expected = toif.from_image(images[name].resize((20, 10), Image.BOX))
+        assert toif.load(path) == expected
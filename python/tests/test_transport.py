@@ -15,10 +15,18 @@
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
 import importlib
+import socket
+import threading
+import time
 from unittest import mock
 
-from trezorlib.transport import all_transports
+import pytest
+
+from trezorlib import transport as transport_module
+from trezorlib.transport import Transport, all_transports
 from trezorlib.transport.bridge import BridgeTransport
+from trezorlib.transport.protocol import ProtocolV1
+from trezorlib.transport.udp import UdpTransport
 
 
 def test_disabled_transport():
@@ -53,3 +61,207 @@ def test_transport_dependencies():
     with mock.patch.dict("sys.modules", {"hid": mock.Mock()}):
         importlib.reload(hid_transport)
         assert hid_transport.HidTransport.ENABLED
+
+
+class LoopbackHandle:
+    def __init__(self):
+        self.chunks = []
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def write_chunk(self, chunk):
+        assert isinstance(chunk, bytes) and len(chunk) == 64
+        self.chunks.append(chunk)
+
+    def read_chunk(self):
+        return self.chunks.pop(0)
+
+
+class BatchLoopbackHandle(LoopbackHandle):
+    def write_chunks(self, chunks):
+        self.chunks.extend(bytes(chunk) for chunk in chunks)
+
+    def read_chunks(self, count):
+        assert count <= len(self.chunks)
+        chunks, self.chunks = self.chunks[:count], self.chunks[count:]
+        return chunks
+
+
+@pytest.mark.parametrize("handle_class", (LoopbackHandle, BatchLoopbackHandle))
+@pytest.mark.parametrize("length", (0, 1, 55, 56, 57, 118, 119, 120, 1000, 65536))
+def test_protocol_v1_roundtrip(handle_class, length):
+    handle = handle_class()
+    protocol = ProtocolV1(handle)
+    data = bytes(i & 0xFF for i in range(length))
+
+    protocol.write(0x1234, data)
+    assert handle.chunks[0][:9] == b"?##\x12\x34" + length.to_bytes(4, "big")
+    assert all(chunk[:1] == b"?" for chunk in handle.chunks)
+    assert len(handle.chunks) == max(1, -(-(length + 8) // 63))
+    # padding is zeroed
+    assert handle.chunks[-1].endswith(b"\x00" * (-(length + 8) % 63))
+
+    msg_type, msg_data = protocol.read()
+    assert msg_type == 0x1234
+    assert msg_data == data
+    assert not handle.chunks
+
+
+class PongResponder:
+    """Answers PINGPING like an emulator interface."""
+
+    def __init__(self, port=0):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", port))
+        self.sock.settimeout(0.1)
+        self.port = self.sock.getsockname()[1]
+        self.running = True
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        while self.running:
+            try:
+                data, addr = self.sock.recvfrom(64)
+            except socket.timeout:
+                continue
+            if data == b"PINGPING":
+                self.sock.sendto(b"PONGPONG", addr)
+
+    def close(self):
+        self.running = False
+        self.thread.join()
+        self.sock.close()
+
+
+def start_emulator_ports():
+    # main and debug interface on consecutive ports
+    while True:
+        main = PongResponder()
+        try:
+            return main, PongResponder(main.port + 1)
+        except OSError:
+            main.close()
+
+
+def test_udp_scan():
+    emulators = [start_emulator_ports() for _ in range(3)]
+    closed = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()
+    try:
+        main_ports = [main.port for main, _ in emulators]
+        all_ports = [r.port for pair in emulators for r in pair] + [closed_port]
+
+        start = time.monotonic()
+        found = UdpTransport.scan(all_ports, timeout=5)
+        # every port either answered or refused, no need to wait for the timeout
+        assert time.monotonic() - start < 1
+        assert [t.get_path() for t in found] == [
+            f"udp:127.0.0.1:{port}" for port in sorted(main_ports)
+        ]
+
+        found = UdpTransport.scan(all_ports, timeout=0.5, skip_debug=False)
+        assert len(found) == 6
+
+        with mock.patch.dict(
+            "os.environ", {"TREZOR_UDP_PORTS": f"{main_ports[0]}, {closed_port}"}
+        ):
+            assert UdpTransport.scan_ports() == [main_ports[0], closed_port]
+            (found,) = UdpTransport.enumerate()
+            assert found.device[1] == main_ports[0]
+        with mock.patch.dict("os.environ", {"TREZOR_UDP_PORTS": "100-102,7"}):
+            assert UdpTransport.scan_ports() == [100, 101, 102, 7]
+    finally:
+        for pair in emulators:
+            for responder in pair:
+                responder.close()
+
+
+class FakeTransport(Transport):
+    PATH_PREFIX = "fake"
+    ENABLED = True
+    calls = 0
+    delay = 0.0
+
+    def __init__(self, name):
+        self.name = name
+
+    def get_path(self):
+        return f"{self.PATH_PREFIX}:{self.name}"
+
+    def clone(self):
+        return type(self)(self.name)
+
+    @classmethod
+    def enumerate(cls, models=None):
+        cls.calls += 1
+        time.sleep(cls.delay)
+        return [cls("a"), cls("b")]
+
+
+class SlowTransport(FakeTransport):
+    PATH_PREFIX = "slow"
+    ENUMERATE_TIMEOUT = 0.2
+    delay = 2.0
+
+
+class BrokenTransport(FakeTransport):
+    @classmethod
+    def enumerate(cls, models=None):
+        raise OSError("no bus")
+
+
+def test_enumerate_devices_parallel_and_cached():
+    transport_module.invalidate_enumeration_cache()
+    transports = {FakeTransport, SlowTransport, BrokenTransport}
+    FakeTransport.calls = 0
+    with mock.patch.object(transport_module, "all_transports", lambda: transports):
+        start = time.monotonic()
+        devices = transport_module.enumerate_devices()
+        # the slow transport is abandoned after its deadline
+        assert time.monotonic() - start < 1
+        assert [str(d) for d in devices] == ["fake:a", "fake:b"]
+        assert FakeTransport.calls == 1
+
+        # cached, but every caller gets its own transport instances
+        cached = transport_module.enumerate_devices()
+        assert [str(d) for d in cached] == ["fake:a", "fake:b"]
+        assert not any(a is b for a, b in zip(cached, devices))
+        assert FakeTransport.calls == 1
+
+        transport_module.invalidate_enumeration_cache()
+        transport_module.enumerate_devices()
+        assert FakeTransport.calls == 2
+        transport_module.enumerate_devices(use_cache=False)
+        assert FakeTransport.calls == 3
+
+        with mock.patch.object(transport_module, "ENUMERATE_CACHE_TTL", 0):
+            transport_module.enumerate_devices()
+            assert FakeTransport.calls == 4
+    transport_module.invalidate_enumeration_cache()
+
+
+class UncloneableTransport(FakeTransport):
+    PATH_PREFIX = "uncloneable"
+
+    def clone(self):
+        raise NotImplementedError
+
+
+def test_enumerate_devices_not_cached_without_clone():
+    transport_module.invalidate_enumeration_cache()
+    UncloneableTransport.calls = 0
+    with mock.patch.object(
+        transport_module, "all_transports", lambda: {UncloneableTransport}
+    ):
+        first = transport_module.enumerate_devices()
+        second = transport_module.enumerate_devices()
+    assert UncloneableTransport.calls == 2
+    assert not any(a is b for a, b in zip(first, second))
+    transport_module.invalidate_enumeration_cache()
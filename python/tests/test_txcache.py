@@ -0,0 +1,83 @@
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+import json
+
+import pytest
+
+from trezorlib import messages, protobuf, txcache
+
+
+def make_tx(n):
+    return messages.TransactionType(
+        version=2,
+        lock_time=n,
+        inputs=[
+            messages.TxInputType(
+                prev_hash=bytes([n]) * 32, prev_index=i, script_sig=b"", sequence=0
+            )
+            for i in range(3)
+        ],
+        bin_outputs=[messages.TxOutputBinType(amount=n, script_pubkey=b"\x00\x14")],
+    )
+
+
+def test_add_and_lookup(tmp_path):
+    path = tmp_path / "txes.sqlite"
+    with txcache.TxCache(path, "Bitcoin", lru_size=2) as cache:
+        cache.add_many((bytes([n]) * 32, make_tx(n)) for n in range(5))
+        assert len(cache) == 5
+        assert bytes([1]) * 32 in cache
+        assert bytes([9]) * 32 not in cache
+        assert cache[bytes([3]) * 32] == make_tx(3)
+        with pytest.raises(KeyError):
+            cache[bytes([9]) * 32]
+
+        # LRU returns the same decoded object
+        tx = cache[bytes([4]) * 32]
+        assert cache[bytes([4]) * 32] is tx
+        cache[bytes([0]) * 32]
+        cache[bytes([1]) * 32]
+        assert cache[bytes([4]) * 32] is not tx
+
+    # persisted, and coins are kept apart
+    with txcache.TxCache(path, "bitcoin", compact=True) as cache:
+        tx = cache[bytes([2]) * 32]
+        assert tx == make_tx(2)
+        assert not hasattr(tx, "__dict__")
+    with txcache.TxCache(path, "Testnet") as cache:
+        assert len(cache) == 0
+
+
+def test_import_json(tmp_path):
+    root = tmp_path / "txcache" / "bitcoin"
+    root.mkdir(parents=True)
+    for n in range(3):
+        txhash = (bytes([n]) * 32).hex()
+        (root / f"{txhash}.json").write_text(json.dumps(protobuf.to_dict(make_tx(n))))
+    (root.parent / "testnet").mkdir()
+    (root.parent / "testnet" / f"{'00' * 32}.json").write_text(
+        json.dumps(protobuf.to_dict(make_tx(7)))
+    )
+
+    path = tmp_path / "txes.sqlite"
+    assert txcache.import_json_tree(path, root.parent) == 4
+    with txcache.TxCache(path, "Bitcoin") as cache:
+        assert len(cache) == 3
+        for n in range(3):
+            assert cache[bytes([n]) * 32] == make_tx(n)
+    with txcache.TxCache(path, "Testnet") as cache:
+        assert cache[bytes(32)] == make_tx(7)
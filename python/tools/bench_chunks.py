@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Benchmark sending a large payload to the device in chunks.
+
+Replays the `EthereumSignTx` chunk loop against a fake client that encodes every
+message like the transport would, optionally sleeping to simulate the device. The
+payload is served by the former `data = data[n:]` slicing, and by `ChunkReader` over
+bytes, a file and an iterator. Reports the time and the peak of memory allocated by
+the loop.
+
+    bench_chunks.py [payload size in kB] [device latency in ms]
+"""
+
+import io
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from trezorlib import chunks, messages
+from trezorlib.mapping import DEFAULT_MAPPING
+
+CHUNK_SIZE = 1024
+
+
+class FakeClient:
+    mapping = DEFAULT_MAPPING
+
+    def __init__(self, length: int, latency: float) -> None:
+        self.remaining = length
+        self.latency = latency
+
+    def call(self, msg: Any, encoded: Any = None) -> messages.EthereumTxRequest:
+        if encoded is None:
+            encoded = self.mapping.encode(msg)
+        if self.latency:
+            time.sleep(self.latency)
+        if isinstance(msg, messages.EthereumSignTx):
+            self.remaining -= len(msg.data_initial_chunk)
+        else:
+            self.remaining -= len(msg.data_chunk)
+        if self.remaining:
+            return messages.EthereumTxRequest(data_length=CHUNK_SIZE)
+        return messages.EthereumTxRequest(signature_v=0)
+
+
+def sign_msg(data_length: int, chunk: Any) -> messages.EthereumSignTx:
+    return messages.EthereumSignTx(
+        gas_price=b"\x01",
+        gas_limit=b"\x01",
+        chain_id=1,
+        data_length=data_length,
+        data_initial_chunk=chunk,
+    )
+
+
+def sliced(client: FakeClient, data: bytes) -> None:
+    data_length = len(data)
+    data, chunk = data[CHUNK_SIZE:], data[:CHUNK_SIZE]
+    response = client.call(sign_msg(data_length, chunk))
+    while response.data_length is not None:
+        data_length = response.data_length
+        data, chunk = data[data_length:], data[:data_length]
+        response = client.call(messages.EthereumTxAck(data_chunk=chunk))
+
+
+def streamed(client: FakeClient, data: chunks.Payload) -> None:
+    reader = chunks.ChunkReader(data, client.remaining)
+    msg = sign_msg(reader.length, reader.read(CHUNK_SIZE))
+    chunks.send_chunks(
+        client,
+        msg,
+        reader,
+        messages.EthereumTxRequest,
+        lambda chunk: messages.EthereumTxAck(data_chunk=chunk),
+    )
+
+
+def measure(
+    label: str, fn: Callable[[FakeClient], None], length: int, latency: float
+) -> None:
+    client = FakeClient(length, latency)
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(client)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert client.remaining == 0
+    print(f"  {label:<24} {elapsed * 1000:9.1f} ms {peak / 1024:9.1f} kB peak")
+
+
+def main() -> None:
+    size = int(sys.argv[1]) * 1024 if len(sys.argv) > 1 else 1024 * 1024
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.0
+    payload = bytes(i & 0xFF for i in range(size))
+    print(f"{size} bytes in {CHUNK_SIZE}-byte chunks, {latency * 1000:g} ms latency")
+
+    def pieces() -> Any:
+        return (payload[i : i + 4096] for i in range(0, size, 4096))
+
+    measure("slicing", lambda c: sliced(c, payload), size, latency)
+    measure("ChunkReader, bytes", lambda c: streamed(c, payload), size, latency)
+    measure(
+        "ChunkReader, file", lambda c: streamed(c, io.BytesIO(payload)), size, latency
+    )
+    measure("ChunkReader, iterator", lambda c: streamed(c, pieces()), size, latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure firmware validation and upload over a synthetic 4 MB image.
+
+Validation: `parse()` of the file contents with the previous chunk hashing, which
+sliced and copied every chunk, against `parse_headers()` of an mmap of the file.
+Reports the time and the peak traced memory.
+
+Upload: `update()` against a fake bootloader that takes `--link` MB/s to receive
+a chunk. The previous upload loop hashed every chunk before sending it, the
+current one reuses the digests from validation and prepares the next chunk while
+the current one is in flight.
+"""
+
+import argparse
+import mmap
+import os
+import tempfile
+import time
+import tracemalloc
+from hashlib import blake2s
+from typing import Any, Callable, List, Optional, Tuple
+
+from trezorlib import firmware, mapping, messages
+
+
+def build_image(size: int) -> bytes:
+    """Unsigned TREZOR_T image of `size` bytes with valid code hashes."""
+    vendor_header = firmware.VendorHeader.build(
+        dict(
+            header_len=1024,
+            expiry=0,
+            version=dict(major=1, minor=0),
+            sig_m=1,
+            trust=dict(
+                show_vendor_string=False,
+                require_user_click=False,
+                red_background=False,
+                delay=0,
+            ),
+            pubkeys=[b"\0" * 32],
+            text="bench",
+            image=dict(
+                format=firmware.ToifMode.full_color, width=1, height=1, data=b""
+            ),
+            sigmask=0,
+            signature=b"\0" * 64,
+        )
+    )
+    version = dict(major=2, minor=0, patch=0, build=0)
+    header = dict(
+        magic=firmware.HeaderType.FIRMWARE,
+        header_len=0,
+        expiry=0,
+        code_length=0,
+        version=version,
+        fix_version=version,
+        onekey_version=version,
+        hash_block=0,
+        hashes=[b"\0" * 32] * 16,
+        v1_signatures=[b"\0" * 64] * 3,
+        v1_key_indexes=[0] * 3,
+        build_id=b"\0" * 16,
+        sigmask=0,
+        signature=b"\0" * 64,
+    )
+    code_offset = len(vendor_header) + len(firmware.FirmwareHeader.build(header))
+    code = os.urandom(size - code_offset)
+    header["hashes"], _ = firmware.calculate_code_hashes(code, code_offset)
+    image = firmware.FirmwareImage.build(dict(header=header, code=code))
+    return vendor_header + image
+
+
+def legacy_calculate_code_hashes(
+    code: bytes, code_offset: int, chunk_size: int = firmware.V2_CHUNK_SIZE
+) -> List[bytes]:
+    hashes = []
+    ends = [(i + 1) * chunk_size - code_offset for i in range(16)]
+    start = 0
+    for end in ends:
+        chunk = code[start:end]
+        hashes.append(blake2s(chunk).digest() if chunk else b"\0" * 32)
+        start = end
+    return hashes
+
+
+def validate_legacy(path: str) -> None:
+    with open(path, "rb") as f:
+        data = f.read()
+    _, fw = firmware.parse(data)
+    hashes = legacy_calculate_code_hashes(fw.image.code, fw.image._code_offset)
+    assert hashes == fw.image.header.hashes
+
+
+def validate_streaming(path: str, chunk_digests: firmware.ChunkDigests) -> None:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        _, fw = firmware.parse_headers(m)
+        firmware.validate_code_hashes(
+            fw, firmware.FirmwareFormat.TREZOR_T, chunk_digests
+        )
+        del fw
+
+
+def measure(label: str, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    # separate run, tracing slows down allocations considerably
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<24} {elapsed * 1000:8.1f} ms {peak / 1024:10.1f} KiB peak")
+
+
+class FakeBootloader:
+    features = messages.Features(
+        vendor="onekey.so",
+        major_version=2,
+        minor_version=0,
+        patch_version=0,
+        bootloader_mode=True,
+    )
+    mapping = mapping.DEFAULT_MAPPING
+
+    def __init__(self, size: int, link_speed: float) -> None:
+        self.size = size
+        self.link_speed = link_speed
+        self.offset = 0
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _request(self) -> messages.MessageType:
+        if self.offset >= self.size:
+            return messages.Success()
+        length = min(firmware.V2_CHUNK_SIZE, self.size - self.offset)
+        return messages.FirmwareRequest(offset=self.offset, length=length)
+
+    def call(
+        self, msg: messages.MessageType, encoded: Optional[Tuple[int, bytes]] = None
+    ) -> messages.MessageType:
+        if isinstance(msg, messages.FirmwareUpload):
+            if encoded is None:
+                encoded = self.mapping.encode(msg)
+            # the transfer releases the GIL, like a read from a USB device
+            time.sleep(len(encoded[1]) / self.link_speed / 1e6)
+            self.offset += len(msg.payload)
+        return self._request()
+
+
+def update_legacy(client: FakeBootloader, data: bytes) -> None:
+    resp = client.call(messages.FirmwareErase(length=len(data)))
+    while isinstance(resp, messages.FirmwareRequest):
+        assert resp.offset is not None
+        assert resp.length is not None
+        payload = data[resp.offset : resp.offset + resp.length]
+        digest = blake2s(payload).digest()
+        resp = client.call(messages.FirmwareUpload(payload=payload, hash=digest))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=float, default=4, help="image size in MB")
+    parser.add_argument("--link", type=float, default=100, help="link speed in MB/s")
+    args = parser.parse_args()
+
+    size = int(args.size * 1024 * 1024)
+    image = build_image(size)
+    with tempfile.NamedTemporaryFile(suffix=".bin") as f:
+        f.write(image)
+        f.flush()
+        print(f"validation of a {len(image)} bytes image")
+        measure("parse", lambda: validate_legacy(f.name))
+        chunk_digests: firmware.ChunkDigests = {}
+        measure("parse_headers", lambda: validate_streaming(f.name, chunk_digests))
+
+        print(f"upload over a {args.link} MB/s link")
+        measure("legacy", lambda: update_legacy(FakeBootloader(size, args.link), image))
+
+        def update() -> None:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                client: Any = FakeBootloader(size, args.link)
+                firmware.update(client, m, chunk_digests=chunk_digests)
+
+        measure("update", update)
+
+
+if __name__ == "__main__":
+    main()
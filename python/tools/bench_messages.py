@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Compare regular and compact (slotted) message instances.
+
+Builds a synthetic previous-transaction cache with 10 000 inputs in total, in the
+JSON layout used by `tests/txcache`, and reports construction time and memory use
+for regular and compact `TransactionType` trees.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from trezorlib import messages, protobuf
+
+
+def synthetic_cache(txes: int, inputs: int) -> List[Dict[str, Any]]:
+    result = []
+    for t in range(txes):
+        result.append(
+            {
+                "version": 2,
+                "lock_time": 0,
+                "inputs": [
+                    {
+                        "prev_hash": (t * inputs + i).to_bytes(32, "big").hex(),
+                        "prev_index": i % 4,
+                        "script_sig": "16001431b0f8f6bb6a2bd79c0eafd1d4e93f2a4c55d9f9",
+                        "sequence": 0xFFFFFFFD,
+                    }
+                    for i in range(inputs)
+                ],
+                "bin_outputs": [
+                    {
+                        "amount": 1000 + o,
+                        "script_pubkey": "0014" + "22" * 20,
+                    }
+                    for o in range(2)
+                ],
+            }
+        )
+    return result
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[Any, float, int]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def main() -> None:
+    txes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    inputs = 10_000 // txes
+    cache = synthetic_cache(txes, inputs)
+    print(f"{txes} previous transactions, {txes * inputs} inputs")
+
+    variants = {
+        "regular": messages.TransactionType,
+        "compact": protobuf.compact_type(messages.TransactionType),
+    }
+    results = {}
+    for label, tx_type in variants.items():
+        txes_out, elapsed, memory = measure(
+            lambda: [protobuf.dict_to_proto(tx_type, tx) for tx in cache]
+        )
+        results[label] = txes_out
+        print(
+            f"  dict_to_proto {label:<8} {elapsed * 1000:8.1f} ms"
+            f" {memory / 1024:10.1f} KiB"
+        )
+
+    assert results["regular"] == results["compact"]
+
+    for label, tx_type in variants.items():
+        input_type = protobuf.compact_type(messages.TxInputType)
+        if label == "regular":
+            input_type = messages.TxInputType
+        _, elapsed, memory = measure(
+            lambda: [
+                input_type(prev_hash=b"\x11" * 32, prev_index=i, sequence=0)
+                for i in range(txes * inputs)
+            ]
+        )
+        print(
+            f"  TxInputType() {label:<8} {elapsed * 1000:8.1f} ms"
+            f" {memory / 1024:10.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
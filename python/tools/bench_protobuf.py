@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Benchmark the protobuf codec.
+
+Builds a populated instance of every message in `trezorlib.messages`, checks that
+the streaming decoder and the compiled codec produce identical results, and reports
+decode throughput of both, as well as encode and ByteSize throughput.
+"""
+
+import sys
+import timeit
+from enum import IntEnum
+from io import BytesIO
+from typing import Any, Callable, List
+
+from trezorlib import messages, protobuf
+
+SAMPLE_VALUES = {
+    "uint32": 0xDEADBEEF,
+    "uint64": 2**40 + 7,
+    "sint32": -(2**20),
+    "sint64": -(2**40),
+    "bool": True,
+    "bytes": b"\x5a" * 32,
+    "string": "sample string",
+}
+
+
+def sample_value(field: protobuf.Field, depth: int) -> Any:
+    if field.type in SAMPLE_VALUES:
+        return SAMPLE_VALUES[field.type]
+    field_type = protobuf.get_field_type_object(field)
+    if protobuf.safe_issubclass(field_type, IntEnum):
+        return next(iter(field_type))
+    if protobuf.safe_issubclass(field_type, protobuf.MessageType):
+        return sample_message(field_type, depth + 1)
+    raise ValueError(f"Unknown field type {field.type}")
+
+
+def sample_message(msg_type: Any, depth: int = 0) -> Any:
+    kwargs = {}
+    for field in msg_type.FIELDS.values():
+        if depth > 3 and not field.required:
+            continue
+        value = sample_value(field, depth)
+        kwargs[field.name] = [value, value] if field.repeated else value
+    return msg_type(**kwargs)
+
+
+def all_messages() -> List[protobuf.MessageType]:
+    result = []
+    for name in dir(messages):
+        msg_type = getattr(messages, name)
+        if protobuf.safe_issubclass(msg_type, protobuf.MessageType):
+            result.append(sample_message(msg_type))
+    return result
+
+
+def tx_messages() -> List[protobuf.MessageType]:
+    tx = messages.TransactionType(
+        version=2,
+        lock_time=0,
+        inputs_cnt=500,
+        outputs_cnt=2,
+        inputs=[
+            messages.TxInputType(
+                address_n=[0x8000002C, 0x80000000, 0x80000000, 0, 5],
+                prev_hash=b"\x11" * 32,
+                prev_index=1,
+                amount=123456,
+                script_type=messages.InputScriptType.SPENDWITNESS,
+                sequence=0xFFFFFFFD,
+            )
+        ],
+    )
+    request = messages.TxRequest(
+        request_type=messages.RequestType.TXINPUT,
+        details=messages.TxRequestDetailsType(request_index=17),
+        serialized=messages.TxRequestSerializedType(
+            signature_index=16, signature=b"\x30" * 71, serialized_tx=b"\x00" * 148
+        ),
+    )
+    return [messages.TxAck(tx=tx), request]
+
+
+def deep_tx_messages() -> List[protobuf.MessageType]:
+    tx = messages.TransactionType(
+        version=1,
+        lock_time=0,
+        bin_outputs=[
+            messages.TxOutputBinType(amount=i, script_pubkey=b"\x00\x14" + b"\x22" * 20)
+            for i in range(1000)
+        ],
+    )
+    return [messages.TxAck(tx=tx)]
+
+
+def stream_encode(msg: protobuf.MessageType) -> bytes:
+    buf = BytesIO()
+    protobuf.dump_message(buf, msg)
+    return buf.getvalue()
+
+
+def stream_decode(data: bytes, msg_type: Any) -> Any:
+    return protobuf.load_message(BytesIO(data), msg_type)
+
+
+def measure(label: str, fn: Callable[[], Any], count: int, number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=3))
+    per_msg = best / (number * count) * 1e6
+    print(f"  {label:<16} {per_msg:8.2f} us/msg")
+    return per_msg
+
+
+def run(title: str, msgs: List[protobuf.MessageType], number: int) -> None:
+    encoded = [(stream_encode(m), m.__class__) for m in msgs]
+    for msg, (data, msg_type) in zip(msgs, encoded):
+        assert protobuf.encode_message(msg) == data, msg_type.__name__
+        assert protobuf.decode_message(data, msg_type) == msg, msg_type.__name__
+
+    total = sum(len(data) for data, _ in encoded)
+    print(f"{title}: {len(msgs)} messages, {total} bytes")
+    count = len(msgs)
+
+    measure(
+        "encode_message",
+        lambda: [protobuf.encode_message(m) for m in msgs],
+        count,
+        number,
+    )
+    measure("ByteSize", lambda: [m.ByteSize() for m in msgs], count, number)
+
+    old = measure(
+        "load_message",
+        lambda: [stream_decode(d, t) for d, t in encoded],
+        count,
+        number,
+    )
+    new = measure(
+        "decode_message",
+        lambda: [protobuf.decode_message(d, t) for d, t in encoded],
+        count,
+        number,
+    )
+    print(f"  decode speedup   {old / new:8.2f}x")
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    run("messages.py", all_messages(), number)
+    run("TxAck/TxRequest", tx_messages(), number * 200)
+    run("TxAck with 1000 bin_outputs", deep_tx_messages(), number)
+
+
+if __name__ == "__main__":
+    main()
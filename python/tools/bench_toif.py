@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure TOIF conversion of an icon set.
+
+Converts every image in `--source` with the previous per-pixel conversion, with
+the pure-Python whole-buffer conversion, with NumPy (if installed), and with
+`from_files()` in worker processes. The outputs of all variants are compared.
+"""
+
+import argparse
+import os
+import struct
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from PIL import Image
+
+from trezorlib import toif
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_SOURCE = ROOT / "core" / "src" / "trezor" / "lvglui" / "res"
+
+
+def prepare(image: "Image.Image") -> "Image.Image":
+    # the mode conversions of `from_image()`
+    if image.mode == "RGBA":
+        background = Image.new("RGBA", image.size, (0, 0, 0, 255))
+        image = Image.alpha_composite(background, image).convert("RGB")
+    if image.mode == "1":
+        image = image.convert("L")
+    return image
+
+
+def legacy_convert(image: "Image.Image") -> bytes:
+    """The pixel conversion of the previous `from_image()`, per pixel."""
+    data = bytearray()
+    pixels = image.getdata()
+    if image.mode == "RGB":
+        for r, g, b in pixels:
+            c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
+            data += struct.pack("<H", c)
+    else:
+        if image.mode == "LA":
+            pixels = [int(v * a / 255) for v, a in pixels]
+        for i in range(0, len(pixels), 2):
+            left, right = pixels[i], pixels[i + 1]
+            data += struct.pack(">B", (right & 0xF0) | ((left & 0xF0) >> 4))
+    return bytes(data)
+
+
+def convert(image: "Image.Image") -> bytes:
+    if image.mode == "RGB":
+        return toif._from_pil_rgb(image.tobytes(), little_endian=True)
+    elif image.mode == "LA":
+        return toif._from_pil_grayscale_alpha(image.tobytes(), right_hi=True)
+    else:
+        return toif._from_pil_grayscale(image.tobytes(), right_hi=True)
+
+
+def legacy_from_image(image: "Image.Image") -> toif.Toif:
+    """The previous `from_image()`."""
+    image = prepare(image)
+    if image.mode == "RGB":
+        mode = toif.firmware.ToifMode.full_color_le
+    else:
+        mode = toif.firmware.ToifMode.grayscale_eh
+    return toif.Toif(mode, image.size, toif._compress(legacy_convert(image)))
+
+
+def load_images(paths: List[Path]) -> List["Image.Image"]:
+    images = []
+    for path in paths:
+        image = Image.open(path)
+        if image.mode not in ("RGB", "RGBA", "L", "LA", "1"):
+            image = image.convert("RGBA")
+        if image.mode in ("L", "LA") and image.size[0] % 2:
+            image = image.convert("RGBA")
+        image.load()
+        images.append(image)
+    return images
+
+
+def measure(label: str, fn: Callable[[], List[toif.Toif]], baseline: float) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    speedup = baseline / elapsed if baseline else 1.0
+    print(f"  {label:<24} {elapsed * 1000:9.1f} ms {speedup:7.1f}x")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE)
+    parser.add_argument("--pattern", default="*.png")
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    paths = sorted(args.source.rglob(args.pattern))
+    images = load_images(paths)
+    pixels = sum(image.size[0] * image.size[1] for image in images)
+    print(f"{len(images)} images, {pixels / 1e6:.1f} Mpixels, from {args.source}")
+
+    engines = [("whole-buffer python", False)]
+    if toif.NUMPY_AVAILABLE:
+        engines.append(("whole-buffer numpy", True))
+
+    print("pixel conversion only")
+    prepared = [prepare(image) for image in images]
+    expected_data = [legacy_convert(image) for image in prepared]
+    baseline = measure("per-pixel", lambda: [legacy_convert(i) for i in prepared], 0)
+    for label, use_numpy in engines:
+        toif.USE_NUMPY = use_numpy
+        assert [convert(i) for i in prepared] == expected_data
+        measure(label, lambda: [convert(i) for i in prepared], baseline)
+
+    print("from_image(), including compression")
+    expected = [legacy_from_image(image) for image in images]
+    baseline = measure("per-pixel", lambda: [legacy_from_image(i) for i in images], 0)
+    for label, use_numpy in engines:
+        toif.USE_NUMPY = use_numpy
+        assert [toif.from_image(i) for i in images] == expected
+        measure(label, lambda: [toif.from_image(i) for i in images], baseline)
+    toif.USE_NUMPY = toif.NUMPY_AVAILABLE
+
+    # the images as they are read by the workers
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for n, image in enumerate(images):
+            files.append(os.path.join(tmp, f"{n}.png"))
+            image.save(files[-1])
+        assert toif.from_files(files, processes=args.processes) == expected
+        measure(
+            f"from_files, {args.processes} processes",
+            lambda: toif.from_files(files, processes=args.processes),
+            baseline,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Measure ProtocolV1 chunking throughput over a loopback handle.
+
+Compares the current `ProtocolV1` with the previous implementation, which sliced
+the remaining message on every report, for messages of a few MB (the size of a
+`FirmwareUpload` payload). Reports MB/s and peak traced memory per MB of payload.
+"""
+
+import struct
+import sys
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Deque, Iterable, List, Tuple
+
+from trezorlib.transport.protocol import REPLEN, ProtocolV1
+
+
+class LoopbackHandle:
+    def __init__(self) -> None:
+        self.chunks: Deque[bytes] = deque()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def write_chunk(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+
+    def read_chunk(self) -> bytes:
+        return self.chunks.popleft()
+
+
+class BatchLoopbackHandle(LoopbackHandle):
+    def write_chunks(self, chunks: Iterable[bytes]) -> None:
+        # like a socket, copy the data out of the shared buffer
+        self.chunks.extend(bytes(chunk) for chunk in chunks)
+
+    def read_chunks(self, count: int) -> List[bytes]:
+        return [self.chunks.popleft() for _ in range(count)]
+
+
+class LegacyProtocolV1(ProtocolV1):
+    def write(self, message_type: int, message_data: bytes) -> None:
+        header = struct.pack(">HL", message_type, len(message_data))
+        buffer = bytearray(b"##" + header + message_data)
+
+        while buffer:
+            chunk = b"?" + buffer[: REPLEN - 1]
+            chunk = chunk.ljust(REPLEN, b"\x00")
+            self.handle.write_chunk(chunk)
+            buffer = buffer[63:]
+
+    def read(self) -> Tuple[int, bytes]:
+        buffer = bytearray()
+        msg_type, datalen, first_chunk = self.read_first()
+        buffer.extend(first_chunk)
+        while len(buffer) < datalen:
+            buffer.extend(self.read_next())
+        return msg_type, buffer[:datalen]
+
+
+def measure(label: str, fn: Any, megabytes: float) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    # separate run, tracing slows down allocations considerably
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label:<24} {megabytes / elapsed:8.2f} MB/s"
+        f" {peak / 1024 / megabytes:10.1f} KiB peak per MB"
+    )
+
+
+def run(label: str, protocol: ProtocolV1, data: bytes) -> None:
+    megabytes = len(data) / 1e6
+    handle = protocol.handle
+    measure(f"{label} write", lambda: protocol.write(0x1234, data), megabytes)
+    # keep the reports of one message to replay them for reading
+    chunks = list(handle.chunks)[: len(handle.chunks) // 2]
+    handle.chunks.clear()
+
+    def read() -> None:
+        handle.chunks.extend(chunks)
+        assert protocol.read() == (0x1234, data)
+
+    measure(f"{label} read", read, megabytes)
+
+
+def main() -> None:
+    size = int(float(sys.argv[1]) * 1e6) if len(sys.argv) > 1 else 4_000_000
+    data = bytes(range(256)) * (size // 256)
+    print(f"message of {len(data)} bytes")
+    run("legacy", LegacyProtocolV1(LoopbackHandle()), data)
+    run("ProtocolV1", ProtocolV1(LoopbackHandle()), data)
+    run("ProtocolV1 batched", ProtocolV1(BatchLoopbackHandle()), data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+# This file is part of the Trezor project.
+#
+# Copyright (C) 2012-2022 SatoshiLabs and contributors
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3
+# as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the License along with this library.
+# If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
+
+"""Benchmark answering the device's requests in `ethereum.sign_typed_data`.
+
+Builds a Seaport-like typed-data document with an array of nested structs, and
+replays the struct and value requests the device sends for it. The requests are
+answered by walking each member path from the root, as `sign_typed_data` used to,
+and by `ethereum.TypedDataIndex`. Checks that both give the same answers and reports
+the time of each.
+
+    bench_typed_data.py [number of array elements]
+"""
+
+import sys
+import time
+from typing import Any, Callable, Iterator, List, Tuple
+
+from trezorlib import ethereum, messages
+
+TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "OrderComponents": [
+        {"name": "offerer", "type": "address"},
+        {"name": "offer", "type": "OfferItem[]"},
+        {"name": "salt", "type": "uint256"},
+        {"name": "conduitKey", "type": "bytes32"},
+    ],
+    "OfferItem": [
+        {"name": "itemType", "type": "uint8"},
+        {"name": "token", "type": "address"},
+        {"name": "amount", "type": "Amount"},
+    ],
+    "Amount": [
+        {"name": "startAmount", "type": "uint256"},
+        {"name": "endAmount", "type": "uint256"},
+    ],
+}
+
+
+def typed_data(count: int) -> dict:
+    offer = [
+        {
+            "itemType": i % 5,
+            "token": "0x" + f"{i:040x}",
+            "amount": {"startAmount": str(i * 10**18), "endAmount": i * 10**18 + 1},
+        }
+        for i in range(count)
+    ]
+    return {
+        "types": TYPES,
+        "primaryType": "OrderComponents",
+        "domain": {
+            "name": "Seaport",
+            "version": "1.5",
+            "chainId": 1,
+            "verifyingContract": "0x00000000000000adc04c56bf30ac9d3c0aaf14dc",
+        },
+        "message": {
+            "offerer": "0x" + "11" * 20,
+            "offer": offer,
+            "salt": "12345",
+            "conduitKey": "0x" + "00" * 32,
+        },
+    }
+
+
+def member_paths(data: dict) -> Iterator[List[int]]:
+    """Member paths in the order the device asks for them."""
+
+    def walk(path: List[int], value: Any, type_name: str) -> Iterator[List[int]]:
+        if isinstance(value, dict):
+            for i, member in enumerate(data["types"][type_name]):
+                yield from walk(path + [i], value[member["name"]], member["type"])
+        elif isinstance(value, list):
+            yield path
+            entry_type = ethereum.typeof_array(type_name)
+            for i, item in enumerate(value):
+                yield from walk(path + [i], item, entry_type)
+        else:
+            yield path
+
+    yield from walk([0], data["domain"], "EIP712Domain")
+    if data["primaryType"] != "EIP712Domain":
+        yield from walk([1], data["message"], data["primaryType"])
+
+
+def walk_struct(data: dict, struct_name: str) -> List[messages.EthereumStructMember]:
+    types = data["types"]
+    return [
+        messages.EthereumStructMember(
+            type=ethereum.get_field_type(field["type"], types), name=field["name"]
+        )
+        for field in types[struct_name]
+    ]
+
+
+def walk_value(data: dict, member_path: List[int]) -> bytes:
+    types = data["types"]
+    if member_path[0] == 0:
+        member_typename = "EIP712Domain"
+        member_data = data["domain"]
+    else:
+        member_typename = data["primaryType"]
+        member_data = data["message"]
+    for index in member_path[1:]:
+        if isinstance(member_data, dict):
+            member_def = types[member_typename][index]
+            member_typename = member_def["type"]
+            member_data = member_data[member_def["name"]]
+        elif isinstance(member_data, list):
+            member_typename = ethereum.typeof_array(member_typename)
+            member_data = member_data[index]
+    if isinstance(member_data, list):
+        return len(member_data).to_bytes(2, "big")
+    return ethereum.encode_data(member_data, member_typename)
+
+
+def answer_walk(data: dict, structs: List[str], paths: List[List[int]]) -> Tuple:
+    members = [walk_struct(data, name) for name in structs]
+    return members, [walk_value(data, path) for path in paths]
+
+
+def answer_index(data: dict, structs: List[str], paths: List[List[int]]) -> Tuple:
+    index = ethereum.TypedDataIndex(data)
+    members = [index.struct_members(name) for name in structs]
+    return members, [index.value(path) for path in paths]
+
+
+def measure(label: str, fn: Callable[[], Any]) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<16} {elapsed * 1000:9.1f} ms")
+    return elapsed, result
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    data = typed_data(count)
+    structs = list(TYPES)
+    paths = list(member_paths(data))
+    print(f"{count} array elements, {len(paths)} value requests")
+
+    old, expected = measure("path walk", lambda: answer_walk(data, structs, paths))
+    new, result = measure("TypedDataIndex", lambda: answer_index(data, structs, paths))
+    assert result == expected
+    print(f"  speedup          {old / new:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
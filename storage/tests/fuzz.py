@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Randomized differential test and benchmark of the storage implementations.
+
+Runs the same random sequence of operations on the C storage and on the Python
+model and checks that they return the same values and leave the same flash
+contents behind. The keys are few, so that the items are rewritten, deleted and
+compacted over and over.
+
+    ./fuzz.py --ops 1000000 --seed 1
+    ./fuzz.py --python-only --ops 100000
+
+The second form benchmarks the Python model on its own, e.g. without a built
+libtrezor-storage.so.
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from python.src import consts, prng
+from python.src.storage import Storage as StoragePy
+
+test_uid = b"\x67\xce\x6a\xe8\xf7\x9b\x73\x96\x83\x88\x21\x5e"
+
+# protected, public and public writable apps, 16 keys each
+KEYS = [
+    (app << 8) | key
+    for app in (0x01, 0x02, consts.FLAG_PUBLIC | 0x01, consts.FLAGS_WRITE | 0x01)
+    for key in range(16)
+]
+# only used as counters, the values of other keys are not valid counters
+COUNTER_KEYS = [((consts.FLAGS_WRITE | 0x01) << 8) | key for key in range(16, 20)]
+MAX_VALUE_LEN = 300
+
+# PIN operations run PBKDF2, so they are rare
+OPERATIONS = (
+    ("set", 50),
+    ("get", 30),
+    ("delete", 15),
+    ("next_counter", 5),
+    ("unlock", 0.01),
+)
+
+
+def call(storage, name, *args):
+    try:
+        return getattr(storage, name)(*args)
+    except RuntimeError:
+        # both implementations signal errors this way, e.g. a missing key
+        return RuntimeError
+
+
+class Fuzzer:
+    def __init__(self, storages, rng):
+        self.storages = storages
+        self.rng = rng
+        self.durations = [0.0] * len(storages)
+        self.ops = 0
+        self.pin = ""
+        names, weights = zip(*OPERATIONS)
+        self.names = names
+        self.weights = weights
+
+    def step(self):
+        name = self.rng.choices(self.names, self.weights)[0]
+        args = getattr(self, "args_" + name)()
+        results = []
+        for i, storage in enumerate(self.storages):
+            start = time.perf_counter()
+            results.append(call(storage, name, *args))
+            self.durations[i] += time.perf_counter() - start
+        self.ops += 1
+        if len(set(map(repr, results))) != 1:
+            raise AssertionError(f"op {self.ops}: {name}{args} returned {results}")
+
+    def args_set(self):
+        key = self.rng.choice(KEYS)
+        length = self.rng.randrange(MAX_VALUE_LEN)
+        value = self.rng.getrandbits(8 * length).to_bytes(length, "little")
+        return key, value
+
+    def args_get(self):
+        return (self.rng.choice(KEYS + COUNTER_KEYS),)
+
+    def args_delete(self):
+        return (self.rng.choice(KEYS),)
+
+    def args_next_counter(self):
+        return (self.rng.choice(COUNTER_KEYS),)
+
+    def args_unlock(self):
+        return (self.pin,)
+
+    def check_dumps(self):
+        dumps = [storage._dump() for storage in self.storages]
+        if any(dump != dumps[0] for dump in dumps[1:]):
+            raise AssertionError(f"op {self.ops}: flash contents differ")
+
+    def report(self, names):
+        rates = []
+        for name, duration in zip(names, self.durations):
+            rates.append(f"{name} {self.ops / max(duration, 1e-9):,.0f} ops/s")
+        print(f"{self.ops:,} ops: " + ", ".join(rates))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--check-every",
+        type=int,
+        default=1000,
+        help="compare the flash contents every N operations",
+    )
+    parser.add_argument("--python-only", action="store_true")
+    args = parser.parse_args()
+
+    storages = [StoragePy()]
+    names = ["python"]
+    if not args.python_only:
+        from c.storage import Storage as StorageC
+
+        sc = StorageC()
+        sc.lib.random_reseed(args.seed)
+        storages.insert(0, sc)
+        names.insert(0, "c")
+    prng.random_reseed(args.seed)
+    for s in storages:
+        s.init(test_uid)
+        assert s.unlock("")
+
+    fuzzer = Fuzzer(storages, random.Random(args.seed))
+    last_report = time.monotonic()
+    for i in range(1, args.ops + 1):
+        fuzzer.step()
+        if i % args.check_every == 0:
+            fuzzer.check_dumps()
+            if time.monotonic() - last_report > 10:
+                fuzzer.report(names)
+                last_report = time.monotonic()
+    fuzzer.check_dumps()
+    fuzzer.report(names)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -84,9 +84,30 @@ def calculate_hmacs(sak: bytes, keys: bytes) -> bytes:
     In other words, it does HMAC for every KEY and XORs it all together.
     One more final HMAC is then performed on the result.
     """
-    hmacs = _hmac(sak, keys[0])
-    for key in keys[1:]:
-        hmacs = _xor(hmacs, _hmac(sak, key))
+    return finalize_hmacs(sak, xor_hmacs(sak, keys))
+
+
+def xor_hmacs(sak: bytes, keys: bytes) -> bytes:
+    """
+    XOR of HMAC-SHA-256(SAK, KEY_i) over all the keys, before the final HMAC.
+    All zeros if there are no keys.
+    """
+    hmacs = b"\x00" * hashes.SHA256.digest_size
+    for key in keys:
+        hmacs = update_hmacs(sak, hmacs, key)
+    return hmacs
+
+
+def update_hmacs(sak: bytes, hmacs: bytes, key: bytes) -> bytes:
+    """
+    Adds the HMAC of a key to the XOR of HMACs, or removes it if it is
+    already there. Lets the authentication tag follow the set of keys
+    without going through all of them on every change.
+    """
+    return _xor(hmacs, _hmac(sak, key))
+
+
+def finalize_hmacs(sak: bytes, hmacs: bytes) -> bytes:
     return _final_hmac(sak, hmacs)
 
 
@@ -105,7 +126,8 @@ def _hmac(key: bytes, data: bytes) -> bytes:
 
 
 def _xor(first: bytes, second: bytes) -> bytes:
-    return bytes(a ^ b for a, b in zip(first, second))
+    xored = int.from_bytes(first, "little") ^ int.from_bytes(second, "little")
+    return xored.to_bytes(len(first), "little")
 
 
 class InvalidPinError(ValueError):
@@ -16,13 +16,16 @@ class Norcow:
     def __init__(self):
         self.sectors = None
         self.active_sector = 0
+        # Offsets of the items in the active sector by their keys, so that the items
+        # are found without scanning the sector. Deleted items are not included.
+        self.index = {}
 
     def init(self):
         if self.sectors:
             for sector in range(consts.NORCOW_SECTOR_COUNT):
                 if self.sectors[sector][:8] == consts.NORCOW_MAGIC_AND_VERSION:
                     self.active_sector = sector
-                    self.active_offset = len(consts.NORCOW_MAGIC_AND_VERSION)
+                    self.active_offset = self._build_index()
                     break
         else:
             self.wipe()
@@ -38,6 +41,7 @@ class Norcow:
         self.sectors[sector][:8] = consts.NORCOW_MAGIC_AND_VERSION
         self.active_sector = sector
         self.active_offset = len(consts.NORCOW_MAGIC_AND_VERSION)
+        self.index = {}
 
     def get(self, key: int) -> bytes:
         value, _ = self._find_item(key)
@@ -55,7 +59,7 @@ class Norcow:
             else:
                 self._delete_old(pos, found_value)
 
-        if self.active_offset + 4 + len(val) > consts.NORCOW_SECTOR_SIZE:
+        if self._needs_compaction(4 + len(val)):
             self._compact()
 
         self._append(key, val)
@@ -80,6 +84,9 @@ class Norcow:
             )
         self._write(offset, key, new_value)
 
+    def _needs_compaction(self, item_length: int) -> bool:
+        return self.active_offset + item_length > consts.NORCOW_SECTOR_SIZE
+
     def _is_updatable(self, old: bytes, new: bytes) -> bool:
         """
         Item is updatable if the new value is the same or
@@ -96,10 +103,14 @@ class Norcow:
         return True
 
     def _delete_old(self, pos: int, value: bytes):
+        key, _ = self._read_item(pos)
+        if self.index.get(key) == pos:
+            del self.index[key]
         wiped_data = b"\x00" * len(value)
         self._write(pos, 0x0000, wiped_data)
 
     def _append(self, key: int, value: bytes):
+        self.index[key] = self.active_offset
         self.active_offset += self._write(self.active_offset, key, value)
 
     def _write(self, pos: int, key: int, new_value: bytes) -> int:
@@ -110,37 +121,39 @@ class Norcow:
         return len(data)
 
     def _find_item(self, key: int) -> (bytes, int):
-        offset = len(consts.NORCOW_MAGIC_AND_VERSION)
-        value = False
-        pos = offset
-        while True:
-            try:
-                k, v = self._read_item(offset)
-                if k == key:
-                    value = v
-                    pos = offset
-            except ValueError:
-                break
-            offset = offset + self._norcow_item_length(v)
+        pos = self.index.get(key)
+        if pos is None:
+            return False, len(consts.NORCOW_MAGIC_AND_VERSION)
+        _, value = self._read_item(pos)
         return value, pos
 
-    def _get_all_keys(self) -> (bytes, int):
+    def _get_all_keys(self) -> set:
+        return set(self.index)
+
+    def _build_index(self) -> int:
+        """
+        Scans the active sector and indexes the items in it.
+        Returns the offset of the free space after the items.
+        """
+        self.index = {}
         offset = len(consts.NORCOW_MAGIC_AND_VERSION)
-        keys = set()
         while True:
             try:
                 k, v = self._read_item(offset)
-                keys.add(k)
             except ValueError:
                 break
+            if k != 0x0000:
+                self.index[k] = offset
             offset = offset + self._norcow_item_length(v)
-        return keys
+        return offset
 
     def _norcow_item_length(self, data: bytes) -> int:
         # APP_ID, KEY_ID, LENGTH, DATA, ALIGNMENT
         return 1 + 1 + 2 + len(data) + align4_int(len(data))
 
     def _read_item(self, offset: int) -> (int, bytes):
+        if offset + 4 > consts.NORCOW_SECTOR_SIZE:
+            raise ValueError("Norcow: no data on this offset")
         key = self.sectors[self.active_sector][offset : offset + 2]
         key = int.from_bytes(key, sys.byteorder)
         if key == consts.NORCOW_KEY_FREE:
@@ -173,6 +186,7 @@ class Norcow:
         ]:
             raise RuntimeError("Norcow: set_sectors called with invalid data length")
         self.sectors = [bytearray(sector) for sector in data]
+        self._build_index()
 
     def _dump(self):
         return [bytes(sector) for sector in self.sectors]
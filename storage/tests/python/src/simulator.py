@@ -0,0 +1,294 @@
+"""
+Flash wear and compaction simulator built on the Python storage model.
+
+Replays a sequence of storage operations on a Storage whose norcow counts what
+the flash would go through: the bytes programmed, the sector erases and the
+compactions. The time of each operation is modeled from the flash timing.
+Alternative compaction and placement policies can be plugged in to compare
+them on the same workload.
+"""
+
+import random
+import sys
+
+from . import consts
+from .norcow import Norcow
+from .pin_log import PinLog
+from .storage import Storage
+
+
+class FlashTiming:
+    """
+    Programming and erase times of the flash. The defaults are the typical
+    values for STM32F4 at x32 parallelism: 16 us per programmed word and
+    550 ms to erase a 64 kB sector.
+    """
+
+    def __init__(self, word_program_us: float = 16, sector_erase_us: float = 550000):
+        self.word_program_us = word_program_us
+        self.sector_erase_us = sector_erase_us
+
+    def latency_us(self, programmed_bytes: int, erases: int) -> float:
+        words = (programmed_bytes + consts.WORD_SIZE - 1) // consts.WORD_SIZE
+        return words * self.word_program_us + erases * self.sector_erase_us
+
+
+class Policy:
+    """
+    Compacts when the active sector has no room for an item and rewrites items
+    in place when the flash allows it, like norcow.c.
+    """
+
+    name = "norcow"
+
+    def needs_compaction(self, norcow: "SimulatedNorcow", item_length: int) -> bool:
+        return norcow.active_offset + item_length > consts.NORCOW_SECTOR_SIZE
+
+    def update_in_place(self, old: bytes, new: bytes) -> bool:
+        return True
+
+
+class EarlyCompaction(Policy):
+    """
+    Also compacts once deleted items take more than `dead_ratio` of the
+    sector, to keep the free space away from the end of the sector.
+    """
+
+    def __init__(self, dead_ratio: float = 0.5):
+        self.dead_ratio = dead_ratio
+        self.name = f"early-{dead_ratio:g}"
+
+    def needs_compaction(self, norcow: "SimulatedNorcow", item_length: int) -> bool:
+        dead = norcow.active_offset - norcow.live_bytes()
+        return (
+            super().needs_compaction(norcow, item_length)
+            or dead > self.dead_ratio * consts.NORCOW_SECTOR_SIZE
+        )
+
+
+class AppendOnly(Policy):
+    """Never rewrites an item in place, every change appends a new copy."""
+
+    name = "append-only"
+
+    def update_in_place(self, old: bytes, new: bytes) -> bool:
+        return False
+
+
+POLICIES = {
+    "norcow": Policy,
+    "early": EarlyCompaction,
+    "append-only": AppendOnly,
+}
+
+
+class SimulatedNorcow(Norcow):
+    def __init__(self, policy: Policy):
+        super().__init__()
+        self.policy = policy
+        self.programmed_bytes = 0
+        self.compactions = 0
+        # bytes of live items copied by the compactions
+        self.rewritten_bytes = 0
+        self.erases = [0] * consts.NORCOW_SECTOR_COUNT
+        self.compacting = False
+
+    def live_bytes(self) -> int:
+        live = len(consts.NORCOW_MAGIC_AND_VERSION)
+        for pos in self.index.values():
+            _, value = self._read_item(pos)
+            live += self._norcow_item_length(value)
+        return live
+
+    def wipe(self, sector: int = None):
+        super().wipe(sector)
+        # a compaction erases its two sectors itself
+        if not self.compacting:
+            self.erases = [count + 1 for count in self.erases]
+        self.programmed_bytes += len(consts.NORCOW_MAGIC_AND_VERSION)
+
+    def _compact(self):
+        old_sector = self.active_sector
+        programmed = self.programmed_bytes
+        self.compacting = True
+        try:
+            super()._compact()
+        finally:
+            self.compacting = False
+        self.compactions += 1
+        self.rewritten_bytes += self.programmed_bytes - programmed
+        # the new sector is erased before the copy, the old one after it
+        self.erases[self.active_sector] += 1
+        self.erases[old_sector] += 1
+
+    def _needs_compaction(self, item_length: int) -> bool:
+        return self.policy.needs_compaction(self, item_length)
+
+    def _is_updatable(self, old: bytes, new: bytes) -> bool:
+        return self.policy.update_in_place(old, new) and super()._is_updatable(old, new)
+
+    def _write(self, pos: int, key: int, new_value: bytes) -> int:
+        length = super()._write(pos, key, new_value)
+        self.programmed_bytes += length
+        return length
+
+
+class Simulator:
+    """
+    Runs operations on a storage with a SimulatedNorcow and collects the
+    metrics. The operations are tuples of the name and the arguments:
+
+        ("set", key, value), ("get", key), ("delete", key), ("counter", key)
+    """
+
+    def __init__(self, policy: Policy = None, timing: FlashTiming = None):
+        self.policy = policy or Policy()
+        self.timing = timing or FlashTiming()
+        self.storage = Storage()
+        self.nc = SimulatedNorcow(self.policy)
+        self.storage.nc = self.nc
+        self.storage.pin_log = PinLog(self.nc)
+        self.storage.init(b"")
+        if not self.storage.unlock(""):
+            raise RuntimeError("Simulator: failed to unlock the storage")
+        # modeled latencies in microseconds, by operation
+        self.latencies = {}
+        self.operations = 0
+        self._reset_counters()
+
+    def _reset_counters(self):
+        # the setup of the storage is not a part of the workload
+        self.nc.programmed_bytes = 0
+        self.nc.compactions = 0
+        self.nc.rewritten_bytes = 0
+        self.nc.erases = [0] * consts.NORCOW_SECTOR_COUNT
+
+    def run(self, operations) -> "Simulator":
+        for name, *args in operations:
+            self.step(name, *args)
+        return self
+
+    def step(self, name: str, *args):
+        programmed = self.nc.programmed_bytes
+        erases = sum(self.nc.erases)
+        if name == "set":
+            self.storage.set(*args)
+        elif name == "get":
+            try:
+                self.storage.get(*args)
+            except RuntimeError:
+                pass
+        elif name == "delete":
+            self.storage.delete(*args)
+        elif name == "counter":
+            self.storage.next_counter(*args)
+        else:
+            raise ValueError(f"Simulator: unknown operation {name}")
+        latency = self.timing.latency_us(
+            self.nc.programmed_bytes - programmed, sum(self.nc.erases) - erases
+        )
+        self.latencies.setdefault(name, []).append(latency)
+        self.operations += 1
+
+    def report(self) -> dict:
+        latencies = {}
+        for name, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            latencies[name] = {
+                "count": len(values),
+                "mean_us": sum(values) / len(values),
+                "p99_us": values[min(len(values) - 1, len(values) * 99 // 100)],
+                "max_us": values[-1],
+            }
+        return {
+            "policy": self.policy.name,
+            "operations": self.operations,
+            "compactions": self.nc.compactions,
+            "programmed_bytes": self.nc.programmed_bytes,
+            "rewritten_bytes": self.nc.rewritten_bytes,
+            "erases": list(self.nc.erases),
+            "latencies": latencies,
+        }
+
+
+# Keys as the firmware passes them to the storage, see core/src/storage
+APP_DEVICE = 0x01
+APP_WEBAUTHN = 0x04
+U2F_COUNTER_KEY = ((consts.FLAGS_WRITE | APP_DEVICE) << 8) | 0x00
+RESIDENT_CREDENTIAL_KEY = APP_WEBAUTHN << 8
+# public and protected device settings with typical value lengths
+SETTINGS = [
+    (((consts.FLAG_PUBLIC | APP_DEVICE) << 8) | 0x10, 2),  # brightness
+    (((consts.FLAG_PUBLIC | APP_DEVICE) << 8) | 0x11, 5),  # language
+    (((consts.FLAG_PUBLIC | APP_DEVICE) << 8) | 0x12, 40),  # homescreen
+    (((consts.FLAG_PUBLIC | APP_DEVICE) << 8) | 0x13, 1),  # failed fingerprints
+    ((APP_DEVICE << 8) | 0x14, 4),  # autolock delay
+    ((APP_DEVICE << 8) | 0x15, 4),  # flags
+]
+
+
+def _random_bytes(rng: random.Random, length: int) -> bytes:
+    return rng.getrandbits(8 * length).to_bytes(length, sys.byteorder)
+
+
+def u2f_workload(count: int, rng: random.Random):
+    """U2F authentications, each increments the counter."""
+    for _ in range(count):
+        yield ("counter", U2F_COUNTER_KEY)
+
+
+def fido2_workload(count: int, rng: random.Random, slots: int = 100):
+    """
+    Resident credentials being registered, used (with the counter) and
+    removed. `count` is the number of such events.
+    """
+    stored = set()
+    for _ in range(count):
+        slot = rng.randrange(slots)
+        key = RESIDENT_CREDENTIAL_KEY | (slot + 1)
+        if slot in stored and rng.random() < 0.3:
+            stored.discard(slot)
+            yield ("delete", key)
+        elif slot in stored:
+            yield ("get", key)
+            yield ("counter", U2F_COUNTER_KEY)
+        else:
+            stored.add(slot)
+            yield ("set", key, _random_bytes(rng, rng.randrange(150, 250)))
+
+
+def settings_workload(count: int, rng: random.Random):
+    """Frequently changed device settings."""
+    for _ in range(count):
+        key, length = rng.choice(SETTINGS)
+        yield ("set", key, _random_bytes(rng, length))
+
+
+WORKLOADS = {
+    "u2f": u2f_workload,
+    "fido2": fido2_workload,
+    "settings": settings_workload,
+}
+
+
+def read_workload(lines):
+    """
+    Parses a recorded workload, one operation per line:
+
+        set 0x8110 2
+        get 0x8110
+        delete 0x0401
+        counter 0xC100
+
+    The number after the key of a set is the length of the value, the value
+    itself is not recorded. Empty lines and lines starting with # are skipped.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, key, *rest = line.split()
+        if name == "set":
+            yield (name, int(key, 0), b"\x5a" * int(rest[0], 0))
+        else:
+            yield (name, int(key, 0))
@@ -14,6 +14,10 @@ class Storage:
         self.sak = None
         self.nc = Norcow()
         self.pin_log = PinLog(self.nc)
+        # XOR of the HMACs of the protected keys and the SAK it was computed with,
+        # updated key by key, see _calculate_authentication_tag()
+        self.hmacs = None
+        self.hmacs_sak = None
 
     def init(self, hardware_salt: bytes = b""):
         """
@@ -22,6 +26,7 @@ class Storage:
         a new storage each time.
         """
         self.nc.init()
+        self.hmacs = None
         self.initialized = True
         self.hw_salt_hash = hashlib.sha256(hardware_salt).digest()
 
@@ -36,6 +41,7 @@ class Storage:
         """
         self.dek = prng.random_buffer(consts.DEK_SIZE)
         self.sak = prng.random_buffer(consts.SAK_SIZE)
+        self.hmacs = None
 
         self.nc.set(consts.SAT_KEY, crypto.init_hmacs(self.sak))
         self._set_encrypt(consts.VERSION_KEY, consts.NORCOW_VERSION)
@@ -190,6 +196,8 @@ class Storage:
         self._check_lock(app)
         ret = self.nc.delete(key)
         if consts.is_app_protected(app):
+            if ret:
+                self._update_hmacs(key)
             sat = self._calculate_authentication_tag()
             self.nc.set(consts.SAT_KEY, sat)
         return ret
@@ -203,6 +211,8 @@ class Storage:
     def _get_encrypted(self, key: int) -> bytes:
         if not consts.is_app_protected(key):
             raise RuntimeError("Only protected values are encrypted")
+        if self.nc.get(key) is False:
+            return False
         sat = self.nc.get(consts.SAT_KEY)
         if not sat:
             raise RuntimeError("SAT not found")
@@ -228,8 +238,11 @@ class Storage:
         preallocate = b"\xFF" * (
             consts.CHACHA_IV_SIZE + len(val) + consts.POLY1305_MAC_SIZE
         )
+        is_new = self.nc.get(key) is False
         self.nc.set(key, preallocate)
         if consts.is_app_protected(key >> 8):
+            if is_new:
+                self._update_hmacs(key)
             sat = self._calculate_authentication_tag()
             self.nc.set(consts.SAT_KEY, sat)
 
@@ -240,13 +253,24 @@ class Storage:
         return self.nc.replace(key, iv + tag + cipher_text)
 
     def _calculate_authentication_tag(self) -> bytes:
-        keys = []
-        for key in self.nc._get_all_keys():
-            if consts.is_app_protected(key >> 8):
-                keys.append(key.to_bytes(2, sys.byteorder))
-        if not keys:
-            return crypto.init_hmacs(self.sak)
-        return crypto.calculate_hmacs(self.sak, keys)
+        if self.hmacs is None or self.hmacs_sak != self.sak:
+            keys = []
+            for key in self.nc._get_all_keys():
+                if consts.is_app_protected(key >> 8):
+                    keys.append(key.to_bytes(2, sys.byteorder))
+            self.hmacs = crypto.xor_hmacs(self.sak, keys)
+            self.hmacs_sak = self.sak
+        return crypto.finalize_hmacs(self.sak, self.hmacs)
+
+    def _update_hmacs(self, key: int):
+        """
+        Adds or removes a protected key in the XOR of HMACs. If it is not
+        computed yet, it will be from all the keys when needed.
+        """
+        if self.hmacs is not None and self.hmacs_sak == self.sak:
+            self.hmacs = crypto.update_hmacs(
+                self.sak, self.hmacs, key.to_bytes(2, sys.byteorder)
+            )
 
     def _set_bool(self, key: int, val: bool) -> bool:
         if val:
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from ..src import consts, norcow
@@ -157,3 +159,25 @@ def test_norcow_compact():
 
     assert n.get(0x0101) == b"hello"
     assert n.get(0x0103) == b"123456789x"
+
+
+def test_norcow_index():
+    n = norcow.Norcow()
+    n.init()
+    rng = random.Random(0)
+    for _ in range(3000):
+        key = rng.choice((0x0101, 0x0102, 0x0103, 0x0201, 0x0202))
+        if rng.random() < 0.2:
+            n.delete(key)
+        else:
+            n.set(key, bytes(rng.randrange(256) for _ in range(rng.randrange(200))))
+
+    # several compactions happened, the index matches a scan of the sector
+    scanned = norcow.Norcow()
+    scanned._set_sectors(n._dump())
+    scanned.init()
+    assert scanned.active_sector == n.active_sector
+    assert scanned.active_offset == n.active_offset
+    assert scanned.index == n.index
+    for key in n.index:
+        assert scanned.get(key) == n.get(key)
@@ -0,0 +1,42 @@
+import random
+
+from ..src import consts, simulator
+
+
+def test_simulator_counts_compactions():
+    key = ((consts.FLAG_PUBLIC | 0x01) << 8) | 0x01
+    value = b"\x01" * 1000
+    sim = simulator.Simulator(simulator.AppendOnly())
+    # 1004 bytes per item, the sector fills up after 65 of them
+    sim.run(("set", key, value) for _ in range(100))
+    report = sim.report()
+    assert report["compactions"] == 1
+    assert report["erases"] == [1, 1]
+    assert report["latencies"]["set"]["count"] == 100
+    assert (
+        report["latencies"]["set"]["max_us"] >= simulator.FlashTiming().sector_erase_us
+    )
+    assert sim.storage.get(key) == value
+
+
+def test_simulator_policies():
+    reports = {}
+    for name, policy in simulator.POLICIES.items():
+        rng = random.Random(0)
+        sim = simulator.Simulator(policy())
+        reports[name] = sim.run(simulator.u2f_workload(500, rng)).report()
+    # the counter is updated in place unless the policy forbids it
+    assert (
+        reports["norcow"]["programmed_bytes"]
+        < reports["append-only"]["programmed_bytes"]
+    )
+    assert reports["norcow"]["operations"] == 500
+
+
+def test_read_workload():
+    lines = ["# recorded", "", "set 0x8110 2", "get 0x8110", "delete 0x0401"]
+    assert list(simulator.read_workload(lines)) == [
+        ("set", 0x8110, b"\x5a\x5a"),
+        ("get", 0x8110),
+        ("delete", 0x0401),
+    ]
@@ -0,0 +1,44 @@
+import sys
+
+from ..src import consts, crypto
+from ..src.storage import Storage
+
+
+def full_authentication_tag(s: Storage) -> bytes:
+    keys = [
+        key.to_bytes(2, sys.byteorder)
+        for key in s.nc._get_all_keys()
+        if consts.is_app_protected(key >> 8)
+    ]
+    if not keys:
+        return crypto.init_hmacs(s.sak)
+    return crypto.calculate_hmacs(s.sak, keys)
+
+
+def test_authentication_tag_follows_keys():
+    s = Storage()
+    s.init(b"")
+    assert s.unlock("")
+    assert s._calculate_authentication_tag() == full_authentication_tag(s)
+
+    for key in (0x0101, 0x0102, 0x0201):
+        s.set(key, b"value")
+        s.set(key, b"value 2")
+        assert s.nc.get(consts.SAT_KEY) == full_authentication_tag(s)
+    s.delete(0x0102)
+    s.delete(0x0102)
+    assert s.nc.get(consts.SAT_KEY) == full_authentication_tag(s)
+    assert s.get(0x0101) == b"value 2"
+
+    # the keys are gone with the wipe, along with their HMACs
+    s.wipe()
+    assert s._calculate_authentication_tag() == crypto.init_hmacs(s.sak)
+
+
+def test_xor_hmacs():
+    sak = bytes(range(16))
+    keys = [b"\x01\x01", b"\x02\x01", b"\x03\x01"]
+    hmacs = crypto.xor_hmacs(sak, keys)
+    assert crypto.xor_hmacs(sak, []) == bytes(32)
+    assert crypto.update_hmacs(sak, hmacs, keys[1]) == crypto.xor_hmacs(sak, keys[::2])
+    assert crypto.finalize_hmacs(sak, hmacs) == crypto.calculate_hmacs(sak, keys)
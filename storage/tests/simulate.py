@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Simulates the flash wear and the compactions of a storage workload.
+
+The workload is one of the synthetic ones or a file with recorded operations,
+see python/src/simulator.py for the format. Each policy replays it on a fresh
+storage, so that they can be compared:
+
+    ./simulate.py settings --ops 100000
+    ./simulate.py fido2 --policy norcow --policy append-only
+    ./simulate.py recorded.txt --policy early --dead-ratio 0.3
+"""
+
+import argparse
+import random
+import sys
+
+from python.src import simulator
+
+
+def print_report(report):
+    erases = "/".join(str(count) for count in report["erases"])
+    print(
+        f"{report['policy']}: {report['operations']} ops, "
+        f"{report['compactions']} compactions, "
+        f"{report['programmed_bytes']} bytes programmed "
+        f"({report['rewritten_bytes']} rewritten by compactions), "
+        f"sector erases {erases}"
+    )
+    for name, latency in report["latencies"].items():
+        print(
+            f"  {name:<8} {latency['count']:>8} x  "
+            f"mean {latency['mean_us'] / 1000:8.2f} ms  "
+            f"p99 {latency['p99_us'] / 1000:8.2f} ms  "
+            f"max {latency['max_us'] / 1000:8.2f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "workload", help=f"{', '.join(simulator.WORKLOADS)} or a file to replay"
+    )
+    parser.add_argument("--ops", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--policy",
+        action="append",
+        choices=list(simulator.POLICIES),
+        help="may be repeated, all policies by default",
+    )
+    parser.add_argument("--dead-ratio", type=float, default=0.5)
+    parser.add_argument("--word-program-us", type=float, default=16)
+    parser.add_argument("--sector-erase-us", type=float, default=550000)
+    args = parser.parse_args()
+
+    timing = simulator.FlashTiming(args.word_program_us, args.sector_erase_us)
+    for name in args.policy or simulator.POLICIES:
+        if name == "early":
+            policy = simulator.EarlyCompaction(args.dead_ratio)
+        else:
+            policy = simulator.POLICIES[name]()
+
+        if args.workload in simulator.WORKLOADS:
+            rng = random.Random(args.seed)
+            operations = simulator.WORKLOADS[args.workload](args.ops, rng)
+        else:
+            with open(args.workload) as f:
+                operations = list(simulator.read_workload(f))
+
+        sim = simulator.Simulator(policy, timing)
+        print_report(sim.run(operations).report())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,8 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Generator
+import time
+from typing import TYPE_CHECKING, Dict, Generator, Optional, Tuple
 
 import pytest
 
@@ -28,7 +29,7 @@ from trezorlib.transport import enumerate_devices, get_transport
 
 from . import ui_tests
 from .device_handler import BackgroundDeviceHandler
-from .emulators import EmulatorWrapper
+from .emulators import EmulatorPool
 from .ui_tests.reporting import testreport
 
 if TYPE_CHECKING:
@@ -46,10 +47,11 @@ def emulator(request: pytest.FixtureRequest) -> Generator["Emulator", None, None
     """Fixture for getting emulator connection in case tests should operate it on their own.
 
     Is responsible for starting it at the start of the session and stopping
-    it at the end of the session - using `with EmulatorWrapper...`.
+    it at the end of the session - using `with EmulatorPool...`.
 
     Makes sure that each process will run the emulator on a different
     port and with different profile directory, which is cleaned afterwards.
+    Worker gw0 gets the pool slot 0 (port 20000), gw1 the slot 1 (port 20003), etc.
 
     Used so that we can run the device tests in parallel using `pytest-xdist` plugin.
     Docs: https://pypi.org/project/pytest-xdist/
@@ -71,25 +73,22 @@ def emulator(request: pytest.FixtureRequest) -> Generator["Emulator", None, None
             "Legacy emulator is not supported until it can be run on arbitrary ports."
         )
 
-    def _get_port() -> int:
-        """Get a unique port for this worker process on which it can run.
-
-        Guarantees to be unique because each worker has a different name.
-        gw0=>20000, gw1=>20003, gw2=>20006, etc.
-        """
-        worker_id = os.getenv("PYTEST_XDIST_WORKER")
-        assert worker_id is not None
-        assert worker_id.startswith("gw")
-        # One emulator instance occupies 3 consecutive ports:
-        # 1. normal link, 2. debug link and 3. webauthn fake interface
-        return 20000 + int(worker_id[2:]) * 3
-
-    with EmulatorWrapper(
-        model, port=_get_port(), headless=True, auto_interact=not interact
-    ) as emu:
+    with EmulatorPool(
+        [EmulatorPool.worker_slot()], headless=True, auto_interact=not interact
+    ) as (emu,):
         yield emu
 
 
+@pytest.fixture(scope="session")
+def _storage_snapshots() -> Dict[Tuple, Optional[Tuple[bytes, float]]]:
+    """Flash contents of the emulator right after the setup, by setup parameters.
+
+    Along with the flash, the time the setup took. None for a setup that is faster
+    than restoring its snapshot.
+    """
+    return {}
+
+
 @pytest.fixture(scope="session")
 def _raw_client(request: pytest.FixtureRequest) -> Client:
     # In case tests run in parallel, each process has its own emulator/client.
@@ -155,7 +154,21 @@ def client(
     To enable experimental features:
 
     @pytest.mark.experimental
+
+    With `--emulator-snapshots`, the flash of the emulator is saved after the first
+    setup with the given parameters, and later tests with the same parameters get it
+    restored instead of going through the wipe and load again. Restoring restarts
+    the emulator, so a snapshot that takes longer to restore than the setup it
+    replaces is dropped after its first use. Not used with a PIN,
+    which the restarted emulator would ask for, nor in UI tests, which need the
+    exact setup sequence for the reseeded RNG.
     """
+    emulator = None
+    if request.config.getoption("control_emulators"):
+        emulator = request.getfixturevalue("emulator")
+        # restoring a snapshot restarts the emulator, along with its client
+        _raw_client = emulator.client
+
     if request.node.get_closest_marker("skip_t2") and _raw_client.features.model == "T":
         pytest.skip("Test excluded on Trezor T")
     if request.node.get_closest_marker("skip_t1") and _raw_client.features.model == "1":
@@ -188,12 +201,6 @@ def client(
         # we need to reseed before the wipe
         _raw_client.debug.reseed(0)
 
-    if sd_marker:
-        should_format = sd_marker.kwargs.get("formatted", True)
-        _raw_client.debug.erase_sd_card(format=should_format)
-
-    wipe_device(_raw_client)
-
     setup_params = dict(
         uninitialized=False,
         mnemonic=" ".join(["all"] * 12),
@@ -211,18 +218,48 @@ def client(
         setup_params["passphrase"], str
     )
 
-    if not setup_params["uninitialized"]:
-        debuglink.load_device(
-            _raw_client,
-            mnemonic=setup_params["mnemonic"],
-            pin=setup_params["pin"],
-            passphrase_protection=use_passphrase,
-            label="test",
-            language="en-US",
-            needs_backup=setup_params["needs_backup"],
-            no_backup=setup_params["no_backup"],
-        )
+    snapshot_key = None
+    if (
+        emulator is not None
+        and request.config.getoption("emulator_snapshots")
+        and not test_ui
+        and setup_params["pin"] is None
+    ):
+        snapshot_key = tuple(sorted(setup_params.items()))
+    snapshots = request.getfixturevalue("_storage_snapshots")
 
+    if sd_marker:
+        should_format = sd_marker.kwargs.get("formatted", True)
+        _raw_client.debug.erase_sd_card(format=should_format)
+
+    snapshot = snapshots.get(snapshot_key)
+    if snapshot is not None:
+        storage, setup_time = snapshot
+        start = time.monotonic()
+        emulator.restore_storage(storage)
+        _raw_client = emulator.client
+        if time.monotonic() - start > setup_time:
+            # the restart costs more than the setup it saves
+            snapshots[snapshot_key] = None
+    else:
+        start = time.monotonic()
+        wipe_device(_raw_client)
+        if not setup_params["uninitialized"]:
+            debuglink.load_device(
+                _raw_client,
+                mnemonic=setup_params["mnemonic"],
+                pin=setup_params["pin"],
+                passphrase_protection=use_passphrase,
+                label="test",
+                language="en-US",
+                needs_backup=setup_params["needs_backup"],
+                no_backup=setup_params["no_backup"],
+            )
+        if snapshot_key is not None and snapshot_key not in snapshots:
+            setup_time = time.monotonic() - start
+            snapshots[snapshot_key] = emulator.get_storage(), setup_time
+
+    if not setup_params["uninitialized"]:
         if request.node.get_closest_marker("experimental"):
             apply_settings(_raw_client, experimental_features=True)
 
@@ -240,7 +277,12 @@ def client(
     _raw_client.close()
 
 
+_SESSION_START = time.monotonic()
+
+
 def pytest_sessionstart(session: pytest.Session) -> None:
+    global _SESSION_START
+    _SESSION_START = time.monotonic()
     ui_tests.read_fixtures()
     if session.config.getoption("ui"):
         testreport.clear_dir()
@@ -254,6 +296,7 @@ def _should_write_ui_report(exitstatus: pytest.ExitCode) -> bool:
 
 
 def pytest_sessionfinish(session: pytest.Session, exitstatus: pytest.ExitCode) -> None:
+    ui_tests.shutdown()
     if not _should_write_ui_report(exitstatus):
         return
 
@@ -306,6 +349,12 @@ def pytest_terminal_summary(
         print("See", ui_tests.SUGGESTION_FILE, "for suggestions for ONLY PASSED tests.")
         println("")
 
+    if ui_option:
+        println("-------- UI bookkeeping time: --------")
+        for line in ui_tests.timing_summary(time.monotonic() - _SESSION_START):
+            println(line)
+        println("")
+
     if _should_write_ui_report(exitstatus):
         println("-------- UI tests summary: --------")
         println("Run ./tests/show_results.py to open test summary")
@@ -333,6 +382,13 @@ def pytest_addoption(parser: "Parser") -> None:
         help="Pytest will be responsible for starting and stopping the emulators. "
         "Useful when running tests in parallel.",
     )
+    parser.addoption(
+        "--emulator-snapshots",
+        action="store_true",
+        default=False,
+        help="Restore a flash snapshot of the emulator instead of wiping and loading "
+        "the device before each test. Only valid with `--control-emulators`.",
+    )
     parser.addoption(
         "--model",
         action="store",
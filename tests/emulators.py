@@ -14,10 +14,12 @@
 # You should have received a copy of the License along with this library.
 # If not, see <https://www.gnu.org/licenses/lgpl-3.0.html>.
 
+import os
 import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from trezorlib._internal.emulator import CoreEmulator, Emulator, LegacyEmulator
 
@@ -120,3 +122,66 @@ class EmulatorWrapper:
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.emulator.stop()
         self.profile_dir.cleanup()
+
+
+class EmulatorPool:
+    """Core emulators on disjoint ports, each with its own profile directory.
+
+    The emulator in slot `i` listens on `base_port + 3 * i` and the two ports
+    above it: normal link, debug link and the webauthn fake interface. Emulators
+    of different pools and processes do not collide as long as their slots differ,
+    which is how every pytest-xdist worker gets an emulator of its own, see
+    `worker_slot()`.
+    """
+
+    PORTS_PER_EMULATOR = 3
+
+    def __init__(
+        self,
+        slots: Iterable[int],
+        tag: Optional[str] = None,
+        base_port: int = 20000,
+        headless: bool = True,
+        auto_interact: bool = True,
+    ) -> None:
+        self.wrappers = [
+            EmulatorWrapper(
+                "core",
+                tag,
+                port=base_port + slot * self.PORTS_PER_EMULATOR,
+                headless=headless,
+                auto_interact=auto_interact,
+            )
+            for slot in slots
+        ]
+
+    @staticmethod
+    def worker_slot() -> int:
+        """Slot of the current pytest-xdist worker, gw0 => 0, gw1 => 1, etc.
+
+        Without xdist, the tests run in a single process which uses slot 0.
+        """
+        worker_id = os.getenv("PYTEST_XDIST_WORKER")
+        if worker_id is None:
+            return 0
+        assert worker_id.startswith("gw")
+        return int(worker_id[2:])
+
+    def start(self) -> List[Emulator]:
+        # the emulators boot at the same time, each is waited for separately
+        with ThreadPoolExecutor(len(self.wrappers) or 1) as executor:
+            return list(executor.map(EmulatorWrapper.__enter__, self.wrappers))
+
+    def stop(self) -> None:
+        for wrapper in self.wrappers:
+            wrapper.__exit__(None, None, None)
+
+    def __enter__(self) -> List[Emulator]:
+        try:
+            return self.start()
+        except BaseException:
+            self.stop()
+            raise
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
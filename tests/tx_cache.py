@@ -55,13 +55,16 @@ class TxCache:
     def __init__(self, coin_name: str) -> None:
         self.slug = coin_name.lower().replace(" ", "_")
 
+    def cache_file(self, txhash: str) -> Path:
+        return CACHE_PATH / self.slug / f"{txhash}.json"
+
     def get_tx(self, txhash: str) -> messages.TransactionType:
         try:
             (CACHE_PATH / self.slug).mkdir()
         except Exception:
             pass
 
-        cache_file = CACHE_PATH / self.slug / f"{txhash}.json"
+        cache_file = self.cache_file(txhash)
         if not cache_file.exists():
             raise RuntimeError(
                 f"cache miss for {self.slug} tx {txhash}.\n"
@@ -75,11 +78,8 @@ class TxCache:
         return self.get_tx(key.hex())
 
     def __contains__(self, key: bytes) -> bool:
-        try:
-            self.get_tx(key.hex())
-            return True
-        except Exception:
-            return False
+        # do not parse the transaction just to find out that it exists
+        return self.cache_file(key.hex()).exists()
 
 
 @click.command()
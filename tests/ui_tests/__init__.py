@@ -1,11 +1,15 @@
 import hashlib
+import io
 import json
 import os
 import re
 import shutil
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Generator, Optional, Set
+from typing import Dict, Generator, List, Optional, Set
 
 import pytest
 from _pytest.outcomes import Failed
@@ -24,6 +28,17 @@ ACTUAL_HASHES: Dict[str, str] = {}
 PROCESSED: Set[str] = set()
 FAILED_TESTS: Set[str] = set()
 
+# Decoded pixels of the screens seen in this session, by SHA-256 of the PNG file.
+# Most tests share screens (at least the homescreen they end on), which are then
+# decoded only once. The oldest screens are dropped above SCREEN_STORE_LIMIT bytes.
+SCREEN_STORE: Dict[bytes, bytes] = {}
+SCREEN_STORE_LIMIT = 256 * 1024 * 1024
+# Total size of the pixels in SCREEN_STORE
+SCREEN_STORE_SIZE = 0
+# Seconds spent in the UI bookkeeping around the tests, by stage
+TIMINGS: Dict[str, float] = defaultdict(float)
+_DECODER_POOL: Optional[ProcessPoolExecutor] = None
+
 # T1/TT, to be set in screen_recording(), as we do not know it beforehand
 # TODO: it is not the cleanest, we could create a class out of this file
 MODEL = ""
@@ -43,13 +58,28 @@ def get_test_name(node_id: str) -> str:
     return new_name[:91] + "-" + hashlib.sha256(new_name.encode()).hexdigest()[:8]
 
 
-def _process_recorded(screen_path: Path, test_name: str) -> None:
+@contextmanager
+def _timed(stage: str) -> Generator[None, None, None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        TIMINGS[stage] += time.perf_counter() - start
+
+
+def _process_recorded(
+    screen_path: Path, test_name: str, actual_hash: Optional[str] = None
+) -> None:
     # calculate hash
-    actual_hash = _hash_files(screen_path)
+    if actual_hash is None:
+        with _timed("hash"):
+            actual_hash = _hash_files(screen_path)
     FILE_HASHES[test_name] = actual_hash
     ACTUAL_HASHES[test_name] = actual_hash
-    _rename_records(screen_path)
-    testreport.recorded(screen_path, test_name, actual_hash)
+    with _timed("rename"):
+        _rename_records(screen_path)
+    with _timed("report"):
+        testreport.recorded(screen_path, test_name, actual_hash)
 
 
 def _rename_records(screen_path: Path) -> None:
@@ -59,14 +89,49 @@ def _rename_records(screen_path: Path) -> None:
 
 
 def _hash_files(path: Path) -> str:
-    files = path.iterdir()
+    contents = [file.read_bytes() for file in sorted(path.iterdir())]
+    digests = [hashlib.sha256(content).digest() for content in contents]
+
+    screens = {d: SCREEN_STORE[d] for d in digests if d in SCREEN_STORE}
+    missing = {d: c for d, c in zip(digests, contents) if d not in screens}
+    if missing:
+        pool = _decoder_pool() if len(missing) > 1 else None
+        decode = pool.map if pool is not None else map
+        screens.update(zip(missing, decode(_get_bytes_from_png_data, missing.values())))
+        for digest in missing:
+            _store_screen(digest, screens[digest])
+
     hasher = hashlib.sha256()
-    for file in sorted(files):
-        hasher.update(_get_bytes_from_png(str(file)))
+    for digest in digests:
+        hasher.update(screens[digest])
 
     return hasher.digest().hex()
 
 
+def _store_screen(digest: bytes, pixels: bytes) -> None:
+    global SCREEN_STORE_SIZE
+    if digest in SCREEN_STORE:
+        return
+    SCREEN_STORE[digest] = pixels
+    SCREEN_STORE_SIZE += len(pixels)
+    while SCREEN_STORE_SIZE > SCREEN_STORE_LIMIT:
+        oldest = next(iter(SCREEN_STORE))
+        SCREEN_STORE_SIZE -= len(SCREEN_STORE.pop(oldest))
+
+
+def _decoder_pool() -> Optional[ProcessPoolExecutor]:
+    """Processes decoding the PNG files, started on first use.
+
+    Not used under pytest-xdist, whose workers are already busy on all the cores.
+    """
+    global _DECODER_POOL
+    if os.getenv("PYTEST_XDIST_WORKER") is not None or (os.cpu_count() or 1) < 2:
+        return None
+    if _DECODER_POOL is None:
+        _DECODER_POOL = ProcessPoolExecutor()
+    return _DECODER_POOL
+
+
 def _get_bytes_from_png(png_file: str) -> bytes:
     """Decode a PNG file into bytes representing all the pixels.
 
@@ -76,12 +141,21 @@ def _get_bytes_from_png(png_file: str) -> bytes:
     return Image.open(png_file).tobytes()
 
 
-def _process_tested(fixture_test_path: Path, test_name: str) -> None:
+def _get_bytes_from_png_data(data: bytes) -> bytes:
+    return Image.open(io.BytesIO(data)).tobytes()
+
+
+def _process_tested(
+    fixture_test_path: Path, test_name: str, actual_hash: Optional[str] = None
+) -> None:
     actual_path = fixture_test_path / "actual"
-    actual_hash = _hash_files(actual_path)
+    if actual_hash is None:
+        with _timed("hash"):
+            actual_hash = _hash_files(actual_path)
     ACTUAL_HASHES[test_name] = actual_hash
 
-    _rename_records(actual_path)
+    with _timed("rename"):
+        _rename_records(actual_path)
 
     expected_hash = FILE_HASHES.get(test_name)
     if expected_hash is None:
@@ -89,9 +163,10 @@ def _process_tested(fixture_test_path: Path, test_name: str) -> None:
 
     if actual_hash != expected_hash:
         assert expected_hash is not None
-        file_path = testreport.failed(
-            fixture_test_path, test_name, actual_hash, expected_hash
-        )
+        with _timed("report"):
+            file_path = testreport.failed(
+                fixture_test_path, test_name, actual_hash, expected_hash
+            )
 
         pytest.fail(
             f"Hash of {test_name} differs.\n"
@@ -100,7 +175,8 @@ def _process_tested(fixture_test_path: Path, test_name: str) -> None:
             f"Diff file: {file_path}"
         )
     else:
-        testreport.passed(fixture_test_path, test_name, actual_hash)
+        with _timed("report"):
+            testreport.passed(fixture_test_path, test_name, actual_hash)
 
 
 def get_last_call_test_result(request: pytest.FixtureRequest) -> Optional[bool]:
@@ -135,21 +211,27 @@ def screen_recording(
     else:
         screen_path = screens_test_path / "actual"
 
-    if not screens_test_path.exists():
-        screens_test_path.mkdir()
-    # remove previous files
-    shutil.rmtree(screen_path, ignore_errors=True)
-    screen_path.mkdir()
+    with _timed("recording"):
+        if not screens_test_path.exists():
+            screens_test_path.mkdir()
+        # remove previous files
+        shutil.rmtree(screen_path, ignore_errors=True)
+        screen_path.mkdir()
 
     try:
-        client.debug.start_recording(str(screen_path))
+        with _timed("recording"):
+            client.debug.start_recording(str(screen_path))
         yield
     finally:
         # Wait for response to Initialize, which gives the emulator time to catch up
         # and redraw the homescreen. Otherwise there's a race condition between that
         # and stopping recording.
-        client.init_device()
-        client.debug.stop_recording()
+        with _timed("recording"):
+            client.init_device()
+            client.debug.stop_recording()
+
+    # hashed while recording where the screenshots pass through debuglink
+    actual_hash = client.debug.screenshots_hash()
 
     if test_ui:
         PROCESSED.add(test_name)
@@ -157,9 +239,26 @@ def screen_recording(
             FAILED_TESTS.add(test_name)
 
         if test_ui == "record":
-            _process_recorded(screen_path, test_name)
+            _process_recorded(screen_path, test_name, actual_hash)
         else:
-            _process_tested(screens_test_path, test_name)
+            _process_tested(screens_test_path, test_name, actual_hash)
+
+
+def shutdown() -> None:
+    global _DECODER_POOL
+    if _DECODER_POOL is not None:
+        _DECODER_POOL.shutdown()
+        _DECODER_POOL = None
+
+
+def timing_summary(session_duration: float) -> List[str]:
+    """Lines describing the time spent in the UI bookkeeping, for the terminal."""
+    total = sum(TIMINGS.values())
+    share = total / session_duration * 100 if session_duration else 0
+    lines = [f"{total:.1f}s of {session_duration:.1f}s ({share:.0f}%) in total"]
+    for stage, duration in sorted(TIMINGS.items(), key=lambda item: -item[1]):
+        lines.append(f"  {stage:<10} {duration:.1f}s")
+    return lines
 
 
 def list_missing() -> Set[str]:
@@ -178,15 +277,20 @@ def read_fixtures() -> None:
 
 
 def write_fixtures(remove_missing: bool) -> None:
-    HASH_FILE.write_text(_get_fixtures_content(FILE_HASHES, remove_missing))
+    with _timed("fixtures"):
+        content = _get_fixtures_content(FILE_HASHES, remove_missing)
+        # rewriting an unchanged file would only touch its timestamp
+        if not HASH_FILE.exists() or HASH_FILE.read_text() != content:
+            HASH_FILE.write_text(content)
 
 
 def write_fixtures_suggestion(
     remove_missing: bool, only_passed_tests: bool = False
 ) -> None:
-    SUGGESTION_FILE.write_text(
-        _get_fixtures_content(ACTUAL_HASHES, remove_missing, only_passed_tests)
-    )
+    with _timed("fixtures"):
+        SUGGESTION_FILE.write_text(
+            _get_fixtures_content(ACTUAL_HASHES, remove_missing, only_passed_tests)
+        )
 
 
 def _get_fixtures_content(
@@ -222,4 +326,5 @@ def main() -> None:
         except Failed:
             print("FAILED:", record.name)
 
+    shutdown()
     testreport.index()